@@ -22,6 +22,8 @@ from src.infrastructure.database.models.hospital_model import HospitalModel
 from src.infrastructure.database.models.doctor_hospital_model import DoctorHospitalModel
 from src.infrastructure.database.models.production_model import ProductionModel
 from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.database.models.doctor_balance_model import DoctorBalanceModel
+from src.infrastructure.database.models.collection_version_model import CollectionVersionModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,32 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: a1c3e5f7b9d2
+Revises: fd5ebbbba863
+Create Date: 2026-10-18 10:12:41.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b9d2'
+down_revision: Union[str, None] = 'fd5ebbbba863'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_doctors_user_id_created_at_id', 'doctors', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_hospitals_user_id_created_at_id', 'hospitals', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_productions_user_id_created_at_id', 'productions', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_repasses_user_id_created_at_id', 'repasses', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_repasses_user_id_created_at_id', table_name='repasses')
+    op.drop_index('ix_productions_user_id_created_at_id', table_name='productions')
+    op.drop_index('ix_hospitals_user_id_created_at_id', table_name='hospitals')
+    op.drop_index('ix_doctors_user_id_created_at_id', table_name='doctors')
@@ -0,0 +1,35 @@
+"""add_collection_versions
+
+Revision ID: a3c5e7f9b1d4
+Revises: f1b3d5e7a9c2
+Create Date: 2026-10-18 21:26:09.174302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b1d4'
+down_revision: Union[str, None] = 'f1b3d5e7a9c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sem carga inicial: coleção sem linha está na versão 0 até a primeira escrita
+    op.create_table(
+        'collection_versions',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('collection', sa.String(length=32), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'collection')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('collection_versions')
@@ -0,0 +1,49 @@
+"""add_doctor_balances
+
+Revision ID: b2d4f6a8c0e1
+Revises: a1c3e5f7b9d2
+Create Date: 2026-10-18 14:05:09.512377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d4f6a8c0e1'
+down_revision: Union[str, None] = 'a1c3e5f7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'doctor_balances',
+        sa.Column('doctor_id', sa.UUID(), nullable=False),
+        sa.Column('pending_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pending_value', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('consolidated_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('consolidated_value', sa.Numeric(precision=14, scale=2), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('doctor_id')
+    )
+    # Carga inicial a partir dos repasses existentes
+    op.execute("""
+        INSERT INTO doctor_balances (doctor_id, pending_count, pending_value, consolidated_count, consolidated_value, updated_at)
+        SELECT p.doctor_id,
+               COUNT(*) FILTER (WHERE lower(r.status::text) = 'pending'),
+               COALESCE(SUM(r.amount) FILTER (WHERE lower(r.status::text) = 'pending'), 0),
+               COUNT(*) FILTER (WHERE lower(r.status::text) = 'consolidated'),
+               COALESCE(SUM(r.amount) FILTER (WHERE lower(r.status::text) = 'consolidated'), 0),
+               now()
+        FROM repasses r
+        JOIN productions p ON p.id = r.production_id
+        GROUP BY p.doctor_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('doctor_balances')
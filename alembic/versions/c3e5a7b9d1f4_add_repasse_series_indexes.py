@@ -0,0 +1,34 @@
+"""add_repasse_series_indexes
+
+Revision ID: c3e5a7b9d1f4
+Revises: b2d4f6a8c0e1
+Create Date: 2026-10-18 15:32:47.904115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d1f4'
+down_revision: Union[str, None] = 'b2d4f6a8c0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_productions_doctor_id_series', 'productions', ['doctor_id'],
+        unique=False, postgresql_include=['id', 'hospital_id', 'type']
+    )
+    op.create_index(
+        'ix_repasses_production_id_created_at', 'repasses', ['production_id', 'created_at'],
+        unique=False, postgresql_include=['status', 'amount']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_repasses_production_id_created_at', table_name='repasses')
+    op.drop_index('ix_productions_doctor_id_series', table_name='productions')
@@ -0,0 +1,32 @@
+"""index_repository_query_patterns
+
+Revision ID: d5f7b9c1e3a6
+Revises: c3e5a7b9d1f4
+Create Date: 2026-10-18 16:48:20.377512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f7b9c1e3a6'
+down_revision: Union[str, None] = 'c3e5a7b9d1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Médicos de um hospital: a chave primária (doctor_id, hospital_id) não atende filtro só por hospital_id
+    op.create_index('ix_doctor_hospital_hospital_id_doctor_id', 'doctor_hospital', ['hospital_id', 'doctor_id'], unique=False)
+    # Cobertos pelos índices compostos que começam pela mesma coluna; só custavam escrita
+    op.drop_index('ix_productions_doctor_id', table_name='productions')
+    op.drop_index('ix_repasses_production_id', table_name='repasses')
+
+
+def downgrade() -> None:
+    op.create_index('ix_repasses_production_id', 'repasses', ['production_id'], unique=False)
+    op.create_index('ix_productions_doctor_id', 'productions', ['doctor_id'], unique=False)
+    op.drop_index('ix_doctor_hospital_hospital_id_doctor_id', table_name='doctor_hospital')
@@ -0,0 +1,32 @@
+"""add_repasse_external_id
+
+Revision ID: e7a9c1d3f5b8
+Revises: d5f7b9c1e3a6
+Create Date: 2026-10-18 18:11:36.640218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a9c1d3f5b8'
+down_revision: Union[str, None] = 'd5f7b9c1e3a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('repasses', sa.Column('source_system', sa.String(length=100), nullable=True))
+    op.add_column('repasses', sa.Column('external_id', sa.String(length=255), nullable=True))
+    op.create_index(
+        'ix_repasses_user_id_source_system_external_id', 'repasses', ['user_id', 'source_system', 'external_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_repasses_user_id_source_system_external_id', table_name='repasses')
+    op.drop_column('repasses', 'external_id')
+    op.drop_column('repasses', 'source_system')
@@ -0,0 +1,37 @@
+"""index_paginated_hospital_lists
+
+Revision ID: f1b3d5e7a9c2
+Revises: e7a9c1d3f5b8
+Create Date: 2026-10-18 20:04:52.813946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b3d5e7a9c2'
+down_revision: Union[str, None] = 'e7a9c1d3f5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Listagens por hospital paginadas em (created_at, id): a página sai do índice, sem ordenar o histórico todo
+    op.create_index('ix_productions_hospital_id_created_at_id', 'productions', ['hospital_id', 'created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_doctor_hospital_hospital_id_created_at_doctor_id', 'doctor_hospital',
+        ['hospital_id', 'created_at', 'doctor_id'], unique=False
+    )
+    # Cobertos pelos novos índices, que começam pela mesma coluna
+    op.drop_index('ix_productions_hospital_id', table_name='productions')
+    op.drop_index('ix_doctor_hospital_hospital_id_doctor_id', table_name='doctor_hospital')
+
+
+def downgrade() -> None:
+    op.create_index('ix_doctor_hospital_hospital_id_doctor_id', 'doctor_hospital', ['hospital_id', 'doctor_id'], unique=False)
+    op.create_index('ix_productions_hospital_id', 'productions', ['hospital_id'], unique=False)
+    op.drop_index('ix_doctor_hospital_hospital_id_created_at_doctor_id', table_name='doctor_hospital')
+    op.drop_index('ix_productions_hospital_id_created_at_id', table_name='productions')
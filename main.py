@@ -80,6 +80,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # O frontend lê o ETag para mandar If-None-Match nas próximas leituras
+        expose_headers=["ETag"],
     )
 
     @app.get(
@@ -0,0 +1,50 @@
+"""
+Microbenchmark do custo de autenticação por requisição.
+
+- antes: `get_current_user` criava um JWTService e verificava a assinatura do token a cada chamada.
+- depois: payloads verificados ficam em cache (sha256 do token → payload) até o `exp` do token.
+
+Uso:
+    python scripts/benchmarks/bench_auth.py --iterations 20000
+"""
+import argparse
+import os
+import sys
+import timeit
+from uuid import uuid4
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.infrastructure.auth.dependencies import get_current_user
+from src.infrastructure.services.jwt_service import JWTService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = JWTService().create_access_token(data={"sub": str(uuid4()), "email": "bench@seiwa.com"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    def before():
+        return JWTService().verify_token(token)
+
+    def after():
+        return get_current_user(credentials)
+
+    results = {}
+    for label, fn in (("before (verify every request)", before), ("after (verified-token cache)", after)):
+        fn()  # aquecimento
+        best = min(timeit.repeat(fn, number=args.iterations, repeat=5))
+        results[label] = best / args.iterations * 1_000_000
+        print(f"{label:<32} {results[label]:10.2f} us/request")
+
+    before_us, after_us = results.values()
+    print(f"{'speedup':<32} {before_us / after_us:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Ingestão de produções: um POST por produção vs POST /productions/bulk.
+
+- antes: `CreateProductionUseCase` por item (busca médico, busca hospital,
+  INSERT, commit e refresh a cada produção).
+- depois: `BulkCreateProductionsUseCase` (uma consulta IN para médicos, outra
+  para hospitais e um INSERT de múltiplas linhas num único commit).
+
+Roda os casos de uso com os repositórios reais sobre um SQLite temporário em
+arquivo e mede produções por segundo.
+
+Uso:
+    python scripts/benchmarks/bench_bulk_productions.py --items 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.bootstrap.container import RepositoryScope
+from src.domain.usecase.production.bulk_create_productions import BulkCreateProductionsUseCase
+from src.domain.usecase.production.create_production import CreateProductionUseCase
+from src.dto.productionDTO import CreateProductionDTO
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel
+
+
+def seed(session, doctors, hospitals):
+    user_id = uuid.uuid4()
+    session.add(UserModel(id=user_id, name="Bench", email="bench@seiwa.com", password="x"))
+    doctor_ids = [uuid.uuid4() for _ in range(doctors)]
+    hospital_ids = [uuid.uuid4() for _ in range(hospitals)]
+    session.add_all(
+        DoctorModel(id=doctor_id, user_id=user_id, name=f"Dr. {i}", crm=f"B{i}", specialty="Cardiologia", email=f"dr{i}@seiwa.com")
+        for i, doctor_id in enumerate(doctor_ids)
+    )
+    session.add_all(
+        HospitalModel(id=hospital_id, user_id=user_id, name=f"Hospital {i}", address="Rua 1")
+        for i, hospital_id in enumerate(hospital_ids)
+    )
+    session.commit()
+    return user_id, doctor_ids, hospital_ids
+
+
+def payload(items, doctor_ids, hospital_ids):
+    rng = random.Random(42)
+    return [
+        {
+            "doctor_id": str(rng.choice(doctor_ids)),
+            "hospital_id": str(rng.choice(hospital_ids)),
+            "type": rng.choice(["shift", "consultation"]),
+            "date": "2024-01-15",
+            "description": f"Produção {i}",
+        }
+        for i in range(items)
+    ]
+
+
+def one_by_one(session, items, user_id):
+    repos = RepositoryScope(session)
+    usecase = CreateProductionUseCase(
+        save_production_port=repos.production_repository,
+        get_doctor_by_id_port=repos.doctor_repository,
+        get_hospital_by_id_port=repos.hospital_repository
+    )
+    for item in items:
+        usecase.execute(CreateProductionDTO.model_validate(item), user_id)
+
+
+def bulk(session, items, user_id):
+    repos = RepositoryScope(session)
+    usecase = BulkCreateProductionsUseCase(
+        save_productions_port=repos.production_repository,
+        get_existing_doctor_ids_port=repos.doctor_repository,
+        get_existing_hospital_ids_port=repos.hospital_repository
+    )
+    result = usecase.execute(items, user_id)
+    assert result.failed == 0, result.errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--doctors", type=int, default=50)
+    parser.add_argument("--hospitals", type=int, default=10)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-bulk-"), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        user_id, doctor_ids, hospital_ids = seed(session, args.doctors, args.hospitals)
+    items = payload(args.items, doctor_ids, hospital_ids)
+
+    rates = {}
+    for label, fn in (("before (one per request)", one_by_one), ("after (bulk)", bulk)):
+        with Session() as session:
+            started = time.perf_counter()
+            fn(session, items, user_id)
+            seconds = time.perf_counter() - started
+            session.query(ProductionModel).delete()
+            session.commit()
+        rates[label] = args.items / seconds
+        print(f"{label:<26} {seconds * 1000:10.1f} ms   {rates[label]:10.0f} productions/s")
+
+    before, after = rates.values()
+    print(f"{'speedup':<26} {after / before:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Carga analítica de um ano de repasses: paginação da API JSON x exportação colunar.
+
+Semeia --rows repasses (distribuídos por um ano de produções) e mede o tempo
+até ter os dados numa tabela em memória:
+
+- json: percorre GET /api/v1/repasses/ com cursor (100 itens por página),
+  como faz hoje quem raspa a API; os valores chegam como números JSON;
+- parquet / arrow: baixa GET /api/v1/repasses/export/columnar e lê com pyarrow,
+  com valores em decimal128 e datas tipadas.
+
+Roda a aplicação em processo (httpx.ASGITransport) sobre um SQLite em arquivo
+temporário. Requer pyarrow.
+
+Uso:
+    python scripts/benchmarks/bench_columnar_export.py --rows 50000
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+_db_dir = tempfile.mkdtemp(prefix="bench-columnar-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+import httpx
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import insert
+
+from main import create_app
+from src.domain.enums.repasse_status import RepasseStatus
+from src.infrastructure.database.connection import Base, SessionLocal, engine
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel, ProductionType
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.database.models.user_model import UserModel
+
+EMAIL = "columnar@seiwa.com"
+PASSWORD = "123456"
+REPASSES_PER_PRODUCTION = 4
+
+
+def seed(user_id, rows):
+    started = datetime(2024, 1, 1)
+    with SessionLocal() as db:
+        doctor = DoctorModel(id=uuid.uuid4(), user_id=user_id, name="Dr. Columnar", crm="C1",
+                             specialty="Cardiologia", email="dr@seiwa.com")
+        hospital = HospitalModel(id=uuid.uuid4(), user_id=user_id, name="Hospital", address="Rua 1")
+        db.add_all([doctor, hospital])
+        db.flush()
+        productions = [
+            {"id": uuid.uuid4(), "user_id": user_id, "doctor_id": doctor.id, "hospital_id": hospital.id,
+             "type": ProductionType.SHIFT, "date": date(2024, 1, 1) + timedelta(days=i % 365),
+             "created_at": started + timedelta(minutes=i)}
+            for i in range(rows // REPASSES_PER_PRODUCTION)
+        ]
+        db.execute(insert(ProductionModel), productions)
+        db.execute(insert(RepasseModel), [
+            {"id": uuid.uuid4(), "user_id": user_id, "production_id": production["id"], "amount": Decimal("123.45"),
+             "status": RepasseStatus.PENDING, "created_at": production["created_at"],
+             "updated_at": production["created_at"]}
+            for production in productions for _ in range(REPASSES_PER_PRODUCTION)
+        ])
+        db.commit()
+
+
+async def load_json(client, headers):
+    rows, cursor = [], None
+    while True:
+        params = {"page_size": 100, "include_total": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await client.get("/api/v1/repasses/", params=params, headers=headers)).json()
+        rows.extend(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return len(rows)
+
+
+async def load_columnar(client, headers, export_format):
+    response = await client.get("/api/v1/repasses/export/columnar", params={"format": export_format}, headers=headers)
+    response.raise_for_status()
+    if export_format == "parquet":
+        table = pq.read_table(io.BytesIO(response.content))
+    else:
+        table = pa.ipc.open_stream(response.content).read_all()
+    return table.num_rows
+
+
+async def run(args):
+    Base.metadata.create_all(bind=engine)
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await client.post("/api/v1/signup", json={"name": "Columnar", "email": EMAIL, "password": PASSWORD})
+        response = await client.post("/api/v1/signin", json={"email": EMAIL, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        with SessionLocal() as db:
+            user_id = db.query(UserModel.id).filter(UserModel.email == EMAIL).scalar()
+        seed(user_id, args.rows)
+
+        for label, load in (
+            ("json pages", lambda: load_json(client, headers)),
+            ("parquet", lambda: load_columnar(client, headers, "parquet")),
+            ("arrow", lambda: load_columnar(client, headers, "arrow")),
+        ):
+            started = time.perf_counter()
+            loaded = await load()
+            print(f"{label:<12} {loaded:>10} rows  {time.perf_counter() - started:8.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Microbenchmark do custo de injeção de dependências por requisição.
+
+- antes: o que `usecase_factory` fazia a cada requisição — um Container novo com
+  PasswordService (CryptContext), JWTService, os seis repositórios e todos os casos de uso.
+- depois: Container montado uma vez por processo; a requisição só liga a sessão
+  ao caso de uso pedido (e aos repositórios que ele usa).
+
+Uso:
+    python scripts/benchmarks/bench_container.py --iterations 2000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.bootstrap.container import Container, RepositoryScope
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--usecase", default="get_all_doctors_usecase")
+    args = parser.parse_args()
+
+    db = sessionmaker(bind=create_engine("sqlite://"))()
+    names = sorted(Container.usecase_names())
+
+    def before():
+        container = Container()
+        repos = RepositoryScope(db)
+        for name in names:
+            getattr(container, name)(repos)
+        return getattr(container, args.usecase)(repos)
+
+    container = Container()
+
+    def after():
+        return container.resolve(args.usecase, db)
+
+    results = {}
+    for label, fn in (("before (Container per request)", before), ("after (process-wide Container)", after)):
+        fn()  # aquecimento
+        best = min(timeit.repeat(fn, number=args.iterations, repeat=5))
+        results[label] = best / args.iterations * 1_000_000
+        print(f"{label:<34} {results[label]:10.2f} us/request")
+
+    before_us, after_us = results.values()
+    print(f"{'speedup':<34} {before_us / after_us:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Exportação em streaming: memória e vazão em função do número de linhas.
+
+Semeia --rows repasses direto no banco e baixa GET /api/v1/repasses/export,
+consumindo a resposta em pedaços, sem guardá-la. Mede o pico de memória
+alocada no processo (tracemalloc) durante o download e as linhas por segundo;
+rodar com tamanhos diferentes mostra que o pico não cresce com a exportação.
+
+Roda a aplicação em processo sobre um SQLite em arquivo temporário. O download
+chama a aplicação ASGI diretamente: o httpx.ASGITransport acumula o corpo
+inteiro da resposta antes de devolvê-lo, o que esconderia o streaming.
+
+Uso:
+    python scripts/benchmarks/bench_export.py --rows 100000
+    python scripts/benchmarks/bench_export.py --rows 1000000 --format ndjson
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+_db_dir = tempfile.mkdtemp(prefix="bench-export-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+import httpx
+from sqlalchemy import insert
+
+from main import create_app
+from src.domain.enums.repasse_status import RepasseStatus
+from src.infrastructure.database.connection import Base, SessionLocal, engine
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel, ProductionType
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.database.models.user_model import UserModel
+
+EMAIL = "export@seiwa.com"
+PASSWORD = "123456"
+
+
+def seed(user_id, rows):
+    started = datetime(2024, 1, 1)
+    with SessionLocal() as db:
+        doctor = DoctorModel(id=uuid.uuid4(), user_id=user_id, name="Dr. Export", crm="E1",
+                             specialty="Cardiologia", email="dr@seiwa.com")
+        hospital = HospitalModel(id=uuid.uuid4(), user_id=user_id, name="Hospital", address="Rua 1")
+        db.add_all([doctor, hospital])
+        db.flush()
+        production = ProductionModel(id=uuid.uuid4(), user_id=user_id, doctor_id=doctor.id, hospital_id=hospital.id,
+                                     type=ProductionType.SHIFT, date=date(2024, 1, 1))
+        db.add(production)
+        for offset in range(0, rows, 10000):
+            db.execute(insert(RepasseModel), [
+                {"id": uuid.uuid4(), "user_id": user_id, "production_id": production.id, "amount": Decimal("123.45"),
+                 "status": RepasseStatus.PENDING, "created_at": started + timedelta(seconds=i),
+                 "updated_at": started + timedelta(seconds=i)}
+                for i in range(offset, min(rows, offset + 10000))
+            ])
+        db.commit()
+
+
+async def download(app, query_string, headers):
+    """GET /api/v1/repasses/export contando os bytes de cada pedaço enviado, sem guardá-los"""
+    received = lines = 0
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/api/v1/repasses/export", "raw_path": b"/api/v1/repasses/export", "root_path": "",
+        "query_string": query_string.encode(), "server": ("bench", 80), "client": ("127.0.0.1", 1),
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    }
+    requested = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal received, lines
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+            lines += message.get("body", b"").count(b"\n")
+            if not message.get("more_body", False):
+                disconnected.set()
+
+    await app(scope, receive, send)
+    return received, lines
+
+
+async def run(args):
+    Base.metadata.create_all(bind=engine)
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await client.post("/api/v1/signup", json={"name": "Export", "email": EMAIL, "password": PASSWORD})
+        response = await client.post("/api/v1/signin", json={"email": EMAIL, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        with SessionLocal() as db:
+            user_id = db.query(UserModel.id).filter(UserModel.email == EMAIL).scalar()
+        seed(user_id, args.rows)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        received, lines = await download(app, f"format={args.format}", headers)
+        seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"rows        {args.rows:>12}")
+    print(f"lines       {lines:>12}")
+    print(f"size        {received / 1024 / 1024:12.2f} MiB")
+    print(f"throughput  {args.rows / seconds:12.0f} rows/s")
+    print(f"peak memory {peak / 1024 / 1024:12.2f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Importação NDJSON de repasses: memória e vazão em função do tamanho do arquivo.
+
+Envia --lines linhas para POST /api/v1/repasses/import em pedaços de 64 KiB,
+gerados sob demanda (o arquivo nunca existe inteiro em memória), e mede o pico
+de memória alocada no processo (tracemalloc) e as linhas por segundo. Rodar
+com tamanhos diferentes mostra que o pico não cresce com o arquivo.
+
+Roda a aplicação em processo (httpx.ASGITransport) sobre um SQLite em arquivo
+temporário.
+
+Uso:
+    python scripts/benchmarks/bench_import.py --lines 100000
+    python scripts/benchmarks/bench_import.py --lines 1000000 --chunk-size 5000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+_db_dir = tempfile.mkdtemp(prefix="bench-import-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+import httpx
+
+from main import create_app
+from src.infrastructure.database.connection import Base, SessionLocal, engine
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel, ProductionType
+from src.infrastructure.database.models.user_model import UserModel
+
+EMAIL = "import@seiwa.com"
+PASSWORD = "123456"
+
+
+def seed_production(user_id):
+    from datetime import date
+    import uuid
+
+    with SessionLocal() as db:
+        doctor = DoctorModel(id=uuid.uuid4(), user_id=user_id, name="Dr. Import", crm="I1",
+                             specialty="Cardiologia", email="dr@seiwa.com")
+        hospital = HospitalModel(id=uuid.uuid4(), user_id=user_id, name="Hospital", address="Rua 1")
+        db.add_all([doctor, hospital])
+        db.flush()
+        production = ProductionModel(id=uuid.uuid4(), user_id=user_id, doctor_id=doctor.id, hospital_id=hospital.id,
+                                     type=ProductionType.SHIFT, date=date(2024, 1, 1))
+        db.add(production)
+        db.commit()
+        return str(production.id)
+
+
+async def body(lines, production_id):
+    line = (json.dumps({"production_id": production_id, "amount": 123.45}) + "\n").encode()
+    per_chunk = max(1, 65536 // len(line))
+    sent = 0
+    while sent < lines:
+        count = min(per_chunk, lines - sent)
+        sent += count
+        yield line * count
+
+
+async def run(args):
+    Base.metadata.create_all(bind=engine)
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await client.post("/api/v1/signup", json={"name": "Import", "email": EMAIL, "password": PASSWORD})
+        response = await client.post("/api/v1/signin", json={"email": EMAIL, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}",
+                   "Content-Type": "application/x-ndjson"}
+        with SessionLocal() as db:
+            user_id = db.query(UserModel.id).filter(UserModel.email == EMAIL).scalar()
+        production_id = seed_production(user_id)
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        last = None
+        async with client.stream("POST", "/api/v1/repasses/import", params={"chunk_size": args.chunk_size},
+                                 content=body(args.lines, production_id), headers=headers) as response:
+            async for line in response.aiter_lines():
+                last = line
+        seconds = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"result      {last}")
+    print(f"lines       {args.lines:>12}")
+    print(f"throughput  {args.lines / seconds:12.0f} lines/s")
+    print(f"peak memory {peak / 1024 / 1024:12.2f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compara o custo de páginas profundas: offset/limit vs keyset (cursor).
+
+Popula médicos de um único usuário num SQLite temporário (com os mesmos índices
+dos models) e mede a última página por offset e pelo cursor equivalente.
+
+Uso:
+    python scripts/benchmarks/bench_pagination.py --rows 200000 --page-size 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.database.connection import Base
+# Todos os models, como no alembic/env.py: o create_all precisa das tabelas referenciadas por FK
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.doctor_hospital_model import DoctorHospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.database.models.doctor_balance_model import DoctorBalanceModel
+from src.infrastructure.database.models.collection_version_model import CollectionVersionModel
+from src.infrastructure.repositories.doctor_repository import DoctorRepository
+
+
+def seed(session, rows):
+    user_id = uuid.uuid4()
+    session.add(UserModel(id=user_id, name="Bench", email="bench@seiwa.com", password="x"))
+    start = datetime(2025, 1, 1)
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "id": uuid.uuid4(), "user_id": user_id, "name": f"Dr. {i}", "crm": f"B{i}",
+            "specialty": "Cardiologia", "email": f"b{i}@seiwa.com",
+            "created_at": start + timedelta(seconds=i),
+        })
+        if len(batch) == 10000:
+            session.execute(insert(DoctorModel), batch)
+            batch = []
+    if batch:
+        session.execute(insert(DoctorModel), batch)
+    session.commit()
+    return user_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-pagination-"), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    user_id = seed(session, args.rows)
+    repo = DoctorRepository(session)
+
+    for depth in (0.01, 0.5, 0.99):
+        skip = int(args.rows * depth)
+        previous = repo.get_all(skip=skip - 1, limit=1, user_id=user_id) if skip else []
+        after = (previous[0].created_at, previous[0].id) if previous else None
+
+        offset_s = min(timeit.repeat(
+            lambda: repo.get_all(skip=skip, limit=args.page_size, user_id=user_id), number=1, repeat=args.repeat))
+        keyset_s = min(timeit.repeat(
+            lambda: repo.get_all(limit=args.page_size, user_id=user_id, after=after), number=1, repeat=args.repeat))
+        print(f"offset {skip:>8}: offset {offset_s * 1000:8.2f} ms   keyset {keyset_s * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
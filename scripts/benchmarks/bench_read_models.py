@@ -0,0 +1,169 @@
+"""
+Compara o caminho de leitura das listagens: entidades pydantic vs modelos de leitura com __slots__.
+
+Antes: objetos do ORM -> entidade pydantic (timestamps com .isoformat()) -> DTO
+validado, que volta a interpretar os textos. Agora: só as colunas -> ProductionRow
+(tipos nativos, sem validação) -> DTO montado sem validação.
+
+Popula produções de um único usuário num SQLite temporário e mede, para um
+resultado de --rows linhas, o tempo de CPU e a memória (pico e retida) de cada
+caminho, além da memória só das entidades.
+
+Uso:
+    python scripts/benchmarks/bench_read_models.py --rows 10000
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.Production import Production
+from src.dto.productionDTO import ProductionResponseDTO
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel, ProductionType
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.repositories.production_repository import ProductionRepository
+
+
+def seed(session, rows):
+    user_id, doctor_id, hospital_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    session.add(UserModel(id=user_id, name="Bench", email="bench@seiwa.com", password="x"))
+    session.add(DoctorModel(id=doctor_id, user_id=user_id, name="Dr. Bench", crm="B1", specialty="Cardiologia", email="b@seiwa.com"))
+    session.add(HospitalModel(id=hospital_id, user_id=user_id, name="Hospital", address="Rua A"))
+    session.flush()
+    start = datetime(2025, 1, 1)
+    session.execute(insert(ProductionModel), [
+        {
+            "id": uuid.uuid4(), "user_id": user_id, "doctor_id": doctor_id, "hospital_id": hospital_id,
+            "type": ProductionType.SHIFT, "date": date(2025, 1, 1) + timedelta(days=i % 365),
+            "description": f"Plantão {i}", "created_at": start + timedelta(seconds=i, microseconds=i),
+            "updated_at": start + timedelta(days=1, seconds=i),
+        }
+        for i in range(rows)
+    ])
+    session.commit()
+    return user_id
+
+
+def pydantic_entities(session, user_id, rows):
+    """Caminho anterior: objetos do ORM -> entidades pydantic com timestamps em texto"""
+    models = session.query(ProductionModel).filter(ProductionModel.user_id == user_id).order_by(
+        ProductionModel.created_at, ProductionModel.id
+    ).limit(rows).all()
+    productions = [
+        Production(
+            id=production.id,
+            user_id=production.user_id,
+            doctor_id=production.doctor_id,
+            hospital_id=production.hospital_id,
+            type=production.type.value,
+            date=production.date,
+            description=production.description,
+            created_at=production.created_at.isoformat(),
+            updated_at=production.updated_at.isoformat() if production.updated_at else None
+        )
+        for production in models
+    ]
+    return productions
+
+
+def pydantic_path(session, user_id, rows):
+    productions = pydantic_entities(session, user_id, rows)
+    dtos = [
+        ProductionResponseDTO(
+            id=str(production.id),
+            doctor_id=str(production.doctor_id),
+            hospital_id=str(production.hospital_id),
+            type=production.type,
+            date=production.date.isoformat(),
+            description=production.description,
+            created_at=production.created_at,
+            updated_at=production.updated_at
+        )
+        for production in productions
+    ]
+    return productions, dtos
+
+
+def row_entities(session, user_id, rows):
+    return ProductionRepository(session).get_all(limit=rows, user_id=user_id)
+
+
+def row_path(session, user_id, rows):
+    productions = row_entities(session, user_id, rows)
+    return productions, [ProductionResponseDTO.from_row(production) for production in productions]
+
+
+def cpu(build, session_factory, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        session = session_factory()
+        gc.collect()
+        started = time.process_time()
+        build(session)
+        best = min(best, time.process_time() - started)
+        session.close()
+    return best
+
+
+def memory(build, session_factory):
+    """(pico, retida) em bytes durante a montagem do resultado"""
+    session = session_factory()
+    gc.collect()
+    tracemalloc.start()
+    result = build(session)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    session.close()
+    return peak, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-read-models-"), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        user_id = seed(session, args.rows)
+
+    # Os dois caminhos devem produzir o mesmo JSON
+    with session_factory() as session:
+        before = [dto.model_dump_json() for dto in pydantic_path(session, user_id, args.rows)[1]]
+    with session_factory() as session:
+        after = [dto.model_dump_json() for dto in row_path(session, user_id, args.rows)[1]]
+    assert before == after
+
+    cases = (
+        ("entidades pydantic", lambda s: pydantic_entities(s, user_id, args.rows)),
+        ("ProductionRow", lambda s: row_entities(s, user_id, args.rows)),
+        ("entidades pydantic + DTO", lambda s: pydantic_path(s, user_id, args.rows)),
+        ("ProductionRow + DTO.from_row", lambda s: row_path(s, user_id, args.rows)),
+    )
+    print(f"{args.rows} produções")
+    print(f"{'caminho':<32} {'CPU (ms)':>9} {'pico (MB)':>10} {'retida (MB)':>12}")
+    for label, build in cases:
+        cpu_s = cpu(build, session_factory, args.repeat)
+        peak, retained = memory(build, session_factory)
+        print(f"{label:<32} {cpu_s * 1000:9.1f} {peak / 2**20:10.1f} {retained / 2**20:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
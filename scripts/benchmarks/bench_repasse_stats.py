@@ -0,0 +1,125 @@
+"""
+Estatísticas de repasses de um médico: agregação em Python vs GROUP BY no banco.
+
+- antes: carrega todos os repasses (`get_by_doctor_and_date_range`) e soma em Python.
+- depois: `get_stats_by_doctor` devolve COUNT/SUM por status numa única query.
+
+Popula um SQLite temporário com --rows repasses para um único médico e mede
+latência (melhor de N execuções) e pico de memória alocada (tracemalloc).
+
+Uso:
+    python scripts/benchmarks/bench_repasse_stats.py --rows 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.enums.repasse_status import RepasseStatus
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel, ProductionType
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.repositories.repasse_repository import RepasseRepository
+
+
+def seed(session, rows):
+    user_id, doctor_id, hospital_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    session.add(UserModel(id=user_id, name="Bench", email="bench@seiwa.com", password="x"))
+    session.add(DoctorModel(id=doctor_id, user_id=user_id, name="Dr. Bench", crm="B1",
+                            specialty="Cardiologia", email="dr@seiwa.com"))
+    session.add(HospitalModel(id=hospital_id, user_id=user_id, name="Hospital", address="Rua 1"))
+    session.flush()
+
+    production_ids = [uuid.uuid4() for _ in range(max(1, rows // 10))]
+    session.execute(insert(ProductionModel), [
+        {"id": pid, "doctor_id": doctor_id, "hospital_id": hospital_id, "user_id": user_id,
+         "type": ProductionType.SHIFT, "date": date(2024, 1, 1)}
+        for pid in production_ids
+    ])
+
+    start = datetime(2020, 1, 1)
+    rng = random.Random(42)
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "id": uuid.uuid4(), "user_id": user_id, "production_id": production_ids[i % len(production_ids)],
+            "amount": Decimal(rng.randint(100, 500000)) / 100,
+            "status": RepasseStatus.PENDING if i % 3 else RepasseStatus.CONSOLIDATED,
+            "created_at": start + timedelta(minutes=i), "updated_at": start + timedelta(minutes=i),
+        })
+        if len(batch) == 10000:
+            session.execute(insert(RepasseModel), batch)
+            batch = []
+    if batch:
+        session.execute(insert(RepasseModel), batch)
+    session.commit()
+    return doctor_id
+
+
+def python_aggregation(repo, doctor_id):
+    totals = {status: [0, Decimal(0)] for status in RepasseStatus}
+    for repasse in repo.get_by_doctor_and_date_range(doctor_id, None, None):
+        totals[repasse.status][0] += 1
+        totals[repasse.status][1] += repasse.amount
+    return {status: tuple(values) for status, values in totals.items()}
+
+
+def sql_aggregation(repo, doctor_id):
+    return repo.get_stats_by_doctor(doctor_id, None, None)
+
+
+def measure(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-stats-"), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    doctor_id = seed(session, args.rows)
+
+    results = {}
+    for label, fn in (("before (rows -> Python)", python_aggregation), ("after (GROUP BY status)", sql_aggregation)):
+        session.expunge_all()
+        repo = RepasseRepository(session)
+        seconds, peak, totals = measure(lambda: fn(repo, doctor_id), args.repeat)
+        results[label] = (seconds, peak, totals)
+        print(f"{label:<26} {seconds * 1000:10.1f} ms   peak {peak / 1024 / 1024:8.2f} MiB")
+
+    (before_s, before_mem, before_totals), (after_s, after_mem, after_totals) = results.values()
+    assert {s: t for s, t in before_totals.items() if t[0]} == after_totals, "aggregations differ"
+    print(f"{'speedup':<26} {before_s / after_s:10.1f}x   memory {before_mem / max(after_mem, 1):8.0f}x less")
+
+
+if __name__ == "__main__":
+    main()
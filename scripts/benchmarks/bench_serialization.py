@@ -0,0 +1,100 @@
+"""
+Compara a serialização de páginas de listagem: caminho padrão do FastAPI vs fast_json.
+
+Caminho padrão: o FastAPI converte o PaginatedResponse em dict, valida de novo
+contra o response_model e codifica com json.dumps (JSONResponse). fast_json:
+os DTOs, já validados pelo controller, vão direto para bytes pelo pydantic-core.
+Mede só a serialização de páginas já montadas (o que muda entre os caminhos).
+
+Uso:
+    python scripts/benchmarks/bench_serialization.py --page-size 100 --pages 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.controller.fast_json import fast_json
+from src.domain.enums.repasse_status import RepasseStatus
+from src.dto.pagination import PaginatedResponse
+from src.dto.productionDTO import ProductionResponseDTO
+from src.dto.repasseDTO import RepasseResponseDTO
+
+
+def production_page(page_size):
+    start = datetime(2025, 1, 1)
+    items = [
+        ProductionResponseDTO(
+            id=str(uuid.uuid4()), doctor_id=str(uuid.uuid4()), hospital_id=str(uuid.uuid4()),
+            type="plantao", date=(date(2025, 1, 1) + timedelta(days=i % 28)).isoformat(),
+            description=f"Plantão {i}", created_at=(start + timedelta(minutes=i)).isoformat(), updated_at=None
+        )
+        for i in range(page_size)
+    ]
+    return PaginatedResponse.create(items=items, total=10000, page=1, page_size=page_size, next_cursor="x" * 40)
+
+
+def repasse_page(page_size):
+    start = datetime(2025, 1, 1)
+    items = [
+        RepasseResponseDTO(
+            id=uuid.uuid4(), production_id=uuid.uuid4(), amount=Decimal("1500.00") + i, status=RepasseStatus.PENDING,
+            created_at=start + timedelta(minutes=i), updated_at=start + timedelta(minutes=i)
+        )
+        for i in range(page_size)
+    ]
+    return PaginatedResponse.create(items=items, total=10000, page=1, page_size=page_size, next_cursor="x" * 40)
+
+
+async def standard(field, page):
+    content = await serialize_response(field=field, response_content=page)
+    return JSONResponse(content).body
+
+
+def measure(label, fn, pages, repeat):
+    best = min(_timed(fn, pages) for _ in range(repeat))
+    print(f"{label:<32} {best / pages * 1e6:9.1f} µs/página   {pages / best:9.0f} páginas/s")
+    return best
+
+
+def _timed(fn, pages):
+    started = time.perf_counter()
+    for _ in range(pages):
+        fn()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    for name, dto, build in (("productions", ProductionResponseDTO, production_page), ("repasses", RepasseResponseDTO, repasse_page)):
+        page = build(args.page_size)
+        field = create_model_field(name="Response", type_=PaginatedResponse[dto], mode="serialization")
+        # Os dois caminhos devem produzir o mesmo JSON
+        assert json.loads(fast_json(page).body) == json.loads(loop.run_until_complete(standard(field, page)))
+
+        print(f"{name}: {args.page_size} itens por página")
+        slow = measure("  response_model + json.dumps", lambda: loop.run_until_complete(standard(field, page)), args.pages, args.repeat)
+        fast = measure("  fast_json (pydantic-core)", lambda: fast_json(page).body, args.pages, args.repeat)
+        print(f"  {slow / fast:.1f}x mais rápido")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
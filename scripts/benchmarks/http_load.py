@@ -0,0 +1,83 @@
+"""
+Gerador de carga HTTP simples para comparar os modos de banco (DB_MODE=sync|async).
+
+Uso:
+    DB_MODE=sync  uvicorn main:app --port 8000 --workers 1
+    python scripts/benchmarks/http_load.py --path /api/v1/doctors/ --concurrency 50 --requests 2000
+
+    DB_MODE=async uvicorn main:app --port 8000 --workers 1
+    python scripts/benchmarks/http_load.py --path /api/v1/doctors/ --concurrency 50 --requests 2000
+
+O token é obtido com as credenciais da seed (admin@seiwa.com / 123456) quando --token não é informado.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def fetch_token(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post("/api/v1/signin", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run(args):
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+        token = args.token or await fetch_token(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        latencies = []
+        errors = 0
+        queue = asyncio.Queue()
+        for _ in range(args.requests):
+            queue.put_nowait(None)
+
+        async def worker():
+            nonlocal errors
+            while not queue.empty():
+                queue.get_nowait()
+                started = time.perf_counter()
+                try:
+                    response = await client.get(args.path, headers=headers)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    print(f"requests:    {len(latencies)} ({errors} errors)")
+    print(f"concurrency: {args.concurrency}")
+    print(f"throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"p50:         {statistics.median(latencies) * 1000:.1f} ms")
+    print(f"p95:         {percentile(latencies, 95) * 1000:.1f} ms")
+    print(f"p99:         {percentile(latencies, 99) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/v1/doctors/")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--token", default=None)
+    parser.add_argument("--email", default="admin@seiwa.com")
+    parser.add_argument("--password", default="123456")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
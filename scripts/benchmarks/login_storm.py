@@ -0,0 +1,128 @@
+"""
+Benchmark de "tempestade de logins": latência de uma rota não relacionada
+(GET /api/v1/doctors/) sozinha e durante uma rajada de signins concorrentes.
+
+Roda a aplicação em processo (httpx.ASGITransport) sobre um SQLite em arquivo
+temporário, então não precisa de Postgres nem de servidor rodando. O modo de
+banco segue DB_MODE (sync|async).
+
+- padrão: bcrypt no pool dedicado (PASSWORD_HASH_MAX_WORKERS) e signin/signup
+  com limite de threads próprio.
+- --baseline: bcrypt na própria thread do caso de uso e signin/signup no
+  threadpool compartilhado (comportamento anterior).
+
+Uso:
+    python scripts/benchmarks/login_storm.py --logins 200 --login-concurrency 50
+    python scripts/benchmarks/login_storm.py --logins 200 --login-concurrency 50 --baseline
+    DB_MODE=async python scripts/benchmarks/login_storm.py --baseline
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+_db_dir = tempfile.mkdtemp(prefix="login-storm-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+import httpx
+
+from main import create_app
+from src.bootstrap import provider
+from src.infrastructure.database.connection import Base, engine
+
+EMAIL = "storm@seiwa.com"
+PASSWORD = "123456"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def use_baseline():
+    password_service = provider.container.password_service
+    password_service._run = lambda fn, *args: fn(*args)
+    provider.isolated_limiter = None
+
+
+async def probe(client, headers, count, concurrency):
+    latencies = []
+    remaining = count
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get("/api/v1/doctors/", headers=headers)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def storm(client, count, concurrency):
+    remaining = count
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await client.post("/api/v1/signin", json={"email": EMAIL, "password": PASSWORD})
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return count / (time.perf_counter() - started)
+
+
+def report(label, latencies):
+    print(
+        f"{label:<24} p50 {statistics.median(latencies) * 1000:8.1f} ms"
+        f"   p99 {percentile(latencies, 99) * 1000:8.1f} ms"
+    )
+
+
+async def run(args):
+    Base.metadata.create_all(bind=engine)
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        await client.post("/api/v1/signup", json={"name": "Storm", "email": EMAIL, "password": PASSWORD})
+        response = await client.post("/api/v1/signin", json={"email": EMAIL, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        idle = await probe(client, headers, args.probes, args.probe_concurrency)
+
+        storm_task = asyncio.create_task(storm(client, args.logins, args.login_concurrency))
+        await asyncio.sleep(0.05)
+        during = await probe(client, headers, args.probes, args.probe_concurrency)
+        logins_per_second = await storm_task
+
+    print(f"mode: {'baseline' if args.baseline else 'offloaded'}  DB_MODE={os.getenv('DB_MODE', 'sync')}")
+    report("doctors (idle)", idle)
+    report("doctors (login storm)", during)
+    print(f"{'login throughput':<24} {logins_per_second:8.1f} logins/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--login-concurrency", type=int, default=50)
+    parser.add_argument("--probes", type=int, default=200)
+    parser.add_argument("--probe-concurrency", type=int, default=4)
+    parser.add_argument("--baseline", action="store_true")
+    args = parser.parse_args()
+    if args.baseline:
+        use_baseline()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from src.infrastructure.database.models.hospital_model import HospitalModel
 from src.infrastructure.database.models.production_model import ProductionModel, ProductionType
 from src.infrastructure.database.models.repasse_model import RepasseModel
 from src.infrastructure.database.models.doctor_hospital_model import DoctorHospitalModel
+from src.infrastructure.repositories.doctor_balance_repository import DoctorBalanceRepository
 from src.domain.enums.repasse_status import RepasseStatus
 from passlib.context import CryptContext
 
@@ -139,6 +140,9 @@ def create_demo_data():
         db.commit()
         print(f"Created {len(repasses)} repasses.")
 
+        # Repasses inseridos direto nos modelos: o saldo dos médicos é recalculado
+        DoctorBalanceRepository(db).repair()
+
         print("\n=== DEMO DATA CREATED SUCCESSFULLY ===")
         print(f"Login: {demo_user.email}")
         print(f"Password: 123456")
@@ -0,0 +1,51 @@
+"""
+Verifica (e corrige) a tabela doctor_balances contra os repasses.
+
+O saldo por médico é mantido nas escritas de repasses/produções/hospitais; este
+comando recalcula tudo com um GROUP BY e regrava apenas os médicos divergentes.
+Sem --dry-run, as escritas em repasses ficam bloqueadas até o fim do reparo.
+Útil depois de cargas feitas fora da API ou de correções manuais no banco.
+
+Uso:
+    python scripts/repair_doctor_balances.py            # verifica e corrige
+    python scripts/repair_doctor_balances.py --dry-run  # só verifica
+"""
+import argparse
+import os
+import sys
+
+# Add the project root to sys.path to allow imports from src
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.repositories.doctor_balance_repository import DoctorBalanceRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="only report drift, do not write")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        balances = DoctorBalanceRepository(db)
+        if not args.dry_run:
+            # Antes do recálculo: o que for impresso é exatamente o que será gravado
+            balances.lock_repasses()
+        drift = balances.find_drift()
+        for doctor_id, stored, expected in drift:
+            print(f"{doctor_id}: stored={stored} expected={expected}")
+
+        if not drift:
+            print("doctor_balances is consistent.")
+        elif args.dry_run:
+            print(f"{len(drift)} doctor(s) with drift (dry run, nothing written).")
+            sys.exit(1)
+        else:
+            print(f"Repaired {balances.repair(drift)} doctor(s).")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from src.domain.usecase.oauth.signin import SignInUseCase
 from src.domain.usecase.doctor.create_doctor import CreateDoctorUseCase
 from src.domain.usecase.doctor.get_all_doctors import GetAllDoctorsUseCase
 from src.domain.usecase.doctor.get_doctor_by_id import GetDoctorByIdUseCase
+from src.domain.usecase.doctor.get_doctor_statement import GetDoctorStatementUseCase
 from src.domain.usecase.doctor.update_doctor import UpdateDoctorUseCase
 from src.domain.usecase.doctor.delete_doctor import DeleteDoctorUseCase
 from src.domain.usecase.hospital.create_hospital import CreateHospitalUseCase
@@ -15,10 +16,12 @@ from src.domain.usecase.doctor_hospital.remove_doctor_from_hospital import Remov
 from src.domain.usecase.doctor_hospital.get_hospitals_by_doctor import GetHospitalsByDoctorUseCase
 from src.domain.usecase.doctor_hospital.get_doctors_by_hospital import GetDoctorsByHospitalUseCase
 from src.domain.usecase.production.create_production import CreateProductionUseCase
+from src.domain.usecase.production.bulk_create_productions import BulkCreateProductionsUseCase
 from src.domain.usecase.production.get_all_productions import GetAllProductionsUseCase
 from src.domain.usecase.production.get_production_by_id import GetProductionByIdUseCase
 from src.domain.usecase.production.get_productions_by_doctor import GetProductionsByDoctorUseCase
 from src.domain.usecase.production.get_productions_by_hospital import GetProductionsByHospitalUseCase
+from src.domain.usecase.production.export_productions import ExportProductionsUseCase
 from src.domain.usecase.production.update_production import UpdateProductionUseCase
 from src.domain.usecase.production.delete_production import DeleteProductionUseCase
 from src.domain.usecase.repasse.create_repasse import CreateRepasseUseCase
@@ -28,178 +31,431 @@ from src.domain.usecase.repasse.get_repasses_by_production import GetRepassesByP
 from src.domain.usecase.repasse.get_repasses_by_hospital import GetRepassesByHospitalUseCase
 from src.domain.usecase.repasse.update_repasse import UpdateRepasseUseCase
 from src.domain.usecase.repasse.delete_repasse import DeleteRepasseUseCase
+from src.domain.usecase.repasse.upsert_repasses import UpsertRepassesUseCase
+from src.domain.usecase.repasse.import_repasses import ImportRepassesUseCase
+from src.domain.usecase.repasse.export_repasses import ExportRepassesUseCase
+from src.domain.usecase.repasse.export_repasses_columnar import ExportRepassesColumnarUseCase
 from src.domain.usecase.repasse.get_repasse_stats import GetRepasseStatsUseCase
+from src.domain.usecase.repasse.get_cached_repasse_stats import GetCachedRepasseStatsUseCase
+from src.domain.usecase.repasse.get_repasse_stats_batch import GetRepasseStatsBatchUseCase
+from src.domain.usecase.repasse.get_repasse_stats_series import GetRepasseStatsSeriesUseCase
+from src.domain.usecase.versioning.get_collection_version import GetCollectionVersionUseCase
+from src.domain.usecase.versioning.get_item_version import GetItemVersionUseCase
 from src.infrastructure.repositories.user_repository import UserRepository
 from src.infrastructure.repositories.doctor_repository import DoctorRepository
 from src.infrastructure.repositories.hospital_repository import HospitalRepository
 from src.infrastructure.repositories.doctor_hospital_repository import DoctorHospitalRepository
 from src.infrastructure.repositories.production_repository import ProductionRepository
 from src.infrastructure.repositories.repasse_repository import RepasseRepository
-from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.repositories.collection_version_repository import CollectionVersionRepository
 from src.infrastructure.services.password_service import PasswordService
 from src.infrastructure.services.jwt_service import JWTService
+from src.infrastructure.services.columnar_encoder import ColumnarEncoder
+from src.infrastructure.cache.stats_cache import stats_cache
+from functools import cached_property
+from typing import Any, Callable, FrozenSet
 from sqlalchemy.orm import Session
 
-class Container:
+
+def usecase(builder: Callable) -> Callable:
+    """Marca um método do Container como construtor de caso de uso"""
+    builder.is_usecase = True
+    return builder
+
+
+def isolated_usecase(builder: Callable) -> Callable:
+    """
+    Marca um caso de uso CPU-bound (hash de senha) que, no modo sync, roda com um
+    limite de threads próprio em vez de ocupar o threadpool das demais rotas.
+    """
+    builder.is_isolated = True
+    return usecase(builder)
+
+
+def read_only_usecase(builder: Callable) -> Callable:
+    """Marca um caso de uso que só lê dados e pode ser atendido pela réplica"""
+    builder.is_read_only = True
+    return usecase(builder)
+
+
+def stats_cache_fill_usecase(builder: Callable) -> Callable:
+    """
+    Marca um caso de uso que preenche o cache de estatísticas: lê do primário
+    quando há cache configurado e, com STATS_CACHE_BACKEND=none (nada a
+    preencher), é uma leitura comum, atendida pela réplica.
+    """
+    builder.fills_stats_cache = True
+    return usecase(builder)
+
+
+class RepositoryScope:
+    """
+    Repositórios vinculados à sessão de uma requisição.
+
+    Cada repositório só é instanciado no primeiro acesso, então uma requisição
+    monta apenas os repositórios que o seu caso de uso realmente usa.
+    """
+
     def __init__(self, db: Session):
         self.db = db
 
-        # Repositories
-        self.user_repository = UserRepository(db=self.db)
-        self.doctor_repository = DoctorRepository(db=self.db)
-        self.hospital_repository = HospitalRepository(db=self.db)
-        self.doctor_hospital_repository = DoctorHospitalRepository(db=self.db)
-        self.production_repository = ProductionRepository(db=self.db)
-        self.repasse_repository = RepasseRepository(db=self.db)
+    @cached_property
+    def user_repository(self) -> UserRepository:
+        return UserRepository(db=self.db)
+
+    @cached_property
+    def doctor_repository(self) -> DoctorRepository:
+        return DoctorRepository(db=self.db)
+
+    @cached_property
+    def hospital_repository(self) -> HospitalRepository:
+        return HospitalRepository(db=self.db)
+
+    @cached_property
+    def doctor_hospital_repository(self) -> DoctorHospitalRepository:
+        return DoctorHospitalRepository(db=self.db)
+
+    @cached_property
+    def production_repository(self) -> ProductionRepository:
+        return ProductionRepository(db=self.db)
+
+    @cached_property
+    def repasse_repository(self) -> RepasseRepository:
+        return RepasseRepository(db=self.db)
+
+    @cached_property
+    def collection_version_repository(self) -> CollectionVersionRepository:
+        return CollectionVersionRepository(db=self.db)
+
+
+class Container:
+    """
+    Grafo de dependências montado uma única vez por processo.
+
+    Os serviços sem estado por requisição (PasswordService, JWTService) são criados
+    aqui uma vez. Cada caso de uso é um método que recebe o RepositoryScope da
+    requisição, então só o caso de uso pedido é construído a cada chamada.
+    """
 
+    def __init__(self):
         # Services
         self.password_service = PasswordService()
         self.token_service = JWTService()
+        self.columnar_encoder = ColumnarEncoder()
+        # Cache de resultado das estatísticas (None com STATS_CACHE_BACKEND=none)
+        self.stats_cache = stats_cache
+
+    @classmethod
+    def usecase_names(cls) -> FrozenSet[str]:
+        return frozenset(
+            name for name, attr in vars(cls).items()
+            if getattr(attr, "is_usecase", False)
+        )
 
-        # User UseCases
-        self.signup_usecase = SignUpUseCase(
-            get_user_by_email_port=self.user_repository,
+    def provides(self, usecase_name: str) -> bool:
+        return getattr(getattr(type(self), usecase_name, None), "is_usecase", False)
+
+    def is_read_only(self, usecase_name: str) -> bool:
+        builder = getattr(type(self), usecase_name, None)
+        if getattr(builder, "fills_stats_cache", False):
+            return self.stats_cache is None
+        return getattr(builder, "is_read_only", False)
+
+    def is_primary_read(self, usecase_name: str) -> bool:
+        """Só lê, mas no primário e sem fixar o usuário nele (o cálculo que preenche o cache)"""
+        builder = getattr(type(self), usecase_name, None)
+        return getattr(builder, "fills_stats_cache", False) and self.stats_cache is not None
+
+    def is_isolated(self, usecase_name: str) -> bool:
+        return getattr(getattr(type(self), usecase_name, None), "is_isolated", False)
+
+    def resolve(self, usecase_name: str, db: Session) -> Any:
+        """Monta o caso de uso pedido ligado à sessão informada"""
+        if not self.provides(usecase_name):
+            raise ValueError(f"Use case '{usecase_name}' not found in container.")
+        return getattr(self, usecase_name)(RepositoryScope(db))
+
+    # User UseCases
+    @isolated_usecase
+    def signup_usecase(self, repos: RepositoryScope) -> SignUpUseCase:
+        return SignUpUseCase(
+            get_user_by_email_port=repos.user_repository,
             encrypt_password_port=self.password_service,
-            save_user_port=self.user_repository
+            save_user_port=repos.user_repository
         )
 
-        self.signin_usecase = SignInUseCase(
-            get_user_by_email_port=self.user_repository,
+    @isolated_usecase
+    def signin_usecase(self, repos: RepositoryScope) -> SignInUseCase:
+        return SignInUseCase(
+            get_user_by_email_port=repos.user_repository,
             encrypt_password_port=self.password_service,
             token_service_port=self.token_service
         )
 
-        # Doctor UseCases
-        self.create_doctor_usecase = CreateDoctorUseCase(
-            save_doctor_port=self.doctor_repository,
-            get_doctor_by_crm_port=self.doctor_repository,
-            get_doctor_by_email_port=self.doctor_repository
+    # Doctor UseCases
+    @usecase
+    def create_doctor_usecase(self, repos: RepositoryScope) -> CreateDoctorUseCase:
+        return CreateDoctorUseCase(
+            save_doctor_port=repos.doctor_repository,
+            get_doctor_by_crm_port=repos.doctor_repository,
+            get_doctor_by_email_port=repos.doctor_repository
+        )
+
+    @read_only_usecase
+    def get_all_doctors_usecase(self, repos: RepositoryScope) -> GetAllDoctorsUseCase:
+        return GetAllDoctorsUseCase(
+            get_all_doctors_port=repos.doctor_repository
+        )
+
+    @read_only_usecase
+    def get_doctor_by_id_usecase(self, repos: RepositoryScope) -> GetDoctorByIdUseCase:
+        return GetDoctorByIdUseCase(
+            get_doctor_by_id_port=repos.doctor_repository
+        )
+
+    @read_only_usecase
+    def get_doctor_statement_usecase(self, repos: RepositoryScope) -> GetDoctorStatementUseCase:
+        return GetDoctorStatementUseCase(
+            get_doctor_by_id_port=repos.doctor_repository,
+            get_doctor_statement_port=repos.production_repository
+        )
+
+    @usecase
+    def update_doctor_usecase(self, repos: RepositoryScope) -> UpdateDoctorUseCase:
+        return UpdateDoctorUseCase(
+            update_doctor_port=repos.doctor_repository,
+            get_doctor_by_id_port=repos.doctor_repository
+        )
+
+    @usecase
+    def delete_doctor_usecase(self, repos: RepositoryScope) -> DeleteDoctorUseCase:
+        return DeleteDoctorUseCase(
+            delete_doctor_port=repos.doctor_repository,
+            get_doctor_by_id_port=repos.doctor_repository
         )
 
-        self.get_all_doctors_usecase = GetAllDoctorsUseCase(
-            get_all_doctors_port=self.doctor_repository
+    # Hospital UseCases
+    @usecase
+    def create_hospital_usecase(self, repos: RepositoryScope) -> CreateHospitalUseCase:
+        return CreateHospitalUseCase(
+            save_hospital_port=repos.hospital_repository
         )
 
-        self.get_doctor_by_id_usecase = GetDoctorByIdUseCase(
-            get_doctor_by_id_port=self.doctor_repository
+    @read_only_usecase
+    def get_all_hospitals_usecase(self, repos: RepositoryScope) -> GetAllHospitalsUseCase:
+        return GetAllHospitalsUseCase(
+            get_all_hospitals_port=repos.hospital_repository
         )
 
-        self.update_doctor_usecase = UpdateDoctorUseCase(
-            update_doctor_port=self.doctor_repository,
-            get_doctor_by_id_port=self.doctor_repository
+    @read_only_usecase
+    def get_hospital_by_id_usecase(self, repos: RepositoryScope) -> GetHospitalByIdUseCase:
+        return GetHospitalByIdUseCase(
+            get_hospital_by_id_port=repos.hospital_repository
         )
 
-        self.delete_doctor_usecase = DeleteDoctorUseCase(
-            delete_doctor_port=self.doctor_repository,
-            get_doctor_by_id_port=self.doctor_repository
+    @usecase
+    def update_hospital_usecase(self, repos: RepositoryScope) -> UpdateHospitalUseCase:
+        return UpdateHospitalUseCase(
+            update_hospital_port=repos.hospital_repository,
+            get_hospital_by_id_port=repos.hospital_repository
         )
 
-        # Hospital UseCases
-        self.create_hospital_usecase = CreateHospitalUseCase(
-            save_hospital_port=self.hospital_repository
+    @usecase
+    def delete_hospital_usecase(self, repos: RepositoryScope) -> DeleteHospitalUseCase:
+        return DeleteHospitalUseCase(
+            delete_hospital_port=repos.hospital_repository,
+            get_hospital_by_id_port=repos.hospital_repository
         )
 
-        self.get_all_hospitals_usecase = GetAllHospitalsUseCase(
-            get_all_hospitals_port=self.hospital_repository
+    # Doctor-Hospital UseCases
+    @usecase
+    def assign_doctor_to_hospital_usecase(self, repos: RepositoryScope) -> AssignDoctorToHospitalUseCase:
+        return AssignDoctorToHospitalUseCase(
+            assign_doctor_to_hospital_port=repos.doctor_hospital_repository,
+            get_doctor_by_id_port=repos.doctor_repository,
+            get_hospital_by_id_port=repos.hospital_repository
         )
 
-        self.get_hospital_by_id_usecase = GetHospitalByIdUseCase(
-            get_hospital_by_id_port=self.hospital_repository
+    @usecase
+    def remove_doctor_from_hospital_usecase(self, repos: RepositoryScope) -> RemoveDoctorFromHospitalUseCase:
+        return RemoveDoctorFromHospitalUseCase(
+            remove_doctor_from_hospital_port=repos.doctor_hospital_repository
         )
 
-        self.update_hospital_usecase = UpdateHospitalUseCase(
-            update_hospital_port=self.hospital_repository,
-            get_hospital_by_id_port=self.hospital_repository
+    @read_only_usecase
+    def get_hospitals_by_doctor_usecase(self, repos: RepositoryScope) -> GetHospitalsByDoctorUseCase:
+        return GetHospitalsByDoctorUseCase(
+            get_hospitals_by_doctor_port=repos.doctor_hospital_repository
         )
 
-        self.delete_hospital_usecase = DeleteHospitalUseCase(
-            delete_hospital_port=self.hospital_repository,
-            get_hospital_by_id_port=self.hospital_repository
+    @read_only_usecase
+    def get_doctors_by_hospital_usecase(self, repos: RepositoryScope) -> GetDoctorsByHospitalUseCase:
+        return GetDoctorsByHospitalUseCase(
+            get_doctors_by_hospital_port=repos.doctor_hospital_repository
         )
 
-        # Doctor-Hospital UseCases
-        self.assign_doctor_to_hospital_usecase = AssignDoctorToHospitalUseCase(
-            assign_doctor_to_hospital_port=self.doctor_hospital_repository,
-            get_doctor_by_id_port=self.doctor_repository,
-            get_hospital_by_id_port=self.hospital_repository
+    # Production UseCases
+    @usecase
+    def create_production_usecase(self, repos: RepositoryScope) -> CreateProductionUseCase:
+        return CreateProductionUseCase(
+            save_production_port=repos.production_repository,
+            get_doctor_by_id_port=repos.doctor_repository,
+            get_hospital_by_id_port=repos.hospital_repository
         )
 
-        self.remove_doctor_from_hospital_usecase = RemoveDoctorFromHospitalUseCase(
-            remove_doctor_from_hospital_port=self.doctor_hospital_repository
+    @usecase
+    def bulk_create_productions_usecase(self, repos: RepositoryScope) -> BulkCreateProductionsUseCase:
+        return BulkCreateProductionsUseCase(
+            save_productions_port=repos.production_repository,
+            get_existing_doctor_ids_port=repos.doctor_repository,
+            get_existing_hospital_ids_port=repos.hospital_repository
         )
 
-        self.get_hospitals_by_doctor_usecase = GetHospitalsByDoctorUseCase(
-            get_hospitals_by_doctor_port=self.doctor_hospital_repository
+    @read_only_usecase
+    def get_all_productions_usecase(self, repos: RepositoryScope) -> GetAllProductionsUseCase:
+        return GetAllProductionsUseCase(
+            get_all_productions_port=repos.production_repository
         )
 
-        self.get_doctors_by_hospital_usecase = GetDoctorsByHospitalUseCase(
-            get_doctors_by_hospital_port=self.doctor_hospital_repository
+    @read_only_usecase
+    def get_production_by_id_usecase(self, repos: RepositoryScope) -> GetProductionByIdUseCase:
+        return GetProductionByIdUseCase(
+            get_production_by_id_port=repos.production_repository
         )
 
-        # Production UseCases
-        self.create_production_usecase = CreateProductionUseCase(
-            save_production_port=self.production_repository,
-            get_doctor_by_id_port=self.doctor_repository,
-            get_hospital_by_id_port=self.hospital_repository
+    @read_only_usecase
+    def get_productions_by_doctor_usecase(self, repos: RepositoryScope) -> GetProductionsByDoctorUseCase:
+        return GetProductionsByDoctorUseCase(
+            get_productions_by_doctor_port=repos.production_repository
         )
 
-        self.get_all_productions_usecase = GetAllProductionsUseCase(
-            get_all_productions_port=self.production_repository
+    @read_only_usecase
+    def get_productions_by_hospital_usecase(self, repos: RepositoryScope) -> GetProductionsByHospitalUseCase:
+        return GetProductionsByHospitalUseCase(
+            repository=repos.production_repository
         )
 
-        self.get_production_by_id_usecase = GetProductionByIdUseCase(
-            get_production_by_id_port=self.production_repository
+    @read_only_usecase
+    def export_productions_usecase(self, repos: RepositoryScope) -> ExportProductionsUseCase:
+        return ExportProductionsUseCase(
+            repository=repos.production_repository
         )
 
-        self.get_productions_by_doctor_usecase = GetProductionsByDoctorUseCase(
-            get_productions_by_doctor_port=self.production_repository
+    @usecase
+    def update_production_usecase(self, repos: RepositoryScope) -> UpdateProductionUseCase:
+        return UpdateProductionUseCase(
+            update_production_port=repos.production_repository,
+            get_production_by_id_port=repos.production_repository
         )
 
-        self.get_productions_by_hospital_usecase = GetProductionsByHospitalUseCase(
-            repository=self.production_repository
+    @usecase
+    def delete_production_usecase(self, repos: RepositoryScope) -> DeleteProductionUseCase:
+        return DeleteProductionUseCase(
+            delete_production_port=repos.production_repository,
+            get_production_by_id_port=repos.production_repository
         )
 
-        self.update_production_usecase = UpdateProductionUseCase(
-            update_production_port=self.production_repository,
-            get_production_by_id_port=self.production_repository
+    # Repasse UseCases
+    @usecase
+    def create_repasse_usecase(self, repos: RepositoryScope) -> CreateRepasseUseCase:
+        return CreateRepasseUseCase(
+            repasse_repository=repos.repasse_repository,
+            production_repository=repos.production_repository
         )
 
-        self.delete_production_usecase = DeleteProductionUseCase(
-            delete_production_port=self.production_repository,
-            get_production_by_id_port=self.production_repository
+    @usecase
+    def upsert_repasses_usecase(self, repos: RepositoryScope) -> UpsertRepassesUseCase:
+        return UpsertRepassesUseCase(
+            repasse_repository=repos.repasse_repository,
+            production_repository=repos.production_repository
         )
 
-        # Repasse UseCases
-        self.create_repasse_usecase = CreateRepasseUseCase(
-            repasse_repository=self.repasse_repository,
-            production_repository=self.production_repository
+    @usecase
+    def import_repasses_usecase(self, repos: RepositoryScope) -> ImportRepassesUseCase:
+        return ImportRepassesUseCase(
+            repasse_repository=repos.repasse_repository,
+            production_repository=repos.production_repository
         )
 
-        self.get_all_repasses_usecase = GetAllRepassesUseCase(
-            repasse_repository=self.repasse_repository
+    @read_only_usecase
+    def export_repasses_usecase(self, repos: RepositoryScope) -> ExportRepassesUseCase:
+        return ExportRepassesUseCase(
+            repasse_repository=repos.repasse_repository
         )
 
-        self.get_repasse_by_id_usecase = GetRepasseByIdUseCase(
-            repasse_repository=self.repasse_repository
+    @read_only_usecase
+    def export_repasses_columnar_usecase(self, repos: RepositoryScope) -> ExportRepassesColumnarUseCase:
+        return ExportRepassesColumnarUseCase(
+            production_repository=repos.production_repository,
+            columnar_encoder=self.columnar_encoder
         )
 
-        self.get_repasses_by_production_usecase = GetRepassesByProductionUseCase(
-            repasse_repository=self.repasse_repository
+    @read_only_usecase
+    def get_all_repasses_usecase(self, repos: RepositoryScope) -> GetAllRepassesUseCase:
+        return GetAllRepassesUseCase(
+            repasse_repository=repos.repasse_repository
         )
 
-        self.get_repasses_by_hospital_usecase = GetRepassesByHospitalUseCase(
-            repasse_repository=self.repasse_repository
+    @read_only_usecase
+    def get_repasse_by_id_usecase(self, repos: RepositoryScope) -> GetRepasseByIdUseCase:
+        return GetRepasseByIdUseCase(
+            repasse_repository=repos.repasse_repository
         )
 
-        self.update_repasse_usecase = UpdateRepasseUseCase(
-            repasse_repository=self.repasse_repository
+    @read_only_usecase
+    def get_repasses_by_production_usecase(self, repos: RepositoryScope) -> GetRepassesByProductionUseCase:
+        return GetRepassesByProductionUseCase(
+            repasse_repository=repos.repasse_repository
         )
 
-        self.delete_repasse_usecase = DeleteRepasseUseCase(
-            repasse_repository=self.repasse_repository
+    @read_only_usecase
+    def get_repasses_by_hospital_usecase(self, repos: RepositoryScope) -> GetRepassesByHospitalUseCase:
+        return GetRepassesByHospitalUseCase(
+            repasse_repository=repos.repasse_repository
         )
 
+    @usecase
+    def update_repasse_usecase(self, repos: RepositoryScope) -> UpdateRepasseUseCase:
+        return UpdateRepasseUseCase(
+            repasse_repository=repos.repasse_repository
+        )
+
+    @usecase
+    def delete_repasse_usecase(self, repos: RepositoryScope) -> DeleteRepasseUseCase:
+        return DeleteRepasseUseCase(
+            repasse_repository=repos.repasse_repository
+        )
+
+    @stats_cache_fill_usecase
+    def get_repasse_stats_use_case(self, repos: RepositoryScope) -> GetCachedRepasseStatsUseCase:
+        return GetCachedRepasseStatsUseCase(
+            get_repasse_stats=GetRepasseStatsUseCase(
+                repasse_repository=repos.repasse_repository
+            ),
+            stats_cache=self.stats_cache
+        )
+
+    @read_only_usecase
+    def get_repasse_stats_batch_use_case(self, repos: RepositoryScope) -> GetRepasseStatsBatchUseCase:
+        return GetRepasseStatsBatchUseCase(
+            repasse_repository=repos.repasse_repository,
+            doctor_hospital_repository=repos.doctor_hospital_repository
+        )
+
+    @read_only_usecase
+    def get_repasse_stats_series_use_case(self, repos: RepositoryScope) -> GetRepasseStatsSeriesUseCase:
+        return GetRepasseStatsSeriesUseCase(
+            repasse_repository=repos.repasse_repository
+        )
+
+    @read_only_usecase
+    def get_collection_version_usecase(self, repos: RepositoryScope) -> GetCollectionVersionUseCase:
+        return GetCollectionVersionUseCase(
+            get_collection_version_port=repos.collection_version_repository
+        )
 
-        self.get_repasse_stats_use_case = GetRepasseStatsUseCase(
-            repasse_repository=self.repasse_repository
+    @read_only_usecase
+    def get_item_version_usecase(self, repos: RepositoryScope) -> GetItemVersionUseCase:
+        return GetItemVersionUseCase(
+            get_item_version_port=repos.collection_version_repository
         )
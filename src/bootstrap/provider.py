@@ -1,15 +1,166 @@
-from typing import Callable
-from fastapi import Depends
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Optional, Union
+import anyio
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.infrastructure.database.connection import get_db
+from src.infrastructure.database.connection import (
+    READ_YOUR_WRITES_SECONDS,
+    get_read_session_factory,
+    get_replica_session,
+    get_session,
+    get_session_factory,
+    has_replica,
+)
+from src.infrastructure.database.routing import ReadYourWritesPins
+from src.infrastructure.services.password_service import PASSWORD_HASH_MAX_WORKERS
 from src.bootstrap.container import Container
 
-def usecase_factory(usecase_name: str):
-    def _get_usecase(db: Session = Depends(get_db)) -> Callable:
-        container = Container(db=db)
+# Montado uma vez por processo; cada requisição só liga a sua sessão ao caso de uso pedido
+container = Container()
+
+# Usuários que escreveram há pouco leem do primário (read-your-writes)
+read_your_writes = ReadYourWritesPins(READ_YOUR_WRITES_SECONDS)
+
+# Limite próprio para signin/signup: um pico de logins não consome as threads das demais rotas
+isolated_limiter = anyio.CapacityLimiter(PASSWORD_HASH_MAX_WORKERS)
+
+# Sentinela de fim para AwaitableUseCase.iterate (None pode ser um item válido)
+_EXHAUSTED = object()
+
+
+class AwaitableUseCase:
+    """
+    Adapta um caso de uso síncrono para ser aguardado pelas rotas async.
+
+    - Session (modo sync): o caso de uso roda no threadpool, sem bloquear o event loop.
+    - AsyncSession (modo async): o caso de uso roda via `run_sync`, com o IO do
+      banco aguardado no driver assíncrono (asyncpg) dentro do event loop.
+    """
+
+    def __init__(
+        self,
+        usecase_name: str,
+        db: Union[Session, AsyncSession],
+        on_success: Optional[Callable[[], None]] = None,
+    ):
+        self.usecase_name = usecase_name
+        self.db = db
+        self.on_success = on_success
+
+    def _resolve(self, db: Session) -> Any:
+        return container.resolve(self.usecase_name, db)
+
+    async def _run(self, fn: Callable[[Session], Any]) -> Any:
+        """Roda `fn(sessão síncrona)` fora do event loop, conforme o modo do banco"""
+        if isinstance(self.db, AsyncSession):
+            return await self.db.run_sync(fn)
+        limiter = isolated_limiter if container.is_isolated(self.usecase_name) else None
+        return await anyio.to_thread.run_sync(partial(fn, self.db), limiter=limiter)
+
+    async def execute(self, *args, **kwargs) -> Any:
+        result = await self._run(lambda session: self._resolve(session).execute(*args, **kwargs))
+        if self.on_success is not None:
+            self.on_success()
+        return result
+
+    async def iterate(self, *args, **kwargs) -> AsyncIterator[Any]:
+        """
+        Para casos de uso cujo `execute` retorna um iterador (ex.: cursor no servidor).
+
+        Cada item é puxado com o mesmo `_run` do `execute`, então o IO do banco
+        nunca roda no event loop e o resultado não é materializado de uma vez.
+        """
+        iterator = await self._run(lambda session: iter(self._resolve(session).execute(*args, **kwargs)))
         try:
-            attr =  getattr(container, usecase_name)
-            return attr
-        except AttributeError:
-            raise ValueError(f"Use case '{usecase_name}' not found in container.")
-    return _get_usecase
\ No newline at end of file
+            while True:
+                item = await self._run(lambda session: next(iterator, _EXHAUSTED))
+                if item is _EXHAUSTED:
+                    return
+                yield item
+        finally:
+            # Fecha o cursor mesmo se o cliente desconectou no meio (cancelamento)
+            with anyio.CancelScope(shield=True):
+                await self._run(lambda session: getattr(iterator, "close", lambda: None)())
+
+
+def _pin_after_write(usecase_name: str, request: Optional[Request]) -> Optional[Callable[[], None]]:
+    """Callback que fixa o autor no primário depois de uma escrita bem-sucedida (só com réplica)"""
+    if request is None or not has_replica():
+        return None
+    if container.is_read_only(usecase_name) or container.is_primary_read(usecase_name):
+        return None
+    return lambda: read_your_writes.pin(request)
+
+
+@asynccontextmanager
+async def open_usecase(
+    usecase_name: str,
+    session_factory: Callable[[], Union[Session, AsyncSession]],
+    request: Optional[Request] = None
+) -> AsyncIterator[AwaitableUseCase]:
+    """
+    Caso de uso com sessão própria, aberta e fechada aqui.
+
+    Para respostas em streaming: o gerador do corpo roda depois que a sessão
+    da requisição (dependency com yield) já foi fechada. Escritas feitas por
+    aqui (ex.: importação NDJSON) recebem a requisição para fixar o autor no
+    primário a cada execução concluída, como as rotas de escrita comuns.
+    """
+    if not container.provides(usecase_name):
+        raise ValueError(f"Use case '{usecase_name}' not found in container.")
+
+    db = session_factory()
+    try:
+        yield AwaitableUseCase(usecase_name, db, on_success=_pin_after_write(usecase_name, request))
+    finally:
+        if isinstance(db, AsyncSession):
+            await db.close()
+        else:
+            db.close()
+
+
+def read_session_factory(
+    request: Request,
+    primary: Callable[[], Union[Session, AsyncSession]] = Depends(get_session_factory),
+    replica: Callable[[], Union[Session, AsyncSession]] = Depends(get_read_session_factory),
+) -> Callable[[], Union[Session, AsyncSession]]:
+    """
+    Fábrica de sessões das leituras em streaming (exportações e listagens NDJSON).
+
+    Segue o mesmo roteamento de usecase_factory: a réplica, salvo para quem
+    escreveu há pouco, que lê do primário e vê a própria escrita na exportação.
+    """
+    if read_your_writes.is_pinned(request):
+        return primary
+    return replica
+
+
+def usecase_factory(usecase_name: str):
+    if not container.provides(usecase_name):
+        raise ValueError(f"Use case '{usecase_name}' not found in container.")
+
+    if container.is_read_only(usecase_name):
+        # As sessões só abrem conexão no primeiro uso, então receber as duas não custa um checkout extra
+        def _get_read_usecase(
+            request: Request,
+            db: Union[Session, AsyncSession] = Depends(get_session),
+            replica: Optional[Union[Session, AsyncSession]] = Depends(get_replica_session),
+        ) -> AwaitableUseCase:
+            if replica is None or read_your_writes.is_pinned(request):
+                return AwaitableUseCase(usecase_name, db)
+            return AwaitableUseCase(usecase_name, replica)
+        return _get_read_usecase
+
+    if container.is_primary_read(usecase_name):
+        def _get_primary_read_usecase(db: Union[Session, AsyncSession] = Depends(get_session)) -> AwaitableUseCase:
+            return AwaitableUseCase(usecase_name, db)
+        return _get_primary_read_usecase
+
+    def _get_usecase(
+        request: Request,
+        db: Union[Session, AsyncSession] = Depends(get_session),
+    ) -> AwaitableUseCase:
+        return AwaitableUseCase(usecase_name, db, on_success=_pin_after_write(usecase_name, request))
+    return _get_usecase
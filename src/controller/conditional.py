@@ -0,0 +1,88 @@
+import hashlib
+from typing import Any, Dict
+from uuid import UUID
+from fastapi import Depends, HTTPException, Request, Response
+from src.bootstrap.provider import AwaitableUseCase, usecase_factory
+from src.domain.enums.collection import Collection
+from src.infrastructure.auth.dependencies import get_current_user
+
+# O navegador guarda a resposta, mas sempre revalida com If-None-Match antes de reusá-la
+_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(user_id: UUID, collection: Collection, version: int, request: Request) -> str:
+    """
+    ETag fraco da leitura: versão da coleção do usuário + rota e query string.
+
+    Qualquer escrita na coleção muda a versão e, com ela, o ETag de todas as
+    páginas e itens; leituras diferentes da mesma versão têm ETags diferentes.
+    """
+    raw = f"{user_id}:{collection.value}:{version}:{request.url.path}?{request.url.query}"
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparação fraca (RFC 9110): ignora o prefixo W/ e aceita `*`"""
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def _revalidate(request: Request, response: Response, etag: str) -> None:
+    """304 se o If-None-Match bate com o ETag; senão a resposta sai com ele"""
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def conditional_get(collection: Collection):
+    """
+    Dependency de rota para leituras da coleção.
+
+    Lê só o contador de versão (uma linha, pela chave primária). Se o ETag
+    bater com o If-None-Match, responde 304 antes de a rota consultar as
+    tabelas; senão a resposta sai com o ETag calculado.
+    """
+    async def check(
+        request: Request,
+        response: Response,
+        usecase: AwaitableUseCase = Depends(usecase_factory('get_collection_version_usecase')),
+        current_user: Dict[str, Any] = Depends(get_current_user)
+    ) -> None:
+        user_id = UUID(current_user.get("sub"))
+        version = await usecase.execute(user_id, collection)
+        _revalidate(request, response, make_etag(user_id, collection, version, request))
+
+    return check
+
+
+def conditional_get_item(collection: Collection, id_param: str):
+    """
+    Como conditional_get, para GET /{id}: o ETag vem da versão do dono do registro.
+
+    A busca por ID não filtra por usuário, e uma escrita só incrementa a versão
+    do dono; com a versão de quem lê, outro usuário receberia 304 com o corpo
+    antigo. Registro inexistente: sem ETag, a rota responde 404.
+    """
+    async def check(
+        request: Request,
+        response: Response,
+        usecase: AwaitableUseCase = Depends(usecase_factory('get_item_version_usecase')),
+        current_user: Dict[str, Any] = Depends(get_current_user)
+    ) -> None:
+        try:
+            item_id = UUID(str(request.path_params[id_param]))
+        except ValueError:
+            return
+        owner_version = await usecase.execute(collection, item_id)
+        if owner_version is None:
+            return
+        owner_id, version = owner_version
+        _revalidate(request, response, make_etag(owner_id, collection, version, request))
+
+    return check
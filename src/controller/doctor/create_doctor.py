@@ -9,9 +9,9 @@ class CreateDoctorHandler:
     def __init__(self, create_doctor_usecase: CreateDoctorUseCase):
         self.create_doctor_usecase = create_doctor_usecase
 
-    def handle(self, doctor_data: CreateDoctorDTO, user_id: str):
+    async def handle(self, doctor_data: CreateDoctorDTO, user_id: str):
         try:
-            doctor = self.create_doctor_usecase.execute(doctor_data, uuid.UUID(user_id))
+            doctor = await self.create_doctor_usecase.execute(doctor_data, uuid.UUID(user_id))
             return {
                 "id": str(doctor.id),
                 "user_id": str(doctor.user_id),
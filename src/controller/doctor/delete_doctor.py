@@ -7,9 +7,9 @@ class DeleteDoctorHandler:
     def __init__(self, delete_doctor_usecase: DeleteDoctorUseCase):
         self.delete_doctor_usecase = delete_doctor_usecase
 
-    def handle(self, doctor_id: uuid.UUID):
+    async def handle(self, doctor_id: uuid.UUID):
         try:
-            self.delete_doctor_usecase.execute(doctor_id)
+            await self.delete_doctor_usecase.execute(doctor_id)
             return {"message": "Doctor deleted successfully"}
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
@@ -1,39 +1,39 @@
 from fastapi import HTTPException
 from src.domain.usecase.doctor.get_all_doctors import GetAllDoctorsUseCase
-from src.dto.pagination import PaginatedResponse
+from src.dto.pagination import PaginatedResponse, decode_cursor, next_cursor_for
 from src.dto.doctorDTO import DoctorResponseDTO
 
 
+from typing import Optional
 import uuid
 
 class GetAllDoctorsHandler:
     def __init__(self, get_all_doctors_usecase: GetAllDoctorsUseCase):
         self.get_all_doctors_usecase = get_all_doctors_usecase
 
-    def handle(self, user_id: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[DoctorResponseDTO]:
+    async def handle(self, user_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True) -> PaginatedResponse[DoctorResponseDTO]:
         try:
-            doctors, total = self.get_all_doctors_usecase.execute(skip=skip, limit=limit, user_id=uuid.UUID(user_id))
-            items = [
-                DoctorResponseDTO(
-                    id=str(doctor.id),
-                    user_id=str(doctor.user_id),
-                    name=doctor.name,
-                    crm=doctor.crm,
-                    specialty=doctor.specialty,
-                    phone=doctor.phone,
-                    email=doctor.email,
-                    created_at=doctor.created_at,
-                    updated_at=doctor.updated_at
-                )
-                for doctor in doctors
-            ]
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
 
-            page = (skip // limit) + 1 if limit > 0 else 1
+        try:
+            # Uma linha a mais só para saber se existe próxima página
+            doctors, total = await self.get_all_doctors_usecase.execute(
+                skip=skip, limit=limit + 1, user_id=uuid.UUID(user_id), after=after, include_total=include_total
+            )
+            next_cursor = next_cursor_for(doctors, limit)
+            doctors = doctors[:limit]
+            items = [DoctorResponseDTO.from_row(doctor) for doctor in doctors]
+
+            page = None if after else ((skip // limit) + 1 if limit > 0 else 1)
             return PaginatedResponse.create(
                 items=items,
-                total=total,
+                total=total.value if total is not None else None,
                 page=page,
-                page_size=limit
+                page_size=limit,
+                next_cursor=next_cursor,
+                total_exact=total.exact if total is not None else None
             )
         except Exception as e:
             print(e)
@@ -7,9 +7,9 @@ class GetDoctorByIdHandler:
     def __init__(self, get_doctor_by_id_usecase: GetDoctorByIdUseCase):
         self.get_doctor_by_id_usecase = get_doctor_by_id_usecase
 
-    def handle(self, doctor_id: uuid.UUID):
+    async def handle(self, doctor_id: uuid.UUID):
         try:
-            doctor = self.get_doctor_by_id_usecase.execute(doctor_id)
+            doctor = await self.get_doctor_by_id_usecase.execute(doctor_id)
             return {
                 "id": str(doctor.id),
                 "name": doctor.name,
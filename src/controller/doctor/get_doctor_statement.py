@@ -0,0 +1,52 @@
+from datetime import date
+from typing import Optional
+from fastapi import HTTPException
+import uuid
+from src.domain.usecase.doctor.get_doctor_statement import GetDoctorStatementUseCase
+from src.dto.doctorDTO import DoctorResponseDTO, DoctorStatementDTO, StatementProductionDTO
+from src.dto.repasseDTO import RepasseResponseDTO
+
+
+class GetDoctorStatementHandler:
+    def __init__(self, get_doctor_statement_usecase: GetDoctorStatementUseCase):
+        self.get_doctor_statement_usecase = get_doctor_statement_usecase
+
+    async def handle(self, doctor_id: uuid.UUID, start_date: Optional[date] = None, end_date: Optional[date] = None) -> DoctorStatementDTO:
+        if start_date and end_date and start_date > end_date:
+            raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+
+        try:
+            statement = await self.get_doctor_statement_usecase.execute(doctor_id, start_date, end_date)
+        except ValueError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except Exception as e:
+            print(e)
+            raise HTTPException(status_code=500, detail="Internal server error while fetching doctor statement")
+
+        doctor = statement.doctor
+        return DoctorStatementDTO(
+            doctor=DoctorResponseDTO(
+                id=str(doctor.id),
+                name=doctor.name,
+                crm=doctor.crm,
+                specialty=doctor.specialty,
+                phone=doctor.phone,
+                email=doctor.email,
+                created_at=doctor.created_at,
+                updated_at=doctor.updated_at
+            ),
+            period_start=statement.period_start,
+            period_end=statement.period_end,
+            productions=[
+                StatementProductionDTO.from_row(
+                    item.production,
+                    hospital_name=item.hospital_name,
+                    repasses=[RepasseResponseDTO.from_row(repasse) for repasse in item.repasses]
+                )
+                for item in statement.productions
+            ],
+            total_pending_count=statement.total_pending_count,
+            total_pending_value=statement.total_pending_value,
+            total_consolidated_count=statement.total_consolidated_count,
+            total_consolidated_value=statement.total_consolidated_value
+        )
@@ -8,9 +8,9 @@ class UpdateDoctorHandler:
     def __init__(self, update_doctor_usecase: UpdateDoctorUseCase):
         self.update_doctor_usecase = update_doctor_usecase
 
-    def handle(self, doctor_id: uuid.UUID, doctor_data: UpdateDoctorDTO):
+    async def handle(self, doctor_id: uuid.UUID, doctor_data: UpdateDoctorDTO):
         try:
-            doctor = self.update_doctor_usecase.execute(doctor_id, doctor_data)
+            doctor = await self.update_doctor_usecase.execute(doctor_id, doctor_data)
             return {
                 "id": str(doctor.id),
                 "name": doctor.name,
@@ -1,15 +1,59 @@
+from datetime import datetime
+from typing import Callable, Optional, Union
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 import uuid
+from src.controller.listing import check_period, decode_after, paginated, streamed
 from src.domain.usecase.doctor_hospital.get_doctors_by_hospital import GetDoctorsByHospitalUseCase
+from src.dto.doctorHospitalDTO import HospitalDoctorDTO
+
+
+def _to_dto(doctor: dict) -> HospitalDoctorDTO:
+    return HospitalDoctorDTO(**doctor)
+
+
+def _sort_key(doctor: dict):
+    # Mesma ordem do repositório: data do vínculo, desempate pelo id do médico
+    return doctor["assigned_at"], doctor["id"]
 
 
 class GetDoctorsByHospitalHandler:
-    def __init__(self, get_doctors_by_hospital_usecase: GetDoctorsByHospitalUseCase):
+    def __init__(
+        self,
+        get_doctors_by_hospital_usecase: GetDoctorsByHospitalUseCase,
+        session_factory: Optional[Callable[[], Union[Session, AsyncSession]]] = None
+    ):
         self.get_doctors_by_hospital_usecase = get_doctors_by_hospital_usecase
+        self.session_factory = session_factory
+
+    async def handle(
+        self,
+        hospital_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        stream: bool = False
+    ):
+        check_period(start_date, end_date)
+
+        def fetch(usecase, **page):
+            return usecase.execute(hospital_id, start_date=start_date, end_date=end_date, **page)
+
+        if stream:
+            return streamed(
+                "get_doctors_by_hospital_usecase", self.session_factory, fetch, _to_dto,
+                tuple(HospitalDoctorDTO.model_fields), key=_sort_key
+            )
 
-    def handle(self, hospital_id: uuid.UUID):
+        after = decode_after(cursor)
         try:
-            return self.get_doctors_by_hospital_usecase.execute(hospital_id)
+            return await paginated(
+                self.get_doctors_by_hospital_usecase, fetch, _to_dto, skip, limit, after, include_total, key=_sort_key
+            )
         except Exception as e:
             print(e)
             raise HTTPException(status_code=500, detail="Internal server error while fetching doctors by hospital")
@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+from uuid import UUID
+from fastapi.responses import StreamingResponse
+from src.domain.enums.export_format import ColumnarFormat, ExportFormat
+
+# Linhas lidas do cursor no servidor a cada ida ao banco
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+# Nos formatos colunares cada bloco vira um row group/record batch, então blocos maiores
+COLUMNAR_EXPORT_BATCH_SIZE = int(os.getenv("COLUMNAR_EXPORT_BATCH_SIZE", "10000"))
+
+_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ColumnarFormat.PARQUET: "application/vnd.apache.parquet",
+    ColumnarFormat.ARROW: "application/vnd.apache.arrow.stream",
+}
+
+
+def _plain(value: Any) -> Any:
+    """Valor como aparece na API JSON: enums pelo valor, datas em ISO 8601, UUID e Decimal como texto"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+async def _encode(
+    batches: AsyncIterator[List[Dict[str, Any]]],
+    fields: Sequence[str],
+    export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    if export_format == ExportFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+        yield buffer.getvalue().encode()
+        async for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_plain(row[field]) for field in fields] for row in batch)
+            yield buffer.getvalue().encode()
+        return
+
+    async for batch in batches:
+        yield "".join(
+            json.dumps({field: _plain(row[field]) for field in fields}) + "\n" for row in batch
+        ).encode()
+
+
+def columnar_export_response(
+    content: AsyncIterator[bytes],
+    export_format: ColumnarFormat,
+    filename: str
+) -> StreamingResponse:
+    """Resposta em streaming de um arquivo colunar já codificado pelo caso de uso"""
+    return StreamingResponse(
+        content,
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'}
+    )
+
+
+def export_response(
+    batches: AsyncIterator[List[Dict[str, Any]]],
+    fields: Sequence[str],
+    export_format: ExportFormat,
+    filename: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Resposta em streaming com um bloco codificado por bloco lido do banco.
+    Com `filename`, vai como anexo (Content-Disposition).
+
+    Um erro no meio da exportação interrompe a resposta (o status 200 já foi
+    enviado), então o cliente recebe um corpo incompleto em vez de um arquivo
+    truncado silenciosamente.
+    """
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'} if filename else None
+    return StreamingResponse(
+        _encode(batches, fields, export_format),
+        media_type=_MEDIA_TYPES[export_format],
+        headers=headers
+    )
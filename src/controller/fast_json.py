@@ -0,0 +1,31 @@
+from typing import Optional
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class ModelJSONResponse(Response):
+    """Resposta JSON de um modelo pydantic já montado, serializada direto para bytes pelo pydantic-core"""
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+def fast_json(content: BaseModel, response: Optional[Response] = None, status_code: int = 200) -> ModelJSONResponse:
+    """
+    Caminho rápido, opcional por rota, para respostas grandes (listagens).
+
+    Quando a rota retorna o modelo, o FastAPI o converte em dict, valida de novo
+    contra o `response_model` e codifica com o `json` da biblioteca padrão. Aqui
+    os DTOs, já validados ao serem montados pelo controller, vão direto para
+    bytes. O `response_model` da rota continua valendo para a documentação.
+
+    `response` é o Response injetado na rota: os cabeçalhos que as dependencies
+    puseram nele (ex.: ETag do conditional_get) são copiados, como o FastAPI faz
+    no caminho padrão.
+    """
+    fast = ModelJSONResponse(content, status_code=status_code)
+    if response is not None:
+        fast.headers.raw.extend(response.headers.raw)
+    return fast
@@ -9,9 +9,9 @@ class CreateHospitalHandler:
     def __init__(self, create_hospital_usecase: CreateHospitalUseCase):
         self.create_hospital_usecase = create_hospital_usecase
 
-    def handle(self, hospital_data: CreateHospitalDTO, user_id: str):
+    async def handle(self, hospital_data: CreateHospitalDTO, user_id: str):
         try:
-            hospital = self.create_hospital_usecase.execute(hospital_data, uuid.UUID(user_id))
+            hospital = await self.create_hospital_usecase.execute(hospital_data, uuid.UUID(user_id))
             return {
                 "id": str(hospital.id),
                 "name": hospital.name,
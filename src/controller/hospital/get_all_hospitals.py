@@ -1,35 +1,39 @@
 from fastapi import HTTPException
 from src.domain.usecase.hospital.get_all_hospitals import GetAllHospitalsUseCase
-from src.dto.pagination import PaginatedResponse
+from src.dto.pagination import PaginatedResponse, decode_cursor, next_cursor_for
 from src.dto.hospitalDTO import HospitalResponseDTO
 
 
+from typing import Optional
 import uuid
 
 class GetAllHospitalsHandler:
     def __init__(self, get_all_hospitals_usecase: GetAllHospitalsUseCase):
         self.get_all_hospitals_usecase = get_all_hospitals_usecase
 
-    def handle(self, user_id: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[HospitalResponseDTO]:
+    async def handle(self, user_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True) -> PaginatedResponse[HospitalResponseDTO]:
         try:
-            hospitals, total = self.get_all_hospitals_usecase.execute(skip=skip, limit=limit, user_id=uuid.UUID(user_id))
-            items = [
-                HospitalResponseDTO(
-                    id=str(hospital.id),
-                    name=hospital.name,
-                    address=hospital.address,
-                    created_at=hospital.created_at,
-                    updated_at=hospital.updated_at
-                )
-                for hospital in hospitals
-            ]
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
 
-            page = (skip // limit) + 1 if limit > 0 else 1
+        try:
+            # Uma linha a mais só para saber se existe próxima página
+            hospitals, total = await self.get_all_hospitals_usecase.execute(
+                skip=skip, limit=limit + 1, user_id=uuid.UUID(user_id), after=after, include_total=include_total
+            )
+            next_cursor = next_cursor_for(hospitals, limit)
+            hospitals = hospitals[:limit]
+            items = [HospitalResponseDTO.from_row(hospital) for hospital in hospitals]
+
+            page = None if after else ((skip // limit) + 1 if limit > 0 else 1)
             return PaginatedResponse.create(
                 items=items,
-                total=total,
+                total=total.value if total is not None else None,
                 page=page,
-                page_size=limit
+                page_size=limit,
+                next_cursor=next_cursor,
+                total_exact=total.exact if total is not None else None
             )
         except Exception as e:
             print(e)
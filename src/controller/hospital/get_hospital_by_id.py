@@ -7,9 +7,9 @@ class GetHospitalByIdHandler:
     def __init__(self, get_hospital_by_id_usecase: GetHospitalByIdUseCase):
         self.get_hospital_by_id_usecase = get_hospital_by_id_usecase
 
-    def handle(self, hospital_id: uuid.UUID):
+    async def handle(self, hospital_id: uuid.UUID):
         try:
-            hospital = self.get_hospital_by_id_usecase.execute(hospital_id)
+            hospital = await self.get_hospital_by_id_usecase.execute(hospital_id)
             return {
                 "id": str(hospital.id),
                 "name": hospital.name,
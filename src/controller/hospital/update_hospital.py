@@ -8,9 +8,9 @@ class UpdateHospitalHandler:
     def __init__(self, update_hospital_usecase: UpdateHospitalUseCase):
         self.update_hospital_usecase = update_hospital_usecase
 
-    def handle(self, hospital_id: uuid.UUID, hospital_data: UpdateHospitalDTO):
+    async def handle(self, hospital_id: uuid.UUID, hospital_data: UpdateHospitalDTO):
         try:
-            hospital = self.update_hospital_usecase.execute(hospital_id, hospital_data)
+            hospital = await self.update_hospital_usecase.execute(hospital_id, hospital_data)
             return {
                 "id": str(hospital.id),
                 "name": hospital.name,
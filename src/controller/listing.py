@@ -0,0 +1,97 @@
+import os
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.bootstrap.provider import AwaitableUseCase, open_usecase
+from src.controller.export import export_response
+from src.controller.fast_json import ModelJSONResponse, fast_json
+from src.domain.entities.TotalCount import TotalCount
+from src.domain.enums.export_format import ExportFormat
+from src.dto.pagination import PaginatedResponse, decode_cursor, next_cursor_for
+
+# Itens lidos por consulta no modo streaming das listagens
+LIST_STREAM_PAGE_SIZE = int(os.getenv("LIST_STREAM_PAGE_SIZE", "500"))
+
+# Página de uma listagem: fetch(usecase, skip=, limit=, after=, include_total=) -> (linhas, total)
+PageFetcher = Callable[..., Awaitable[Tuple[List[Any], Optional[TotalCount]]]]
+SortKey = Callable[[Any], Tuple[Union[str, datetime], Union[str, UUID]]]
+
+
+def _sort_key(row: Any) -> Tuple[Union[str, datetime], Union[str, UUID]]:
+    return row.created_at, row.id
+
+
+def check_period(start_date: Optional[Union[date, datetime]], end_date: Optional[Union[date, datetime]]) -> None:
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+
+
+def decode_after(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    """Posição keyset do cursor recebido na query string (400 se inválido)"""
+    try:
+        return decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+async def paginated(
+    usecase: AwaitableUseCase,
+    fetch: PageFetcher,
+    to_item: Callable[[Any], BaseModel],
+    skip: int,
+    limit: int,
+    after: Optional[Tuple[datetime, UUID]],
+    include_total: bool,
+    key: SortKey = _sort_key
+) -> ModelJSONResponse:
+    """Uma página no mesmo contrato das listagens get_all (page/cursor/include_total), pelo caminho rápido de JSON"""
+    # Uma linha a mais só para saber se existe próxima página
+    rows, total = await fetch(usecase, skip=skip, limit=limit + 1, after=after, include_total=include_total)
+    next_cursor = next_cursor_for(rows, limit, key)
+
+    page = None if after else ((skip // limit) + 1 if limit > 0 else 1)
+    return fast_json(PaginatedResponse.create(
+        items=[to_item(row) for row in rows[:limit]],
+        total=total.value if total is not None else None,
+        page=page,
+        page_size=limit,
+        next_cursor=next_cursor,
+        total_exact=total.exact if total is not None else None
+    ))
+
+
+def streamed(
+    usecase_name: str,
+    session_factory: Callable[[], Union[Session, AsyncSession]],
+    fetch: PageFetcher,
+    to_item: Callable[[Any], BaseModel],
+    fields: Sequence[str],
+    key: SortKey = _sort_key,
+    page_size: Optional[int] = None
+) -> StreamingResponse:
+    """
+    A listagem inteira em NDJSON, lida página a página pelo cursor keyset.
+
+    Cada página é uma consulta curta e limitada (nada de transação longa nem
+    cursor aberto no servidor), e só uma página fica em memória por vez.
+    """
+    page_size = page_size or LIST_STREAM_PAGE_SIZE
+
+    async def batches():
+        async with open_usecase(usecase_name, session_factory) as usecase:
+            after = None
+            while True:
+                rows, _ = await fetch(usecase, skip=0, limit=page_size + 1, after=after, include_total=False)
+                if rows:
+                    yield [to_item(row).model_dump(mode="json") for row in rows[:page_size]]
+                next_cursor = next_cursor_for(rows, page_size, key)
+                if next_cursor is None:
+                    return
+                after = decode_cursor(next_cursor)
+
+    return export_response(batches(), fields, ExportFormat.NDJSON)
@@ -7,10 +7,10 @@ class SignUpHandler:
     def __init__ (self, sign_up_usecase: SignUpUseCase):
         self.sign_up_usecase = sign_up_usecase
 
-    def handle(self, user_data: CreateUserDTO):
+    async def handle(self, user_data: CreateUserDTO):
         """Handler para cadastro de novos usuários"""
         try:
-            self.sign_up_usecase.execute(user_data)
+            await self.sign_up_usecase.execute(user_data)
             return {
                 "message": "Usuário cadastrado com sucesso!",
                 "email": user_data.email
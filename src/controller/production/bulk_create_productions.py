@@ -0,0 +1,17 @@
+from fastapi import HTTPException
+from src.dto.productionDTO import BulkCreateProductionDTO, BulkCreateProductionResponseDTO
+from src.domain.usecase.production.bulk_create_productions import BulkCreateProductionsUseCase
+
+
+import uuid
+
+class BulkCreateProductionsHandler:
+    def __init__(self, bulk_create_productions_usecase: BulkCreateProductionsUseCase):
+        self.bulk_create_productions_usecase = bulk_create_productions_usecase
+
+    async def handle(self, data: BulkCreateProductionDTO, user_id: str) -> BulkCreateProductionResponseDTO:
+        try:
+            return await self.bulk_create_productions_usecase.execute(data.items, uuid.UUID(user_id))
+        except Exception as e:
+            print(e)
+            raise HTTPException(status_code=500, detail="Internal server error while creating productions")
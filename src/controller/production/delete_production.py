@@ -7,9 +7,9 @@ class DeleteProductionHandler:
     def __init__(self, delete_production_usecase: DeleteProductionUseCase):
         self.delete_production_usecase = delete_production_usecase
 
-    def handle(self, production_id: uuid.UUID):
+    async def handle(self, production_id: uuid.UUID):
         try:
-            self.delete_production_usecase.execute(production_id)
+            await self.delete_production_usecase.execute(production_id)
             return {"message": "Production deleted successfully"}
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
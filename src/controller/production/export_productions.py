@@ -0,0 +1,32 @@
+import uuid
+from datetime import date
+from typing import Callable, Optional, Union
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.bootstrap.provider import open_usecase
+from src.controller.export import EXPORT_BATCH_SIZE, export_response
+from src.domain.enums.export_format import ExportFormat
+from src.dto.productionDTO import ProductionResponseDTO
+
+
+class ExportProductionsHandler:
+    def __init__(self, session_factory: Callable[[], Union[Session, AsyncSession]]):
+        # A exportação abre a própria sessão: o corpo em streaming roda depois que a da requisição fechou
+        self.session_factory = session_factory
+
+    async def handle(
+        self,
+        user_id: str,
+        export_format: ExportFormat,
+        doctor_id: Optional[uuid.UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> StreamingResponse:
+        async def batches():
+            async with open_usecase("export_productions_usecase", self.session_factory) as usecase:
+                async for batch in usecase.iterate(uuid.UUID(user_id), doctor_id, start_date, end_date, batch_size):
+                    yield batch
+
+        return export_response(batches(), tuple(ProductionResponseDTO.model_fields), export_format, "productions")
@@ -1,38 +1,39 @@
 from fastapi import HTTPException
 from src.domain.usecase.production.get_all_productions import GetAllProductionsUseCase
-from src.dto.pagination import PaginatedResponse
+from src.dto.pagination import PaginatedResponse, decode_cursor, next_cursor_for
 from src.dto.productionDTO import ProductionResponseDTO
 
 
+from typing import Optional
 import uuid
 
 class GetAllProductionsHandler:
     def __init__(self, get_all_productions_usecase: GetAllProductionsUseCase):
         self.get_all_productions_usecase = get_all_productions_usecase
 
-    def handle(self, user_id: str, skip: int = 0, limit: int = 100) -> PaginatedResponse[ProductionResponseDTO]:
+    async def handle(self, user_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, include_total: bool = True) -> PaginatedResponse[ProductionResponseDTO]:
         try:
-            productions, total = self.get_all_productions_usecase.execute(skip=skip, limit=limit, user_id=uuid.UUID(user_id))
-            items = [
-                ProductionResponseDTO(
-                    id=str(production.id),
-                    doctor_id=str(production.doctor_id),
-                    hospital_id=str(production.hospital_id),
-                    type=production.type,
-                    date=production.date.isoformat(),
-                    description=production.description,
-                    created_at=production.created_at,
-                    updated_at=production.updated_at
-                )
-                for production in productions
-            ]
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
 
-            page = (skip // limit) + 1 if limit > 0 else 1
+        try:
+            # Uma linha a mais só para saber se existe próxima página
+            productions, total = await self.get_all_productions_usecase.execute(
+                skip=skip, limit=limit + 1, user_id=uuid.UUID(user_id), after=after, include_total=include_total
+            )
+            next_cursor = next_cursor_for(productions, limit)
+            productions = productions[:limit]
+            items = [ProductionResponseDTO.from_row(production) for production in productions]
+
+            page = None if after else ((skip // limit) + 1 if limit > 0 else 1)
             return PaginatedResponse.create(
                 items=items,
-                total=total,
+                total=total.value if total is not None else None,
                 page=page,
-                page_size=limit
+                page_size=limit,
+                next_cursor=next_cursor,
+                total_exact=total.exact if total is not None else None
             )
         except Exception as e:
             print(e)
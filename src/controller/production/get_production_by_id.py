@@ -7,9 +7,9 @@ class GetProductionByIdHandler:
     def __init__(self, get_production_by_id_usecase: GetProductionByIdUseCase):
         self.get_production_by_id_usecase = get_production_by_id_usecase
 
-    def handle(self, production_id: uuid.UUID):
+    async def handle(self, production_id: uuid.UUID):
         try:
-            production = self.get_production_by_id_usecase.execute(production_id)
+            production = await self.get_production_by_id_usecase.execute(production_id)
             return {
                 "id": str(production.id),
                 "doctor_id": str(production.doctor_id),
@@ -1,26 +1,49 @@
+from datetime import date
+from typing import Callable, Optional, Union
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 import uuid
+from src.controller.listing import check_period, decode_after, paginated, streamed
 from src.domain.usecase.production.get_productions_by_hospital import GetProductionsByHospitalUseCase
+from src.dto.productionDTO import ProductionResponseDTO
+
 
 class GetProductionsByHospitalHandler:
-    def __init__(self, usecase: GetProductionsByHospitalUseCase):
+    def __init__(
+        self,
+        usecase: GetProductionsByHospitalUseCase,
+        session_factory: Optional[Callable[[], Union[Session, AsyncSession]]] = None
+    ):
         self.usecase = usecase
+        self.session_factory = session_factory
+
+    async def handle(
+        self,
+        hospital_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        stream: bool = False
+    ):
+        check_period(start_date, end_date)
+
+        def fetch(usecase, **page):
+            return usecase.execute(hospital_id, start_date=start_date, end_date=end_date, **page)
+
+        if stream:
+            # O corpo em streaming roda depois que a sessão da requisição fechou, então abre a sua
+            return streamed(
+                "get_productions_by_hospital_usecase", self.session_factory, fetch, ProductionResponseDTO.from_row,
+                tuple(ProductionResponseDTO.model_fields)
+            )
 
-    def handle(self, hospital_id: uuid.UUID):
+        after = decode_after(cursor)
         try:
-            productions = self.usecase.execute(hospital_id)
-            return [
-                {
-                    "id": str(production.id),
-                    "doctor_id": str(production.doctor_id),
-                    "hospital_id": str(production.hospital_id),
-                    "type": production.type,
-                    "date": production.date.isoformat() if hasattr(production.date, 'isoformat') else str(production.date),
-                    "description": production.description,
-                    "created_at": production.created_at,
-                    "updated_at": production.updated_at
-                }
-                for production in productions
-            ]
+            return await paginated(self.usecase, fetch, ProductionResponseDTO.from_row, skip, limit, after, include_total)
         except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+            print(e)
+            raise HTTPException(status_code=500, detail="Internal server error while fetching productions by hospital")
@@ -8,9 +8,9 @@ class UpdateProductionHandler:
     def __init__(self, update_production_usecase: UpdateProductionUseCase):
         self.update_production_usecase = update_production_usecase
 
-    def handle(self, production_id: uuid.UUID, production_data: UpdateProductionDTO):
+    async def handle(self, production_id: uuid.UUID, production_data: UpdateProductionDTO):
         try:
-            production = self.update_production_usecase.execute(production_id, production_data)
+            production = await self.update_production_usecase.execute(production_id, production_data)
             return {
                 "id": str(production.id),
                 "doctor_id": str(production.doctor_id),
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Callable, Optional, Union
+from uuid import UUID
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.bootstrap.provider import open_usecase
+from src.controller.export import EXPORT_BATCH_SIZE, export_response
+from src.domain.enums.export_format import ExportFormat
+from src.dto.repasseDTO import RepasseResponseDTO
+
+
+async def export_repasses_controller(
+    user_id: UUID,
+    session_factory: Callable[[], Union[Session, AsyncSession]],
+    export_format: ExportFormat,
+    doctor_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> StreamingResponse:
+    # A exportação abre a própria sessão: o corpo em streaming roda depois que a da requisição fechou
+    async def batches():
+        async with open_usecase("export_repasses_usecase", session_factory) as usecase:
+            async for batch in usecase.iterate(user_id, doctor_id, start_date, end_date, batch_size):
+                yield batch
+
+    return export_response(batches(), tuple(RepasseResponseDTO.model_fields), export_format, "repasses")
@@ -0,0 +1,31 @@
+from datetime import date
+from typing import Callable, Optional, Union
+from uuid import UUID
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.bootstrap.provider import container, open_usecase
+from src.controller.export import COLUMNAR_EXPORT_BATCH_SIZE, columnar_export_response
+from src.domain.enums.export_format import ColumnarFormat
+
+
+async def export_repasses_columnar_controller(
+    user_id: UUID,
+    session_factory: Callable[[], Union[Session, AsyncSession]],
+    export_format: ColumnarFormat,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    batch_size: int = COLUMNAR_EXPORT_BATCH_SIZE
+) -> StreamingResponse:
+    # Verificado antes de abrir o streaming, enquanto ainda dá para responder com outro status
+    if not container.columnar_encoder.is_available():
+        raise HTTPException(status_code=501, detail="Columnar export requires pyarrow, which is not installed")
+
+    async def content():
+        async with open_usecase("export_repasses_columnar_usecase", session_factory) as usecase:
+            async for chunk in usecase.iterate(user_id, export_format, start_date, end_date, batch_size):
+                if chunk:
+                    yield chunk
+
+    return columnar_export_response(content(), export_format, "repasses")
@@ -1,23 +1,38 @@
+from typing import Optional
 from uuid import UUID
+from fastapi import HTTPException
 from src.dto.repasseDTO import RepasseResponseDTO
-from src.dto.pagination import PaginatedResponse
+from src.dto.pagination import PaginatedResponse, decode_cursor, next_cursor_for
 from src.domain.usecase.repasse.get_all_repasses import GetAllRepassesUseCase
 
 
-def get_all_repasses_controller(
+async def get_all_repasses_controller(
     usecase: GetAllRepassesUseCase,
     user_id: UUID,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True
 ) -> PaginatedResponse[RepasseResponseDTO]:
-    repasses, total = usecase.execute(skip=skip, limit=limit, user_id=user_id)
-    items = [RepasseResponseDTO.model_validate(repasse) for repasse in repasses]
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
 
-    page = (skip // limit) + 1 if limit > 0 else 1
+    # Uma linha a mais só para saber se existe próxima página
+    repasses, total = await usecase.execute(
+        skip=skip, limit=limit + 1, user_id=user_id, after=after, include_total=include_total
+    )
+    next_cursor = next_cursor_for(repasses, limit)
+    items = [RepasseResponseDTO.from_row(repasse) for repasse in repasses[:limit]]
+
+    page = None if after else ((skip // limit) + 1 if limit > 0 else 1)
 
     return PaginatedResponse.create(
         items=items,
-        total=total,
+        total=total.value if total is not None else None,
         page=page,
-        page_size=limit
+        page_size=limit,
+        next_cursor=next_cursor,
+        total_exact=total.exact if total is not None else None
     )
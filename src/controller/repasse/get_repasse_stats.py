@@ -1,18 +1,49 @@
-from typing import Optional
+from typing import Callable, Optional, Set, Tuple, Union
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query, status
-from src.bootstrap.provider import usecase_factory
-from src.domain.usecase.repasse.get_repasse_stats import GetRepasseStatsUseCase
+from fastapi import BackgroundTasks, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.bootstrap.provider import AwaitableUseCase, open_usecase, usecase_factory
 from src.dto.repasseDTO import RepasseStatsDTO
 from src.infrastructure.auth.dependencies import get_current_user
+from src.infrastructure.database.connection import get_session_factory
 
+# Recálculos em segundo plano em andamento neste processo (um por chave)
+_refreshing: Set[Tuple[UUID, UUID, Optional[datetime], Optional[datetime]]] = set()
 
-def get_repasse_stats(
+
+async def refresh_repasse_stats(
+    session_factory: Callable[[], Union[Session, AsyncSession]],
+    user_id: UUID,
+    doctor_id: UUID,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime]
+) -> None:
+    """Recalcula e regrava no cache uma entrada vencida, com sessão própria (roda depois da resposta)"""
+    key = (user_id, doctor_id, start_date, end_date)
+    if key in _refreshing:
+        return
+    _refreshing.add(key)
+    try:
+        async with open_usecase("get_repasse_stats_use_case", session_factory) as usecase:
+            await usecase.execute(user_id, doctor_id, start_date, end_date, refresh=True)
+    finally:
+        _refreshing.discard(key)
+
+
+async def get_repasse_stats(
     doctor_id: UUID,
+    background_tasks: BackgroundTasks,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    use_case: GetRepasseStatsUseCase = Depends(usecase_factory("get_repasse_stats_use_case")),
+    use_case: AwaitableUseCase = Depends(usecase_factory("get_repasse_stats_use_case")),
+    session_factory=Depends(get_session_factory),
     current_user: dict = Depends(get_current_user)
 ) -> RepasseStatsDTO:
-    return use_case.execute(doctor_id, start_date, end_date)
+    user_id = UUID(current_user.get("sub"))
+    stats, stale = await use_case.execute(user_id, doctor_id, start_date, end_date)
+    if stale:
+        # stale-while-revalidate: responde com o valor vencido e recalcula depois da resposta
+        background_tasks.add_task(refresh_repasse_stats, session_factory, user_id, doctor_id, start_date, end_date)
+    return stats
@@ -0,0 +1,13 @@
+from fastapi import Depends
+from src.bootstrap.provider import usecase_factory
+from src.domain.usecase.repasse.get_repasse_stats_batch import GetRepasseStatsBatchUseCase
+from src.dto.repasseDTO import RepasseStatsBatchDTO, RepasseStatsBatchRequestDTO
+from src.infrastructure.auth.dependencies import get_current_user
+
+
+async def get_repasse_stats_batch(
+    data: RepasseStatsBatchRequestDTO,
+    use_case: GetRepasseStatsBatchUseCase = Depends(usecase_factory("get_repasse_stats_batch_use_case")),
+    current_user: dict = Depends(get_current_user)
+) -> RepasseStatsBatchDTO:
+    return await use_case.execute(data.doctor_ids, data.hospital_id, data.start_date, data.end_date)
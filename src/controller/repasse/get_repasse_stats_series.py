@@ -0,0 +1,21 @@
+from typing import List, Optional
+from uuid import UUID
+from datetime import datetime
+from fastapi import Depends, Query
+from src.bootstrap.provider import usecase_factory
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+from src.domain.usecase.repasse.get_repasse_stats_series import GetRepasseStatsSeriesUseCase
+from src.dto.repasseDTO import RepasseStatsSeriesDTO
+from src.infrastructure.auth.dependencies import get_current_user
+
+
+async def get_repasse_stats_series(
+    doctor_id: UUID,
+    granularity: SeriesGranularity = Query(SeriesGranularity.MONTH, description="Bucket size"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    group_by: List[SeriesDimension] = Query([], description="Breakdown dimensions (repeatable)"),
+    use_case: GetRepasseStatsSeriesUseCase = Depends(usecase_factory("get_repasse_stats_series_use_case")),
+    current_user: dict = Depends(get_current_user)
+) -> RepasseStatsSeriesDTO:
+    return await use_case.execute(doctor_id, granularity, start_date, end_date, group_by)
@@ -1,9 +1,34 @@
-from typing import List
+from datetime import datetime
+from typing import Callable, Optional, Union
 from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.controller.listing import check_period, decode_after, paginated, streamed
 from src.dto.repasseDTO import RepasseResponseDTO
 from src.domain.usecase.repasse.get_repasses_by_production import GetRepassesByProductionUseCase
 
 
-def get_repasses_by_production_controller(production_id: UUID, usecase: GetRepassesByProductionUseCase) -> List[RepasseResponseDTO]:
-    repasses = usecase.execute(production_id)
-    return [RepasseResponseDTO.model_validate(repasse) for repasse in repasses]
+async def get_repasses_by_production_controller(
+    production_id: UUID,
+    usecase: GetRepassesByProductionUseCase,
+    session_factory: Callable[[], Union[Session, AsyncSession]],
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    stream: bool = False
+):
+    check_period(start_date, end_date)
+
+    def fetch(usecase, **page):
+        return usecase.execute(production_id, start_date=start_date, end_date=end_date, **page)
+
+    if stream:
+        return streamed(
+            "get_repasses_by_production_usecase", session_factory, fetch, RepasseResponseDTO.from_row,
+            tuple(RepasseResponseDTO.model_fields)
+        )
+    after = decode_after(cursor)
+    return await paginated(usecase, fetch, RepasseResponseDTO.from_row, skip, limit, after, include_total)
@@ -0,0 +1,125 @@
+import json
+import os
+from typing import AsyncIterator, Callable, List, Optional, Tuple, Union
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.requests import ClientDisconnect, Request
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+from src.bootstrap.provider import open_usecase
+
+# Linhas por commit e tamanho máximo de uma linha: limitam a memória da importação
+IMPORT_CHUNK_SIZE = int(os.getenv("REPASSE_IMPORT_CHUNK_SIZE", "1000"))
+IMPORT_MAX_LINE_BYTES = int(os.getenv("REPASSE_IMPORT_MAX_LINE_BYTES", "65536"))
+
+
+class BodyStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse cujo gerador ainda lê o corpo da requisição.
+
+    A StreamingResponse padrão escuta `receive` em paralelo para detectar
+    desconexão, o que disputaria as mensagens do corpo com o gerador. Aqui só
+    o gerador lê; uma desconexão aparece como ClientDisconnect na leitura.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = IMPORT_MAX_LINE_BYTES
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Separa o corpo em linhas sem acumulá-lo: guarda no máximo uma linha parcial.
+
+    Produz (número da linha, conteúdo); linhas em branco são puladas e linhas
+    maiores que `max_line_bytes` saem com conteúdo None e são descartadas.
+    """
+    buffer = b""
+    number = 0
+    oversized = False
+    async for chunk in chunks:
+        buffer += chunk
+        # Percorre o bloco por deslocamento e corta o resto uma vez só, em vez
+        # de copiar o restante do buffer a cada linha
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line = buffer[start:end]
+            start = end + 1
+            number += 1
+            if oversized or len(line) > max_line_bytes:
+                oversized = False
+                yield number, None
+            elif line.strip():
+                yield number, line
+        buffer = buffer[start:]
+        if len(buffer) > max_line_bytes:
+            oversized = True
+            buffer = b""
+    number += 1
+    if oversized:
+        yield number, None
+    elif buffer.strip():
+        yield number, buffer
+
+
+def _event(**fields) -> bytes:
+    return (json.dumps(fields) + "\n").encode()
+
+
+async def import_repasses_controller(
+    body: AsyncIterator[bytes],
+    user_id: UUID,
+    session_factory: Callable[[], Union[Session, AsyncSession]],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    request: Optional[Request] = None
+) -> BodyStreamingResponse:
+    async def report() -> AsyncIterator[bytes]:
+        lines = imported = failed = 0
+        # Com a requisição, cada bloco gravado fixa o autor no primário (read-your-writes)
+        async with open_usecase("import_repasses_usecase", session_factory, request) as usecase:
+            chunk: List[Tuple[int, bytes]] = []
+
+            async def flush():
+                nonlocal imported, failed
+                result = await usecase.execute(chunk, user_id)
+                chunk.clear()
+                imported += result.imported
+                failed += len(result.errors)
+                for error in result.errors:
+                    yield _event(event="error", line=error.line, detail=error.detail)
+                yield _event(event="progress", lines=lines, imported=imported, failed=failed)
+
+            try:
+                async for number, line in iter_ndjson_lines(body):
+                    lines = number
+                    if line is None:
+                        failed += 1
+                        yield _event(event="error", line=number, detail=f"Line longer than {IMPORT_MAX_LINE_BYTES} bytes")
+                        continue
+                    chunk.append((number, line))
+                    if len(chunk) >= chunk_size:
+                        async for event in flush():
+                            yield event
+                if chunk:
+                    async for event in flush():
+                        yield event
+            except ClientDisconnect:
+                return
+            except Exception as e:
+                print(e)
+                # Blocos anteriores já foram gravados; o relatório diz até onde chegou
+                yield _event(event="aborted", lines=lines, imported=imported, failed=failed,
+                             detail="Internal server error while importing repasses")
+                return
+
+        yield _event(event="done", lines=lines, imported=imported, failed=failed)
+
+    return BodyStreamingResponse(report(), media_type="application/x-ndjson")
@@ -3,6 +3,6 @@ from src.dto.repasseDTO import UpdateRepasseDTO, RepasseResponseDTO
 from src.domain.usecase.repasse.update_repasse import UpdateRepasseUseCase
 
 
-def update_repasse_controller(repasse_id: UUID, data: UpdateRepasseDTO, usecase: UpdateRepasseUseCase) -> RepasseResponseDTO:
-    repasse = usecase.execute(repasse_id, data)
+async def update_repasse_controller(repasse_id: UUID, data: UpdateRepasseDTO, usecase: UpdateRepasseUseCase) -> RepasseResponseDTO:
+    repasse = await usecase.execute(repasse_id, data)
     return RepasseResponseDTO.model_validate(repasse)
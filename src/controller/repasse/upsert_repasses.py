@@ -0,0 +1,20 @@
+from uuid import UUID
+from fastapi import HTTPException
+from src.dto.repasseDTO import (
+    BulkUpsertRepasseDTO,
+    BulkUpsertRepasseResponseDTO,
+    UpsertRepasseDTO,
+    UpsertRepasseResponseDTO,
+)
+from src.domain.usecase.repasse.upsert_repasses import UpsertRepassesUseCase
+
+
+async def upsert_repasse_controller(data: UpsertRepasseDTO, user_id: UUID, usecase: UpsertRepassesUseCase) -> UpsertRepasseResponseDTO:
+    result = await usecase.execute([data], user_id)
+    if result.errors:
+        raise HTTPException(status_code=404, detail=result.errors[0].detail)
+    return UpsertRepasseResponseDTO(id=result.ids[0], created=result.created == 1)
+
+
+async def bulk_upsert_repasses_controller(data: BulkUpsertRepasseDTO, user_id: UUID, usecase: UpsertRepassesUseCase) -> BulkUpsertRepasseResponseDTO:
+    return await usecase.execute(data.items, user_id)
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from src.dto.repasseDTO import RepasseStatsDTO
+
+
+class CachedStats(BaseModel):
+    """Estatísticas lidas do cache; stale=True quando já passaram do TTL e devem ser recalculadas"""
+    stats: RepasseStatsDTO
+    stale: bool = False
@@ -0,0 +1,28 @@
+from datetime import date
+from decimal import Decimal
+from typing import List
+from pydantic import BaseModel, ConfigDict
+from src.domain.entities.Doctor import Doctor
+from src.domain.entities.ReadModels import ProductionRow
+from src.domain.entities.Repasse import Repasse
+
+
+class StatementProduction(BaseModel):
+    """Produção do extrato com o nome do hospital e os seus repasses"""
+    production: ProductionRow
+    hospital_name: str
+    repasses: List[Repasse]
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class DoctorStatement(BaseModel):
+    """Extrato de um médico no período: produções, repasses e totais por status"""
+    doctor: Doctor
+    period_start: date | None = None
+    period_end: date | None = None
+    productions: List[StatementProduction]
+    total_pending_count: int = 0
+    total_pending_value: Decimal = Decimal(0)
+    total_consolidated_count: int = 0
+    total_consolidated_value: Decimal = Decimal(0)
@@ -0,0 +1,106 @@
+import uuid
+from datetime import date, datetime
+from typing import Optional
+
+
+class ReadModel:
+    """
+    Base dos modelos de leitura: objetos com `__slots__`, montados direto das
+    linhas do banco nas listagens.
+
+    Ao contrário das entidades pydantic, não validam campo a campo (os dados
+    vêm do próprio banco) e mantêm os tipos nativos (UUID, datetime, date) até
+    a resposta, sem passar por texto. Sem `__dict__`, ocupam bem menos memória
+    por linha em resultados grandes.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class DoctorRow(ReadModel):
+    """Médico lido para listagens"""
+
+    __slots__ = ("id", "user_id", "name", "crm", "specialty", "phone", "email", "created_at", "updated_at")
+
+    def __init__(
+        self,
+        id: uuid.UUID,
+        user_id: uuid.UUID,
+        name: str,
+        crm: str,
+        specialty: str,
+        phone: Optional[str],
+        email: str,
+        created_at: datetime,
+        updated_at: Optional[datetime]
+    ):
+        self.id = id
+        self.user_id = user_id
+        self.name = name
+        self.crm = crm
+        self.specialty = specialty
+        self.phone = phone
+        self.email = email
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+class HospitalRow(ReadModel):
+    """Hospital lido para listagens"""
+
+    __slots__ = ("id", "user_id", "name", "address", "created_at", "updated_at")
+
+    def __init__(
+        self,
+        id: uuid.UUID,
+        user_id: uuid.UUID,
+        name: str,
+        address: str,
+        created_at: datetime,
+        updated_at: Optional[datetime]
+    ):
+        self.id = id
+        self.user_id = user_id
+        self.name = name
+        self.address = address
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+class ProductionRow(ReadModel):
+    """Produção lida para listagens e extratos (`type` já como texto)"""
+
+    __slots__ = ("id", "user_id", "doctor_id", "hospital_id", "type", "date", "description", "created_at", "updated_at")
+
+    def __init__(
+        self,
+        id: uuid.UUID,
+        user_id: uuid.UUID,
+        doctor_id: uuid.UUID,
+        hospital_id: uuid.UUID,
+        type: str,
+        date: date,
+        description: Optional[str],
+        created_at: datetime,
+        updated_at: Optional[datetime]
+    ):
+        self.id = id
+        self.user_id = user_id
+        self.doctor_id = doctor_id
+        self.hospital_id = hospital_id
+        self.type = type
+        self.date = date
+        self.description = description
+        self.created_at = created_at
+        self.updated_at = updated_at
@@ -6,6 +6,11 @@ from src.domain.enums.repasse_status import RepasseStatus
 
 
 class Repasse:
+    # Sem __dict__: as listagens e exportações montam milhares destes por consulta
+    __slots__ = (
+        "id", "user_id", "production_id", "amount", "created_at", "updated_at", "status", "source_system", "external_id"
+    )
+
     def __init__(
         self,
         id: UUID,
@@ -14,7 +19,9 @@ class Repasse:
         amount: Decimal,
         created_at: datetime,
         updated_at: datetime,
-        status: RepasseStatus = RepasseStatus.PENDING
+        status: RepasseStatus = RepasseStatus.PENDING,
+        source_system: Optional[str] = None,
+        external_id: Optional[str] = None
     ):
         self.id = id
         self.user_id = user_id
@@ -23,3 +30,5 @@ class Repasse:
         self.created_at = created_at
         self.updated_at = updated_at
         self.status = status
+        self.source_system = source_system
+        self.external_id = external_id
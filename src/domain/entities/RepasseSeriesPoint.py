@@ -0,0 +1,15 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pydantic import BaseModel
+from src.domain.enums.repasse_status import RepasseStatus
+
+
+class RepasseSeriesPoint(BaseModel):
+    """Quantidade e soma dos repasses de um status num intervalo (e dimensões pedidas)"""
+    bucket_start: datetime
+    hospital_id: uuid.UUID | None = None
+    production_type: str | None = None
+    status: RepasseStatus
+    count: int
+    amount: Decimal
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+class TotalCount(BaseModel):
+    """Total de itens de uma listagem; exact=False quando veio do cache de contagens"""
+    value: int
+    exact: bool = True
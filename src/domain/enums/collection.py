@@ -0,0 +1,7 @@
+from enum import Enum
+
+class Collection(str, Enum):
+    """Coleções com contador de versão por usuário (ETag das leituras)"""
+    DOCTORS = "doctors"
+    HOSPITALS = "hospitals"
+    PRODUCTIONS = "productions"
@@ -0,0 +1,10 @@
+from enum import Enum
+
+class SeriesGranularity(str, Enum):
+    DAY = "day"
+    MONTH = "month"
+
+
+class SeriesDimension(str, Enum):
+    HOSPITAL = "hospital"
+    PRODUCTION_TYPE = "production_type"
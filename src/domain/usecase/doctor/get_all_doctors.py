@@ -1,6 +1,8 @@
 from src.domain.usecase.interfaces.IGetAllDoctors import IGetAllDoctors
 from typing import List, Tuple, Optional
-from src.domain.entities.Doctor import Doctor
+from src.domain.entities.ReadModels import DoctorRow
+from src.domain.entities.TotalCount import TotalCount
+from datetime import datetime
 import uuid
 
 
@@ -8,5 +10,14 @@ class GetAllDoctorsUseCase:
     def __init__(self, get_all_doctors_port: IGetAllDoctors):
         self.get_all_doctors_port = get_all_doctors_port
 
-    def execute(self, skip: int = 0, limit: int = 100, user_id: Optional[uuid.UUID] = None) -> Tuple[List[Doctor], int]:
-        return self.get_all_doctors_port.get_all(skip=skip, limit=limit, user_id=user_id)
+    def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[uuid.UUID] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        include_total: bool = True
+    ) -> Tuple[List[DoctorRow], Optional[TotalCount]]:
+        doctors = self.get_all_doctors_port.get_all(skip=skip, limit=limit, user_id=user_id, after=after)
+        total = self.get_all_doctors_port.count_all(user_id=user_id) if include_total else None
+        return doctors, total
@@ -9,6 +9,7 @@ class GetDoctorByIdUseCase:
         self.get_doctor_by_id_port = get_doctor_by_id_port
 
     def execute(self, doctor_id: uuid.UUID) -> Optional[Doctor]:
+        # Sem o cache de entidades: o corpo precisa corresponder à versão usada no ETag da rota
         doctor = self.get_doctor_by_id_port.get_by_id(doctor_id)
         if not doctor:
             raise ValueError("Doctor not found.")
@@ -0,0 +1,38 @@
+from datetime import date
+from typing import Optional
+import uuid
+from src.domain.entities.DoctorStatement import DoctorStatement
+from src.domain.enums.repasse_status import RepasseStatus
+from src.domain.usecase.interfaces.IGetDoctorById import IGetDoctorById
+from src.domain.usecase.interfaces.IGetDoctorStatement import IGetDoctorStatement
+
+
+class GetDoctorStatementUseCase:
+    """Extrato do médico no período: produções com hospital e repasses, e os totais por status"""
+
+    def __init__(self, get_doctor_by_id_port: IGetDoctorById, get_doctor_statement_port: IGetDoctorStatement):
+        self.get_doctor_by_id_port = get_doctor_by_id_port
+        self.get_doctor_statement_port = get_doctor_statement_port
+
+    def execute(
+        self,
+        doctor_id: uuid.UUID,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> DoctorStatement:
+        # Leitura pura: a cópia do cache de entidades basta
+        doctor = self.get_doctor_by_id_port.get_by_id(doctor_id, cached=True)
+        if not doctor:
+            raise ValueError("Doctor not found.")
+
+        productions = self.get_doctor_statement_port.get_statement(doctor_id, start_date, end_date)
+        statement = DoctorStatement(doctor=doctor, period_start=start_date, period_end=end_date, productions=productions)
+        for item in productions:
+            for repasse in item.repasses:
+                if repasse.status == RepasseStatus.CONSOLIDATED:
+                    statement.total_consolidated_count += 1
+                    statement.total_consolidated_value += repasse.amount
+                else:
+                    statement.total_pending_count += 1
+                    statement.total_pending_value += repasse.amount
+        return statement
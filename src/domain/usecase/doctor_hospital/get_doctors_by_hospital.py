@@ -1,5 +1,7 @@
 from src.domain.usecase.interfaces.IGetDoctorsByHospital import IGetDoctorsByHospital
-from typing import List
+from src.domain.entities.TotalCount import TotalCount
+from datetime import datetime
+from typing import List, Optional, Tuple
 import uuid
 
 
@@ -7,5 +9,21 @@ class GetDoctorsByHospitalUseCase:
     def __init__(self, get_doctors_by_hospital_port: IGetDoctorsByHospital):
         self.get_doctors_by_hospital_port = get_doctors_by_hospital_port
 
-    def execute(self, hospital_id: uuid.UUID) -> List[dict]:
-        return self.get_doctors_by_hospital_port.get_doctors_by_hospital(hospital_id)
+    def execute(
+        self,
+        hospital_id: uuid.UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        include_total: bool = True
+    ) -> Tuple[List[dict], Optional[TotalCount]]:
+        doctors = self.get_doctors_by_hospital_port.get_doctors_by_hospital(
+            hospital_id, skip, limit, after, start_date, end_date
+        )
+        total = (
+            self.get_doctors_by_hospital_port.count_doctors_by_hospital(hospital_id, start_date, end_date)
+            if include_total else None
+        )
+        return doctors, total
@@ -1,6 +1,8 @@
 from src.domain.usecase.interfaces.IGetAllHospitals import IGetAllHospitals
 from typing import List, Tuple, Optional
-from src.domain.entities.Hospital import Hospital
+from src.domain.entities.ReadModels import HospitalRow
+from src.domain.entities.TotalCount import TotalCount
+from datetime import datetime
 import uuid
 
 
@@ -8,5 +10,14 @@ class GetAllHospitalsUseCase:
     def __init__(self, get_all_hospitals_port: IGetAllHospitals):
         self.get_all_hospitals_port = get_all_hospitals_port
 
-    def execute(self, skip: int = 0, limit: int = 100, user_id: Optional[uuid.UUID] = None) -> Tuple[List[Hospital], int]:
-        return self.get_all_hospitals_port.get_all(skip=skip, limit=limit, user_id=user_id)
+    def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[uuid.UUID] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        include_total: bool = True
+    ) -> Tuple[List[HospitalRow], Optional[TotalCount]]:
+        hospitals = self.get_all_hospitals_port.get_all(skip=skip, limit=limit, user_id=user_id, after=after)
+        total = self.get_all_hospitals_port.count_all(user_id=user_id) if include_total else None
+        return hospitals, total
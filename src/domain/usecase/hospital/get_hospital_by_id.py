@@ -9,6 +9,7 @@ class GetHospitalByIdUseCase:
         self.get_hospital_by_id_port = get_hospital_by_id_port
 
     def execute(self, hospital_id: uuid.UUID) -> Optional[Hospital]:
+        # Sem o cache de entidades: o corpo precisa corresponder à versão usada no ETag da rota
         hospital = self.get_hospital_by_id_port.get_by_id(hospital_id)
         if not hospital:
             raise ValueError("Hospital not found.")
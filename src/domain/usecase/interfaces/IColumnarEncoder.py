@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List
+from src.domain.enums.export_format import ColumnarFormat
+
+class IColumnarEncoder(ABC):
+    @abstractmethod
+    def is_available(self) -> bool:
+        """Se a biblioteca do formato colunar está instalada (dependência opcional)"""
+        pass
+
+    @abstractmethod
+    def encode(self, batches: Iterator[Dict[str, List[Any]]], export_format: ColumnarFormat) -> Iterator[bytes]:
+        """Codifica os blocos por coluna no formato pedido, devolvendo os bytes à medida que são gerados"""
+        pass
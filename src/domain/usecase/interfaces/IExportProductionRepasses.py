@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+class IExportProductionRepasses(ABC):
+    @abstractmethod
+    def export_with_repasses(
+        self,
+        user_id: UUID,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 10000
+    ) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Produções do usuário com seus repasses (uma linha por repasse; produções
+        sem repasse aparecem uma vez, com as colunas do repasse nulas), em blocos
+        por coluna.
+        """
+        pass
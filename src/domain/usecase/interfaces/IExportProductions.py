@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+class IExportProductions(ABC):
+    @abstractmethod
+    def export(
+        self,
+        user_id: UUID,
+        doctor_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        pass
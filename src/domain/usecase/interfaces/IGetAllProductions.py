@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional
+from datetime import datetime
 import uuid
-from src.domain.entities.Production import Production
+from src.domain.entities.ReadModels import ProductionRow
+from src.domain.entities.TotalCount import TotalCount
 
 
 class IGetAllProductions(ABC):
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100, user_id: Optional[uuid.UUID] = None) -> Tuple[List[Production], int]:
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[uuid.UUID] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[ProductionRow]:
+        pass
+
+    @abstractmethod
+    def count_all(self, user_id: Optional[uuid.UUID] = None) -> TotalCount:
         pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+import uuid
+from src.domain.enums.collection import Collection
+
+
+class IGetCollectionVersion(ABC):
+    @abstractmethod
+    def get_version(self, user_id: uuid.UUID, collection: Collection) -> int:
+        pass
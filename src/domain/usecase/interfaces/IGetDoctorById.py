@@ -6,5 +6,6 @@ from src.domain.entities.Doctor import Doctor
 
 class IGetDoctorById(ABC):
     @abstractmethod
-    def get_by_id(self, doctor_id: uuid.UUID) -> Optional[Doctor]:
+    def get_by_id(self, doctor_id: uuid.UUID, cached: bool = False) -> Optional[Doctor]:
+        """Busca um médico pelo ID; `cached=True` aceita a cópia do cache de entidades"""
         pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import List
+import uuid
+
+
+class IGetDoctorIdsByHospital(ABC):
+    @abstractmethod
+    def get_doctor_ids_by_hospital(self, hospital_id: uuid.UUID) -> List[uuid.UUID]:
+        pass
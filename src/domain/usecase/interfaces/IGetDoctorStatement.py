@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+from src.domain.entities.DoctorStatement import StatementProduction
+
+class IGetDoctorStatement(ABC):
+    @abstractmethod
+    def get_statement(
+        self,
+        doctor_id: UUID,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[StatementProduction]:
+        pass
@@ -1,9 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 import uuid
+from src.domain.entities.TotalCount import TotalCount
 
 
 class IGetDoctorsByHospital(ABC):
     @abstractmethod
-    def get_doctors_by_hospital(self, hospital_id: uuid.UUID) -> List[dict]:
+    def get_doctors_by_hospital(
+        self,
+        hospital_id: uuid.UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def count_doctors_by_hospital(
+        self,
+        hospital_id: uuid.UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> TotalCount:
         pass
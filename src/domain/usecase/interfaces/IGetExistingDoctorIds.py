@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Set
+import uuid
+
+
+class IGetExistingDoctorIds(ABC):
+    @abstractmethod
+    def get_existing_ids(self, doctor_ids: Iterable[uuid.UUID]) -> Set[uuid.UUID]:
+        pass
@@ -6,5 +6,6 @@ from src.domain.entities.Hospital import Hospital
 
 class IGetHospitalById(ABC):
     @abstractmethod
-    def get_by_id(self, hospital_id: uuid.UUID) -> Optional[Hospital]:
+    def get_by_id(self, hospital_id: uuid.UUID, cached: bool = False) -> Optional[Hospital]:
+        """Busca um hospital pelo ID; `cached=True` aceita a cópia do cache de entidades"""
         pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+import uuid
+from src.domain.enums.collection import Collection
+
+
+class IGetItemVersion(ABC):
+    @abstractmethod
+    def get_item_version(self, collection: Collection, item_id: uuid.UUID) -> Optional[Tuple[uuid.UUID, int]]:
+        """Dono do registro e a versão da coleção dele; None se o registro não existe"""
+        pass
@@ -6,5 +6,6 @@ from src.domain.entities.Production import Production
 
 class IGetProductionById(ABC):
     @abstractmethod
-    def get_by_id(self, production_id: uuid.UUID) -> Optional[Production]:
+    def get_by_id(self, production_id: uuid.UUID, cached: bool = False) -> Optional[Production]:
+        """Busca uma produção pelo ID; `cached=True` aceita a cópia do cache de entidades"""
         pass
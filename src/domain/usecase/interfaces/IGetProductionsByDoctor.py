@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import List
 import uuid
-from src.domain.entities.Production import Production
+from src.domain.entities.ReadModels import ProductionRow
 
 
 class IGetProductionsByDoctor(ABC):
     @abstractmethod
-    def get_by_doctor(self, doctor_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Production]:
+    def get_by_doctor(self, doctor_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[ProductionRow]:
         pass
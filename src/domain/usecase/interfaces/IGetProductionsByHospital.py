@@ -1,9 +1,28 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
-from src.domain.entities.Production import Production
+from src.domain.entities.ReadModels import ProductionRow
+from src.domain.entities.TotalCount import TotalCount
 
 class IGetProductionsByHospital(ABC):
     @abstractmethod
-    def get_by_hospital(self, hospital_id: UUID) -> List[Production]:
+    def get_by_hospital(
+        self,
+        hospital_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[ProductionRow]:
+        pass
+
+    @abstractmethod
+    def count_by_hospital(
+        self,
+        hospital_id: UUID,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> TotalCount:
         pass
@@ -5,4 +5,5 @@ from src.domain.entities.Production import Production
 class ISaveProduction(ABC):
     @abstractmethod
     def save(self, production: Production) -> Production:
+        """Salva a produção; ValueError se o médico ou o hospital não existe mais"""
         pass
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import List
+from src.domain.entities.Production import Production
+
+
+class ISaveProductions(ABC):
+    @abstractmethod
+    def save_many(self, productions: List[Production]) -> int:
+        pass
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Iterable, Optional
+import uuid
+from src.domain.entities.CachedStats import CachedStats
+from src.dto.repasseDTO import RepasseStatsDTO
+
+
+class IStatsCache(ABC):
+    @abstractmethod
+    def get(
+        self,
+        user_id: uuid.UUID,
+        doctor_id: uuid.UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Optional[CachedStats]:
+        pass
+
+    @abstractmethod
+    def set(
+        self,
+        user_id: uuid.UUID,
+        doctor_id: uuid.UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        stats: RepasseStatsDTO,
+        generation: Any = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def generation(self, doctor_id: uuid.UUID) -> Any:
+        """Marca opaca lida antes de calcular: set(..., generation) só grava se o médico não foi invalidado depois dela"""
+        pass
+
+    @abstractmethod
+    def invalidate_doctors(self, doctor_ids: Iterable[uuid.UUID]) -> None:
+        pass
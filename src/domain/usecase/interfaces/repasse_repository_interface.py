@@ -1,18 +1,53 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
 from datetime import datetime
 from src.domain.entities.Repasse import Repasse
-from src.dto.repasseDTO import CreateRepasseDTO, UpdateRepasseDTO
+from src.domain.entities.RepasseSeriesPoint import RepasseSeriesPoint
+from src.domain.entities.TotalCount import TotalCount
+from src.domain.enums.repasse_status import RepasseStatus
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+from src.dto.repasseDTO import CreateRepasseDTO, UpdateRepasseDTO, UpsertRepasseDTO
 
 
 class IRepasseRepository(ABC):
     @abstractmethod
     def create(self, data: CreateRepasseDTO, user_id: UUID) -> Repasse:
+        """Cria o repasse; ValueError se a produção não existe mais (apagada depois da verificação)"""
         pass
 
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100, user_id: Optional[UUID] = None) -> Tuple[List[Repasse], int]:
+    def create_many(self, items: List[CreateRepasseDTO], user_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    def upsert_many(self, items: List[UpsertRepasseDTO], user_id: UUID) -> List[Tuple[UUID, bool]]:
+        pass
+
+    @abstractmethod
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[UUID] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Repasse]:
+        pass
+
+    @abstractmethod
+    def count_all(self, user_id: Optional[UUID] = None) -> TotalCount:
+        pass
+
+    @abstractmethod
+    def export(
+        self,
+        user_id: UUID,
+        doctor_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
         pass
 
     @abstractmethod
@@ -24,12 +59,66 @@ class IRepasseRepository(ABC):
     ) -> List[Repasse]:
         pass
 
+    @abstractmethod
+    def get_stats_by_doctor(
+        self,
+        doctor_id: UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[RepasseStatus, Tuple[int, Decimal]]:
+        pass
+
+    @abstractmethod
+    def get_stats_series(
+        self,
+        doctor_id: UUID,
+        granularity: SeriesGranularity,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        dimensions: Sequence[SeriesDimension] = ()
+    ) -> List[RepasseSeriesPoint]:
+        pass
+
+    @abstractmethod
+    def get_stats_by_doctors(
+        self,
+        doctor_ids: Sequence[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[UUID, Dict[RepasseStatus, Tuple[int, Decimal]]]:
+        pass
+
+    @abstractmethod
+    def get_doctor_balances(self, doctor_ids: Sequence[UUID]) -> Dict[UUID, Dict[RepasseStatus, Tuple[int, Decimal]]]:
+        pass
+
+    @abstractmethod
+    def get_doctor_balance(self, doctor_id: UUID) -> Dict[RepasseStatus, Tuple[int, Decimal]]:
+        pass
+
     @abstractmethod
     def get_by_id(self, repasse_id: UUID) -> Optional[Repasse]:
         pass
 
     @abstractmethod
-    def get_by_hospital(self, hospital_id: UUID) -> List[Repasse]:
+    def get_by_hospital(
+        self,
+        hospital_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Repasse]:
+        pass
+
+    @abstractmethod
+    def count_by_hospital(
+        self,
+        hospital_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> TotalCount:
         pass
 
     @abstractmethod
@@ -42,5 +131,22 @@ class IRepasseRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_production(self, production_id: UUID) -> List[Repasse]:
+    def get_by_production(
+        self,
+        production_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Repasse]:
+        pass
+
+    @abstractmethod
+    def count_by_production(
+        self,
+        production_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> TotalCount:
         pass
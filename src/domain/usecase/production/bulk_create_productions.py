@@ -0,0 +1,85 @@
+from typing import Any, Dict, List, Optional
+from pydantic import ValidationError
+from src.domain.entities.Production import Production
+from src.domain.usecase.interfaces.ISaveProductions import ISaveProductions
+from src.domain.usecase.interfaces.IGetExistingDoctorIds import IGetExistingDoctorIds
+from src.domain.usecase.interfaces.IGetExistingHospitalIds import IGetExistingHospitalIds
+from src.dto.productionDTO import BulkCreateProductionResponseDTO, CreateProductionDTO
+from src.dto.responses import BulkItemErrorDTO
+import uuid
+from datetime import datetime, timezone
+
+
+class BulkCreateProductionsUseCase:
+    """
+    Cria várias produções de uma vez.
+
+    Médicos e hospitais são validados com uma consulta IN cada, e os itens
+    válidos entram num único INSERT de múltiplas linhas. Itens inválidos não
+    barram o lote: voltam em `errors`, com a posição no pedido.
+    """
+
+    def __init__(
+        self,
+        save_productions_port: ISaveProductions,
+        get_existing_doctor_ids_port: IGetExistingDoctorIds,
+        get_existing_hospital_ids_port: IGetExistingHospitalIds
+    ):
+        self.save_productions_port = save_productions_port
+        self.get_existing_doctor_ids_port = get_existing_doctor_ids_port
+        self.get_existing_hospital_ids_port = get_existing_hospital_ids_port
+
+    def execute(self, items: List[Dict[str, Any]], user_id: uuid.UUID) -> BulkCreateProductionResponseDTO:
+        errors: List[BulkItemErrorDTO] = []
+        parsed = []
+        for index, item in enumerate(items):
+            try:
+                data = CreateProductionDTO.model_validate(item)
+            except ValidationError as e:
+                errors.append(BulkItemErrorDTO(index=index, detail=self._describe(e)))
+                continue
+            try:
+                doctor_id = uuid.UUID(data.doctor_id)
+                hospital_id = uuid.UUID(data.hospital_id)
+            except ValueError:
+                errors.append(BulkItemErrorDTO(index=index, detail="Invalid doctor_id or hospital_id."))
+                continue
+            parsed.append((index, data, doctor_id, hospital_id))
+
+        doctors = self.get_existing_doctor_ids_port.get_existing_ids({doctor_id for _, _, doctor_id, _ in parsed})
+        hospitals = self.get_existing_hospital_ids_port.get_existing_ids({hospital_id for _, _, _, hospital_id in parsed})
+
+        ids: List[Optional[uuid.UUID]] = [None] * len(items)
+        productions = []
+        # Mesmo relógio dos defaults dos models: a ordem (created_at, id) das listagens não depende do fuso do servidor
+        created_at = datetime.now(timezone.utc).isoformat()
+        for index, data, doctor_id, hospital_id in parsed:
+            if doctor_id not in doctors:
+                errors.append(BulkItemErrorDTO(index=index, detail="Doctor not found."))
+                continue
+            if hospital_id not in hospitals:
+                errors.append(BulkItemErrorDTO(index=index, detail="Hospital not found."))
+                continue
+
+            production = Production(
+                id=uuid.uuid4(),
+                user_id=user_id,
+                doctor_id=doctor_id,
+                hospital_id=hospital_id,
+                type=data.type.value,
+                date=data.date,
+                description=data.description,
+                created_at=created_at,
+            )
+            productions.append(production)
+            ids[index] = production.id
+
+        created = self.save_productions_port.save_many(productions)
+        errors.sort(key=lambda error: error.index)
+        return BulkCreateProductionResponseDTO(created=created, failed=len(errors), ids=ids, errors=errors)
+
+    @staticmethod
+    def _describe(error: ValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+        )
@@ -19,13 +19,13 @@ class CreateProductionUseCase:
         self.get_hospital_by_id_port = get_hospital_by_id_port
 
     def execute(self, production_data: CreateProductionDTO, user_id: uuid.UUID) -> Production:
-        # Verifica se o médico existe
-        doctor = self.get_doctor_by_id_port.get_by_id(uuid.UUID(production_data.doctor_id))
+        # Verifica se o médico existe (pelo cache: exclusões concorrentes caem na chave estrangeira do save)
+        doctor = self.get_doctor_by_id_port.get_by_id(uuid.UUID(production_data.doctor_id), cached=True)
         if not doctor:
             raise ValueError("Doctor not found.")
 
         # Verifica se o hospital existe
-        hospital = self.get_hospital_by_id_port.get_by_id(uuid.UUID(production_data.hospital_id))
+        hospital = self.get_hospital_by_id_port.get_by_id(uuid.UUID(production_data.hospital_id), cached=True)
         if not hospital:
             raise ValueError("Hospital not found.")
 
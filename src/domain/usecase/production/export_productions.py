@@ -0,0 +1,21 @@
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+from src.domain.usecase.interfaces.IExportProductions import IExportProductions
+
+
+class ExportProductionsUseCase:
+    """Produções do usuário em blocos, para exportação em streaming"""
+
+    def __init__(self, repository: IExportProductions):
+        self.repository = repository
+
+    def execute(
+        self,
+        user_id: UUID,
+        doctor_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        return self.repository.export(user_id, doctor_id, start_date, end_date, batch_size)
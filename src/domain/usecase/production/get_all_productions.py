@@ -1,6 +1,8 @@
 from src.domain.usecase.interfaces.IGetAllProductions import IGetAllProductions
 from typing import List, Tuple, Optional
-from src.domain.entities.Production import Production
+from src.domain.entities.ReadModels import ProductionRow
+from src.domain.entities.TotalCount import TotalCount
+from datetime import datetime
 import uuid
 
 
@@ -8,5 +10,14 @@ class GetAllProductionsUseCase:
     def __init__(self, get_all_productions_port: IGetAllProductions):
         self.get_all_productions_port = get_all_productions_port
 
-    def execute(self, skip: int = 0, limit: int = 100, user_id: Optional[uuid.UUID] = None) -> Tuple[List[Production], int]:
-        return self.get_all_productions_port.get_all(skip=skip, limit=limit, user_id=user_id)
+    def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[uuid.UUID] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        include_total: bool = True
+    ) -> Tuple[List[ProductionRow], Optional[TotalCount]]:
+        productions = self.get_all_productions_port.get_all(skip=skip, limit=limit, user_id=user_id, after=after)
+        total = self.get_all_productions_port.count_all(user_id=user_id) if include_total else None
+        return productions, total
@@ -9,6 +9,7 @@ class GetProductionByIdUseCase:
         self.get_production_by_id_port = get_production_by_id_port
 
     def execute(self, production_id: uuid.UUID) -> Optional[Production]:
+        # Sem o cache de entidades: o corpo precisa corresponder à versão usada no ETag da rota
         production = self.get_production_by_id_port.get_by_id(production_id)
         if not production:
             raise ValueError("Production not found.")
@@ -1,11 +1,24 @@
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
-from src.domain.entities.Production import Production
+from src.domain.entities.ReadModels import ProductionRow
+from src.domain.entities.TotalCount import TotalCount
 from src.domain.usecase.interfaces.IGetProductionsByHospital import IGetProductionsByHospital
 
 class GetProductionsByHospitalUseCase:
     def __init__(self, repository: IGetProductionsByHospital):
         self.repository = repository
 
-    def execute(self, hospital_id: UUID) -> List[Production]:
-        return self.repository.get_by_hospital(hospital_id)
+    def execute(
+        self,
+        hospital_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        include_total: bool = True
+    ) -> Tuple[List[ProductionRow], Optional[TotalCount]]:
+        productions = self.repository.get_by_hospital(hospital_id, skip, limit, after, start_date, end_date)
+        total = self.repository.count_by_hospital(hospital_id, start_date, end_date) if include_total else None
+        return productions, total
@@ -16,9 +16,12 @@ class CreateRepasseUseCase:
         self.production_repository = production_repository
 
     def execute(self, data: CreateRepasseDTO, user_id: UUID) -> Repasse:
-        # Valida se a produção existe
-        production = self.production_repository.get_by_id(data.production_id)
+        # Valida se a produção existe (pelo cache: uma exclusão concorrente é detectada no create)
+        production = self.production_repository.get_by_id(data.production_id, cached=True)
         if not production:
             raise HTTPException(status_code=404, detail="Production not found")
 
-        return self.repasse_repository.create(data, user_id)
+        try:
+            return self.repasse_repository.create(data, user_id)
+        except ValueError:
+            raise HTTPException(status_code=404, detail="Production not found")
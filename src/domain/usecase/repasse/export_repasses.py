@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
+
+
+class ExportRepassesUseCase:
+    """Repasses do usuário em blocos, para exportação em streaming"""
+
+    def __init__(self, repasse_repository: IRepasseRepository):
+        self.repasse_repository = repasse_repository
+
+    def execute(
+        self,
+        user_id: UUID,
+        doctor_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        return self.repasse_repository.export(user_id, doctor_id, start_date, end_date, batch_size)
@@ -0,0 +1,29 @@
+from datetime import date
+from typing import Iterator, Optional
+from uuid import UUID
+from src.domain.enums.export_format import ColumnarFormat
+from src.domain.usecase.interfaces.IColumnarEncoder import IColumnarEncoder
+from src.domain.usecase.interfaces.IExportProductionRepasses import IExportProductionRepasses
+
+
+class ExportRepassesColumnarUseCase:
+    """
+    Produções do usuário com seus repasses em formato colunar (Parquet/Arrow),
+    para carga em ferramentas de análise. Cada bloco lido do banco é codificado
+    e devolvido antes do próximo.
+    """
+
+    def __init__(self, production_repository: IExportProductionRepasses, columnar_encoder: IColumnarEncoder):
+        self.production_repository = production_repository
+        self.columnar_encoder = columnar_encoder
+
+    def execute(
+        self,
+        user_id: UUID,
+        export_format: ColumnarFormat,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 10000
+    ) -> Iterator[bytes]:
+        batches = self.production_repository.export_with_repasses(user_id, start_date, end_date, batch_size)
+        return self.columnar_encoder.encode(batches, export_format)
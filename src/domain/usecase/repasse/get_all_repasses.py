@@ -1,6 +1,8 @@
 from typing import List, Tuple, Optional
 from uuid import UUID
+from datetime import datetime
 from src.domain.entities.Repasse import Repasse
+from src.domain.entities.TotalCount import TotalCount
 from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
 
 
@@ -8,5 +10,14 @@ class GetAllRepassesUseCase:
     def __init__(self, repasse_repository: IRepasseRepository):
         self.repasse_repository = repasse_repository
 
-    def execute(self, skip: int = 0, limit: int = 100, user_id: Optional[UUID] = None) -> Tuple[List[Repasse], int]:
-        return self.repasse_repository.get_all(skip=skip, limit=limit, user_id=user_id)
+    def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[UUID] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        include_total: bool = True
+    ) -> Tuple[List[Repasse], Optional[TotalCount]]:
+        repasses = self.repasse_repository.get_all(skip=skip, limit=limit, user_id=user_id, after=after)
+        total = self.repasse_repository.count_all(user_id=user_id) if include_total else None
+        return repasses, total
@@ -0,0 +1,45 @@
+from typing import Optional, Tuple
+from uuid import UUID
+from datetime import datetime
+from src.domain.usecase.interfaces.IStatsCache import IStatsCache
+from src.domain.usecase.repasse.get_repasse_stats import GetRepasseStatsUseCase
+from src.dto.repasseDTO import RepasseStatsDTO
+
+
+class GetCachedRepasseStatsUseCase:
+    """
+    GetRepasseStatsUseCase com cache de resultado por (usuário, médico, período).
+
+    Retorna (estatísticas, vencidas). Com vencidas=True o chamador deve pedir o
+    recálculo (refresh=True) fora da requisição (stale-while-revalidate).
+
+    O cálculo que preenche o cache roda no primário: lido de uma réplica
+    atrasada logo depois de uma invalidação, gravaria números antigos por um
+    TTL inteiro.
+    """
+
+    def __init__(self, get_repasse_stats: GetRepasseStatsUseCase, stats_cache: Optional[IStatsCache] = None):
+        self.get_repasse_stats = get_repasse_stats
+        self.stats_cache = stats_cache
+
+    def execute(
+        self,
+        user_id: UUID,
+        doctor_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        refresh: bool = False
+    ) -> Tuple[RepasseStatsDTO, bool]:
+        if self.stats_cache is None:
+            return self.get_repasse_stats.execute(doctor_id, start_date, end_date), False
+
+        if not refresh:
+            cached = self.stats_cache.get(user_id, doctor_id, start_date, end_date)
+            if cached is not None:
+                return cached.stats, cached.stale
+
+        # Geração lida antes do cálculo: se uma escrita invalidar o médico no meio, o resultado não é gravado
+        generation = self.stats_cache.generation(doctor_id)
+        stats = self.get_repasse_stats.execute(doctor_id, start_date, end_date)
+        self.stats_cache.set(user_id, doctor_id, start_date, end_date, stats, generation)
+        return stats, False
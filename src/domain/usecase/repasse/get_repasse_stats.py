@@ -16,20 +16,14 @@ class GetRepasseStatsUseCase:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> RepasseStatsDTO:
-        repasses = self.repasse_repository.get_by_doctor_and_date_range(doctor_id, start_date, end_date)
+        if start_date is None and end_date is None:
+            # Período completo: saldo mantido incrementalmente (leitura por chave primária)
+            stats = self.repasse_repository.get_doctor_balance(doctor_id)
+        else:
+            stats = self.repasse_repository.get_stats_by_doctor(doctor_id, start_date, end_date)
 
-        pending_count = 0
-        pending_value = Decimal(0)
-        consolidated_count = 0
-        consolidated_value = Decimal(0)
-
-        for repasse in repasses:
-            if repasse.status == RepasseStatus.PENDING:
-                pending_count += 1
-                pending_value += repasse.amount
-            elif repasse.status == RepasseStatus.CONSOLIDATED:
-                consolidated_count += 1
-                consolidated_value += repasse.amount
+        pending_count, pending_value = stats.get(RepasseStatus.PENDING, (0, Decimal(0)))
+        consolidated_count, consolidated_value = stats.get(RepasseStatus.CONSOLIDATED, (0, Decimal(0)))
 
         return RepasseStatsDTO(
             doctor_id=doctor_id,
@@ -0,0 +1,51 @@
+from typing import List, Optional
+from uuid import UUID
+from datetime import datetime
+from decimal import Decimal
+from src.domain.enums.repasse_status import RepasseStatus
+from src.domain.usecase.interfaces.IGetDoctorIdsByHospital import IGetDoctorIdsByHospital
+from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
+from src.dto.repasseDTO import DoctorRepasseStatsDTO, RepasseStatsBatchDTO
+
+
+class GetRepasseStatsBatchUseCase:
+    """
+    Estatísticas de vários médicos de uma vez (os informados ou os do hospital),
+    com os mesmos números de GetRepasseStatsUseCase para cada um, lidas numa
+    única consulta agrupada.
+    """
+
+    def __init__(self, repasse_repository: IRepasseRepository, doctor_hospital_repository: IGetDoctorIdsByHospital):
+        self.repasse_repository = repasse_repository
+        self.doctor_hospital_repository = doctor_hospital_repository
+
+    def execute(
+        self,
+        doctor_ids: Optional[List[UUID]] = None,
+        hospital_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> RepasseStatsBatchDTO:
+        if hospital_id is not None:
+            doctor_ids = self.doctor_hospital_repository.get_doctor_ids_by_hospital(hospital_id)
+        doctor_ids = list(dict.fromkeys(doctor_ids or []))
+
+        if start_date is None and end_date is None:
+            # Período completo: saldos mantidos incrementalmente, sem agregar repasses
+            stats = self.repasse_repository.get_doctor_balances(doctor_ids)
+        else:
+            stats = self.repasse_repository.get_stats_by_doctors(doctor_ids, start_date, end_date)
+
+        doctors = {}
+        for doctor_id in doctor_ids:
+            by_status = stats.get(doctor_id, {})
+            pending_count, pending_value = by_status.get(RepasseStatus.PENDING, (0, Decimal(0)))
+            consolidated_count, consolidated_value = by_status.get(RepasseStatus.CONSOLIDATED, (0, Decimal(0)))
+            doctors[doctor_id] = DoctorRepasseStatsDTO(
+                total_pending_count=pending_count,
+                total_pending_value=pending_value,
+                total_consolidated_count=consolidated_count,
+                total_consolidated_value=consolidated_value
+            )
+
+        return RepasseStatsBatchDTO(period_start=start_date, period_end=end_date, doctors=doctors)
@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from datetime import datetime
+from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
+from src.dto.repasseDTO import RepasseSeriesBucketDTO, RepasseStatsSeriesDTO
+from src.domain.enums.repasse_status import RepasseStatus
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+
+class GetRepasseStatsSeriesUseCase:
+    def __init__(self, repasse_repository: IRepasseRepository):
+        self.repasse_repository = repasse_repository
+
+    def execute(
+        self,
+        doctor_id: UUID,
+        granularity: SeriesGranularity = SeriesGranularity.MONTH,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Optional[List[SeriesDimension]] = None
+    ) -> RepasseStatsSeriesDTO:
+        dimensions = [dimension for dimension in SeriesDimension if dimension in (group_by or [])]
+        points = self.repasse_repository.get_stats_series(doctor_id, granularity, start_date, end_date, dimensions)
+
+        # Uma linha por (intervalo, dimensões), com pendente e consolidado lado a lado
+        buckets: Dict[Tuple, RepasseSeriesBucketDTO] = {}
+        for point in points:
+            key = (point.bucket_start, point.hospital_id, point.production_type)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = RepasseSeriesBucketDTO(
+                    bucket_start=point.bucket_start,
+                    hospital_id=point.hospital_id,
+                    production_type=point.production_type
+                )
+            if point.status == RepasseStatus.PENDING:
+                bucket.total_pending_count += point.count
+                bucket.total_pending_value += point.amount
+            else:
+                bucket.total_consolidated_count += point.count
+                bucket.total_consolidated_value += point.amount
+
+        return RepasseStatsSeriesDTO(
+            doctor_id=doctor_id,
+            granularity=granularity,
+            group_by=dimensions,
+            period_start=start_date,
+            period_end=end_date,
+            buckets=list(buckets.values())
+        )
@@ -1,6 +1,8 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 from src.domain.entities.Repasse import Repasse
+from src.domain.entities.TotalCount import TotalCount
 from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
 
 
@@ -8,5 +10,16 @@ class GetRepassesByProductionUseCase:
     def __init__(self, repasse_repository: IRepasseRepository):
         self.repasse_repository = repasse_repository
 
-    def execute(self, production_id: UUID) -> List[Repasse]:
-        return self.repasse_repository.get_by_production(production_id)
+    def execute(
+        self,
+        production_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        include_total: bool = True
+    ) -> Tuple[List[Repasse], Optional[TotalCount]]:
+        repasses = self.repasse_repository.get_by_production(production_id, skip, limit, after, start_date, end_date)
+        total = self.repasse_repository.count_by_production(production_id, start_date, end_date) if include_total else None
+        return repasses, total
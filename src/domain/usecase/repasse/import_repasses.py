@@ -0,0 +1,51 @@
+from typing import List, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from src.dto.repasseDTO import CreateRepasseDTO, ImportChunkResultDTO, ImportLineErrorDTO
+from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
+from src.domain.usecase.interfaces.IGetExistingProductionIds import IGetExistingProductionIds
+
+
+class ImportRepassesUseCase:
+    """
+    Importa um bloco de linhas NDJSON de repasses.
+
+    Cada linha é validada com CreateRepasseDTO; as produções do bloco são
+    conferidas com uma consulta IN e as linhas válidas entram num único INSERT,
+    com commit ao final do bloco. Linhas inválidas voltam em `errors`.
+    """
+
+    def __init__(
+        self,
+        repasse_repository: IRepasseRepository,
+        production_repository: IGetExistingProductionIds
+    ):
+        self.repasse_repository = repasse_repository
+        self.production_repository = production_repository
+
+    def execute(self, lines: List[Tuple[int, bytes]], user_id: UUID) -> ImportChunkResultDTO:
+        errors: List[ImportLineErrorDTO] = []
+        parsed = []
+        for number, line in lines:
+            try:
+                parsed.append((number, CreateRepasseDTO.model_validate_json(line)))
+            except ValidationError as e:
+                errors.append(ImportLineErrorDTO(line=number, detail=self._describe(e)))
+
+        productions = self.production_repository.get_existing_ids({item.production_id for _, item in parsed})
+        valid = []
+        for number, item in parsed:
+            if item.production_id in productions:
+                valid.append(item)
+            else:
+                errors.append(ImportLineErrorDTO(line=number, detail="Production not found"))
+
+        imported = self.repasse_repository.create_many(valid, user_id)
+        errors.sort(key=lambda error: error.line)
+        return ImportChunkResultDTO(imported=imported, errors=errors)
+
+    @staticmethod
+    def _describe(error: ValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'line'}: {detail['msg']}" for detail in error.errors()
+        )
@@ -0,0 +1,49 @@
+from typing import List, Optional
+from uuid import UUID
+from src.dto.repasseDTO import BulkUpsertRepasseResponseDTO, UpsertRepasseDTO
+from src.dto.responses import BulkItemErrorDTO
+from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
+from src.domain.usecase.interfaces.IGetExistingProductionIds import IGetExistingProductionIds
+
+
+class UpsertRepassesUseCase:
+    """
+    Registra eventos de repasse enviados pelos hospitais, sem duplicar reenvios.
+
+    A chave de idempotência é (usuário, source_system, external_id). Produções
+    inexistentes são validadas com uma consulta IN e voltam em `errors`.
+    """
+
+    def __init__(
+        self,
+        repasse_repository: IRepasseRepository,
+        production_repository: IGetExistingProductionIds
+    ):
+        self.repasse_repository = repasse_repository
+        self.production_repository = production_repository
+
+    def execute(self, items: List[UpsertRepasseDTO], user_id: UUID) -> BulkUpsertRepasseResponseDTO:
+        productions = self.production_repository.get_existing_ids({item.production_id for item in items})
+
+        errors = []
+        valid = []
+        for index, item in enumerate(items):
+            if item.production_id not in productions:
+                errors.append(BulkItemErrorDTO(index=index, detail="Production not found"))
+            else:
+                valid.append((index, item))
+
+        ids: List[Optional[UUID]] = [None] * len(items)
+        created = 0
+        results = self.repasse_repository.upsert_many([item for _, item in valid], user_id)
+        for (index, _), (repasse_id, was_created) in zip(valid, results):
+            ids[index] = repasse_id
+            created += was_created
+
+        return BulkUpsertRepasseResponseDTO(
+            created=created,
+            duplicates=len(valid) - created,
+            failed=len(errors),
+            ids=ids,
+            errors=errors
+        )
@@ -0,0 +1,11 @@
+from src.domain.enums.collection import Collection
+from src.domain.usecase.interfaces.IGetCollectionVersion import IGetCollectionVersion
+import uuid
+
+
+class GetCollectionVersionUseCase:
+    def __init__(self, get_collection_version_port: IGetCollectionVersion):
+        self.get_collection_version_port = get_collection_version_port
+
+    def execute(self, user_id: uuid.UUID, collection: Collection) -> int:
+        return self.get_collection_version_port.get_version(user_id, collection)
@@ -0,0 +1,12 @@
+from typing import Optional, Tuple
+from src.domain.enums.collection import Collection
+from src.domain.usecase.interfaces.IGetItemVersion import IGetItemVersion
+import uuid
+
+
+class GetItemVersionUseCase:
+    def __init__(self, get_item_version_port: IGetItemVersion):
+        self.get_item_version_port = get_item_version_port
+
+    def execute(self, collection: Collection, item_id: uuid.UUID) -> Optional[Tuple[uuid.UUID, int]]:
+        return self.get_item_version_port.get_item_version(collection, item_id)
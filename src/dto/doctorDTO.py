@@ -1,5 +1,11 @@
 import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from src.domain.entities.ReadModels import DoctorRow
+from src.dto.productionDTO import ProductionResponseDTO
+from src.dto.repasseDTO import RepasseResponseDTO
 
 
 class CreateDoctorDTO(BaseModel):
@@ -44,14 +50,14 @@ class UpdateDoctorDTO(BaseModel):
 
 class DoctorResponseDTO(BaseModel):
     """Response DTO with doctor data"""
-    id: str
+    id: uuid.UUID
     name: str
     crm: str
     specialty: str
     phone: str | None = None
     email: str
-    created_at: str
-    updated_at: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -67,3 +73,37 @@ class DoctorResponseDTO(BaseModel):
             }
         }
     )
+
+    @classmethod
+    def from_row(cls, doctor: DoctorRow) -> "DoctorResponseDTO":
+        """Builds the DTO from a read model without validation (values come from the database)"""
+        return cls.model_construct(
+            id=doctor.id,
+            name=doctor.name,
+            crm=doctor.crm,
+            specialty=doctor.specialty,
+            phone=doctor.phone,
+            email=doctor.email,
+            created_at=doctor.created_at,
+            updated_at=doctor.updated_at
+        )
+
+
+class StatementProductionDTO(ProductionResponseDTO):
+    """Production in a doctor statement, with its hospital name and repasses"""
+    hospital_name: str
+    repasses: List[RepasseResponseDTO]
+
+    model_config = ConfigDict(json_schema_extra=None)
+
+
+class DoctorStatementDTO(BaseModel):
+    """Doctor statement for a period (by production date)"""
+    doctor: DoctorResponseDTO
+    period_start: date | None = None
+    period_end: date | None = None
+    productions: List[StatementProductionDTO]
+    total_pending_count: int
+    total_pending_value: Decimal
+    total_consolidated_count: int
+    total_consolidated_value: Decimal
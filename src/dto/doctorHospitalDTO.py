@@ -1,4 +1,5 @@
 import uuid
+from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -32,3 +33,28 @@ class DoctorHospitalResponseDTO(BaseModel):
             }
         }
     )
+
+
+class HospitalDoctorDTO(BaseModel):
+    """A doctor linked to a hospital, with the date of the link"""
+    id: str
+    name: str
+    crm: str
+    specialty: str
+    email: str
+    phone: Optional[str] = None
+    assigned_at: str
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "name": "Dr. João Silva",
+                "crm": "CRM12345",
+                "specialty": "Cardiologia",
+                "email": "joao.silva@seiwa.com",
+                "phone": "+55 11 99999-0000",
+                "assigned_at": "2026-01-30T10:00:00"
+            }
+        }
+    )
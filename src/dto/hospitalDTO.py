@@ -1,5 +1,7 @@
 import uuid
+from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
+from src.domain.entities.ReadModels import HospitalRow
 
 
 class CreateHospitalDTO(BaseModel):
@@ -34,11 +36,11 @@ class UpdateHospitalDTO(BaseModel):
 
 class HospitalResponseDTO(BaseModel):
     """Response DTO with hospital data"""
-    id: str
+    id: uuid.UUID
     name: str
     address: str
-    created_at: str
-    updated_at: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -51,3 +53,14 @@ class HospitalResponseDTO(BaseModel):
             }
         }
     )
+
+    @classmethod
+    def from_row(cls, hospital: HospitalRow) -> "HospitalResponseDTO":
+        """Builds the DTO from a read model without validation (values come from the database)"""
+        return cls.model_construct(
+            id=hospital.id,
+            name=hospital.name,
+            address=hospital.address,
+            created_at=hospital.created_at,
+            updated_at=hospital.updated_at
+        )
@@ -1,6 +1,10 @@
-from typing import Generic, TypeVar, List
+from typing import Any, Callable, Generic, TypeVar, List, Optional, Tuple, Union
 from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+import base64
+import json
 import math
+import uuid
 
 T = TypeVar('T')
 
@@ -8,6 +12,8 @@ class PaginationParams(BaseModel):
     """Pagination parameters"""
     page: int = Field(default=1, ge=1, description="Page number (starts at 1)")
     page_size: int = Field(default=10, ge=1, le=100, description="Items per page")
+    cursor: Optional[str] = Field(default=None, description="Opaque cursor from a previous next_cursor; when set, page is ignored")
+    include_total: bool = Field(default=True, description="Include total and total_pages in the response")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -21,24 +27,79 @@ class PaginationParams(BaseModel):
         """Returns item limit"""
         return self.page_size
 
+    @property
+    def after(self) -> Optional[Tuple[datetime, uuid.UUID]]:
+        """Decoded keyset position of the cursor (raises ValueError if invalid)"""
+        return decode_cursor(self.cursor) if self.cursor else None
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response"""
     items: List[T]
-    total: int = Field(description="Total items available")
-    page: int = Field(description="Current page")
+    total: Optional[int] = Field(description="Total items available (null when include_total=false)")
+    total_exact: Optional[bool] = Field(default=None, description="False when total is a cached estimate; null when not included")
+    page: Optional[int] = Field(description="Current page (null when paginating by cursor)")
     page_size: int = Field(description="Items per page")
-    total_pages: int = Field(description="Total pages")
+    total_pages: Optional[int] = Field(description="Total pages (null when include_total=false)")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page (null on the last page)")
 
     model_config = ConfigDict(from_attributes=True)
 
     @classmethod
-    def create(cls, items: List[T], total: int, page: int, page_size: int):
+    def create(
+        cls,
+        items: List[T],
+        total: Optional[int],
+        page: Optional[int],
+        page_size: int,
+        next_cursor: Optional[str] = None,
+        total_exact: Optional[bool] = True
+    ):
         """Factory method to create paginated response"""
+        if total is None:
+            total_pages = None
+            total_exact = None
+        else:
+            total_pages = math.ceil(total / page_size) if page_size > 0 else 0
         return cls(
             items=items,
             total=total,
+            total_exact=total_exact,
             page=page,
             page_size=page_size,
-            total_pages=math.ceil(total / page_size) if page_size > 0 else 0
+            total_pages=total_pages,
+            next_cursor=next_cursor
         )
+
+
+def encode_cursor(created_at: Union[str, datetime], item_id: Union[str, uuid.UUID]) -> str:
+    """Encodes the (created_at, id) sort key of an item as an opaque cursor"""
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = json.dumps([created_at, str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decodes a cursor back into its (created_at, id) sort key"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def next_cursor_for(
+    rows: List,
+    limit: int,
+    key: Callable[[Any], Tuple[Union[str, datetime], Union[str, uuid.UUID]]] = lambda row: (row.created_at, row.id)
+) -> Optional[str]:
+    """
+    Builds next_cursor from rows fetched with `limit + 1`: the extra row only
+    signals that another page exists and is not returned. `key` extracts the
+    (created_at, id) sort key of a row.
+    """
+    if len(rows) <= limit:
+        return None
+    return encode_cursor(*key(rows[limit - 1]))
@@ -1,7 +1,10 @@
 import uuid
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, ConfigDict
-from datetime import date as date_type
+from src.dto.responses import BulkItemErrorDTO
+from datetime import date as date_type, datetime
 from enum import Enum
+from src.domain.entities.ReadModels import ProductionRow
 
 
 class ProductionType(str, Enum):
@@ -30,6 +33,36 @@ class CreateProductionDTO(BaseModel):
     )
 
 
+class BulkCreateProductionDTO(BaseModel):
+    """DTO for creating many productions in one request"""
+    # Items are validated one by one so that a bad item is reported instead of rejecting the batch
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=5000, description="Productions, same fields as POST /productions/")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "doctor_id": "123e4567-e89b-12d3-a456-426614174000",
+                        "hospital_id": "987e6543-e21b-12d3-a456-426614174999",
+                        "type": "shift",
+                        "date": "2026-01-30",
+                        "description": "Night shift at ER"
+                    }
+                ]
+            }
+        }
+    )
+
+
+class BulkCreateProductionResponseDTO(BaseModel):
+    """DTO for the result of a bulk creation"""
+    created: int
+    failed: int
+    ids: List[Optional[uuid.UUID]] = Field(..., description="Created production ID per request item (null when the item failed)")
+    errors: List[BulkItemErrorDTO]
+
+
 class UpdateProductionDTO(BaseModel):
     """DTO for updating a production"""
     type: ProductionType | None = Field(None, description="Production type (shift or consultation)")
@@ -49,14 +82,14 @@ class UpdateProductionDTO(BaseModel):
 
 class ProductionResponseDTO(BaseModel):
     """DTO for production response data"""
-    id: str
-    doctor_id: str
-    hospital_id: str
+    id: uuid.UUID
+    doctor_id: uuid.UUID
+    hospital_id: uuid.UUID
     type: str
-    date: str
+    date: date_type
     description: str | None = None
-    created_at: str
-    updated_at: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -72,3 +105,18 @@ class ProductionResponseDTO(BaseModel):
             }
         }
     )
+
+    @classmethod
+    def from_row(cls, production: ProductionRow, **fields: Any) -> "ProductionResponseDTO":
+        """Builds the DTO from a read model without validation (values come from the database); subclasses pass their extra fields"""
+        return cls.model_construct(
+            id=production.id,
+            doctor_id=production.doctor_id,
+            hospital_id=production.hospital_id,
+            type=production.type,
+            date=production.date,
+            description=production.description,
+            created_at=production.created_at,
+            updated_at=production.updated_at,
+            **fields
+        )
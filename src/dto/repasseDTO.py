@@ -1,9 +1,12 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from decimal import Decimal
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+from src.domain.entities.Repasse import Repasse
 from src.domain.enums.repasse_status import RepasseStatus
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+from src.dto.responses import BulkItemErrorDTO
 
 
 class CreateRepasseDTO(BaseModel):
@@ -22,6 +25,50 @@ class CreateRepasseDTO(BaseModel):
     )
 
 
+class UpsertRepasseDTO(CreateRepasseDTO):
+    source_system: str = Field(..., min_length=1, max_length=100, description="Hospital system that sent the event")
+    external_id: str = Field(..., min_length=1, max_length=255, description="Event ID in the source system")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "production_id": "123e4567-e89b-12d3-a456-426614174000",
+                "amount": 1500.00,
+                "status": "pending",
+                "source_system": "hospital-abc",
+                "external_id": "PAY-000123"
+            }
+        }
+    )
+
+
+class BulkUpsertRepasseDTO(BaseModel):
+    items: List[UpsertRepasseDTO] = Field(..., min_length=1, max_length=1000, description="Repasse events")
+
+
+class UpsertRepasseResponseDTO(BaseModel):
+    id: UUID
+    created: bool = Field(..., description="False when the event had already been received")
+
+
+class BulkUpsertRepasseResponseDTO(BaseModel):
+    created: int
+    duplicates: int
+    failed: int
+    ids: List[Optional[UUID]] = Field(..., description="Repasse ID per request item (null when the item failed)")
+    errors: List[BulkItemErrorDTO]
+
+
+class ImportLineErrorDTO(BaseModel):
+    line: int = Field(..., description="Line number in the NDJSON body (starts at 1)")
+    detail: str
+
+
+class ImportChunkResultDTO(BaseModel):
+    imported: int
+    errors: List[ImportLineErrorDTO]
+
+
 class UpdateRepasseDTO(BaseModel):
     amount: Optional[Decimal] = Field(None, gt=0, description="Payment amount")
     status: Optional[RepasseStatus] = Field(None, description="Payment status")
@@ -41,6 +88,8 @@ class RepasseResponseDTO(BaseModel):
     production_id: UUID
     amount: Decimal
     status: RepasseStatus
+    source_system: Optional[str] = None
+    external_id: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -58,6 +107,20 @@ class RepasseResponseDTO(BaseModel):
         }
     )
 
+    @classmethod
+    def from_row(cls, repasse: Repasse) -> "RepasseResponseDTO":
+        """Builds the DTO from a repasse read from the database, without validation"""
+        return cls.model_construct(
+            id=repasse.id,
+            production_id=repasse.production_id,
+            amount=repasse.amount,
+            status=repasse.status,
+            source_system=repasse.source_system,
+            external_id=repasse.external_id,
+            created_at=repasse.created_at,
+            updated_at=repasse.updated_at
+        )
+
 
 class RepasseStatsDTO(BaseModel):
     doctor_id: UUID
@@ -67,3 +130,58 @@ class RepasseStatsDTO(BaseModel):
     total_pending_value: Decimal
     total_consolidated_count: int
     total_consolidated_value: Decimal
+
+
+class RepasseStatsBatchRequestDTO(BaseModel):
+    doctor_ids: Optional[List[UUID]] = Field(None, min_length=1, max_length=500, description="Doctors to include")
+    hospital_id: Optional[UUID] = Field(None, description="Include every doctor linked to this hospital")
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def _one_selector(self):
+        if (self.doctor_ids is None) == (self.hospital_id is None):
+            raise ValueError("Provide either doctor_ids or hospital_id")
+        return self
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "doctor_ids": ["123e4567-e89b-12d3-a456-426614174000", "123e4567-e89b-12d3-a456-426614174001"],
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-31T23:59:59"
+            }
+        }
+    )
+
+
+class DoctorRepasseStatsDTO(BaseModel):
+    total_pending_count: int
+    total_pending_value: Decimal
+    total_consolidated_count: int
+    total_consolidated_value: Decimal
+
+
+class RepasseStatsBatchDTO(BaseModel):
+    period_start: Optional[datetime]
+    period_end: Optional[datetime]
+    doctors: Dict[UUID, DoctorRepasseStatsDTO] = Field(..., description="Stats keyed by doctor ID (zeros for doctors without repasses)")
+
+
+class RepasseSeriesBucketDTO(BaseModel):
+    bucket_start: datetime = Field(..., description="Start of the day/month bucket")
+    hospital_id: Optional[UUID] = Field(None, description="Hospital, when grouped by hospital")
+    production_type: Optional[str] = Field(None, description="Production type, when grouped by production_type")
+    total_pending_count: int = 0
+    total_pending_value: Decimal = Decimal(0)
+    total_consolidated_count: int = 0
+    total_consolidated_value: Decimal = Decimal(0)
+
+
+class RepasseStatsSeriesDTO(BaseModel):
+    doctor_id: UUID
+    granularity: SeriesGranularity
+    group_by: List[SeriesDimension]
+    period_start: Optional[datetime]
+    period_end: Optional[datetime]
+    buckets: List[RepasseSeriesBucketDTO]
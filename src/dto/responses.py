@@ -106,3 +106,9 @@ class DeleteResponseDTO(BaseModel):
             }
         }
     )
+
+
+class BulkItemErrorDTO(BaseModel):
+    """Why one item of a bulk request was not processed"""
+    index: int = Field(..., description="Position of the item in the request")
+    detail: str
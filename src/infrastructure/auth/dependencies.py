@@ -1,19 +1,52 @@
+import hashlib
+import os
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from prometheus_client import Counter
 from typing import Dict, Any
 
-from src.infrastructure.database.connection import get_db
+from src.infrastructure.cache.ttl_lru import TTLLRUCache
 from src.infrastructure.services.jwt_service import JWTService
 
 
 # Security scheme para o Swagger
 security = HTTPBearer()
 
+token_service = JWTService()
+
+# Payloads já verificados, indexados pelo sha256 do token e válidos até o `exp` do token
+verified_tokens = TTLLRUCache(maxsize=int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000")))
+
+TOKEN_CACHE_HITS = Counter("auth_token_cache_hits_total", "Verified-token cache hits")
+TOKEN_CACHE_MISSES = Counter("auth_token_cache_misses_total", "Verified-token cache misses")
+
+
+def verify_token_cached(token: str) -> Dict[str, Any]:
+    """
+    Verifica o token, reaproveitando a verificação anterior do mesmo token.
+
+    Raises:
+        ValueError: Se o token for inválido ou expirado
+    """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = verified_tokens.get(digest)
+    if payload is not None:
+        TOKEN_CACHE_HITS.inc()
+        return dict(payload)
+
+    TOKEN_CACHE_MISSES.inc()
+    payload = token_service.verify_token(token)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        # A entrada expira junto com o token; tokens sem exp não são guardados
+        verified_tokens.set(digest, dict(payload), ttl=exp - time.time())
+    return payload
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
     Dependency para validar o token JWT e retornar os dados do usuário atual.
@@ -25,7 +58,6 @@ def get_current_user(
 
     Args:
         credentials: Credenciais HTTP Bearer (token JWT)
-        db: Sessão do banco de dados
 
     Returns:
         Dados do usuário decodificados do token
@@ -34,11 +66,9 @@ def get_current_user(
         HTTPException: Se o token for inválido, expirado ou ausente
     """
     token = credentials.credentials
-    token_service = JWTService()
 
     try:
-        payload = token_service.verify_token(token)
-        return payload
+        return verify_token_cached(token)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,342 @@
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from abc import abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
+from src.domain.entities.CachedStats import CachedStats
+from src.domain.usecase.interfaces.IStatsCache import IStatsCache
+from src.dto.repasseDTO import RepasseStatsDTO
+from src.infrastructure.cache.ttl_lru import TTLLRUCache
+
+# redis está em requirements.txt; numa instalação sem ele só STATS_CACHE_BACKEND=redis falha na subida
+try:
+    import redis
+    import redis.asyncio
+except ImportError:
+    redis = None
+
+# local (por processo), redis (compartilhado entre workers) ou none
+STATS_CACHE_BACKEND = os.getenv("STATS_CACHE_BACKEND", "local")
+STATS_CACHE_URL = os.getenv("STATS_CACHE_URL", "redis://localhost:6379/0")
+# Segundos em que o resultado é servido como atual
+STATS_CACHE_TTL_SECONDS = float(os.getenv("STATS_CACHE_TTL_SECONDS", "30"))
+# Segundos extras em que o resultado vencido ainda é servido enquanto é recalculado em segundo plano (0 desativa)
+STATS_CACHE_STALE_SECONDS = float(os.getenv("STATS_CACHE_STALE_SECONDS", "0"))
+# Médicos mantidos no backend local
+STATS_CACHE_SIZE = int(os.getenv("STATS_CACHE_SIZE", "10000"))
+
+# Períodos guardados por médico no backend local; o mais antigo sai primeiro
+_MAX_PERIODS_PER_DOCTOR = 64
+
+STATS_CACHE_HITS = Counter("stats_cache_hits_total", "Stats served from the result cache", ["backend", "state"])
+STATS_CACHE_MISSES = Counter("stats_cache_misses_total", "Stats computed in the database", ["backend"])
+STATS_CACHE_ERRORS = Counter("stats_cache_errors_total", "Result cache operations that failed and were skipped", ["backend"])
+
+_BACKEND_ERRORS = (OSError, redis.RedisError) if redis is not None else (OSError,)
+
+
+class _Generation(NamedTuple):
+    """Geração do médico (None se o backend falhou) e o instante em que o cálculo começou"""
+    value: Optional[int]
+    started_at: float
+
+
+def _field(user_id: UUID, start_date: Optional[datetime], end_date: Optional[datetime]) -> str:
+    """Usuário + período: a chave dentro do grupo do médico"""
+    start = start_date.isoformat() if start_date else ""
+    end = end_date.isoformat() if end_date else ""
+    return f"{user_id}|{start}|{end}"
+
+
+class StatsCache(IStatsCache):
+    """
+    Cache das estatísticas de um médico por (usuário, médico, período).
+
+    As entradas ficam agrupadas por médico, então uma escrita que muda os
+    repasses de um médico descarta todos os períodos dele de uma vez, sem
+    tocar nos demais. Cada entrada guarda o instante em que foi calculada:
+    até `ttl` é atual; até `ttl + stale_ttl` é servida como vencida
+    (stale-while-revalidate); depois disso é ignorada.
+
+    Cada invalidação avança um contador (geração) do médico. Quem calcula lê
+    a geração antes (`generation`) e a repassa ao `set`, que não grava se ela
+    mudou: uma escrita que invalida durante o cálculo não tem o resultado
+    anterior regravado por cima. A entrada guarda o instante de início do
+    cálculo, então, se a marca da geração expirar antes do `set`, a entrada
+    já nasce vencida.
+
+    Falhas do backend não derrubam a rota: a leitura vira falta e a escrita
+    é ignorada.
+    """
+
+    name = "base"
+
+    def __init__(self, ttl: float, stale_ttl: float = 0, clock: Callable[[], float] = time.time):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+
+    @property
+    def lifetime(self) -> float:
+        return self.ttl + self.stale_ttl
+
+    def get(self, user_id, doctor_id, start_date, end_date) -> Optional[CachedStats]:
+        try:
+            payload = self._read(doctor_id, _field(user_id, start_date, end_date))
+        except _BACKEND_ERRORS:
+            STATS_CACHE_ERRORS.labels(self.name).inc()
+            payload = None
+
+        if payload is not None:
+            entry = json.loads(payload)
+            age = self._clock() - entry["stored_at"]
+            if age < self.lifetime:
+                stale = age >= self.ttl
+                STATS_CACHE_HITS.labels(self.name, "stale" if stale else "fresh").inc()
+                return CachedStats(stats=RepasseStatsDTO.model_validate(entry["stats"]), stale=stale)
+
+        STATS_CACHE_MISSES.labels(self.name).inc()
+        return None
+
+    def generation(self, doctor_id: UUID) -> _Generation:
+        started_at = self._clock()
+        try:
+            return _Generation(self._generation(doctor_id), started_at)
+        except _BACKEND_ERRORS:
+            STATS_CACHE_ERRORS.labels(self.name).inc()
+            return _Generation(None, started_at)
+
+    def set(
+        self, user_id, doctor_id, start_date, end_date, stats: RepasseStatsDTO, generation: Optional[_Generation] = None
+    ) -> None:
+        if generation is not None and generation.value is None:
+            # Sem a geração não dá para saber se houve invalidação durante o cálculo
+            return
+        stored_at = generation.started_at if generation is not None else self._clock()
+        payload = json.dumps({"stored_at": stored_at, "stats": stats.model_dump(mode="json")})
+        field = _field(user_id, start_date, end_date)
+        try:
+            if generation is None:
+                self._write(doctor_id, field, payload)
+            else:
+                self._write_if_generation(doctor_id, field, payload, generation.value)
+        except _BACKEND_ERRORS:
+            STATS_CACHE_ERRORS.labels(self.name).inc()
+
+    def invalidate_doctors(self, doctor_ids: Iterable[UUID]) -> None:
+        doctor_ids = set(doctor_ids)
+        if not doctor_ids:
+            return
+        try:
+            self._drop(doctor_ids)
+        except _BACKEND_ERRORS:
+            STATS_CACHE_ERRORS.labels(self.name).inc()
+
+    @abstractmethod
+    def _read(self, doctor_id: UUID, field: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def _write(self, doctor_id: UUID, field: str, payload: str) -> None:
+        pass
+
+    @abstractmethod
+    def _write_if_generation(self, doctor_id: UUID, field: str, payload: str, generation: int) -> None:
+        """Como _write, mas só se a geração do médico ainda for `generation` (verificado atomicamente)"""
+        pass
+
+    @abstractmethod
+    def _generation(self, doctor_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    def _drop(self, doctor_ids: Iterable[UUID]) -> None:
+        """Descarta as entradas dos médicos e avança a geração de cada um"""
+        pass
+
+
+class LocalStatsCache(StatsCache):
+    """Backend em memória, por processo: as escritas de outros workers só aparecem depois do TTL"""
+
+    name = "local"
+
+    def __init__(self, ttl: float, stale_ttl: float = 0, maxsize: int = 10000, clock: Callable[[], float] = time.time):
+        super().__init__(ttl, stale_ttl, clock)
+        self._doctors = TTLLRUCache(maxsize=maxsize, ttl=self.lifetime, clock=clock)
+        # Geração por médico; a marca só precisa durar o tempo de vida de uma entrada
+        self._generations = TTLLRUCache(maxsize=maxsize, ttl=self.lifetime, clock=clock)
+        self._next_generation = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def _read(self, doctor_id: UUID, field: str) -> Optional[str]:
+        periods = self._doctors.get(doctor_id)
+        return periods.get(field) if periods is not None else None
+
+    def _generation(self, doctor_id: UUID) -> int:
+        return self._generations.get(doctor_id, 0)
+
+    def _write(self, doctor_id: UUID, field: str, payload: str) -> None:
+        with self._lock:
+            self._store(doctor_id, field, payload)
+
+    def _write_if_generation(self, doctor_id: UUID, field: str, payload: str, generation: int) -> None:
+        with self._lock:
+            if self._generation(doctor_id) == generation:
+                self._store(doctor_id, field, payload)
+
+    def _store(self, doctor_id: UUID, field: str, payload: str) -> None:
+        periods: Dict[str, str] = dict(self._doctors.get(doctor_id) or {})
+        periods.pop(field, None)
+        periods[field] = payload
+        while len(periods) > _MAX_PERIODS_PER_DOCTOR:
+            periods.pop(next(iter(periods)))
+        # O grupo é substituído inteiro: leitores concorrentes nunca veem um dict sendo alterado
+        self._doctors.set(doctor_id, periods)
+
+    def _drop(self, doctor_ids: Iterable[UUID]) -> None:
+        with self._lock:
+            for doctor_id in doctor_ids:
+                self._doctors.delete(doctor_id)
+                # Contador do processo: nenhuma geração se repete entre médicos ou invalidações
+                self._generations.set(doctor_id, next(self._next_generation))
+
+    def clear(self) -> None:
+        self._doctors.clear()
+        self._generations.clear()
+
+
+# KEYS: hash do médico, geração. ARGV: geração lida antes do cálculo, campo, valor, expiração (s)
+_WRITE_IF_GENERATION = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+def _done(result: Any) -> Any:
+    return result
+
+
+class RedisStatsCache(StatsCache):
+    """
+    Backend de rede compatível com Redis, compartilhado entre workers.
+
+    Um hash por médico (`<prefixo><doctor_id>`), com um campo por usuário e
+    período: a invalidação é um DEL do hash mais um INCR da geração
+    (`<prefixo>gen:<doctor_id>`). O hash expira junto com a entrada mais
+    recente; entradas mais antigas são descartadas na leitura pelo instante
+    gravado. A gravação com geração é um script Lua, para que a comparação e
+    o HSET não sejam intercalados por uma invalidação de outro worker.
+
+    Dois clientes, como o PasswordService faz com o bcrypt:
+    - modo async (dentro de `run_sync`): o cliente `redis.asyncio`, cuja espera
+      é devolvida ao event loop por `await_only`;
+    - modo sync (threadpool): o cliente síncrono, que só bloqueia a thread da
+      requisição.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: Any,
+        ttl: float,
+        stale_ttl: float = 0,
+        prefix: str = "stats:",
+        clock: Callable[[], float] = time.time,
+        async_client: Any = None
+    ):
+        super().__init__(ttl, stale_ttl, clock)
+        self.client = client
+        self.async_client = async_client
+        self.prefix = prefix
+
+    def _client(self) -> Tuple[Any, Callable[[Any], Any]]:
+        """(cliente, espera pelo resultado) para o contexto de quem chamou"""
+        if self.async_client is not None and in_greenlet():
+            return self.async_client, await_only
+        return self.client, _done
+
+    def _key(self, doctor_id: UUID) -> str:
+        return f"{self.prefix}{doctor_id}"
+
+    def _generation_key(self, doctor_id: UUID) -> str:
+        return f"{self.prefix}gen:{doctor_id}"
+
+    def _generation(self, doctor_id: UUID) -> int:
+        client, wait = self._client()
+        return int(wait(client.get(self._generation_key(doctor_id))) or 0)
+
+    def _write_if_generation(self, doctor_id: UUID, field: str, payload: str, generation: int) -> None:
+        client, wait = self._client()
+        wait(client.eval(
+            _WRITE_IF_GENERATION, 2, self._key(doctor_id), self._generation_key(doctor_id),
+            str(generation), field, payload, max(1, math.ceil(self.lifetime))
+        ))
+
+    def _read(self, doctor_id: UUID, field: str) -> Optional[str]:
+        client, wait = self._client()
+        payload = wait(client.hget(self._key(doctor_id), field))
+        return payload.decode() if isinstance(payload, bytes) else payload
+
+    def _write(self, doctor_id: UUID, field: str, payload: str) -> None:
+        client, wait = self._client()
+        key = self._key(doctor_id)
+        pipeline = client.pipeline()
+        pipeline.hset(key, field, payload)
+        pipeline.expire(key, max(1, math.ceil(self.lifetime)))
+        wait(pipeline.execute())
+
+    def _drop(self, doctor_ids: Iterable[UUID]) -> None:
+        client, wait = self._client()
+        pipeline = client.pipeline()
+        pipeline.delete(*(self._key(doctor_id) for doctor_id in doctor_ids))
+        for doctor_id in doctor_ids:
+            key = self._generation_key(doctor_id)
+            pipeline.incr(key)
+            pipeline.expire(key, max(1, math.ceil(self.lifetime)))
+        wait(pipeline.execute())
+
+
+def build_stats_cache(backend: str = STATS_CACHE_BACKEND) -> Optional[StatsCache]:
+    """Backend configurado por STATS_CACHE_BACKEND; None desativa o cache"""
+    if backend == "none":
+        return None
+    if backend == "local":
+        return LocalStatsCache(STATS_CACHE_TTL_SECONDS, STATS_CACHE_STALE_SECONDS, maxsize=STATS_CACHE_SIZE)
+    if backend == "redis":
+        if redis is None:
+            raise RuntimeError("STATS_CACHE_BACKEND=redis requires the redis package, which is not installed")
+        # Os clientes só conectam no primeiro comando
+        return RedisStatsCache(
+            redis.Redis.from_url(STATS_CACHE_URL), STATS_CACHE_TTL_SECONDS, STATS_CACHE_STALE_SECONDS,
+            async_client=redis.asyncio.Redis.from_url(STATS_CACHE_URL)
+        )
+    raise ValueError(f"Unknown STATS_CACHE_BACKEND: {backend}")
+
+
+# Instância única por processo: o caso de uso lê por ela e os repositórios invalidam por ela
+stats_cache = build_stats_cache()
+
+
+def invalidate_doctor_stats(doctor_ids: Iterable[UUID]) -> None:
+    """Chamado pelos repositórios depois do commit de escritas que mudam os repasses dos médicos"""
+    if stats_cache is not None:
+        stats_cache.invalidate_doctors(doctor_ids)
+
+
+def clear_stats_cache() -> None:
+    if isinstance(stats_cache, LocalStatsCache):
+        stats_cache.clear()
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from src.infrastructure.database.connection import Base
+
+
+class CollectionVersionModel(Base):
+    """Versão de cada coleção por usuário, incrementada na mesma transação das escritas"""
+    __tablename__ = "collection_versions"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    collection = Column(String(32), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<CollectionVersion(user_id={self.user_id}, collection={self.collection}, version={self.version})>"
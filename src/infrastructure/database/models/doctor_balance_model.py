@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, Numeric, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from src.infrastructure.database.connection import Base
+
+
+class DoctorBalanceModel(Base):
+    """Saldo consolidado de cada médico, mantido na mesma transação das escritas de repasses"""
+    __tablename__ = "doctor_balances"
+
+    doctor_id = Column(UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), primary_key=True)
+    pending_count = Column(Integer, nullable=False, default=0)
+    pending_value = Column(Numeric(14, 2), nullable=False, default=0)
+    consolidated_count = Column(Integer, nullable=False, default=0)
+    consolidated_value = Column(Numeric(14, 2), nullable=False, default=0)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<DoctorBalance(doctor_id={self.doctor_id}, pending={self.pending_value}, consolidated={self.consolidated_value})>"
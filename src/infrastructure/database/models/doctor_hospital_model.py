@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, DateTime
+from sqlalchemy import Column, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 
@@ -6,6 +6,11 @@ from src.infrastructure.database.connection import Base
 
 class DoctorHospitalModel(Base):
     __tablename__ = "doctor_hospital"
+    __table_args__ = (
+        # A chave primária começa por doctor_id; médicos de um hospital precisam do índice
+        # inverso, já na ordem da listagem paginada (created_at, doctor_id)
+        Index("ix_doctor_hospital_hospital_id_created_at_doctor_id", "hospital_id", "created_at", "doctor_id"),
+    )
 
     doctor_id = Column(UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), primary_key=True)
     hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), primary_key=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 import uuid
@@ -7,6 +7,10 @@ from src.infrastructure.database.connection import Base
 
 class HospitalModel(Base):
     __tablename__ = "hospitals"
+    __table_args__ = (
+        # Listagem paginada por usuário, ordenada por (created_at, id)
+        Index("ix_hospitals_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, Date, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 import uuid
@@ -14,10 +14,18 @@ class ProductionType(str, enum.Enum):
 
 class ProductionModel(Base):
     __tablename__ = "productions"
+    __table_args__ = (
+        # Listagem paginada por usuário, ordenada por (created_at, id)
+        Index("ix_productions_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Listagem paginada por hospital, na mesma ordem
+        Index("ix_productions_hospital_id_created_at_id", "hospital_id", "created_at", "id"),
+        # Séries por médico: produções do médico com as colunas de quebra, sem ler a tabela
+        Index("ix_productions_doctor_id_series", "doctor_id", postgresql_include=["id", "hospital_id", "type"]),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    doctor_id = Column(UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False, index=True)
-    hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), nullable=False, index=True)
+    doctor_id = Column(UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    hospital_id = Column(UUID(as_uuid=True), ForeignKey("hospitals.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     type = Column(Enum(ProductionType), nullable=False)
     date = Column(Date, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum as SAEnum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 import uuid
@@ -8,11 +8,21 @@ from src.domain.enums.repasse_status import RepasseStatus
 
 class RepasseModel(Base):
     __tablename__ = "repasses"
+    __table_args__ = (
+        # Listagem paginada por usuário, ordenada por (created_at, id)
+        Index("ix_repasses_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Séries/estatísticas: repasses de cada produção no período, com status e valor no índice
+        Index("ix_repasses_production_id_created_at", "production_id", "created_at", postgresql_include=["status", "amount"]),
+        # Idempotência dos eventos vindos dos hospitais, por usuário; repasses sem external_id (NULL) não conflitam
+        Index("ix_repasses_user_id_source_system_external_id", "user_id", "source_system", "external_id", unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
-    production_id = Column(UUID(as_uuid=True), ForeignKey("productions.id", ondelete="CASCADE"), nullable=False, index=True)
+    production_id = Column(UUID(as_uuid=True), ForeignKey("productions.id", ondelete="CASCADE"), nullable=False)
     amount = Column(Numeric(10, 2), nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     status = Column(SAEnum(RepasseStatus), default=RepasseStatus.PENDING, nullable=False)
+    source_system = Column(String(100), nullable=True)
+    external_id = Column(String(255), nullable=True)
@@ -0,0 +1,85 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Métricas do pool expostas no /metrics (registry padrão do prometheus_client)
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured number of persistent connections in the pool",
+    ["engine"],
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["engine"],
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections currently open beyond pool_size",
+    ["engine"],
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to obtain a connection from the pool",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+POOL_CHECKOUT_FAILURES = Counter(
+    "db_pool_checkout_failures_total",
+    "Checkouts that failed (pool timeout or connection error)",
+    ["engine"],
+)
+
+
+class _InstrumentedPoolMixin:
+    """Mede o tempo de espera e as falhas de checkout do pool"""
+
+    metrics_label = "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            POOL_CHECKOUT_FAILURES.labels(self.metrics_label).inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.labels(self.metrics_label).observe(time.perf_counter() - started)
+
+    def recreate(self):
+        # O pool é recriado em dispose()/invalidação; o rótulo precisa acompanhar
+        pool = super().recreate()
+        pool.metrics_label = self.metrics_label
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine: Engine, label: str) -> None:
+    """
+    Liga os gauges do pool ao engine informado.
+
+    Os gauges leem o pool atual do engine a cada coleta, então continuam
+    válidos depois de um dispose().
+    """
+    pool = engine.pool
+    if not isinstance(pool, _InstrumentedPoolMixin):
+        return
+    pool.metrics_label = label
+
+    # Cria as séries já zeradas para aparecerem no /metrics antes do primeiro checkout
+    POOL_CHECKOUT_WAIT.labels(label)
+    POOL_CHECKOUT_FAILURES.labels(label)
+
+    POOL_SIZE.labels(label).set_function(lambda: engine.pool.size())
+    POOL_CHECKED_OUT.labels(label).set_function(lambda: engine.pool.checkedout())
+    # QueuePool.overflow() começa em -pool_size; só interessa o que passou do tamanho fixo
+    POOL_OVERFLOW.labels(label).set_function(lambda: max(engine.pool.overflow(), 0))
@@ -0,0 +1,65 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.requests import Request
+
+
+class ReadYourWritesPins:
+    """
+    Mantém, por usuário, uma janela curta em que as leituras vão para o primário.
+
+    Depois de uma escrita, o mesmo usuário lê do primário por `window_seconds`,
+    tempo suficiente para a réplica alcançar o primário. O usuário é identificado
+    pelo hash do header Authorization, então nada depende de decodificar o token.
+    O estado é local ao processo: cada worker mantém os seus próprios pins.
+
+    Como a janela é a mesma para todos e o relógio é monotônico, manter os pins
+    na ordem da última escrita os deixa ordenados por expiração: a limpeza a
+    cada `pin` só retira os vencidos do começo, sem percorrer o mapa inteiro.
+    """
+
+    def __init__(self, window_seconds: float, clock=time.monotonic):
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._pins: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+    def pin(self, request: Request) -> None:
+        key = self.key_for(request)
+        if key is None or self.window_seconds <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._pins[key] = now + self.window_seconds
+            self._pins.move_to_end(key)
+            self._prune(now)
+
+    def is_pinned(self, request: Request) -> bool:
+        key = self.key_for(request)
+        if key is None:
+            return False
+        with self._lock:
+            expires_at = self._pins.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= self._clock():
+                del self._pins[key]
+                return False
+            return True
+
+    def _prune(self, now: float) -> None:
+        while self._pins:
+            key, expires_at = next(iter(self._pins.items()))
+            if expires_at > now:
+                return
+            del self._pins[key]
@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from typing import Hashable, Iterable, Optional, Tuple
+import uuid
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from src.domain.enums.collection import Collection
+from src.domain.usecase.interfaces.IGetCollectionVersion import IGetCollectionVersion
+from src.domain.usecase.interfaces.IGetItemVersion import IGetItemVersion
+from src.infrastructure.database.models.collection_version_model import CollectionVersionModel
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel
+from src.infrastructure.repositories.dialect import dialect_insert
+
+
+# Tabela de cada coleção, para achar o dono de um registro
+_ITEM_MODELS = {
+    Collection.DOCTORS: DoctorModel,
+    Collection.HOSPITALS: HospitalModel,
+    Collection.PRODUCTIONS: ProductionModel,
+}
+
+
+class CollectionVersionRepository(IGetCollectionVersion, IGetItemVersion):
+    """
+    Contador de versão por (usuário, coleção), base do ETag das leituras.
+
+    A versão muda na mesma transação que os dados, então nenhum leitor vê
+    dados novos com a versão antiga (ou o contrário). O upsert bloqueia a
+    linha (usuário, coleção) até o commit e serializa as escritas do usuário
+    naquela coleção; por isso os repositórios chamam `commit`, que grava antes
+    as escritas principais e só então incrementa a versão, uma vez por lote,
+    deixando a linha presa só pelo commit.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def bump(self, user_id: Optional[Hashable], *collections: Collection) -> None:
+        """Incrementa a versão das coleções do usuário de forma atômica (upsert)"""
+        if user_id is None:
+            return
+        now = datetime.now(timezone.utc)
+        insert = dialect_insert(self.db)
+        for collection in collections:
+            statement = insert(CollectionVersionModel).values(
+                user_id=user_id, collection=collection.value, version=1, updated_at=now
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[CollectionVersionModel.user_id, CollectionVersionModel.collection],
+                set_={"version": CollectionVersionModel.version + 1, "updated_at": now},
+            )
+            self.db.execute(statement)
+
+    def commit(self, user_ids: Iterable[Hashable], *collections: Collection) -> None:
+        """Flush das escritas pendentes, incremento das versões (em ordem fixa de usuário) e commit"""
+        self.db.flush()
+        for user_id in sorted(user_ids, key=str):
+            self.bump(user_id, *collections)
+        self.db.commit()
+
+    def get_version(self, user_id: uuid.UUID, collection: Collection) -> int:
+        """Versão atual (0 se a coleção nunca foi escrita): uma leitura pela chave primária"""
+        version = self.db.query(CollectionVersionModel.version).filter(
+            CollectionVersionModel.user_id == user_id,
+            CollectionVersionModel.collection == collection.value
+        ).scalar()
+        return version or 0
+
+    def get_item_version(self, collection: Collection, item_id: uuid.UUID) -> Optional[Tuple[uuid.UUID, int]]:
+        """
+        Dono do registro e a versão da coleção do dono, numa consulta.
+
+        As escritas incrementam a versão do dono do registro, não a de quem as
+        fez; o ETag de um item precisa vir dela para mudar para qualquer leitor.
+        """
+        model = _ITEM_MODELS[collection]
+        row = self.db.query(model.user_id, CollectionVersionModel.version).outerjoin(
+            CollectionVersionModel,
+            and_(
+                CollectionVersionModel.user_id == model.user_id,
+                CollectionVersionModel.collection == collection.value
+            )
+        ).filter(model.id == item_id).first()
+        if row is None:
+            return None
+        return row.user_id, row.version or 0
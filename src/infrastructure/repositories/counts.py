@@ -0,0 +1,45 @@
+import os
+from typing import Callable, Hashable
+
+from prometheus_client import Counter
+
+from src.domain.entities.TotalCount import TotalCount
+from src.infrastructure.cache.ttl_lru import TTLLRUCache
+
+# Por quanto tempo um COUNT(*) por usuário é reaproveitado entre as páginas
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+
+_counts = TTLLRUCache(maxsize=int(os.getenv("COUNT_CACHE_SIZE", "10000")), ttl=COUNT_CACHE_TTL_SECONDS)
+
+COUNT_CACHE_HITS = Counter("list_count_cache_hits_total", "Paginated totals served from the count cache", ["table"])
+COUNT_CACHE_MISSES = Counter("list_count_cache_misses_total", "Paginated totals counted in the database", ["table"])
+
+
+def cached_count(table: str, user_id: Hashable, count: Callable[[], int]) -> TotalCount:
+    """
+    Retorna o total de `table` para o usuário, contando no banco só quando não há
+    valor em cache. O valor em cache é marcado como estimado (exact=False): as
+    escritas deste processo o invalidam, mas as de outros workers só aparecem
+    depois do TTL.
+    """
+    key = (table, user_id)
+    cached = _counts.get(key)
+    if cached is not None:
+        COUNT_CACHE_HITS.labels(table).inc()
+        return TotalCount(value=cached, exact=False)
+
+    COUNT_CACHE_MISSES.labels(table).inc()
+    value = count()
+    _counts.set(key, value)
+    return TotalCount(value=value, exact=True)
+
+
+def invalidate_counts(user_id: Hashable) -> None:
+    """Descarta os totais do usuário (exclusões em cascata afetam mais de uma tabela)"""
+    for table in ("doctors", "hospitals", "productions", "repasses"):
+        _counts.delete((table, user_id))
+        _counts.delete((table, None))
+
+
+def clear_counts() -> None:
+    _counts.clear()
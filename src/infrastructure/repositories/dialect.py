@@ -0,0 +1,13 @@
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session):
+    """`insert` do dialeto da sessão, com suporte a ON CONFLICT (PostgreSQL e SQLite)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upsert not supported for dialect '{dialect}'")
+    return insert
@@ -0,0 +1,171 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from src.domain.enums.repasse_status import RepasseStatus
+from src.infrastructure.database.models.doctor_balance_model import DoctorBalanceModel
+from src.infrastructure.database.models.production_model import ProductionModel
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.repositories.dialect import dialect_insert
+from src.infrastructure.cache.stats_cache import invalidate_doctor_stats
+
+BalanceByStatus = Dict[RepasseStatus, Tuple[int, Decimal]]
+Drift = List[Tuple[UUID, BalanceByStatus, BalanceByStatus]]
+
+_COLUMNS = {
+    RepasseStatus.PENDING: ("pending_count", "pending_value"),
+    RepasseStatus.CONSOLIDATED: ("consolidated_count", "consolidated_value"),
+}
+
+
+class DoctorBalanceRepository:
+    """
+    Saldo por médico (quantidade e soma por status) mantido incrementalmente.
+
+    Os métodos de escrita não fazem commit: são chamados pelos repositórios de
+    repasses/produções/hospitais antes do commit deles, na mesma transação.
+    `touched` junta os médicos alterados, para o chamador invalidar as
+    estatísticas em cache depois do commit.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.touched: Set[UUID] = set()
+
+    def apply(self, doctor_id: UUID, status: RepasseStatus, count: int, amount: Decimal) -> None:
+        """Soma (ou subtrai, com valores negativos) ao saldo do médico de forma atômica"""
+        count_column, value_column = _COLUMNS[status]
+        values = {
+            "pending_count": 0,
+            "pending_value": Decimal(0),
+            "consolidated_count": 0,
+            "consolidated_value": Decimal(0),
+            count_column: count,
+            value_column: amount,
+        }
+        now = datetime.now(timezone.utc)
+        insert = dialect_insert(self.db)
+        statement = insert(DoctorBalanceModel).values(doctor_id=doctor_id, updated_at=now, **values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[DoctorBalanceModel.doctor_id],
+            set_={
+                count_column: getattr(DoctorBalanceModel, count_column) + count,
+                value_column: getattr(DoctorBalanceModel, value_column) + amount,
+                "updated_at": now,
+            },
+        )
+        self.db.execute(statement)
+        self.touched.add(doctor_id)
+
+    def add_repasses(self, *criteria) -> None:
+        """Soma ao saldo os repasses já gravados que atendem aos critérios (inserções em lote)"""
+        self._apply_grouped(1, criteria)
+
+    def subtract_repasses(self, *criteria) -> None:
+        """Retira do saldo os repasses que serão apagados em cascata (produção/hospital removidos)"""
+        self._apply_grouped(-1, criteria)
+
+    def _apply_grouped(self, sign: int, criteria) -> None:
+        rows = (
+            self.db.query(ProductionModel.doctor_id, RepasseModel.status, func.count(RepasseModel.id), func.sum(RepasseModel.amount))
+            .join(ProductionModel, RepasseModel.production_id == ProductionModel.id)
+            .filter(*criteria)
+            .group_by(ProductionModel.doctor_id, RepasseModel.status)
+            .all()
+        )
+        for doctor_id, status, count, total in rows:
+            self.apply(doctor_id, status, sign * count, sign * Decimal(total or 0))
+
+    def delete(self, doctor_id: UUID) -> None:
+        self.db.query(DoctorBalanceModel).filter(DoctorBalanceModel.doctor_id == doctor_id).delete()
+        self.touched.add(doctor_id)
+
+    def get(self, doctor_id: UUID) -> BalanceByStatus:
+        """Saldo de todo o período do médico: uma leitura pela chave primária"""
+        balance = self.db.get(DoctorBalanceModel, doctor_id)
+        if balance is None:
+            return {}
+        return self._to_stats(balance)
+
+    def get_many(self, doctor_ids: Iterable[UUID]) -> Dict[UUID, BalanceByStatus]:
+        """Saldo de todo o período de vários médicos numa consulta; médicos sem saldo ficam de fora"""
+        doctor_ids = set(doctor_ids)
+        if not doctor_ids:
+            return {}
+        balances = self.db.query(DoctorBalanceModel).filter(DoctorBalanceModel.doctor_id.in_(doctor_ids)).all()
+        return {balance.doctor_id: self._to_stats(balance) for balance in balances}
+
+    def lock_repasses(self) -> None:
+        """
+        Bloqueia as escritas em repasses até o fim da transação (SHARE lock).
+
+        Tomado antes do recálculo do reparo: uma escrita em andamento termina
+        antes (e entra no recálculo), e as seguintes esperam o commit e aplicam
+        o delta sobre o saldo já corrigido, em vez de serem sobrescritas. No
+        SQLite as escritas já são serializadas pelo banco.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(text("LOCK TABLE repasses IN SHARE MODE"))
+
+    def find_drift(self) -> Drift:
+        """Compara o saldo mantido com o recalculado a partir dos repasses"""
+        expected = self._recompute()
+        stored = {balance.doctor_id: self._to_stats(balance) for balance in self.db.query(DoctorBalanceModel).all()}
+
+        drift = []
+        for doctor_id in expected.keys() | stored.keys():
+            actual = self._normalize(stored.get(doctor_id, {}))
+            wanted = self._normalize(expected.get(doctor_id, {}))
+            if actual != wanted:
+                drift.append((doctor_id, actual, wanted))
+        return drift
+
+    def repair(self, drift: Optional[Drift] = None) -> int:
+        """
+        Regrava o saldo dos médicos com divergência e faz o commit; retorna quantos foram corrigidos.
+
+        `drift` é o resultado de find_drift calculado depois de lock_repasses,
+        na mesma transação; sem ele, o bloqueio e o cálculo são feitos aqui.
+        """
+        if drift is None:
+            self.lock_repasses()
+            drift = self.find_drift()
+        for doctor_id, _, wanted in drift:
+            self.delete(doctor_id)
+            for status, (count, total) in wanted.items():
+                if count:
+                    self.apply(doctor_id, status, count, total)
+        self.db.commit()
+        invalidate_doctor_stats(self.touched)
+        return len(drift)
+
+    def _recompute(self) -> Dict[UUID, BalanceByStatus]:
+        rows = (
+            self.db.query(ProductionModel.doctor_id, RepasseModel.status, func.count(RepasseModel.id), func.sum(RepasseModel.amount))
+            .join(ProductionModel, RepasseModel.production_id == ProductionModel.id)
+            .group_by(ProductionModel.doctor_id, RepasseModel.status)
+            .all()
+        )
+        expected: Dict[UUID, BalanceByStatus] = {}
+        for doctor_id, status, count, total in rows:
+            expected.setdefault(doctor_id, {})[status] = (count, Decimal(total or 0))
+        return expected
+
+    @staticmethod
+    def _normalize(stats: BalanceByStatus) -> BalanceByStatus:
+        return {
+            status: (count, Decimal(total).quantize(Decimal("0.01")))
+            for status, (count, total) in stats.items()
+            if count or total
+        }
+
+    @staticmethod
+    def _to_stats(balance: DoctorBalanceModel) -> BalanceByStatus:
+        return {
+            RepasseStatus.PENDING: (balance.pending_count, Decimal(balance.pending_value)),
+            RepasseStatus.CONSOLIDATED: (balance.consolidated_count, Decimal(balance.consolidated_value)),
+        }
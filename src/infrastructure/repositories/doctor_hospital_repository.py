@@ -1,15 +1,19 @@
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 import uuid
 
 from src.infrastructure.database.models.doctor_hospital_model import DoctorHospitalModel
+from src.infrastructure.repositories.pagination import page_query
+from src.domain.entities.TotalCount import TotalCount
 from src.domain.usecase.interfaces.IAssignDoctorToHospital import IAssignDoctorToHospital
 from src.domain.usecase.interfaces.IRemoveDoctorFromHospital import IRemoveDoctorFromHospital
 from src.domain.usecase.interfaces.IGetHospitalsByDoctor import IGetHospitalsByDoctor
 from src.domain.usecase.interfaces.IGetDoctorsByHospital import IGetDoctorsByHospital
+from src.domain.usecase.interfaces.IGetDoctorIdsByHospital import IGetDoctorIdsByHospital
 
 
-class DoctorHospitalRepository(IAssignDoctorToHospital, IRemoveDoctorFromHospital, IGetHospitalsByDoctor, IGetDoctorsByHospital):
+class DoctorHospitalRepository(IAssignDoctorToHospital, IRemoveDoctorFromHospital, IGetHospitalsByDoctor, IGetDoctorsByHospital, IGetDoctorIdsByHospital):
     def __init__(self, db: Session):
         self.db = db
 
@@ -79,15 +83,28 @@ class DoctorHospitalRepository(IAssignDoctorToHospital, IRemoveDoctorFromHospita
             for hospital, dh in results
         ]
 
-    def get_doctors_by_hospital(self, hospital_id: uuid.UUID) -> List[dict]:
-        """Lista todos os médicos de um hospital"""
+    def get_doctors_by_hospital(
+        self,
+        hospital_id: uuid.UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[dict]:
+        """
+        Uma página dos médicos de um hospital, na ordem do vínculo (assigned_at,
+        id do médico); o período filtra pela data do vínculo.
+        """
         from src.infrastructure.database.models.doctor_model import DoctorModel
 
-        results = self.db.query(DoctorModel, DoctorHospitalModel).join(
+        query = self.db.query(DoctorModel, DoctorHospitalModel).join(
             DoctorHospitalModel,
             DoctorModel.id == DoctorHospitalModel.doctor_id
-        ).filter(
-            DoctorHospitalModel.hospital_id == hospital_id
+        )
+        query = self._links_of(query, hospital_id, start_date, end_date)
+        results = page_query(
+            query, DoctorHospitalModel, skip, limit, after, id_column=DoctorHospitalModel.doctor_id
         ).all()
 
         return [
@@ -102,3 +119,28 @@ class DoctorHospitalRepository(IAssignDoctorToHospital, IRemoveDoctorFromHospita
             }
             for doctor, dh in results
         ]
+
+    def count_doctors_by_hospital(
+        self,
+        hospital_id: uuid.UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> TotalCount:
+        """Total de médicos vinculados ao hospital no período, contado só no índice do vínculo"""
+        query = self._links_of(self.db.query(DoctorHospitalModel), hospital_id, start_date, end_date)
+        return TotalCount(value=query.count())
+
+    def _links_of(self, query, hospital_id: uuid.UUID, start_date: Optional[datetime], end_date: Optional[datetime]):
+        query = query.filter(DoctorHospitalModel.hospital_id == hospital_id)
+        if start_date:
+            query = query.filter(DoctorHospitalModel.created_at >= start_date)
+        if end_date:
+            query = query.filter(DoctorHospitalModel.created_at <= end_date)
+        return query
+
+    def get_doctor_ids_by_hospital(self, hospital_id: uuid.UUID) -> List[uuid.UUID]:
+        """IDs dos médicos de um hospital, lidos só do índice ix_doctor_hospital_hospital_id_created_at_doctor_id"""
+        rows = self.db.query(DoctorHospitalModel.doctor_id).filter(
+            DoctorHospitalModel.hospital_id == hospital_id
+        ).all()
+        return [row.doctor_id for row in rows]
@@ -1,9 +1,20 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Set, Tuple
+from datetime import datetime
 import uuid
 
 from src.domain.entities.Doctor import Doctor
+from src.domain.entities.ReadModels import DoctorRow
 from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.production_model import ProductionModel
+from src.infrastructure.repositories.pagination import page_query
+from src.infrastructure.repositories.counts import cached_count, invalidate_counts
+from src.infrastructure.cache.stats_cache import invalidate_doctor_stats
+from src.infrastructure.repositories.entity_cache import cached_entity, invalidate_entities, invalidate_entity, store_entity
+from src.infrastructure.repositories.collection_version_repository import CollectionVersionRepository
+from src.domain.enums.collection import Collection
+from src.infrastructure.repositories.doctor_balance_repository import DoctorBalanceRepository
+from src.domain.entities.TotalCount import TotalCount
 from src.domain.usecase.interfaces.IGetDoctorById import IGetDoctorById
 from src.domain.usecase.interfaces.IGetDoctorByCRM import IGetDoctorByCRM
 from src.domain.usecase.interfaces.IGetDoctorByEmail import IGetDoctorByEmail
@@ -11,14 +22,31 @@ from src.domain.usecase.interfaces.ISaveDoctor import ISaveDoctor
 from src.domain.usecase.interfaces.IUpdateDoctor import IUpdateDoctor
 from src.domain.usecase.interfaces.IDeleteDoctor import IDeleteDoctor
 from src.domain.usecase.interfaces.IGetAllDoctors import IGetAllDoctors
+from src.domain.usecase.interfaces.IGetExistingDoctorIds import IGetExistingDoctorIds
 
+# Colunas na ordem do DoctorRow: as listagens não montam objetos do ORM
+_ROW_COLUMNS = (
+    DoctorModel.id, DoctorModel.user_id, DoctorModel.name, DoctorModel.crm, DoctorModel.specialty,
+    DoctorModel.phone, DoctorModel.email, DoctorModel.created_at, DoctorModel.updated_at,
+)
 
-class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISaveDoctor, IUpdateDoctor, IDeleteDoctor, IGetAllDoctors):
+class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISaveDoctor, IUpdateDoctor, IDeleteDoctor, IGetAllDoctors, IGetExistingDoctorIds):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, doctor_id: uuid.UUID) -> Optional[Doctor]:
-        """Busca um médico pelo ID"""
+    def get_by_id(self, doctor_id: uuid.UUID, cached: bool = False) -> Optional[Doctor]:
+        """
+        Busca um médico pelo ID, do cache de entidades só com `cached=True`.
+
+        O cache é por processo e pode estar até o TTL atrás de escritas de
+        outro worker: serve a leituras e às verificações das ingestões, cujo
+        save trata a exclusão concorrente pela chave estrangeira no commit.
+        """
+        if not cached:
+            return self._load(doctor_id)
+        return cached_entity("doctors", doctor_id, lambda: self._load(doctor_id))
+
+    def _load(self, doctor_id: uuid.UUID) -> Optional[Doctor]:
         doctor_model = self.db.query(DoctorModel).filter(DoctorModel.id == doctor_id).first()
 
         if not doctor_model:
@@ -36,6 +64,14 @@ class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISave
             updated_at=doctor_model.updated_at.isoformat() if doctor_model.updated_at else None
         )
 
+    def get_existing_ids(self, doctor_ids: Iterable[uuid.UUID]) -> Set[uuid.UUID]:
+        """Dos IDs informados, retorna os que existem (uma consulta com IN)"""
+        doctor_ids = set(doctor_ids)
+        if not doctor_ids:
+            return set()
+        rows = self.db.query(DoctorModel.id).filter(DoctorModel.id.in_(doctor_ids)).all()
+        return {row.id for row in rows}
+
     def get_by_crm(self, crm: str) -> Optional[Doctor]:
         """Busca um médico pelo CRM"""
         doctor_model = self.db.query(DoctorModel).filter(DoctorModel.crm == crm).first()
@@ -74,32 +110,30 @@ class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISave
             updated_at=doctor_model.updated_at.isoformat() if doctor_model.updated_at else None
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100, user_id: Optional[uuid.UUID] = None) -> Tuple[List[Doctor], int]:
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[uuid.UUID] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[DoctorRow]:
         """Lista todos os médicos com paginação"""
-        query = self.db.query(DoctorModel)
+        query = self.db.query(*_ROW_COLUMNS)
 
         if user_id:
             query = query.filter(DoctorModel.user_id == user_id)
 
-        total = query.count()
-        doctors_model = query.offset(skip).limit(limit).all()
-
-        doctors = [
-            Doctor(
-                id=doctor.id,
-                user_id=doctor.user_id,
-                name=doctor.name,
-                crm=doctor.crm,
-                specialty=doctor.specialty,
-                phone=doctor.phone,
-                email=doctor.email,
-                created_at=doctor.created_at.isoformat(),
-                updated_at=doctor.updated_at.isoformat() if doctor.updated_at else None
-            )
-            for doctor in doctors_model
-        ]
-
-        return doctors, total
+        return [DoctorRow(*row) for row in page_query(query, DoctorModel, skip, limit, after)]
+
+    def count_all(self, user_id: Optional[uuid.UUID] = None) -> TotalCount:
+        """Total de médicos do usuário, reaproveitando a contagem em cache"""
+        def count() -> int:
+            query = self.db.query(DoctorModel)
+            if user_id:
+                query = query.filter(DoctorModel.user_id == user_id)
+            return query.count()
+
+        return cached_count("doctors", user_id, count)
 
     def save(self, doctor: Doctor) -> Doctor:
         """Salva um novo médico no banco de dados"""
@@ -114,10 +148,11 @@ class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISave
         )
 
         self.db.add(doctor_model)
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([doctor_model.user_id], Collection.DOCTORS)
         self.db.refresh(doctor_model)
+        invalidate_counts(doctor_model.user_id)
 
-        return Doctor(
+        doctor = Doctor(
             id=doctor_model.id,
             user_id=doctor_model.user_id,
             name=doctor_model.name,
@@ -128,6 +163,8 @@ class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISave
             created_at=doctor_model.created_at.isoformat(),
             updated_at=doctor_model.updated_at.isoformat() if doctor_model.updated_at else None
         )
+        store_entity("doctors", doctor)
+        return doctor
 
     def update(self, doctor_id: uuid.UUID, **kwargs) -> Optional[Doctor]:
         """Atualiza os dados de um médico"""
@@ -140,10 +177,10 @@ class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISave
             if value is not None and hasattr(doctor_model, key):
                 setattr(doctor_model, key, value)
 
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([doctor_model.user_id], Collection.DOCTORS)
         self.db.refresh(doctor_model)
 
-        return Doctor(
+        doctor = Doctor(
             id=doctor_model.id,
             user_id=doctor_model.user_id,
             name=doctor_model.name,
@@ -154,6 +191,8 @@ class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISave
             created_at=doctor_model.created_at.isoformat(),
             updated_at=doctor_model.updated_at.isoformat() if doctor_model.updated_at else None
         )
+        store_entity("doctors", doctor)
+        return doctor
 
     def delete(self, doctor_id: uuid.UUID) -> bool:
         """Remove um médico do banco de dados"""
@@ -162,6 +201,15 @@ class DoctorRepository(IGetDoctorById, IGetDoctorByCRM, IGetDoctorByEmail, ISave
         if not doctor_model:
             return False
 
+        user_id = doctor_model.user_id
+        # As produções do médico são apagadas em cascata; os IDs saem do índice por doctor_id
+        production_ids = [row.id for row in self.db.query(ProductionModel.id).filter(ProductionModel.doctor_id == doctor_id)]
+        balances = DoctorBalanceRepository(self.db)
+        balances.delete(doctor_id)
         self.db.delete(doctor_model)
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([user_id], Collection.DOCTORS, Collection.PRODUCTIONS)
+        invalidate_counts(user_id)
+        invalidate_doctor_stats(balances.touched)
+        invalidate_entity("doctors", doctor_id)
+        invalidate_entities("productions", production_ids)
         return True
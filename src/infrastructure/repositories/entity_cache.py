@@ -0,0 +1,62 @@
+import os
+from typing import Callable, Dict, Hashable, Iterable, Optional, TypeVar
+
+from prometheus_client import Counter
+from pydantic import BaseModel
+
+from src.infrastructure.cache.ttl_lru import TTLLRUCache
+
+# Por quanto tempo uma entidade lida por ID é reaproveitada (escritas de outros workers só aparecem depois disso)
+ENTITY_CACHE_TTL_SECONDS = float(os.getenv("ENTITY_CACHE_TTL_SECONDS", "60"))
+ENTITY_CACHE_SIZE = int(os.getenv("ENTITY_CACHE_SIZE", "10000"))
+
+ENTITY_KINDS = ("doctors", "hospitals", "productions")
+
+# Um cache por tipo
+_entities: Dict[str, TTLLRUCache] = {
+    kind: TTLLRUCache(maxsize=ENTITY_CACHE_SIZE, ttl=ENTITY_CACHE_TTL_SECONDS) for kind in ENTITY_KINDS
+}
+
+ENTITY_CACHE_HITS = Counter("entity_cache_hits_total", "Lookups by ID served from the entity cache", ["entity"])
+ENTITY_CACHE_MISSES = Counter("entity_cache_misses_total", "Lookups by ID read from the database", ["entity"])
+
+E = TypeVar("E", bound=BaseModel)
+
+
+def cached_entity(kind: str, entity_id: Hashable, load: Callable[[], Optional[E]]) -> Optional[E]:
+    """
+    Retorna a entidade `kind` com o ID informado, indo ao banco só quando não há
+    cópia em cache. Ausências não são guardadas: um registro criado por outro
+    worker aparece na próxima leitura.
+    """
+    cached = _entities[kind].get(entity_id)
+    if cached is not None:
+        ENTITY_CACHE_HITS.labels(kind).inc()
+        # Cópia rasa: quem recebe pode alterar a entidade sem afetar o cache
+        return cached.model_copy()
+
+    ENTITY_CACHE_MISSES.labels(kind).inc()
+    entity = load()
+    if entity is not None:
+        _entities[kind].set(entity_id, entity.model_copy())
+    return entity
+
+
+def store_entity(kind: str, entity: BaseModel) -> None:
+    """Write-through: grava no cache o estado recém-commitado da entidade"""
+    _entities[kind].set(entity.id, entity.model_copy())
+
+
+def invalidate_entity(kind: str, entity_id: Hashable) -> None:
+    _entities[kind].delete(entity_id)
+
+
+def invalidate_entities(kind: str, entity_ids: Iterable[Hashable]) -> None:
+    """Descarta as entidades informadas (ex.: produções apagadas em cascata)"""
+    for entity_id in entity_ids:
+        _entities[kind].delete(entity_id)
+
+
+def clear_entities() -> None:
+    for cache in _entities.values():
+        cache.clear()
@@ -1,22 +1,44 @@
 from sqlalchemy.orm import Session
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Set, Tuple
+from datetime import datetime
 import uuid
 
 from src.domain.entities.Hospital import Hospital
+from src.domain.entities.ReadModels import HospitalRow
 from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.repositories.pagination import page_query
+from src.infrastructure.repositories.counts import cached_count, invalidate_counts
+from src.infrastructure.cache.stats_cache import invalidate_doctor_stats
+from src.infrastructure.repositories.entity_cache import cached_entity, invalidate_entities, invalidate_entity, store_entity
+from src.infrastructure.repositories.collection_version_repository import CollectionVersionRepository
+from src.domain.enums.collection import Collection
+from src.infrastructure.repositories.doctor_balance_repository import DoctorBalanceRepository
+from src.infrastructure.database.models.production_model import ProductionModel
+from src.domain.entities.TotalCount import TotalCount
 from src.domain.usecase.interfaces.IGetHospitalById import IGetHospitalById
 from src.domain.usecase.interfaces.ISaveHospital import ISaveHospital
 from src.domain.usecase.interfaces.IUpdateHospital import IUpdateHospital
 from src.domain.usecase.interfaces.IDeleteHospital import IDeleteHospital
 from src.domain.usecase.interfaces.IGetAllHospitals import IGetAllHospitals
+from src.domain.usecase.interfaces.IGetExistingHospitalIds import IGetExistingHospitalIds
 
+# Colunas na ordem do HospitalRow: as listagens não montam objetos do ORM
+_ROW_COLUMNS = (
+    HospitalModel.id, HospitalModel.user_id, HospitalModel.name, HospitalModel.address,
+    HospitalModel.created_at, HospitalModel.updated_at,
+)
 
-class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDeleteHospital, IGetAllHospitals):
+class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDeleteHospital, IGetAllHospitals, IGetExistingHospitalIds):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, hospital_id: uuid.UUID) -> Optional[Hospital]:
-        """Busca um hospital pelo ID"""
+    def get_by_id(self, hospital_id: uuid.UUID, cached: bool = False) -> Optional[Hospital]:
+        """Busca um hospital pelo ID, do cache de entidades só com `cached=True`"""
+        if not cached:
+            return self._load(hospital_id)
+        return cached_entity("hospitals", hospital_id, lambda: self._load(hospital_id))
+
+    def _load(self, hospital_id: uuid.UUID) -> Optional[Hospital]:
         hospital_model = self.db.query(HospitalModel).filter(HospitalModel.id == hospital_id).first()
 
         if not hospital_model:
@@ -31,29 +53,40 @@ class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDele
             updated_at=hospital_model.updated_at.isoformat() if hospital_model.updated_at else None
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100, user_id: Optional[uuid.UUID] = None) -> Tuple[List[Hospital], int]:
+    def get_existing_ids(self, hospital_ids: Iterable[uuid.UUID]) -> Set[uuid.UUID]:
+        """Dos IDs informados, retorna os que existem (uma consulta com IN)"""
+        hospital_ids = set(hospital_ids)
+        if not hospital_ids:
+            return set()
+        rows = self.db.query(HospitalModel.id).filter(HospitalModel.id.in_(hospital_ids)).all()
+        return {row.id for row in rows}
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[uuid.UUID] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[HospitalRow]:
         """Lista todos os hospitais com paginação"""
-        query = self.db.query(HospitalModel)
+        query = self.db.query(*_ROW_COLUMNS)
 
         if user_id:
             query = query.filter(HospitalModel.user_id == user_id)
 
-        total = query.count()
-        hospitals_model = query.offset(skip).limit(limit).all()
+        hospitals = [HospitalRow(*row) for row in page_query(query, HospitalModel, skip, limit, after)]
+
+        return hospitals
 
-        hospitals = [
-            Hospital(
-                id=hospital.id,
-                user_id=hospital.user_id,
-                name=hospital.name,
-                address=hospital.address,
-                created_at=hospital.created_at.isoformat(),
-                updated_at=hospital.updated_at.isoformat() if hospital.updated_at else None
-            )
-            for hospital in hospitals_model
-        ]
+    def count_all(self, user_id: Optional[uuid.UUID] = None) -> TotalCount:
+        """Total de hospitais do usuário, reaproveitando a contagem em cache"""
+        def count() -> int:
+            query = self.db.query(HospitalModel)
+            if user_id:
+                query = query.filter(HospitalModel.user_id == user_id)
+            return query.count()
 
-        return hospitals, total
+        return cached_count("hospitals", user_id, count)
 
     def save(self, hospital: Hospital) -> Hospital:
         """Salva um novo hospital no banco de dados"""
@@ -65,10 +98,11 @@ class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDele
         )
 
         self.db.add(hospital_model)
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([hospital_model.user_id], Collection.HOSPITALS)
         self.db.refresh(hospital_model)
+        invalidate_counts(hospital_model.user_id)
 
-        return Hospital(
+        hospital = Hospital(
             id=hospital_model.id,
             user_id=hospital_model.user_id,
             name=hospital_model.name,
@@ -76,6 +110,8 @@ class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDele
             created_at=hospital_model.created_at.isoformat(),
             updated_at=hospital_model.updated_at.isoformat() if hospital_model.updated_at else None
         )
+        store_entity("hospitals", hospital)
+        return hospital
 
     def update(self, hospital_id: uuid.UUID, **kwargs) -> Optional[Hospital]:
         """Atualiza os dados de um hospital"""
@@ -88,10 +124,10 @@ class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDele
             if value is not None and hasattr(hospital_model, key):
                 setattr(hospital_model, key, value)
 
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([hospital_model.user_id], Collection.HOSPITALS)
         self.db.refresh(hospital_model)
 
-        return Hospital(
+        hospital = Hospital(
             id=hospital_model.id,
             user_id=hospital_model.user_id,
             name=hospital_model.name,
@@ -99,6 +135,8 @@ class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDele
             created_at=hospital_model.created_at.isoformat(),
             updated_at=hospital_model.updated_at.isoformat() if hospital_model.updated_at else None
         )
+        store_entity("hospitals", hospital)
+        return hospital
 
     def delete(self, hospital_id: uuid.UUID) -> bool:
         """Remove um hospital do banco de dados"""
@@ -107,6 +145,15 @@ class HospitalRepository(IGetHospitalById, ISaveHospital, IUpdateHospital, IDele
         if not hospital_model:
             return False
 
+        user_id = hospital_model.user_id
+        # Produções e repasses do hospital são apagados em cascata; o saldo dos médicos acompanha
+        production_ids = [row.id for row in self.db.query(ProductionModel.id).filter(ProductionModel.hospital_id == hospital_id)]
+        balances = DoctorBalanceRepository(self.db)
+        balances.subtract_repasses(ProductionModel.hospital_id == hospital_id)
         self.db.delete(hospital_model)
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([user_id], Collection.HOSPITALS, Collection.PRODUCTIONS)
+        invalidate_counts(user_id)
+        invalidate_doctor_stats(balances.touched)
+        invalidate_entity("hospitals", hospital_id)
+        invalidate_entities("productions", production_ids)
         return True
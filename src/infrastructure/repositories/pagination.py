@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Optional, Tuple
+import uuid
+
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Query
+
+
+def page_query(
+    query: Query,
+    model,
+    skip: int,
+    limit: int,
+    after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    id_column=None,
+) -> Query:
+    """
+    Ordena por (created_at, id) e aplica a página pedida.
+
+    Sem `after`, usa offset/limit. Com `after` (keyset), continua a partir da
+    posição informada, sem offset: o custo não cresce com a profundidade da página.
+    `id_column` troca o desempate quando o modelo não tem `id` (tabelas de vínculo).
+    """
+    id_column = model.id if id_column is None else id_column
+    query = query.order_by(model.created_at, id_column)
+    if after is None:
+        return query.offset(skip).limit(limit)
+
+    created_at, item_id = after
+    return query.filter(
+        tuple_(model.created_at, id_column) > tuple_(
+            literal(created_at, model.created_at.type),
+            literal(item_id, id_column.type),
+        )
+    ).limit(limit)
@@ -1,25 +1,67 @@
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Set, Tuple
 import uuid
-from datetime import date
+from datetime import date, datetime
 
 from src.domain.entities.Production import Production
+from src.domain.entities.ReadModels import ProductionRow
+from src.domain.entities.Repasse import Repasse
+from src.domain.entities.DoctorStatement import StatementProduction
 from src.infrastructure.database.models.production_model import ProductionModel
+from src.infrastructure.repositories.pagination import page_query
+from src.infrastructure.repositories.streaming import stream_batches, stream_column_batches
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.repositories.counts import cached_count, invalidate_counts
+from src.infrastructure.cache.stats_cache import invalidate_doctor_stats
+from src.infrastructure.repositories.entity_cache import cached_entity, invalidate_entity, store_entity
+from src.infrastructure.repositories.collection_version_repository import CollectionVersionRepository
+from src.domain.enums.collection import Collection
+from src.infrastructure.repositories.doctor_balance_repository import DoctorBalanceRepository
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.domain.entities.TotalCount import TotalCount
 from src.domain.usecase.interfaces.IGetProductionById import IGetProductionById
+from src.domain.usecase.interfaces.IGetExistingProductionIds import IGetExistingProductionIds
+from src.domain.usecase.interfaces.IExportProductions import IExportProductions
+from src.domain.usecase.interfaces.IExportProductionRepasses import IExportProductionRepasses
+from src.domain.usecase.interfaces.IGetDoctorStatement import IGetDoctorStatement
 from src.domain.usecase.interfaces.ISaveProduction import ISaveProduction
+from src.domain.usecase.interfaces.ISaveProductions import ISaveProductions
 from src.domain.usecase.interfaces.IUpdateProduction import IUpdateProduction
 from src.domain.usecase.interfaces.IDeleteProduction import IDeleteProduction
 from src.domain.usecase.interfaces.IGetAllProductions import IGetAllProductions
 from src.domain.usecase.interfaces.IGetProductionsByDoctor import IGetProductionsByDoctor
 from src.domain.usecase.interfaces.IGetProductionsByHospital import IGetProductionsByHospital
 
+# Colunas na ordem do ProductionRow: as listagens não montam objetos do ORM
+_ROW_COLUMNS = (
+    ProductionModel.id, ProductionModel.user_id, ProductionModel.doctor_id, ProductionModel.hospital_id,
+    ProductionModel.type, ProductionModel.date, ProductionModel.description,
+    ProductionModel.created_at, ProductionModel.updated_at,
+)
 
-class ProductionRepository(IGetProductionById, ISaveProduction, IUpdateProduction, IDeleteProduction, IGetAllProductions, IGetProductionsByDoctor, IGetProductionsByHospital):
+
+def _to_row(production) -> ProductionRow:
+    """ProductionRow de uma linha de _ROW_COLUMNS ou de um ProductionModel"""
+    return ProductionRow(
+        production.id, production.user_id, production.doctor_id, production.hospital_id, production.type.value,
+        production.date, production.description, production.created_at, production.updated_at
+    )
+
+
+class ProductionRepository(IGetProductionById, IGetExistingProductionIds, IExportProductions, IExportProductionRepasses, IGetDoctorStatement, ISaveProduction, ISaveProductions, IUpdateProduction, IDeleteProduction, IGetAllProductions, IGetProductionsByDoctor, IGetProductionsByHospital):
     def __init__(self, db: Session):
         self.db = db
 
-    def get_by_id(self, production_id: uuid.UUID) -> Optional[Production]:
-        """Busca uma produção pelo ID"""
+    def get_by_id(self, production_id: uuid.UUID, cached: bool = False) -> Optional[Production]:
+        """Busca uma produção pelo ID, do cache de entidades só com `cached=True`"""
+        if not cached:
+            return self._load(production_id)
+        return cached_entity("productions", production_id, lambda: self._load(production_id))
+
+    def _load(self, production_id: uuid.UUID) -> Optional[Production]:
         production_model = self.db.query(ProductionModel).filter(ProductionModel.id == production_id).first()
 
         if not production_model:
@@ -37,74 +79,195 @@ class ProductionRepository(IGetProductionById, ISaveProduction, IUpdateProductio
             updated_at=production_model.updated_at.isoformat() if production_model.updated_at else None
         )
 
-    def get_all(self, skip: int = 0, limit: int = 100, user_id: Optional[uuid.UUID] = None) -> Tuple[List[Production], int]:
+    def get_existing_ids(self, production_ids: Iterable[uuid.UUID]) -> Set[uuid.UUID]:
+        """Dos IDs informados, retorna os que existem (uma consulta com IN)"""
+        production_ids = set(production_ids)
+        if not production_ids:
+            return set()
+        rows = self.db.query(ProductionModel.id).filter(ProductionModel.id.in_(production_ids)).all()
+        return {row.id for row in rows}
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[uuid.UUID] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[ProductionRow]:
         """Lista todas as produções com paginação"""
-        query = self.db.query(ProductionModel)
+        query = self.db.query(*_ROW_COLUMNS)
 
         if user_id:
             query = query.filter(ProductionModel.user_id == user_id)
 
-        total = query.count()
-        productions_model = query.offset(skip).limit(limit).all()
-
-        productions = [
-            Production(
-                id=production.id,
-                user_id=production.user_id,
-                doctor_id=production.doctor_id,
-                hospital_id=production.hospital_id,
-                type=production.type.value,
-                date=production.date,
-                description=production.description,
-                created_at=production.created_at.isoformat(),
-                updated_at=production.updated_at.isoformat() if production.updated_at else None
+        productions = [_to_row(row) for row in page_query(query, ProductionModel, skip, limit, after)]
+
+        return productions
+
+    def count_all(self, user_id: Optional[uuid.UUID] = None) -> TotalCount:
+        """Total de produções do usuário, reaproveitando a contagem em cache"""
+        def count() -> int:
+            query = self.db.query(ProductionModel)
+            if user_id:
+                query = query.filter(ProductionModel.user_id == user_id)
+            return query.count()
+
+        return cached_count("productions", user_id, count)
+
+    def export(
+        self,
+        user_id: uuid.UUID,
+        doctor_id: Optional[uuid.UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Produções do usuário em blocos, lidas com cursor no servidor, na ordem da listagem"""
+        statement = select(
+            ProductionModel.id,
+            ProductionModel.doctor_id,
+            ProductionModel.hospital_id,
+            ProductionModel.type,
+            ProductionModel.date,
+            ProductionModel.description,
+            ProductionModel.created_at,
+            ProductionModel.updated_at,
+        ).where(ProductionModel.user_id == user_id)
+
+        if doctor_id:
+            statement = statement.where(ProductionModel.doctor_id == doctor_id)
+        if start_date:
+            statement = statement.where(ProductionModel.date >= start_date)
+        if end_date:
+            statement = statement.where(ProductionModel.date <= end_date)
+
+        statement = statement.order_by(ProductionModel.created_at, ProductionModel.id)
+        return stream_batches(self.db, statement, batch_size)
+
+    def export_with_repasses(
+        self,
+        user_id: uuid.UUID,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 10000
+    ) -> Iterator[Dict[str, List[Any]]]:
+        """Produções do usuário no período (pela data da produção) com médico, hospital e repasses, em blocos por coluna"""
+        statement = (
+            select(
+                ProductionModel.id.label("production_id"),
+                ProductionModel.date.label("production_date"),
+                ProductionModel.type.label("production_type"),
+                ProductionModel.doctor_id,
+                DoctorModel.name.label("doctor_name"),
+                ProductionModel.hospital_id,
+                HospitalModel.name.label("hospital_name"),
+                RepasseModel.id.label("repasse_id"),
+                RepasseModel.amount,
+                RepasseModel.status,
+                RepasseModel.source_system,
+                RepasseModel.external_id,
+                RepasseModel.created_at.label("repasse_created_at"),
+                RepasseModel.updated_at.label("repasse_updated_at"),
             )
-            for production in productions_model
-        ]
+            .join(DoctorModel, DoctorModel.id == ProductionModel.doctor_id)
+            .join(HospitalModel, HospitalModel.id == ProductionModel.hospital_id)
+            .outerjoin(RepasseModel, RepasseModel.production_id == ProductionModel.id)
+            .where(ProductionModel.user_id == user_id)
+        )
+
+        if start_date:
+            statement = statement.where(ProductionModel.date >= start_date)
+        if end_date:
+            statement = statement.where(ProductionModel.date <= end_date)
 
-        return productions, total
+        statement = statement.order_by(ProductionModel.created_at, ProductionModel.id, RepasseModel.created_at)
+        return stream_column_batches(self.db, statement, batch_size)
 
-    def get_by_doctor(self, doctor_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[Production]:
+    def get_by_doctor(self, doctor_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[ProductionRow]:
         """Lista todas as produções de um médico específico"""
-        productions_model = self.db.query(ProductionModel).filter(
+        rows = self.db.query(*_ROW_COLUMNS).filter(
             ProductionModel.doctor_id == doctor_id
-        ).offset(skip).limit(limit).all()
-
-        return [
-            Production(
-                id=production.id,
-                user_id=production.user_id,
-                doctor_id=production.doctor_id,
-                hospital_id=production.hospital_id,
-                type=production.type.value,
-                date=production.date,
-                description=production.description,
-                created_at=production.created_at.isoformat(),
-                updated_at=production.updated_at.isoformat() if production.updated_at else None
-            )
-            for production in productions_model
-        ]
+        ).offset(skip).limit(limit)
 
-    def get_by_hospital(self, hospital_id: uuid.UUID) -> List[Production]:
-        """Lista todas as produções de um hospital específico"""
-        productions_model = self.db.query(ProductionModel).filter(
-            ProductionModel.hospital_id == hospital_id
+        return [_to_row(row) for row in rows]
+
+    def get_statement(
+        self,
+        doctor_id: uuid.UUID,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[StatementProduction]:
+        """
+        Produções do médico no período (pela data da produção) com o nome do
+        hospital e os repasses, numa única consulta: o número de idas ao banco
+        não depende de quantas produções o extrato tem.
+        """
+        query = (
+            self.db.query(ProductionModel, HospitalModel.name, RepasseModel)
+            .join(HospitalModel, HospitalModel.id == ProductionModel.hospital_id)
+            .outerjoin(RepasseModel, RepasseModel.production_id == ProductionModel.id)
+            .filter(ProductionModel.doctor_id == doctor_id)
+        )
+
+        if start_date:
+            query = query.filter(ProductionModel.date >= start_date)
+        if end_date:
+            query = query.filter(ProductionModel.date <= end_date)
+
+        rows = query.order_by(
+            ProductionModel.date, ProductionModel.created_at, ProductionModel.id, RepasseModel.created_at
         ).all()
 
-        return [
-            Production(
-                id=production.id,
-                user_id=production.user_id,
-                doctor_id=production.doctor_id,
-                hospital_id=production.hospital_id,
-                type=production.type.value,
-                date=production.date,
-                description=production.description,
-                created_at=production.created_at.isoformat(),
-                updated_at=production.updated_at.isoformat() if production.updated_at else None
-            )
-            for production in productions_model
-        ]
+        # Linhas da mesma produção vêm em sequência (uma por repasse)
+        statement: List[StatementProduction] = []
+        for production, hospital_name, repasse in rows:
+            if not statement or statement[-1].production.id != production.id:
+                statement.append(StatementProduction(
+                    production=_to_row(production), hospital_name=hospital_name, repasses=[]
+                ))
+            if repasse is not None:
+                statement[-1].repasses.append(Repasse(
+                    id=repasse.id,
+                    user_id=repasse.user_id,
+                    production_id=repasse.production_id,
+                    amount=repasse.amount,
+                    created_at=repasse.created_at,
+                    updated_at=repasse.updated_at,
+                    status=repasse.status,
+                    source_system=repasse.source_system,
+                    external_id=repasse.external_id
+                ))
+        return statement
+
+    def get_by_hospital(
+        self,
+        hospital_id: uuid.UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[ProductionRow]:
+        """Uma página das produções de um hospital, na ordem da listagem; o período filtra pela data da produção"""
+        query = self._by_hospital(hospital_id, start_date, end_date)
+        return [_to_row(row) for row in page_query(query, ProductionModel, skip, limit, after)]
+
+    def count_by_hospital(
+        self,
+        hospital_id: uuid.UUID,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> TotalCount:
+        """Total de produções do hospital no período (sem cache: o filtro varia por requisição)"""
+        return TotalCount(value=self._by_hospital(hospital_id, start_date, end_date).count())
+
+    def _by_hospital(self, hospital_id: uuid.UUID, start_date: Optional[date], end_date: Optional[date]):
+        query = self.db.query(*_ROW_COLUMNS).filter(ProductionModel.hospital_id == hospital_id)
+        if start_date:
+            query = query.filter(ProductionModel.date >= start_date)
+        if end_date:
+            query = query.filter(ProductionModel.date <= end_date)
+        return query
 
     def save(self, production: Production) -> Production:
         """Salva uma nova produção no banco de dados"""
@@ -119,10 +282,16 @@ class ProductionRepository(IGetProductionById, ISaveProduction, IUpdateProductio
         )
 
         self.db.add(production_model)
-        self.db.commit()
+        try:
+            CollectionVersionRepository(self.db).commit([production_model.user_id], Collection.PRODUCTIONS)
+        except IntegrityError:
+            self.db.rollback()
+            self._raise_if_parent_missing(production.doctor_id, production.hospital_id)
+            raise
         self.db.refresh(production_model)
+        invalidate_counts(production_model.user_id)
 
-        return Production(
+        production = Production(
             id=production_model.id,
             user_id=production_model.user_id,
             doctor_id=production_model.doctor_id,
@@ -133,6 +302,49 @@ class ProductionRepository(IGetProductionById, ISaveProduction, IUpdateProductio
             created_at=production_model.created_at.isoformat(),
             updated_at=production_model.updated_at.isoformat() if production_model.updated_at else None
         )
+        store_entity("productions", production)
+        return production
+
+    def _raise_if_parent_missing(self, doctor_id: uuid.UUID, hospital_id: uuid.UUID) -> None:
+        """
+        Traduz a violação de chave estrangeira de um save em "não encontrado".
+
+        A verificação do caso de uso lê o cache de entidades, que pode ainda ter
+        um médico ou hospital apagado por outro worker: a cópia velha sai do
+        cache e o erro é o mesmo da verificação.
+        """
+        if self.db.query(DoctorModel.id).filter(DoctorModel.id == doctor_id).first() is None:
+            invalidate_entity("doctors", doctor_id)
+            raise ValueError("Doctor not found.")
+        if self.db.query(HospitalModel.id).filter(HospitalModel.id == hospital_id).first() is None:
+            invalidate_entity("hospitals", hospital_id)
+            raise ValueError("Hospital not found.")
+
+    def save_many(self, productions: List[Production]) -> int:
+        """Insere várias produções com um INSERT de múltiplas linhas, num único commit"""
+        if not productions:
+            return 0
+
+        rows = [
+            {
+                "id": production.id,
+                "user_id": production.user_id,
+                "doctor_id": production.doctor_id,
+                "hospital_id": production.hospital_id,
+                "type": production.type,
+                "date": production.date,
+                "description": production.description,
+                "created_at": datetime.fromisoformat(production.created_at),
+            }
+            for production in productions
+        ]
+        self.db.execute(insert(ProductionModel), rows)
+        user_ids = {production.user_id for production in productions}
+        # Uma versão por usuário para o lote inteiro, depois do INSERT
+        CollectionVersionRepository(self.db).commit(user_ids, Collection.PRODUCTIONS)
+        for user_id in user_ids:
+            invalidate_counts(user_id)
+        return len(rows)
 
     def update(self, production_id: uuid.UUID, **kwargs) -> Optional[Production]:
         """Atualiza os dados de uma produção"""
@@ -145,10 +357,10 @@ class ProductionRepository(IGetProductionById, ISaveProduction, IUpdateProductio
             if value is not None and hasattr(production_model, key):
                 setattr(production_model, key, value)
 
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([production_model.user_id], Collection.PRODUCTIONS)
         self.db.refresh(production_model)
 
-        return Production(
+        production = Production(
             id=production_model.id,
             user_id=production_model.user_id,
             hospital_id=production_model.hospital_id,
@@ -159,6 +371,8 @@ class ProductionRepository(IGetProductionById, ISaveProduction, IUpdateProductio
             created_at=production_model.created_at.isoformat(),
             updated_at=production_model.updated_at.isoformat() if production_model.updated_at else None
         )
+        store_entity("productions", production)
+        return production
 
     def delete(self, production_id: uuid.UUID) -> bool:
         """Remove uma produção do banco de dados"""
@@ -167,6 +381,13 @@ class ProductionRepository(IGetProductionById, ISaveProduction, IUpdateProductio
         if not production_model:
             return False
 
+        user_id = production_model.user_id
+        # Os repasses da produção são apagados em cascata; o saldo do médico acompanha
+        balances = DoctorBalanceRepository(self.db)
+        balances.subtract_repasses(RepasseModel.production_id == production_id)
         self.db.delete(production_model)
-        self.db.commit()
+        CollectionVersionRepository(self.db).commit([user_id], Collection.PRODUCTIONS)
+        invalidate_counts(user_id)
+        invalidate_doctor_stats(balances.touched)
+        invalidate_entity("productions", production_id)
         return True
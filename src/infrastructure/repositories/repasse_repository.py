@@ -1,13 +1,47 @@
-from typing import List, Optional, Tuple
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
+from uuid import uuid4
+from sqlalchemy import func, insert, literal_column, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from src.infrastructure.database.models.repasse_model import RepasseModel
 from src.infrastructure.database.models.production_model import ProductionModel
+from src.infrastructure.repositories.pagination import page_query
+from src.infrastructure.repositories.streaming import stream_batches
+from src.infrastructure.repositories.doctor_balance_repository import DoctorBalanceRepository
+from src.infrastructure.repositories.counts import cached_count, invalidate_counts
+from src.infrastructure.repositories.entity_cache import invalidate_entity
+from src.infrastructure.cache.stats_cache import invalidate_doctor_stats
+from src.infrastructure.repositories.dialect import dialect_insert
+from src.domain.entities.TotalCount import TotalCount
+from src.domain.enums.repasse_status import RepasseStatus
 from src.domain.entities.Repasse import Repasse
-from src.dto.repasseDTO import CreateRepasseDTO, UpdateRepasseDTO
+from src.domain.entities.RepasseSeriesPoint import RepasseSeriesPoint
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+from src.dto.repasseDTO import CreateRepasseDTO, UpdateRepasseDTO, UpsertRepasseDTO
 from src.domain.usecase.interfaces.repasse_repository_interface import IRepasseRepository
 
+# Colunas de productions usadas como quebra da série
+_SERIES_DIMENSIONS = {
+    SeriesDimension.HOSPITAL: ProductionModel.hospital_id,
+    SeriesDimension.PRODUCTION_TYPE: ProductionModel.type,
+}
+
+# Colunas na ordem do construtor de Repasse: as listagens não montam objetos do ORM
+_ROW_COLUMNS = (
+    RepasseModel.id, RepasseModel.user_id, RepasseModel.production_id, RepasseModel.amount,
+    RepasseModel.created_at, RepasseModel.updated_at, RepasseModel.status,
+    RepasseModel.source_system, RepasseModel.external_id,
+)
+
+# SQLite não tem date_trunc; o strftime devolve o início do intervalo como texto
+_SQLITE_BUCKET_FORMATS = {
+    SeriesGranularity.DAY: "%Y-%m-%d 00:00:00",
+    SeriesGranularity.MONTH: "%Y-%m-01 00:00:00",
+}
+
 
 class RepasseRepository(IRepasseRepository):
     def __init__(self, db: Session):
@@ -21,59 +55,259 @@ class RepasseRepository(IRepasseRepository):
             status=data.status
         )
         self.db.add(repasse)
+        # A produção foi verificada no cache de entidades: se outro worker a apagou
+        # nesse meio tempo, a chave estrangeira (ou a busca do médico) acusa aqui
+        try:
+            self.db.flush()
+            doctor_id = self._doctor_id_of(repasse.production_id)
+        except IntegrityError:
+            doctor_id = None
+        if doctor_id is None:
+            self.db.rollback()
+            invalidate_entity("productions", data.production_id)
+            raise ValueError("Production not found")
+        balances = DoctorBalanceRepository(self.db)
+        balances.apply(doctor_id, repasse.status, 1, repasse.amount)
         self.db.commit()
         self.db.refresh(repasse)
+        invalidate_counts(user_id)
+        invalidate_doctor_stats(balances.touched)
         return self._to_entity(repasse)
 
-    def get_all(self, skip: int = 0, limit: int = 100, user_id: Optional[UUID] = None) -> Tuple[List[Repasse], int]:
-        query = self.db.query(RepasseModel)
+    def create_many(self, items: List[CreateRepasseDTO], user_id: UUID) -> int:
+        """Insere vários repasses com um INSERT de múltiplas linhas, num único commit"""
+        if not items:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_id,
+                "production_id": item.production_id,
+                "amount": item.amount,
+                "status": item.status or RepasseStatus.PENDING,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item in items
+        ]
+        self.db.execute(insert(RepasseModel), rows)
+        balances = DoctorBalanceRepository(self.db)
+        balances.add_repasses(RepasseModel.id.in_([row["id"] for row in rows]))
+        self.db.commit()
+        invalidate_counts(user_id)
+        invalidate_doctor_stats(balances.touched)
+        return len(rows)
+
+    def upsert_many(self, items: List[UpsertRepasseDTO], user_id: UUID) -> List[Tuple[UUID, bool]]:
+        """
+        Grava eventos de repasse de forma idempotente por (usuário, source_system, external_id).
+
+        Um único INSERT ... ON CONFLICT DO NOTHING RETURNING para o lote: eventos
+        reenviados não geram linha nem leitura-alteração-escrita. Retorna, na
+        ordem dos itens, (id, criado agora).
+        """
+        if not items:
+            return []
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": uuid4(),
+                "user_id": user_id,
+                "production_id": item.production_id,
+                "amount": item.amount,
+                "status": item.status or RepasseStatus.PENDING,
+                "source_system": item.source_system,
+                "external_id": item.external_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item in items
+        ]
+        insert = dialect_insert(self.db)
+        statement = (
+            insert(RepasseModel)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=[RepasseModel.user_id, RepasseModel.source_system, RepasseModel.external_id]
+            )
+            .returning(RepasseModel.id, RepasseModel.source_system, RepasseModel.external_id)
+        )
+        inserted = {(source, external): repasse_id for repasse_id, source, external in self.db.execute(statement)}
+
+        known = dict(inserted)
+        missing = {(item.source_system, item.external_id) for item in items} - known.keys()
+        if missing:
+            # Eventos já recebidos deste usuário: só o ID existente, pelo índice único
+            existing = self.db.query(RepasseModel.id, RepasseModel.source_system, RepasseModel.external_id).filter(
+                RepasseModel.user_id == user_id,
+                tuple_(RepasseModel.source_system, RepasseModel.external_id).in_(missing)
+            )
+            known.update({(source, external): repasse_id for repasse_id, source, external in existing})
+
+        balances = DoctorBalanceRepository(self.db)
+        if inserted:
+            balances.add_repasses(RepasseModel.id.in_(list(inserted.values())))
+        self.db.commit()
+        if inserted:
+            invalidate_counts(user_id)
+            invalidate_doctor_stats(balances.touched)
+
+        results = []
+        reported = set()
+        for item in items:
+            key = (item.source_system, item.external_id)
+            # Um evento repetido dentro do próprio lote conta como criado só na primeira vez
+            results.append((known[key], key in inserted and key not in reported))
+            reported.add(key)
+        return results
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[UUID] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Repasse]:
+        query = self.db.query(*_ROW_COLUMNS)
 
         if user_id:
             query = query.filter(RepasseModel.user_id == user_id)
 
-        total = query.count()
-        repasses = query.offset(skip).limit(limit).all()
-        return [self._to_entity(repasse) for repasse in repasses], total
+        return [Repasse(*row) for row in page_query(query, RepasseModel, skip, limit, after)]
+
+    def count_all(self, user_id: Optional[UUID] = None) -> TotalCount:
+        """Total de repasses do usuário, reaproveitando a contagem em cache"""
+        def count() -> int:
+            query = self.db.query(RepasseModel)
+            if user_id:
+                query = query.filter(RepasseModel.user_id == user_id)
+            return query.count()
+
+        return cached_count("repasses", user_id, count)
+
+    def export(
+        self,
+        user_id: UUID,
+        doctor_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Repasses do usuário em blocos, lidos com cursor no servidor, na ordem da listagem"""
+        statement = select(
+            RepasseModel.id,
+            RepasseModel.production_id,
+            RepasseModel.amount,
+            RepasseModel.status,
+            RepasseModel.source_system,
+            RepasseModel.external_id,
+            RepasseModel.created_at,
+            RepasseModel.updated_at,
+        ).where(RepasseModel.user_id == user_id)
+
+        if doctor_id:
+            statement = statement.join(ProductionModel, ProductionModel.id == RepasseModel.production_id).where(
+                ProductionModel.doctor_id == doctor_id
+            )
+        if start_date:
+            statement = statement.where(RepasseModel.created_at >= start_date)
+        if end_date:
+            statement = statement.where(RepasseModel.created_at <= end_date)
+
+        statement = statement.order_by(RepasseModel.created_at, RepasseModel.id)
+        return stream_batches(self.db, statement, batch_size)
 
     def get_by_id(self, repasse_id: UUID) -> Optional[Repasse]:
         repasse = self.db.query(RepasseModel).filter(RepasseModel.id == repasse_id).first()
         return self._to_entity(repasse) if repasse else None
 
-    def get_by_hospital(self, hospital_id: UUID) -> List[Repasse]:
-        repasses = (
-            self.db.query(RepasseModel)
-            .join(ProductionModel, RepasseModel.production_id == ProductionModel.id)
-            .filter(ProductionModel.hospital_id == hospital_id)
-            .all()
-        )
-        return [self._to_entity(repasse) for repasse in repasses]
+    def get_by_hospital(
+        self,
+        hospital_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Repasse]:
+        """Uma página dos repasses das produções de um hospital, na ordem da listagem"""
+        query = self._by_hospital(hospital_id, start_date, end_date)
+        return [Repasse(*row) for row in page_query(query, RepasseModel, skip, limit, after)]
+
+    def count_by_hospital(
+        self,
+        hospital_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> TotalCount:
+        return TotalCount(value=self._by_hospital(hospital_id, start_date, end_date).count())
 
     def update(self, repasse_id: UUID, data: UpdateRepasseDTO) -> Optional[Repasse]:
-        repasse = self.db.query(RepasseModel).filter(RepasseModel.id == repasse_id).first()
+        repasse = self._lock(repasse_id)
         if not repasse:
             return None
 
+        old_status, old_amount = repasse.status, repasse.amount
         if data.amount is not None:
             repasse.amount = data.amount
         if data.status is not None:
             repasse.status = data.status
 
+        balances = DoctorBalanceRepository(self.db)
+        if (repasse.status, repasse.amount) != (old_status, old_amount):
+            # Transição de status e/ou mudança de valor: sai do saldo antigo, entra no novo
+            doctor_id = self._doctor_id_of(repasse.production_id)
+            if doctor_id is not None:
+                balances.apply(doctor_id, old_status, -1, -old_amount)
+                balances.apply(doctor_id, repasse.status, 1, repasse.amount)
+
         self.db.commit()
         self.db.refresh(repasse)
+        invalidate_doctor_stats(balances.touched)
         return self._to_entity(repasse)
 
     def delete(self, repasse_id: UUID) -> bool:
-        repasse = self.db.query(RepasseModel).filter(RepasseModel.id == repasse_id).first()
+        repasse = self._lock(repasse_id)
         if not repasse:
             return False
 
+        user_id = repasse.user_id
+        balances = DoctorBalanceRepository(self.db)
+        doctor_id = self._doctor_id_of(repasse.production_id)
+        if doctor_id is not None:
+            balances.apply(doctor_id, repasse.status, -1, -repasse.amount)
         self.db.delete(repasse)
         self.db.commit()
+        invalidate_counts(user_id)
+        invalidate_doctor_stats(balances.touched)
         return True
 
-    def get_by_production(self, production_id: UUID) -> List[Repasse]:
-        repasses = self.db.query(RepasseModel).filter(RepasseModel.production_id == production_id).all()
-        return [self._to_entity(repasse) for repasse in repasses]
+    def get_by_production(
+        self,
+        production_id: UUID,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Repasse]:
+        """Uma página dos repasses de uma produção, na ordem da listagem"""
+        query = self._in_period(
+            self.db.query(*_ROW_COLUMNS).filter(RepasseModel.production_id == production_id), start_date, end_date
+        )
+        return [Repasse(*row) for row in page_query(query, RepasseModel, skip, limit, after)]
+
+    def count_by_production(
+        self,
+        production_id: UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> TotalCount:
+        query = self.db.query(RepasseModel).filter(RepasseModel.production_id == production_id)
+        return TotalCount(value=self._in_period(query, start_date, end_date).count())
 
     def get_by_doctor_and_date_range(
         self,
@@ -92,6 +326,145 @@ class RepasseRepository(IRepasseRepository):
         repasses = query.all()
         return [self._to_entity(repasse) for repasse in repasses]
 
+    def get_stats_by_doctor(
+        self,
+        doctor_id: UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[RepasseStatus, Tuple[int, Decimal]]:
+        """Quantidade e soma dos repasses do médico por status, agregadas no banco"""
+        query = (
+            self.db.query(RepasseModel.status, func.count(RepasseModel.id), func.sum(RepasseModel.amount))
+            .join(ProductionModel, RepasseModel.production_id == ProductionModel.id)
+            .filter(ProductionModel.doctor_id == doctor_id)
+        )
+
+        if start_date:
+            query = query.filter(RepasseModel.created_at >= start_date)
+        if end_date:
+            query = query.filter(RepasseModel.created_at <= end_date)
+
+        rows = query.group_by(RepasseModel.status).all()
+        return {status: (count, Decimal(total or 0)) for status, count, total in rows}
+
+    def get_stats_by_doctors(
+        self,
+        doctor_ids: Sequence[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[UUID, Dict[RepasseStatus, Tuple[int, Decimal]]]:
+        """Como get_stats_by_doctor, para vários médicos numa única consulta agrupada por médico e status"""
+        if not doctor_ids:
+            return {}
+        query = (
+            self.db.query(ProductionModel.doctor_id, RepasseModel.status, func.count(RepasseModel.id), func.sum(RepasseModel.amount))
+            .join(ProductionModel, RepasseModel.production_id == ProductionModel.id)
+            .filter(ProductionModel.doctor_id.in_(set(doctor_ids)))
+        )
+
+        if start_date:
+            query = query.filter(RepasseModel.created_at >= start_date)
+        if end_date:
+            query = query.filter(RepasseModel.created_at <= end_date)
+
+        stats: Dict[UUID, Dict[RepasseStatus, Tuple[int, Decimal]]] = {}
+        for doctor_id, status, count, total in query.group_by(ProductionModel.doctor_id, RepasseModel.status).all():
+            stats.setdefault(doctor_id, {})[status] = (count, Decimal(total or 0))
+        return stats
+
+    def get_stats_series(
+        self,
+        doctor_id: UUID,
+        granularity: SeriesGranularity,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        dimensions: Sequence[SeriesDimension] = ()
+    ) -> List[RepasseSeriesPoint]:
+        """
+        Quantidade e soma por intervalo de tempo, status e dimensões pedidas, numa
+        única consulta agrupada. Os pontos saem ordenados por intervalo.
+        """
+        bucket = self._bucket_start(granularity)
+        dimensions = [dimension for dimension in SeriesDimension if dimension in dimensions]
+        dimension_columns = [_SERIES_DIMENSIONS[dimension] for dimension in dimensions]
+
+        query = (
+            self.db.query(bucket, *dimension_columns, RepasseModel.status, func.count(RepasseModel.id), func.sum(RepasseModel.amount))
+            .join(ProductionModel, RepasseModel.production_id == ProductionModel.id)
+            .filter(ProductionModel.doctor_id == doctor_id)
+        )
+        if start_date:
+            query = query.filter(RepasseModel.created_at >= start_date)
+        if end_date:
+            query = query.filter(RepasseModel.created_at <= end_date)
+
+        rows = (
+            query.group_by(bucket, *dimension_columns, RepasseModel.status)
+            .order_by(bucket, *dimension_columns, RepasseModel.status)
+            .all()
+        )
+
+        points = []
+        for row in rows:
+            bucket_start, *values, status, count, total = row
+            breakdown = dict(zip(dimensions, values))
+            production_type = breakdown.get(SeriesDimension.PRODUCTION_TYPE)
+            points.append(RepasseSeriesPoint(
+                bucket_start=datetime.fromisoformat(bucket_start) if isinstance(bucket_start, str) else bucket_start,
+                hospital_id=breakdown.get(SeriesDimension.HOSPITAL),
+                production_type=production_type.value if production_type is not None else None,
+                status=status,
+                count=count,
+                amount=Decimal(total or 0)
+            ))
+        return points
+
+    def _bucket_start(self, granularity: SeriesGranularity):
+        if self.db.get_bind().dialect.name == "sqlite":
+            return func.strftime(_SQLITE_BUCKET_FORMATS[granularity], RepasseModel.created_at)
+        # Unidade como literal (vem do enum): a mesma expressão no SELECT e no GROUP BY
+        return func.date_trunc(literal_column(f"'{granularity.value}'"), RepasseModel.created_at)
+
+    def get_doctor_balance(self, doctor_id: UUID) -> Dict[RepasseStatus, Tuple[int, Decimal]]:
+        """Saldo de todo o período do médico, lido da tabela doctor_balances"""
+        return DoctorBalanceRepository(self.db).get(doctor_id)
+
+    def get_doctor_balances(self, doctor_ids: Sequence[UUID]) -> Dict[UUID, Dict[RepasseStatus, Tuple[int, Decimal]]]:
+        """Saldo de todo o período de vários médicos, lido da tabela doctor_balances numa consulta"""
+        return DoctorBalanceRepository(self.db).get_many(doctor_ids)
+
+    def _by_hospital(self, hospital_id: UUID, start_date: Optional[datetime], end_date: Optional[datetime]):
+        query = (
+            self.db.query(*_ROW_COLUMNS)
+            .join(ProductionModel, RepasseModel.production_id == ProductionModel.id)
+            .filter(ProductionModel.hospital_id == hospital_id)
+        )
+        return self._in_period(query, start_date, end_date)
+
+    def _in_period(self, query, start_date: Optional[datetime], end_date: Optional[datetime]):
+        """Filtra pela data de criação do repasse"""
+        if start_date:
+            query = query.filter(RepasseModel.created_at >= start_date)
+        if end_date:
+            query = query.filter(RepasseModel.created_at <= end_date)
+        return query
+
+    def _lock(self, repasse_id: UUID) -> Optional[RepasseModel]:
+        """
+        Lê o repasse com SELECT ... FOR UPDATE até o commit.
+
+        O delta aplicado ao saldo do médico sai do status/valor antigos; sem o
+        bloqueio, duas alterações (ou alteração e exclusão) concorrentes leriam a
+        mesma linha e aplicariam os dois deltas sobre ela. populate_existing
+        garante que o objeto já carregado na sessão receba os valores relidos.
+        """
+        return self.db.query(RepasseModel).filter(
+            RepasseModel.id == repasse_id
+        ).with_for_update().populate_existing().first()
+
+    def _doctor_id_of(self, production_id: UUID) -> Optional[UUID]:
+        return self.db.query(ProductionModel.doctor_id).filter(ProductionModel.id == production_id).scalar()
+
     def _to_entity(self, model: RepasseModel) -> Repasse:
         return Repasse(
             id=model.id,
@@ -100,5 +473,7 @@ class RepasseRepository(IRepasseRepository):
             amount=model.amount,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            status=model.status
+            status=model.status,
+            source_system=model.source_system,
+            external_id=model.external_id
         )
@@ -0,0 +1,28 @@
+from typing import Any, Dict, Iterator, List
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+
+def stream_batches(db: Session, statement: Select, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Executa a consulta com cursor no servidor (`yield_per` liga `stream_results`)
+    e devolve as linhas em blocos de `batch_size`: a memória usada não depende do
+    tamanho do resultado. O cursor é fechado ao fim ou quando o iterador é fechado.
+    """
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    try:
+        for batch in result.mappings().partitions():
+            yield [dict(row) for row in batch]
+    finally:
+        result.close()
+
+
+def stream_column_batches(db: Session, statement: Select, batch_size: int) -> Iterator[Dict[str, List[Any]]]:
+    """Como stream_batches, mas cada bloco vem por coluna ({coluna: valores}), pronto para formatos colunares"""
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    try:
+        columns = list(result.keys())
+        for batch in result.partitions():
+            yield dict(zip(columns, (list(values) for values in zip(*batch))))
+    finally:
+        result.close()
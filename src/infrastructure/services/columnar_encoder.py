@@ -0,0 +1,110 @@
+import io
+from enum import Enum
+from typing import Any, Dict, Iterator, List
+from uuid import UUID
+
+from src.domain.enums.export_format import ColumnarFormat
+from src.domain.usecase.interfaces.IColumnarEncoder import IColumnarEncoder
+
+# pyarrow está em requirements.txt; a importação tolerante mantém o resto da API de pé
+# numa instalação sem ele, e só a exportação colunar responde 501
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+def _schema():
+    """Tipos das colunas de ProductionRepository.export_with_repasses"""
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("production_id", pa.string()),
+        ("production_date", pa.date32()),
+        ("production_type", category),
+        ("doctor_id", pa.string()),
+        ("doctor_name", pa.string()),
+        ("hospital_id", pa.string()),
+        ("hospital_name", pa.string()),
+        ("repasse_id", pa.string()),
+        ("amount", pa.decimal128(10, 2)),
+        ("status", category),
+        ("source_system", pa.string()),
+        ("external_id", pa.string()),
+        ("repasse_created_at", pa.timestamp("us")),
+        ("repasse_updated_at", pa.timestamp("us")),
+    ])
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _column(values: List[Any], arrow_type) -> "pa.Array":
+    values = [_plain(value) for value in values]
+    if pa.types.is_dictionary(arrow_type):
+        return pa.array(values, type=arrow_type.value_type).dictionary_encode()
+    return pa.array(values, type=arrow_type)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Arquivo só de escrita que acumula o que o writer gerou até o próximo `drain`"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ColumnarEncoder(IColumnarEncoder):
+    """
+    Parquet ou Arrow IPC (stream) com tipos preservados: valores em decimal128,
+    datas em date32, timestamps em microssegundos e status/tipo como dicionário.
+
+    Cada bloco do repositório vira um record batch (um row group no Parquet) e
+    os bytes são devolvidos logo em seguida, sem montar o arquivo em memória.
+    """
+
+    def is_available(self) -> bool:
+        return pa is not None
+
+    def encode(self, batches: Iterator[Dict[str, List[Any]]], export_format: ColumnarFormat) -> Iterator[bytes]:
+        if not self.is_available():
+            raise RuntimeError("pyarrow is not installed")
+
+        schema = _schema()
+        sink = _ChunkSink()
+        if export_format == ColumnarFormat.PARQUET:
+            writer = pq.ParquetWriter(sink, schema, compression="snappy")
+        else:
+            writer = pa.ipc.new_stream(sink, schema)
+
+        try:
+            for batch in batches:
+                arrays = [_column(batch[field.name], field.type) for field in schema]
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
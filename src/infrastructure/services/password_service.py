@@ -1,20 +1,56 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 from passlib.context import CryptContext
+from sqlalchemy.util.concurrency import await_only, in_greenlet
+
 from src.domain.usecase.interfaces.IEncrypt_password import IEncryptPassword
 
+T = TypeVar("T")
+
+# Quantos hashes bcrypt podem rodar ao mesmo tempo no processo; o excedente espera na fila
+PASSWORD_HASH_MAX_WORKERS = int(
+    os.getenv("PASSWORD_HASH_MAX_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Compartilhado por todas as instâncias, para o limite valer para o processo inteiro
+_hash_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_MAX_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+
+
 class PasswordService(IEncryptPassword):
+    """
+    Hash e verificação de senhas com bcrypt.
+
+    O bcrypt roda num pool de threads próprio, limitado a PASSWORD_HASH_MAX_WORKERS
+    (o bcrypt libera o GIL), nunca na thread que chamou:
+    - modo async (dentro de `run_sync`): a espera é devolvida ao event loop;
+    - modo sync (threadpool): a thread da requisição só aguarda o resultado.
+    """
+
     def __init__(self):
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+    def _run(self, fn: Callable[..., T], *args) -> T:
+        future = _hash_executor.submit(fn, *args)
+        if in_greenlet():
+            return await_only(asyncio.wrap_future(future))
+        return future.result()
+
     def encrypt_password(self, password: str) -> str:
         """Encripta a senha usando bcrypt"""
         # Bcrypt limita senhas a 72 bytes, truncar se necessário
         password_bytes = password.encode('utf-8')[:72]
         password_truncated = password_bytes.decode('utf-8', errors='ignore')
-        return self.pwd_context.hash(password_truncated)
+        return self._run(self.pwd_context.hash, password_truncated)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verifica se a senha corresponde ao hash"""
         # Bcrypt limita senhas a 72 bytes, truncar se necessário
         password_bytes = plain_password.encode('utf-8')[:72]
         password_truncated = password_bytes.decode('utf-8', errors='ignore')
-        return self.pwd_context.verify(password_truncated, hashed_password)
+        return self._run(self.pwd_context.verify, password_truncated, hashed_password)
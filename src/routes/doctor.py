@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, status, Query
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, status, Query, Response
+from typing import List, Dict, Any, Optional
 import uuid
+from datetime import date
 
 from src.dto.pagination import PaginatedResponse
+from src.controller.fast_json import fast_json
 from src.bootstrap.provider import usecase_factory
 from src.infrastructure.auth.dependencies import get_current_user
+from src.controller.conditional import conditional_get, conditional_get_item
+from src.domain.enums.collection import Collection
 from src.controller.doctor.create_doctor import CreateDoctorHandler
 from src.controller.doctor.get_all_doctors import GetAllDoctorsHandler
 from src.controller.doctor.get_doctor_by_id import GetDoctorByIdHandler
+from src.controller.doctor.get_doctor_statement import GetDoctorStatementHandler
 from src.controller.doctor.update_doctor import UpdateDoctorHandler
 from src.controller.doctor.delete_doctor import DeleteDoctorHandler
 from src.controller.doctor_hospital.assign_doctor_to_hospital import AssignDoctorToHospitalHandler
@@ -16,12 +21,13 @@ from src.controller.doctor_hospital.get_hospitals_by_doctor import GetHospitalsB
 from src.domain.usecase.doctor.create_doctor import CreateDoctorUseCase
 from src.domain.usecase.doctor.get_all_doctors import GetAllDoctorsUseCase
 from src.domain.usecase.doctor.get_doctor_by_id import GetDoctorByIdUseCase
+from src.domain.usecase.doctor.get_doctor_statement import GetDoctorStatementUseCase
 from src.domain.usecase.doctor.update_doctor import UpdateDoctorUseCase
 from src.domain.usecase.doctor.delete_doctor import DeleteDoctorUseCase
 from src.domain.usecase.doctor_hospital.assign_doctor_to_hospital import AssignDoctorToHospitalUseCase
 from src.domain.usecase.doctor_hospital.remove_doctor_from_hospital import RemoveDoctorFromHospitalUseCase
 from src.domain.usecase.doctor_hospital.get_hospitals_by_doctor import GetHospitalsByDoctorUseCase
-from src.dto.doctorDTO import CreateDoctorDTO, UpdateDoctorDTO, DoctorResponseDTO
+from src.dto.doctorDTO import CreateDoctorDTO, UpdateDoctorDTO, DoctorResponseDTO, DoctorStatementDTO
 from src.dto.doctorHospitalDTO import DoctorHospitalResponseDTO
 
 router = APIRouter()
@@ -40,19 +46,23 @@ async def create_doctor(
 ):
     handler = CreateDoctorHandler(create_doctor_usecase=usecase)
     user_id = current_user.get("sub")
-    return handler.handle(doctor, user_id)
+    return await handler.handle(doctor, user_id)
 
 
 @router.get(
     '/',
+    dependencies=[Depends(conditional_get(Collection.DOCTORS))],
     summary="List Doctors",
     description="Lists all registered doctors with pagination",
     response_model=PaginatedResponse[DoctorResponseDTO],
     status_code=status.HTTP_200_OK
 )
 async def get_all_doctors(
+    response: Response,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages (may be a cached estimate, see total_exact)"),
     usecase: GetAllDoctorsUseCase = Depends(usecase_factory('get_all_doctors_usecase')),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
@@ -60,11 +70,13 @@ async def get_all_doctors(
     skip = (page - 1) * limit
     handler = GetAllDoctorsHandler(get_all_doctors_usecase=usecase)
     user_id = current_user.get("sub")
-    return handler.handle(user_id=user_id, skip=skip, limit=limit)
+    page_data = await handler.handle(user_id=user_id, skip=skip, limit=limit, cursor=cursor, include_total=include_total)
+    return fast_json(page_data, response)
 
 
 @router.get(
     '/{doctor_id}',
+    dependencies=[Depends(conditional_get_item(Collection.DOCTORS, "doctor_id"))],
     summary="Get Doctor by ID",
     description="Returns data for a specific doctor",
     response_model=DoctorResponseDTO,
@@ -76,7 +88,7 @@ async def get_doctor_by_id(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = GetDoctorByIdHandler(get_doctor_by_id_usecase=usecase)
-    return handler.handle(doctor_id)
+    return await handler.handle(doctor_id)
 
 
 @router.put(
@@ -93,7 +105,7 @@ async def update_doctor(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = UpdateDoctorHandler(update_doctor_usecase=usecase)
-    return handler.handle(doctor_id, doctor)
+    return await handler.handle(doctor_id, doctor)
 
 
 @router.delete(
@@ -108,7 +120,7 @@ async def delete_doctor(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = DeleteDoctorHandler(delete_doctor_usecase=usecase)
-    return handler.handle(doctor_id)
+    return await handler.handle(doctor_id)
 
 
 @router.post(
@@ -125,7 +137,7 @@ async def assign_doctor_to_hospital(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = AssignDoctorToHospitalHandler(assign_doctor_to_hospital_usecase=usecase)
-    return handler.handle(doctor_id, hospital_id)
+    return await handler.handle(doctor_id, hospital_id)
 
 
 @router.delete(
@@ -141,7 +153,7 @@ async def remove_doctor_from_hospital(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = RemoveDoctorFromHospitalHandler(remove_doctor_from_hospital_usecase=usecase)
-    return handler.handle(doctor_id, hospital_id)
+    return await handler.handle(doctor_id, hospital_id)
 
 
 @router.get(
@@ -156,4 +168,22 @@ async def get_hospitals_by_doctor(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = GetHospitalsByDoctorHandler(get_hospitals_by_doctor_usecase=usecase)
-    return handler.handle(doctor_id)
+    return await handler.handle(doctor_id)
+
+
+@router.get(
+    '/{doctor_id}/statement',
+    summary="Doctor Statement",
+    description="Returns the doctor's productions in a period (by production date) with hospital names and repasses embedded, plus pending/consolidated totals, in a fixed number of queries",
+    response_model=DoctorStatementDTO,
+    status_code=status.HTTP_200_OK
+)
+async def get_doctor_statement(
+    doctor_id: uuid.UUID,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    usecase: GetDoctorStatementUseCase = Depends(usecase_factory('get_doctor_statement_usecase')),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    handler = GetDoctorStatementHandler(get_doctor_statement_usecase=usecase)
+    return await handler.handle(doctor_id, start_date=start_date, end_date=end_date)
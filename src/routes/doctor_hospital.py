@@ -29,7 +29,7 @@ async def assign_doctor_to_hospital(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = AssignDoctorToHospitalHandler(assign_doctor_to_hospital_usecase=usecase)
-    return handler.handle(uuid.UUID(data.doctor_id), uuid.UUID(data.hospital_id))
+    return await handler.handle(uuid.UUID(data.doctor_id), uuid.UUID(data.hospital_id))
 
 
 @router.delete(
@@ -45,7 +45,7 @@ async def remove_doctor_from_hospital(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = RemoveDoctorFromHospitalHandler(remove_doctor_from_hospital_usecase=usecase)
-    return handler.handle(doctor_id, hospital_id)
+    return await handler.handle(doctor_id, hospital_id)
 
 
 @router.get(
@@ -60,7 +60,7 @@ async def get_hospitals_by_doctor(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = GetHospitalsByDoctorHandler(get_hospitals_by_doctor_usecase=usecase)
-    return handler.handle(doctor_id)
+    return await handler.handle(doctor_id)
 
 
 @router.get(
@@ -75,4 +75,4 @@ async def get_doctors_by_hospital(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = GetDoctorsByHospitalHandler(get_doctors_by_hospital_usecase=usecase)
-    return handler.handle(hospital_id)
+    return await handler.handle(hospital_id)
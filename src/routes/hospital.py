@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, status, Query
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, status, Query, Response
+from typing import List, Dict, Any, Optional
 import uuid
+from datetime import datetime
 
 from src.dto.pagination import PaginatedResponse
-from src.bootstrap.provider import usecase_factory
+from src.controller.fast_json import fast_json
+from src.bootstrap.provider import usecase_factory, read_session_factory
 from src.infrastructure.auth.dependencies import get_current_user
+from src.controller.conditional import conditional_get, conditional_get_item
+from src.domain.enums.collection import Collection
 from src.controller.hospital.create_hospital import CreateHospitalHandler
 from src.controller.hospital.get_all_hospitals import GetAllHospitalsHandler
 from src.controller.hospital.get_hospital_by_id import GetHospitalByIdHandler
@@ -18,6 +22,7 @@ from src.domain.usecase.hospital.update_hospital import UpdateHospitalUseCase
 from src.domain.usecase.hospital.delete_hospital import DeleteHospitalUseCase
 from src.domain.usecase.doctor_hospital.get_doctors_by_hospital import GetDoctorsByHospitalUseCase
 from src.dto.hospitalDTO import CreateHospitalDTO, UpdateHospitalDTO, HospitalResponseDTO
+from src.dto.doctorHospitalDTO import HospitalDoctorDTO
 
 router = APIRouter()
 
@@ -35,30 +40,36 @@ async def create_hospital(
 ):
     handler = CreateHospitalHandler(create_hospital_usecase=usecase)
     user_id = current_user.get("sub")
-    return handler.handle(hospital, user_id)
+    return await handler.handle(hospital, user_id)
 
 
 @router.get(
     '/',
+    dependencies=[Depends(conditional_get(Collection.HOSPITALS))],
     summary="List Hospitals",
     description="Lists all registered hospitals with pagination",
     response_model=PaginatedResponse[HospitalResponseDTO],
     status_code=status.HTTP_200_OK
 )
 async def get_all_hospitals(
+    response: Response,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages (may be a cached estimate, see total_exact)"),
     usecase: GetAllHospitalsUseCase = Depends(usecase_factory('get_all_hospitals_usecase')),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     skip = (page - 1) * page_size
     handler = GetAllHospitalsHandler(get_all_hospitals_usecase=usecase)
     user_id = current_user.get("sub")
-    return handler.handle(user_id=user_id, skip=skip, limit=page_size)
+    page_data = await handler.handle(user_id=user_id, skip=skip, limit=page_size, cursor=cursor, include_total=include_total)
+    return fast_json(page_data, response)
 
 
 @router.get(
     '/{hospital_id}',
+    dependencies=[Depends(conditional_get_item(Collection.HOSPITALS, "hospital_id"))],
     summary="Get Hospital by ID",
     description="Returns data for a specific hospital",
     response_model=HospitalResponseDTO,
@@ -70,7 +81,7 @@ async def get_hospital_by_id(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = GetHospitalByIdHandler(get_hospital_by_id_usecase=usecase)
-    return handler.handle(hospital_id)
+    return await handler.handle(hospital_id)
 
 
 @router.put(
@@ -87,7 +98,7 @@ async def update_hospital(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = UpdateHospitalHandler(update_hospital_usecase=usecase)
-    return handler.handle(hospital_id, hospital)
+    return await handler.handle(hospital_id, hospital)
 
 
 @router.delete(
@@ -102,19 +113,37 @@ async def delete_hospital(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = DeleteHospitalHandler(delete_hospital_usecase=usecase)
-    return handler.handle(hospital_id)
+    return await handler.handle(hospital_id)
 
 
 @router.get(
     '/{hospital_id}/doctors',
     summary="List Doctors by Hospital",
-    description="Returns all doctors working at a hospital",
+    description=(
+        "Returns the doctors working at a hospital with pagination, ordered by when they were linked. "
+        "`start_date`/`end_date` filter by link date. With `stream=true` the whole filtered list is streamed "
+        "as NDJSON instead, read page by page"
+    ),
+    response_model=PaginatedResponse[HospitalDoctorDTO],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
     status_code=status.HTTP_200_OK
 )
 async def get_doctors_by_hospital(
     hospital_id: uuid.UUID,
+    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    stream: bool = Query(False, description="Stream every matching doctor as NDJSON instead of one page"),
     usecase: GetDoctorsByHospitalUseCase = Depends(usecase_factory('get_doctors_by_hospital_usecase')),
+    session_factory=Depends(read_session_factory),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
-    handler = GetDoctorsByHospitalHandler(get_doctors_by_hospital_usecase=usecase)
-    return handler.handle(hospital_id)
+    skip = (page - 1) * page_size
+    handler = GetDoctorsByHospitalHandler(get_doctors_by_hospital_usecase=usecase, session_factory=session_factory)
+    return await handler.handle(
+        hospital_id, skip=skip, limit=page_size, cursor=cursor, include_total=include_total,
+        start_date=start_date, end_date=end_date, stream=stream
+    )
@@ -62,7 +62,7 @@ async def signup(
     signup_usecase: SignUpUseCase = Depends(usecase_factory('signup_usecase'))
 ):
     handler = SignUpHandler(sign_up_usecase=signup_usecase)
-    return handler.handle(user)
+    return await handler.handle(user)
 
 
 @router.post(
@@ -117,4 +117,4 @@ async def signin(
     signin_usecase: SignInUseCase = Depends(usecase_factory('signin_usecase'))
 ):
     handler = SignInHandler(sign_in_usecase=signin_usecase)
-    return handler.handle(user)
+    return await handler.handle(user)
@@ -1,25 +1,35 @@
-from fastapi import APIRouter, Depends, status, Query
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, status, Query, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Optional
 import uuid
+from datetime import date
 
 from src.dto.pagination import PaginatedResponse
-from src.bootstrap.provider import usecase_factory
+from src.controller.fast_json import fast_json
+from src.bootstrap.provider import usecase_factory, read_session_factory
 from src.infrastructure.auth.dependencies import get_current_user
+from src.controller.conditional import conditional_get, conditional_get_item
+from src.domain.enums.collection import Collection
+from src.domain.enums.export_format import ExportFormat
+from src.controller.export import EXPORT_BATCH_SIZE
 from src.controller.production.create_production import CreateProductionHandler
+from src.controller.production.bulk_create_productions import BulkCreateProductionsHandler
 from src.controller.production.get_all_productions import GetAllProductionsHandler
+from src.controller.production.export_productions import ExportProductionsHandler
 from src.controller.production.get_production_by_id import GetProductionByIdHandler
 from src.controller.production.get_productions_by_doctor import GetProductionsByDoctorHandler
 from src.controller.production.get_productions_by_hospital import GetProductionsByHospitalHandler
 from src.controller.production.update_production import UpdateProductionHandler
 from src.controller.production.delete_production import DeleteProductionHandler
 from src.domain.usecase.production.create_production import CreateProductionUseCase
+from src.domain.usecase.production.bulk_create_productions import BulkCreateProductionsUseCase
 from src.domain.usecase.production.get_all_productions import GetAllProductionsUseCase
 from src.domain.usecase.production.get_production_by_id import GetProductionByIdUseCase
 from src.domain.usecase.production.get_productions_by_doctor import GetProductionsByDoctorUseCase
 from src.domain.usecase.production.get_productions_by_hospital import GetProductionsByHospitalUseCase
 from src.domain.usecase.production.update_production import UpdateProductionUseCase
 from src.domain.usecase.production.delete_production import DeleteProductionUseCase
-from src.dto.productionDTO import CreateProductionDTO, UpdateProductionDTO, ProductionResponseDTO
+from src.dto.productionDTO import CreateProductionDTO, UpdateProductionDTO, ProductionResponseDTO, BulkCreateProductionDTO, BulkCreateProductionResponseDTO
 
 router = APIRouter()
 
@@ -37,30 +47,74 @@ async def create_production(
 ):
     handler = CreateProductionHandler(create_production_usecase=usecase)
     user_id = current_user.get("sub")
-    return handler.handle(production, user_id)
+    return await handler.handle(production, user_id)
+
+
+@router.post(
+    '/bulk',
+    summary="Bulk Create Productions",
+    description="Registers many productions in one transaction. Invalid items are skipped and reported in `errors` by position",
+    response_model=BulkCreateProductionResponseDTO,
+    status_code=status.HTTP_201_CREATED
+)
+async def bulk_create_productions(
+    data: BulkCreateProductionDTO,
+    usecase: BulkCreateProductionsUseCase = Depends(usecase_factory('bulk_create_productions_usecase')),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    handler = BulkCreateProductionsHandler(bulk_create_productions_usecase=usecase)
+    user_id = current_user.get("sub")
+    return await handler.handle(data, user_id)
 
 
 @router.get(
     '/',
+    dependencies=[Depends(conditional_get(Collection.PRODUCTIONS))],
     summary="List Productions",
     description="Lists all registered productions with pagination",
     response_model=PaginatedResponse[ProductionResponseDTO],
     status_code=status.HTTP_200_OK
 )
 async def get_all_productions(
+    response: Response,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages (may be a cached estimate, see total_exact)"),
     usecase: GetAllProductionsUseCase = Depends(usecase_factory('get_all_productions_usecase')),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     skip = (page - 1) * page_size
     handler = GetAllProductionsHandler(get_all_productions_usecase=usecase)
     user_id = current_user.get("sub")
-    return handler.handle(user_id=user_id, skip=skip, limit=page_size)
+    page_data = await handler.handle(user_id=user_id, skip=skip, limit=page_size, cursor=cursor, include_total=include_total)
+    return fast_json(page_data, response)
+
+
+@router.get(
+    '/export',
+    summary="Export Productions",
+    description="Streams all of the user's productions as CSV or NDJSON, read from the database with a server-side cursor. `start_date`/`end_date` filter by production date",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/csv": {}, "application/x-ndjson": {}}}}
+)
+async def export_productions(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Output format"),
+    doctor_id: Optional[uuid.UUID] = Query(None, description="Only productions of this doctor"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=100, le=10000, description="Rows fetched per database round trip"),
+    session_factory=Depends(read_session_factory),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    handler = ExportProductionsHandler(session_factory=session_factory)
+    user_id = current_user.get("sub")
+    return await handler.handle(user_id, format, doctor_id=doctor_id, start_date=start_date, end_date=end_date, batch_size=batch_size)
 
 
 @router.get(
     '/{production_id}',
+    dependencies=[Depends(conditional_get_item(Collection.PRODUCTIONS, "production_id"))],
     summary="Get Production by ID",
     description="Returns data for a specific production",
     response_model=ProductionResponseDTO,
@@ -72,7 +126,7 @@ async def get_production_by_id(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = GetProductionByIdHandler(get_production_by_id_usecase=usecase)
-    return handler.handle(production_id)
+    return await handler.handle(production_id)
 
 
 @router.get(
@@ -90,23 +144,39 @@ async def get_productions_by_doctor(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = GetProductionsByDoctorHandler(get_productions_by_doctor_usecase=usecase)
-    return handler.handle(doctor_id, skip=skip, limit=limit)
+    return await handler.handle(doctor_id, skip=skip, limit=limit)
 
 
 @router.get(
     '/hospital/{hospital_id}',
     summary="List Productions by Hospital",
-    description="Lists all productions for a specific hospital",
-    response_model=List[ProductionResponseDTO],
+    description=(
+        "Lists a hospital's productions with pagination. `start_date`/`end_date` filter by production date. "
+        "With `stream=true` the whole filtered list is streamed as NDJSON instead, read page by page"
+    ),
+    response_model=PaginatedResponse[ProductionResponseDTO],
+    responses={200: {"content": {"application/x-ndjson": {}}}},
     status_code=status.HTTP_200_OK
 )
 async def get_productions_by_hospital(
     hospital_id: uuid.UUID,
+    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    stream: bool = Query(False, description="Stream every matching production as NDJSON instead of one page"),
     usecase: GetProductionsByHospitalUseCase = Depends(usecase_factory('get_productions_by_hospital_usecase')),
+    session_factory=Depends(read_session_factory),
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
-    handler = GetProductionsByHospitalHandler(usecase=usecase)
-    return handler.handle(hospital_id)
+    skip = (page - 1) * page_size
+    handler = GetProductionsByHospitalHandler(usecase=usecase, session_factory=session_factory)
+    return await handler.handle(
+        hospital_id, skip=skip, limit=page_size, cursor=cursor, include_total=include_total,
+        start_date=start_date, end_date=end_date, stream=stream
+    )
 
 
 @router.put(
@@ -123,7 +193,7 @@ async def update_production(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = UpdateProductionHandler(update_production_usecase=usecase)
-    return handler.handle(production_id, production)
+    return await handler.handle(production_id, production)
 
 
 @router.delete(
@@ -138,4 +208,4 @@ async def delete_production(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     handler = DeleteProductionHandler(delete_production_usecase=usecase)
-    return handler.handle(production_id)
+    return await handler.handle(production_id)
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, status, Query
-from typing import List
+from fastapi import APIRouter, Depends, status, Query, Response, Request
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from uuid import UUID
+from datetime import date, datetime
 
 from src.dto.pagination import PaginatedResponse
-from src.bootstrap.provider import usecase_factory
+from src.controller.fast_json import fast_json
+from src.bootstrap.provider import usecase_factory, read_session_factory
 from src.infrastructure.auth.dependencies import get_current_user
+from src.infrastructure.database.connection import get_session_factory
+from src.domain.enums.export_format import ColumnarFormat, ExportFormat
+from src.controller.export import COLUMNAR_EXPORT_BATCH_SIZE, EXPORT_BATCH_SIZE
 from src.controller.repasse.create_repasse import create_repasse_controller
 from src.controller.repasse.get_all_repasses import get_all_repasses_controller
 from src.controller.repasse.get_repasse_by_id import get_repasse_by_id_controller
@@ -13,6 +19,12 @@ from src.controller.repasse.get_repasses_by_hospital import get_repasses_by_hosp
 from src.controller.repasse.update_repasse import update_repasse_controller
 from src.controller.repasse.delete_repasse import delete_repasse_controller
 from src.controller.repasse.get_repasse_stats import get_repasse_stats
+from src.controller.repasse.get_repasse_stats_series import get_repasse_stats_series
+from src.controller.repasse.get_repasse_stats_batch import get_repasse_stats_batch
+from src.controller.repasse.upsert_repasses import bulk_upsert_repasses_controller, upsert_repasse_controller
+from src.controller.repasse.import_repasses import IMPORT_CHUNK_SIZE, import_repasses_controller
+from src.controller.repasse.export_repasses import export_repasses_controller
+from src.controller.repasse.export_repasses_columnar import export_repasses_columnar_controller
 from src.domain.usecase.repasse.create_repasse import CreateRepasseUseCase
 from src.domain.usecase.repasse.get_all_repasses import GetAllRepassesUseCase
 from src.domain.usecase.repasse.get_repasse_by_id import GetRepasseByIdUseCase
@@ -20,7 +32,19 @@ from src.domain.usecase.repasse.get_repasses_by_production import GetRepassesByP
 from src.domain.usecase.repasse.get_repasses_by_hospital import GetRepassesByHospitalUseCase
 from src.domain.usecase.repasse.update_repasse import UpdateRepasseUseCase
 from src.domain.usecase.repasse.delete_repasse import DeleteRepasseUseCase
-from src.dto.repasseDTO import CreateRepasseDTO, UpdateRepasseDTO, RepasseResponseDTO, RepasseStatsDTO
+from src.domain.usecase.repasse.upsert_repasses import UpsertRepassesUseCase
+from src.dto.repasseDTO import (
+    CreateRepasseDTO,
+    UpdateRepasseDTO,
+    RepasseResponseDTO,
+    RepasseStatsDTO,
+    RepasseStatsSeriesDTO,
+    RepasseStatsBatchDTO,
+    UpsertRepasseDTO,
+    UpsertRepasseResponseDTO,
+    BulkUpsertRepasseDTO,
+    BulkUpsertRepasseResponseDTO,
+)
 from src.dto.responses import DeleteResponseDTO
 
 router = APIRouter()
@@ -39,7 +63,59 @@ async def create_repasse(
     current_user=Depends(get_current_user)
 ):
     user_id = UUID(current_user.get("sub"))
-    return create_repasse_controller(data, user_id, usecase)
+    return await create_repasse_controller(data, user_id, usecase)
+
+
+@router.post(
+    "/upsert",
+    summary="Upsert Repasse Event",
+    description="Registers a repasse event from a hospital system once; re-delivering the same (source_system, external_id) returns the existing repasse with created=false",
+    response_model=UpsertRepasseResponseDTO
+)
+async def upsert_repasse(
+    data: UpsertRepasseDTO,
+    usecase: UpsertRepassesUseCase = Depends(usecase_factory('upsert_repasses_usecase')),
+    current_user=Depends(get_current_user)
+):
+    user_id = UUID(current_user.get("sub"))
+    return await upsert_repasse_controller(data, user_id, usecase)
+
+
+@router.post(
+    "/upsert/bulk",
+    summary="Bulk Upsert Repasse Events",
+    description="Registers many repasse events in one statement; duplicates are skipped and items with unknown productions are reported in `errors`",
+    response_model=BulkUpsertRepasseResponseDTO
+)
+async def bulk_upsert_repasses(
+    data: BulkUpsertRepasseDTO,
+    usecase: UpsertRepassesUseCase = Depends(usecase_factory('upsert_repasses_usecase')),
+    current_user=Depends(get_current_user)
+):
+    user_id = UUID(current_user.get("sub"))
+    return await bulk_upsert_repasses_controller(data, user_id, usecase)
+
+
+@router.post(
+    "/import",
+    summary="Import Repasses (NDJSON)",
+    description=(
+        "Imports repasses from an NDJSON body (one CreateRepasse object per line), read as a stream and "
+        "committed every `chunk_size` lines. The response is an NDJSON progress report: `error` events per "
+        "rejected line, a `progress` event per committed chunk and a final `done` (or `aborted`) event"
+    ),
+    openapi_extra={"requestBody": {"required": True, "content": {"application/x-ndjson": {"schema": {"type": "string"}}}}},
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+async def import_repasses(
+    request: Request,
+    chunk_size: int = Query(IMPORT_CHUNK_SIZE, ge=1, le=10000, description="Lines per commit"),
+    session_factory=Depends(get_session_factory),
+    current_user=Depends(get_current_user)
+):
+    user_id = UUID(current_user.get("sub"))
+    return await import_repasses_controller(request.stream(), user_id, session_factory, chunk_size, request)
 
 
 @router.get(
@@ -49,14 +125,65 @@ async def create_repasse(
     response_model=PaginatedResponse[RepasseResponseDTO]
 )
 async def get_all_repasses(
+    response: Response,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages (may be a cached estimate, see total_exact)"),
     usecase: GetAllRepassesUseCase = Depends(usecase_factory('get_all_repasses_usecase')),
     current_user=Depends(get_current_user)
 ):
     skip = (page - 1) * page_size
     user_id = UUID(current_user.get("sub"))
-    return get_all_repasses_controller(usecase, user_id=user_id, skip=skip, limit=page_size)
+    page_data = await get_all_repasses_controller(usecase, user_id=user_id, skip=skip, limit=page_size, cursor=cursor, include_total=include_total)
+    return fast_json(page_data, response)
+
+
+@router.get(
+    "/export",
+    summary="Export Repasses",
+    description="Streams all of the user's repasses as CSV or NDJSON, read from the database with a server-side cursor. `start_date`/`end_date` filter by creation time",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/csv": {}, "application/x-ndjson": {}}}}
+)
+async def export_repasses(
+    format: ExportFormat = Query(ExportFormat.CSV, description="Output format"),
+    doctor_id: Optional[UUID] = Query(None, description="Only repasses of this doctor's productions"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=100, le=10000, description="Rows fetched per database round trip"),
+    session_factory=Depends(read_session_factory),
+    current_user=Depends(get_current_user)
+):
+    user_id = UUID(current_user.get("sub"))
+    return await export_repasses_controller(user_id, session_factory, format, doctor_id, start_date, end_date, batch_size)
+
+
+@router.get(
+    "/export/columnar",
+    summary="Export Productions and Repasses (Parquet/Arrow)",
+    description=(
+        "Streams the user's productions joined with their repasses, doctor and hospital names as Parquet or "
+        "Arrow IPC stream, with typed columns (decimal128 amounts, date32 dates, timestamps). Productions without "
+        "repasses appear once with null repasse columns. `start_date`/`end_date` filter by production date. "
+        "Returns 501 when pyarrow is not installed on the server"
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/vnd.apache.parquet": {}, "application/vnd.apache.arrow.stream": {}}},
+        501: {"description": "pyarrow is not installed"}
+    }
+)
+async def export_repasses_columnar(
+    format: ColumnarFormat = Query(ColumnarFormat.PARQUET, description="Output format"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    batch_size: int = Query(COLUMNAR_EXPORT_BATCH_SIZE, ge=1000, le=100000, description="Rows per record batch (Parquet row group)"),
+    session_factory=Depends(read_session_factory),
+    current_user=Depends(get_current_user)
+):
+    user_id = UUID(current_user.get("sub"))
+    return await export_repasses_columnar_controller(user_id, session_factory, format, start_date, end_date, batch_size)
 
 
 @router.get(
@@ -70,35 +197,67 @@ async def get_repasse_by_id(
     usecase: GetRepasseByIdUseCase = Depends(usecase_factory('get_repasse_by_id_usecase')),
     current_user=Depends(get_current_user)
 ):
-    return get_repasse_by_id_controller(repasse_id, usecase)
+    return await get_repasse_by_id_controller(repasse_id, usecase)
 
 
 @router.get(
     "/production/{production_id}",
     summary="List Repasses by Production",
-    description="Returns all repasses linked to a specific production",
-    response_model=List[RepasseResponseDTO]
+    description=(
+        "Returns the repasses linked to a production with pagination. `start_date`/`end_date` filter by creation time. "
+        "With `stream=true` the whole filtered list is streamed as NDJSON instead, read page by page"
+    ),
+    response_model=PaginatedResponse[RepasseResponseDTO],
+    responses={200: {"content": {"application/x-ndjson": {}}}}
 )
 async def get_repasses_by_production(
     production_id: UUID,
+    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    stream: bool = Query(False, description="Stream every matching repasse as NDJSON instead of one page"),
     usecase: GetRepassesByProductionUseCase = Depends(usecase_factory('get_repasses_by_production_usecase')),
+    session_factory=Depends(read_session_factory),
     current_user=Depends(get_current_user)
 ):
-    return get_repasses_by_production_controller(production_id, usecase)
+    skip = (page - 1) * page_size
+    return await get_repasses_by_production_controller(
+        production_id, usecase, session_factory, skip=skip, limit=page_size, cursor=cursor,
+        include_total=include_total, start_date=start_date, end_date=end_date, stream=stream
+    )
 
 
 @router.get(
     "/hospital/{hospital_id}",
     summary="List Repasses by Hospital",
-    description="Returns all repasses linked to a specific hospital",
-    response_model=List[RepasseResponseDTO]
+    description=(
+        "Returns the repasses linked to a hospital's productions with pagination. `start_date`/`end_date` filter by "
+        "creation time. With `stream=true` the whole filtered list is streamed as NDJSON instead, read page by page"
+    ),
+    response_model=PaginatedResponse[RepasseResponseDTO],
+    responses={200: {"content": {"application/x-ndjson": {}}}}
 )
 async def get_repasses_by_hospital(
     hospital_id: UUID,
+    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous next_cursor; when set, page is ignored"),
+    include_total: bool = Query(True, description="Include total/total_pages"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    stream: bool = Query(False, description="Stream every matching repasse as NDJSON instead of one page"),
     usecase: GetRepassesByHospitalUseCase = Depends(usecase_factory('get_repasses_by_hospital_usecase')),
+    session_factory=Depends(read_session_factory),
     current_user=Depends(get_current_user)
 ):
-    return get_repasses_by_hospital_controller(hospital_id, usecase)
+    skip = (page - 1) * page_size
+    return await get_repasses_by_hospital_controller(
+        hospital_id, usecase, session_factory, skip=skip, limit=page_size, cursor=cursor,
+        include_total=include_total, start_date=start_date, end_date=end_date, stream=stream
+    )
 
 
 @router.put(
@@ -113,7 +272,7 @@ async def update_repasse(
     usecase: UpdateRepasseUseCase = Depends(usecase_factory('update_repasse_usecase')),
     current_user=Depends(get_current_user)
 ):
-    return update_repasse_controller(repasse_id, data, usecase)
+    return await update_repasse_controller(repasse_id, data, usecase)
 
 
 @router.delete(
@@ -127,7 +286,7 @@ async def delete_repasse(
     usecase: DeleteRepasseUseCase = Depends(usecase_factory('delete_repasse_usecase')),
     current_user=Depends(get_current_user)
 ):
-    return delete_repasse_controller(repasse_id, usecase)
+    return await delete_repasse_controller(repasse_id, usecase)
 
 
 router.add_api_route(
@@ -138,3 +297,21 @@ router.add_api_route(
     summary="Doctor Repasse Statistics",
     description="Returns repasse statistics (pending vs consolidated) for a doctor in a date range"
 )
+
+router.add_api_route(
+    "/stats/{doctor_id}/series",
+    get_repasse_stats_series,
+    methods=["GET"],
+    response_model=RepasseStatsSeriesDTO,
+    summary="Doctor Repasse Statistics Series",
+    description="Returns pending vs consolidated totals per day or month for a doctor, optionally split by hospital and/or production type"
+)
+
+router.add_api_route(
+    "/stats/batch",
+    get_repasse_stats_batch,
+    methods=["POST"],
+    response_model=RepasseStatsBatchDTO,
+    summary="Batch Repasse Statistics",
+    description="Returns pending vs consolidated totals for many doctors (a list of IDs or every doctor linked to a hospital) in one grouped query, keyed by doctor ID"
+)
@@ -22,8 +22,13 @@ from src.infrastructure.database.models.hospital_model import HospitalModel
 from src.infrastructure.database.models.doctor_hospital_model import DoctorHospitalModel
 from src.infrastructure.database.models.production_model import ProductionModel
 from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.database.models.doctor_balance_model import DoctorBalanceModel
+from src.infrastructure.database.models.collection_version_model import CollectionVersionModel
 from main import create_app
 from src.infrastructure.services.password_service import PasswordService
+from src.infrastructure.repositories.counts import clear_counts
+from src.infrastructure.repositories.entity_cache import clear_entities
+from src.infrastructure.cache.stats_cache import clear_stats_cache
 
 
 # Database fixture for tests
@@ -40,6 +45,10 @@ def db_session() -> Generator[Session, None, None]:
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
     session = TestingSessionLocal()
+    # Cached list totals, entities and stats are process-wide; every test starts from a fresh database
+    clear_counts()
+    clear_entities()
+    clear_stats_cache()
     try:
         yield session
     finally:
@@ -50,7 +59,7 @@ def db_session() -> Generator[Session, None, None]:
 @pytest.fixture(scope="function")
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """Create a test client with database dependency override"""
-    from src.infrastructure.database.connection import get_db
+    from src.infrastructure.database.connection import get_db, get_read_session_factory, get_session_factory
 
     app = create_app()
 
@@ -61,6 +70,8 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: (lambda: db_session)
+    app.dependency_overrides[get_read_session_factory] = lambda: (lambda: db_session)
 
     with TestClient(app) as test_client:
         yield test_client
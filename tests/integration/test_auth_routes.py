@@ -130,3 +130,17 @@ class TestHealthCheck:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ok"
+
+    def test_metrics_expose_pool_gauges(self, client: TestClient):
+        """Test that /metrics exposes the connection pool metrics"""
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        for metric in (
+            "db_pool_size",
+            "db_pool_checked_out",
+            "db_pool_overflow",
+            "db_pool_checkout_wait_seconds",
+            "db_pool_checkout_failures_total",
+        ):
+            assert metric in response.text
@@ -75,6 +75,51 @@ class TestDoctorRoutes:
         data = response.json()
         assert len(data["items"]) >= 1
 
+    def test_get_all_doctors_by_cursor(self, client: TestClient, auth_headers: dict):
+        """Test walking the doctor list with next_cursor"""
+        for i in range(3):
+            client.post(
+                "/api/v1/doctors/",
+                json={"name": f"Dr. Cursor {i}", "crm": f"CUR{i}", "specialty": "Cardiologia",
+                      "phone": "11999999999", "email": f"cursor{i}@test.com"},
+                headers=auth_headers
+            )
+
+        seen = []
+        response = client.get("/api/v1/doctors/?page_size=2", headers=auth_headers)
+        data = response.json()
+        seen += [item["id"] for item in data["items"]]
+        assert data["page"] == 1
+        assert data["next_cursor"] is not None
+
+        response = client.get(f"/api/v1/doctors/?page_size=2&cursor={data['next_cursor']}", headers=auth_headers)
+        data = response.json()
+        seen += [item["id"] for item in data["items"]]
+
+        assert response.status_code == 200
+        assert data["page"] is None
+        assert data["next_cursor"] is None
+        assert data["total"] == 3
+        assert len(set(seen)) == 3
+
+    def test_get_all_doctors_totals(self, client: TestClient, auth_headers: dict, created_doctor):
+        """Test include_total and the exact/estimated total flag"""
+        without_total = client.get("/api/v1/doctors/?include_total=false", headers=auth_headers).json()
+        counted = client.get("/api/v1/doctors/", headers=auth_headers).json()
+        cached = client.get("/api/v1/doctors/", headers=auth_headers).json()
+
+        assert without_total["total"] is None
+        assert without_total["total_pages"] is None
+        assert len(without_total["items"]) == 1
+        assert (counted["total"], counted["total_exact"]) == (1, True)
+        assert (cached["total"], cached["total_exact"]) == (1, False)
+
+    def test_get_all_doctors_invalid_cursor(self, client: TestClient, auth_headers: dict):
+        """Test that an invalid cursor is rejected"""
+        response = client.get("/api/v1/doctors/?cursor=garbage", headers=auth_headers)
+
+        assert response.status_code == 400
+
     def test_get_doctor_by_id(self, client: TestClient, auth_headers: dict, created_doctor):
         """Test getting doctor by ID"""
         response = client.get(
@@ -136,6 +181,161 @@ class TestDoctorRoutes:
         assert get_response.status_code == 404
 
 
+    def test_get_doctor_statement(self, client: TestClient, auth_headers: dict,
+                                  created_doctor, created_hospital, created_production):
+        """Test statement with embedded hospital names and repasses and period totals"""
+        doctor_id, hospital_name = str(created_doctor.id), created_hospital.name
+        for amount in (100.0, 50.5):
+            client.post("/api/v1/repasses/", json={"production_id": str(created_production.id), "amount": amount},
+                        headers=auth_headers)
+        other = client.post("/api/v1/productions/", json={
+            "doctor_id": doctor_id, "hospital_id": str(created_hospital.id), "type": "consultation", "date": "2024-03-01"
+        }, headers=auth_headers).json()
+
+        response = client.get(f"/api/v1/doctors/{doctor_id}/statement", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["doctor"]["id"] == doctor_id
+        assert [item["id"] for item in data["productions"]] == [str(created_production.id), other["id"]]
+        assert data["productions"][0]["hospital_name"] == hospital_name
+        assert sorted(float(r["amount"]) for r in data["productions"][0]["repasses"]) == [50.5, 100.0]
+        assert data["productions"][1]["repasses"] == []
+        assert data["total_pending_count"] == 2
+        assert float(data["total_pending_value"]) == 150.5
+
+        march = client.get(f"/api/v1/doctors/{doctor_id}/statement",
+                           params={"start_date": "2024-02-01", "end_date": "2024-03-31"}, headers=auth_headers).json()
+        assert [item["id"] for item in march["productions"]] == [other["id"]]
+        assert march["total_pending_count"] == 0
+
+    def test_get_doctor_statement_query_count(self, client: TestClient, auth_headers: dict, db_session,
+                                              created_doctor, created_hospital):
+        """Test that the number of queries does not grow with the number of productions"""
+        from sqlalchemy import event
+
+        doctor_id, hospital_id = str(created_doctor.id), str(created_hospital.id)
+        statements = []
+        engine = db_session.get_bind()
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        def statement_queries():
+            statements.clear()
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                assert client.get(f"/api/v1/doctors/{doctor_id}/statement", headers=auth_headers).status_code == 200
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+            return len(statements)
+
+        def add_production():
+            production = client.post("/api/v1/productions/", json={
+                "doctor_id": doctor_id, "hospital_id": hospital_id, "type": "shift", "date": "2024-01-15"
+            }, headers=auth_headers).json()
+            client.post("/api/v1/repasses/", json={"production_id": production["id"], "amount": 10.0},
+                        headers=auth_headers)
+
+        add_production()
+        # The first call also loads the doctor into the entity cache
+        statement_queries()
+        with_one = statement_queries()
+        for _ in range(10):
+            add_production()
+
+        assert statement_queries() == with_one
+
+    def test_conditional_get_doctors(self, client: TestClient, auth_headers: dict, db_session,
+                                     created_user, sample_doctor_data):
+        """Test ETag/If-None-Match on the doctor list: 304 from the version counter alone until a write"""
+        from sqlalchemy import event
+
+        first = client.get("/api/v1/doctors/", headers=auth_headers)
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert client.get("/api/v1/doctors/?page=2", headers=auth_headers).headers["etag"] != etag
+
+        statements = []
+        engine = db_session.get_bind()
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            unchanged = client.get("/api/v1/doctors/", headers={**auth_headers, "If-None-Match": etag})
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["etag"] == etag
+        assert len(statements) == 1
+        assert "collection_versions" in statements[0]
+
+        created = client.post("/api/v1/doctors/", json=sample_doctor_data, headers=auth_headers).json()
+        changed = client.get("/api/v1/doctors/", headers={**auth_headers, "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total"] == 1
+        assert changed.headers["etag"] != etag
+
+        item_etag = client.get(f"/api/v1/doctors/{created['id']}", headers=auth_headers).headers["etag"]
+        client.put(f"/api/v1/doctors/{created['id']}", json={"name": "Dr. Renamed"}, headers=auth_headers)
+        refreshed = client.get(f"/api/v1/doctors/{created['id']}", headers={**auth_headers, "If-None-Match": item_etag})
+        assert refreshed.status_code == 200
+        assert refreshed.json()["name"] == "Dr. Renamed"
+
+    def test_conditional_get_doctor_by_id_of_another_user(self, client: TestClient, auth_headers: dict,
+                                                          sample_doctor_data):
+        """Test that a reader who does not own the doctor sees the owner's edit instead of a 304"""
+        created = client.post("/api/v1/doctors/", json=sample_doctor_data, headers=auth_headers).json()
+        client.post("/api/v1/signup", json={"name": "Reader", "email": "reader@example.com", "password": "Reader@1234"})
+        token = client.post("/api/v1/signin", json={"email": "reader@example.com", "password": "Reader@1234"}).json()["access_token"]
+        reader_headers = {"Authorization": f"Bearer {token}"}
+
+        etag = client.get(f"/api/v1/doctors/{created['id']}", headers=reader_headers).headers["etag"]
+        assert client.get(
+            f"/api/v1/doctors/{created['id']}", headers={**reader_headers, "If-None-Match": etag}
+        ).status_code == 304
+
+        client.put(f"/api/v1/doctors/{created['id']}", json={"name": "Dr. Renamed"}, headers=auth_headers)
+        response = client.get(f"/api/v1/doctors/{created['id']}", headers={**reader_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Dr. Renamed"
+
+    def test_get_doctor_by_id_ignores_stale_entity_cache(self, client: TestClient, auth_headers: dict, db_session,
+                                                         created_user, sample_doctor_data):
+        """Test that GET /{id} reads the row its ETag describes, not this worker's cached copy"""
+        from uuid import UUID
+        from src.domain.enums.collection import Collection
+        from src.infrastructure.database.models.doctor_model import DoctorModel
+        from src.infrastructure.repositories.collection_version_repository import CollectionVersionRepository
+
+        created = client.post("/api/v1/doctors/", json=sample_doctor_data, headers=auth_headers).json()
+        etag = client.get(f"/api/v1/doctors/{created['id']}", headers=auth_headers).headers["etag"]
+
+        # A write handled by another worker: the row and the version change, this process's entity cache does not
+        db_session.get(DoctorModel, UUID(created["id"])).name = "Dr. Elsewhere"
+        CollectionVersionRepository(db_session).bump(created_user.id, Collection.DOCTORS)
+        db_session.commit()
+
+        response = client.get(f"/api/v1/doctors/{created['id']}", headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Dr. Elsewhere"
+
+    def test_get_doctor_statement_not_found(self, client: TestClient, auth_headers: dict):
+        """Test statement of a non-existent doctor and an inverted period"""
+        from uuid import uuid4
+
+        assert client.get(f"/api/v1/doctors/{uuid4()}/statement", headers=auth_headers).status_code == 404
+        inverted = client.get(f"/api/v1/doctors/{uuid4()}/statement",
+                              params={"start_date": "2024-02-01", "end_date": "2024-01-01"}, headers=auth_headers)
+        assert inverted.status_code == 400
+
+
 class TestDoctorHospitalRoutes:
     """Integration tests for doctor-hospital relationship endpoints"""
 
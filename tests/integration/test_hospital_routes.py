@@ -1,4 +1,5 @@
 """Integration tests for Hospital routes"""
+import json
 import pytest
 from fastapi.testclient import TestClient
 
@@ -130,5 +131,19 @@ class TestHospitalRoutes:
 
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 1
+        assert data["total"] == 1
+        assert data["items"][0]["id"] == str(created_doctor.id)
+        assert data["items"][0]["assigned_at"]
+
+        not_yet = client.get(
+            f"/api/v1/hospitals/{created_hospital.id}/doctors",
+            params={"end_date": "2000-01-01T00:00:00"},
+            headers=auth_headers
+        )
+        assert not_yet.json()["total"] == 0
+
+        streamed = client.get(
+            f"/api/v1/hospitals/{created_hospital.id}/doctors", params={"stream": True}, headers=auth_headers
+        )
+        assert streamed.headers["content-type"].startswith("application/x-ndjson")
+        assert [json.loads(line) for line in streamed.text.splitlines()] == data["items"]
@@ -2,6 +2,9 @@
 import pytest
 from fastapi.testclient import TestClient
 from uuid import uuid4
+from prometheus_client import REGISTRY
+
+from src.infrastructure.cache.stats_cache import LocalStatsCache
 
 
 class TestProductionRoutes:
@@ -70,6 +73,35 @@ class TestProductionRoutes:
         assert response.status_code == 404
         assert "Hospital not found" in response.json()["detail"]
 
+    def test_bulk_create_productions(self, client: TestClient, auth_headers: dict,
+                                     created_doctor, created_hospital):
+        """Test bulk creation with per-item errors"""
+        item = {
+            "doctor_id": str(created_doctor.id),
+            "hospital_id": str(created_hospital.id),
+            "type": "shift",
+            "date": "2024-01-15"
+        }
+        items = [item] * 3 + [{**item, "hospital_id": str(uuid4())}, {**item, "date": "not-a-date"}]
+
+        response = client.post("/api/v1/productions/bulk", json={"items": items}, headers=auth_headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 3
+        assert data["failed"] == 2
+        assert [error["index"] for error in data["errors"]] == [3, 4]
+        assert data["errors"][0]["detail"] == "Hospital not found."
+        listed = client.get("/api/v1/productions/", headers=auth_headers).json()
+        assert listed["total"] == 3
+        assert {production["id"] for production in listed["items"]} == set(data["ids"][:3])
+
+    def test_bulk_create_productions_rejects_empty_batch(self, client: TestClient, auth_headers: dict):
+        """Test that an empty batch is a validation error"""
+        response = client.post("/api/v1/productions/bulk", json={"items": []}, headers=auth_headers)
+
+        assert response.status_code == 422
+
     def test_get_all_productions(self, client: TestClient, auth_headers: dict, created_production):
         """Test listing all productions"""
         response = client.get(
@@ -87,6 +119,34 @@ class TestProductionRoutes:
         assert "total_pages" in data
         assert len(data["items"]) >= 1
 
+    def test_export_productions_csv(self, client: TestClient, auth_headers: dict,
+                                    created_doctor, created_production):
+        """Test CSV export with the same columns as the JSON API and the doctor/date filters"""
+        import csv
+        import io
+
+        response = client.get(
+            "/api/v1/productions/export",
+            params={"doctor_id": str(created_doctor.id), "start_date": "2024-01-01"},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="productions.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(created_production.id)
+        assert rows[0]["type"] == "shift"
+        assert rows[0]["date"] == created_production.date.isoformat()
+
+        other_doctor = client.get(
+            "/api/v1/productions/export", params={"doctor_id": str(uuid4())}, headers=auth_headers
+        )
+        assert other_doctor.text.splitlines() == [
+            "id,doctor_id,hospital_id,type,date,description,created_at,updated_at"
+        ]
+
     def test_get_production_by_id(self, client: TestClient, auth_headers: dict, created_production):
         """Test getting production by ID"""
         response = client.get(
@@ -122,9 +182,59 @@ class TestProductionRoutes:
 
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 1
-        assert data[0]["hospital_id"] == str(created_hospital.id)
+        assert data["total"] == 1
+        assert data["page"] == 1
+        assert data["items"][0]["hospital_id"] == str(created_hospital.id)
+        assert data["next_cursor"] is None
+
+    def test_get_productions_by_hospital_cursor_filter_and_stream(self, client: TestClient, auth_headers: dict,
+                                                                  created_doctor, created_hospital):
+        """Test walking a hospital's productions by cursor, filtering by date and streaming them all"""
+        import json
+
+        item = {"doctor_id": str(created_doctor.id), "hospital_id": str(created_hospital.id), "type": "shift"}
+        items = [{**item, "date": f"2024-{month:02d}-10"} for month in range(1, 13)]
+        client.post("/api/v1/productions/bulk", json={"items": items}, headers=auth_headers)
+        url = f"/api/v1/productions/hospital/{created_hospital.id}"
+
+        seen, cursor = [], None
+        while True:
+            params = {"page_size": 5, "include_total": False, **({"cursor": cursor} if cursor else {})}
+            data = client.get(url, params=params, headers=auth_headers).json()
+            assert data["total"] is None
+            seen += [production["id"] for production in data["items"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        assert len(seen) == len(set(seen)) == 12
+
+        filtered = client.get(url, params={"start_date": "2024-03-01", "end_date": "2024-05-31"}, headers=auth_headers)
+        assert filtered.json()["total"] == 3
+        assert sorted(p["date"] for p in filtered.json()["items"]) == ["2024-03-10", "2024-04-10", "2024-05-10"]
+
+        streamed = client.get(url, params={"stream": True, "start_date": "2024-02-01"}, headers=auth_headers)
+        assert streamed.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in streamed.text.splitlines()]
+        assert len(rows) == 11
+        assert [row["id"] for row in rows] == [i for i in seen if i in {row["id"] for row in rows}]
+
+        assert client.get(url, params={"cursor": "nope"}, headers=auth_headers).status_code == 400
+        reversed_period = {"start_date": "2024-05-01", "end_date": "2024-01-01"}
+        assert client.get(url, params=reversed_period, headers=auth_headers).status_code == 400
+
+    def test_conditional_get_productions_after_hospital_delete(self, client: TestClient, auth_headers: dict,
+                                                               created_hospital, created_production):
+        """Test that deleting a hospital changes the production list ETag (its productions cascade)"""
+        etag = client.get("/api/v1/productions/", headers=auth_headers).headers["etag"]
+        assert client.get(
+            "/api/v1/productions/", headers={**auth_headers, "If-None-Match": f'"other", {etag}'}
+        ).status_code == 304
+
+        client.delete(f"/api/v1/hospitals/{created_hospital.id}", headers=auth_headers)
+
+        response = client.get("/api/v1/productions/", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
 
     def test_update_production(self, client: TestClient, auth_headers: dict, created_production):
         """Test updating production"""
@@ -193,6 +303,51 @@ class TestRepasseRoutes:
         assert response.status_code == 404
         assert "Production not found" in response.json()["detail"]
 
+    def test_upsert_repasse_is_idempotent(self, client: TestClient, auth_headers: dict, created_production):
+        """Test that a re-delivered hospital event does not create a second repasse"""
+        event = {
+            "production_id": str(created_production.id),
+            "amount": 1500.00,
+            "source_system": "hospital-abc",
+            "external_id": "PAY-000123"
+        }
+
+        first = client.post("/api/v1/repasses/upsert", json=event, headers=auth_headers)
+        second = client.post("/api/v1/repasses/upsert", json=event, headers=auth_headers)
+        listed = client.get("/api/v1/repasses/", headers=auth_headers).json()
+
+        assert first.status_code == 200
+        assert first.json()["created"] is True
+        assert second.json() == {"id": first.json()["id"], "created": False}
+        assert listed["total"] == 1
+        assert listed["items"][0]["external_id"] == "PAY-000123"
+
+    def test_bulk_upsert_repasses(self, client: TestClient, auth_headers: dict, created_production):
+        """Test batch upsert with duplicates and unknown productions"""
+        event = {"production_id": str(created_production.id), "amount": 100.00, "source_system": "hospital-abc"}
+        items = [
+            {**event, "external_id": "PAY-1"},
+            {**event, "external_id": "PAY-2"},
+            {**event, "external_id": "PAY-3", "production_id": str(uuid4())},
+        ]
+        client.post("/api/v1/repasses/upsert", json=items[0], headers=auth_headers)
+
+        response = client.post("/api/v1/repasses/upsert/bulk", json={"items": items}, headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["duplicates"], data["failed"]) == (1, 1, 1)
+        assert data["ids"][2] is None
+        assert data["errors"] == [{"index": 2, "detail": "Production not found"}]
+
+    def test_upsert_repasse_unknown_production(self, client: TestClient, auth_headers: dict):
+        """Test upsert for a production that does not exist"""
+        event = {"production_id": str(uuid4()), "amount": 10.0, "source_system": "s", "external_id": "e"}
+
+        response = client.post("/api/v1/repasses/upsert", json=event, headers=auth_headers)
+
+        assert response.status_code == 404
+
     def test_get_all_repasses(self, client: TestClient, auth_headers: dict, created_production):
         """Test listing all repasses"""
         # Create a repasse first
@@ -240,9 +395,16 @@ class TestRepasseRoutes:
 
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 1
-        assert data[0]["production_id"] == str(created_production.id)
+        assert data["total"] == 1
+        assert data["items"][0]["production_id"] == str(created_production.id)
+
+        later = client.get(
+            f"/api/v1/repasses/production/{created_production.id}",
+            params={"start_date": "2999-01-01T00:00:00"},
+            headers=auth_headers
+        )
+        assert later.json()["total"] == 0
+        assert later.json()["items"] == []
 
     def test_get_repasses_by_hospital(self, client: TestClient, auth_headers: dict,
                                       created_production, created_hospital):
@@ -264,12 +426,41 @@ class TestRepasseRoutes:
 
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
-        assert len(data) >= 1
+        assert data["total"] == 1
         # Check if the repasse belongs to the correct production which belongs to the hospital
         # Since the response is just repasse DTOs, we might check IDs or trust the query.
         # Ideally we could verify the structure or check if at least one item returned is the one we created.
-        assert data[0]["production_id"] == str(created_production.id)
+        assert data["items"][0]["production_id"] == str(created_production.id)
+
+    def test_stream_repasses_by_hospital(self, client: TestClient, auth_headers: dict,
+                                         created_production, created_hospital, monkeypatch):
+        """Test that stream mode returns every repasse, read across several keyset pages"""
+        import json
+        from src.controller import listing
+
+        monkeypatch.setattr(listing, "LIST_STREAM_PAGE_SIZE", 40)
+        client.post("/api/v1/repasses/upsert/bulk", json={"items": [
+            {"production_id": str(created_production.id), "amount": 10.0 + i, "source_system": "his", "external_id": str(i)}
+            for i in range(100)
+        ]}, headers=auth_headers)
+
+        response = client.get(
+            f"/api/v1/repasses/hospital/{created_hospital.id}", params={"stream": True}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert "content-disposition" not in response.headers
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 100
+        assert {row["external_id"] for row in rows} == {str(i) for i in range(100)}
+        assert rows == sorted(rows, key=lambda row: (row["created_at"], row["id"]))
+
+        page = client.get(
+            f"/api/v1/repasses/hospital/{created_hospital.id}", params={"page": 3, "page_size": 40}, headers=auth_headers
+        ).json()
+        assert page["total"] == 100
+        assert page["total_pages"] == 3
+        assert [row["id"] for row in page["items"]] == [row["id"] for row in rows[80:]]
 
     def test_update_repasse(self, client: TestClient, auth_headers: dict, created_production):
         """Test updating repasse"""
@@ -317,3 +508,251 @@ class TestRepasseRoutes:
 
         assert response.status_code == 200
         assert "deleted successfully" in response.json()["message"]
+
+    def test_get_repasse_stats(self, client: TestClient, auth_headers: dict, created_production):
+        """Test consolidated stats for a doctor"""
+        for amount, status in ((1000.00, "consolidated"), (250.50, "pending"), (49.50, "pending")):
+            client.post(
+                "/api/v1/repasses/",
+                json={"production_id": str(created_production.id), "amount": amount, "status": status},
+                headers=auth_headers
+            )
+
+        response = client.get(
+            f"/api/v1/repasses/stats/{created_production.doctor_id}",
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_pending_count"] == 2
+        assert float(data["total_pending_value"]) == 300.00
+        assert data["total_consolidated_count"] == 1
+        assert float(data["total_consolidated_value"]) == 1000.00
+
+    def test_repasse_stats_cached_until_write(self, client: TestClient, auth_headers: dict, created_production):
+        """Test that stats are served from the cache and invalidated by repasse writes of the doctor"""
+        url = f"/api/v1/repasses/stats/{created_production.doctor_id}"
+        hits = lambda: REGISTRY.get_sample_value("stats_cache_hits_total", {"backend": "local", "state": "fresh"}) or 0
+
+        assert client.get(url, headers=auth_headers).json()["total_pending_count"] == 0
+        before = hits()
+        assert client.get(url, headers=auth_headers).json()["total_pending_count"] == 0
+        assert hits() == before + 1
+
+        created = client.post(
+            "/api/v1/repasses/",
+            json={"production_id": str(created_production.id), "amount": 100.00, "status": "pending"},
+            headers=auth_headers
+        ).json()
+        assert client.get(url, headers=auth_headers).json()["total_pending_count"] == 1
+
+        client.put(f"/api/v1/repasses/{created['id']}", json={"status": "consolidated"}, headers=auth_headers)
+        data = client.get(url, headers=auth_headers).json()
+        assert (data["total_pending_count"], data["total_consolidated_count"]) == (0, 1)
+
+        client.delete(f"/api/v1/repasses/{created['id']}", headers=auth_headers)
+        assert client.get(url, headers=auth_headers).json()["total_consolidated_count"] == 0
+
+    def test_repasse_stats_stale_while_revalidate(self, client: TestClient, auth_headers: dict,
+                                                  created_production, db_session, monkeypatch):
+        """Test that a stale entry is served once and refreshed in the background"""
+        from src.bootstrap import provider
+        from src.infrastructure.cache import stats_cache as stats_cache_module
+        from src.infrastructure.database.models.repasse_model import RepasseModel
+
+        now = [1000.0]
+        cache = LocalStatsCache(ttl=30, stale_ttl=60, clock=lambda: now[0])
+        monkeypatch.setattr(stats_cache_module, "stats_cache", cache)
+        monkeypatch.setattr(provider.container, "stats_cache", cache)
+        url = f"/api/v1/repasses/stats/{created_production.doctor_id}?start_date=2000-01-01T00:00:00"
+
+        assert client.get(url, headers=auth_headers).json()["total_pending_count"] == 0
+        # Written behind the cache's back: only the TTL can surface it
+        db_session.add(RepasseModel(production_id=created_production.id, user_id=created_production.user_id,
+                                    amount=50, status="pending"))
+        db_session.commit()
+        now[0] += 31
+
+        assert client.get(url, headers=auth_headers).json()["total_pending_count"] == 0
+        assert client.get(url, headers=auth_headers).json()["total_pending_count"] == 1
+
+    def test_get_repasse_stats_batch(self, client: TestClient, auth_headers: dict, created_production):
+        """Test batch stats by doctor IDs and by hospital, matching the single-doctor stats"""
+        doctor_id, hospital_id = str(created_production.doctor_id), str(created_production.hospital_id)
+        for amount, status in ((1000.00, "consolidated"), (250.50, "pending")):
+            client.post(
+                "/api/v1/repasses/",
+                json={"production_id": str(created_production.id), "amount": amount, "status": status},
+                headers=auth_headers
+            )
+        unknown = str(uuid4())
+
+        response = client.post("/api/v1/repasses/stats/batch", json={"doctor_ids": [doctor_id, unknown]},
+                               headers=auth_headers)
+
+        assert response.status_code == 200
+        doctors = response.json()["doctors"]
+        single = client.get(f"/api/v1/repasses/stats/{doctor_id}", headers=auth_headers).json()
+        assert doctors[doctor_id] == {key: single[key] for key in doctors[doctor_id]}
+        assert doctors[unknown]["total_pending_count"] == 0
+
+        in_period = client.post("/api/v1/repasses/stats/batch", json={
+            "doctor_ids": [doctor_id], "start_date": "2000-01-01T00:00:00", "end_date": "2100-01-01T00:00:00"
+        }, headers=auth_headers).json()["doctors"]
+        assert in_period[doctor_id]["total_consolidated_count"] == 1
+        assert float(in_period[doctor_id]["total_pending_value"]) == 250.50
+
+        client.post(f"/api/v1/doctors/{doctor_id}/hospitals/{hospital_id}", headers=auth_headers)
+        by_hospital = client.post("/api/v1/repasses/stats/batch", json={"hospital_id": hospital_id},
+                                  headers=auth_headers).json()["doctors"]
+        assert list(by_hospital) == [doctor_id]
+
+    def test_get_repasse_stats_batch_requires_one_selector(self, client: TestClient, auth_headers: dict):
+        """Test that exactly one of doctor_ids and hospital_id is accepted"""
+        both = {"doctor_ids": [str(uuid4())], "hospital_id": str(uuid4())}
+
+        assert client.post("/api/v1/repasses/stats/batch", json=both, headers=auth_headers).status_code == 422
+        assert client.post("/api/v1/repasses/stats/batch", json={}, headers=auth_headers).status_code == 422
+
+    def test_get_repasse_stats_series(self, client: TestClient, auth_headers: dict, created_production):
+        """Test monthly series split by hospital and production type"""
+        for amount, status in ((1000.00, "consolidated"), (250.50, "pending"), (49.50, "pending")):
+            client.post(
+                "/api/v1/repasses/",
+                json={"production_id": str(created_production.id), "amount": amount, "status": status},
+                headers=auth_headers
+            )
+
+        response = client.get(
+            f"/api/v1/repasses/stats/{created_production.doctor_id}/series",
+            params={"granularity": "month", "group_by": ["hospital", "production_type"]},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["group_by"] == ["hospital", "production_type"]
+        assert len(data["buckets"]) == 1
+        bucket = data["buckets"][0]
+        assert bucket["hospital_id"] == str(created_production.hospital_id)
+        assert bucket["production_type"] == "shift"
+        assert bucket["total_pending_count"] == 2
+        assert float(bucket["total_pending_value"]) == 300.00
+        assert float(bucket["total_consolidated_value"]) == 1000.00
+
+    def test_import_repasses_ndjson(self, client: TestClient, auth_headers: dict, created_production):
+        """Test streaming NDJSON import with chunked commits and per-line errors"""
+        import json
+
+        valid = json.dumps({"production_id": str(created_production.id), "amount": 100.0})
+        lines = [
+            valid,
+            valid,
+            "",
+            "{not json",
+            json.dumps({"production_id": str(uuid4()), "amount": 5.0}),
+            json.dumps({"production_id": str(created_production.id), "amount": -1}),
+            valid,
+        ]
+
+        def body():
+            # Enviado em pedaços que cortam linhas no meio
+            data = "\n".join(lines).encode()
+            for start in range(0, len(data), 7):
+                yield data[start:start + 7]
+
+        response = client.post(
+            "/api/v1/repasses/import",
+            params={"chunk_size": 2},
+            content=body(),
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["line"] for e in events if e["event"] == "error"] == [4, 5, 6]
+        assert len([e for e in events if e["event"] == "progress"]) == 3
+        assert events[-1] == {"event": "done", "lines": 7, "imported": 3, "failed": 3}
+        listed = client.get("/api/v1/repasses/", headers=auth_headers).json()
+        assert listed["total"] == 3
+
+    def test_export_repasses_ndjson(self, client: TestClient, auth_headers: dict,
+                                    created_doctor, created_production):
+        """Test NDJSON export across several cursor batches, in listing order"""
+        import json
+
+        repasses = [{"production_id": str(created_production.id), "amount": 100.0 + i} for i in range(250)]
+        client.post("/api/v1/repasses/upsert/bulk", json={"items": [
+            {**repasse, "source_system": "his", "external_id": str(i)} for i, repasse in enumerate(repasses)
+        ]}, headers=auth_headers)
+
+        response = client.get(
+            "/api/v1/repasses/export",
+            params={"format": "ndjson", "doctor_id": str(created_doctor.id), "batch_size": 100},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 250
+        assert rows[0]["status"] == "pending"
+        assert sorted(float(row["amount"]) for row in rows) == [100.0 + i for i in range(250)]
+        assert {row["external_id"] for row in rows} == {str(i) for i in range(250)}
+        assert rows == sorted(rows, key=lambda row: (row["created_at"], row["id"]))
+
+        empty = client.get("/api/v1/repasses/export", params={"doctor_id": str(uuid4())}, headers=auth_headers)
+        assert empty.text.splitlines() == [
+            "id,production_id,amount,status,source_system,external_id,created_at,updated_at"
+        ]
+
+    def test_export_repasses_columnar_parquet(self, client: TestClient, auth_headers: dict,
+                                              created_doctor, created_production):
+        """Test Parquet export of productions joined with repasses, with typed columns"""
+        import pyarrow.parquet as pq
+        import io
+        from datetime import date
+        from decimal import Decimal
+
+        doctor_name = created_doctor.name
+        client.post("/api/v1/repasses/", json={"production_id": str(created_production.id), "amount": 1500.25},
+                    headers=auth_headers)
+
+        response = client.get("/api/v1/repasses/export/columnar", params={"start_date": "2024-01-01"},
+                              headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.parquet"
+        table = pq.read_table(io.BytesIO(response.content))
+        assert str(table.schema.field("amount").type) == "decimal128(10, 2)"
+        assert str(table.schema.field("production_date").type) == "date32[day]"
+        row = table.to_pylist()[0]
+        assert row["amount"] == Decimal("1500.25")
+        assert row["production_date"] == date(2024, 1, 15)
+        assert row["doctor_name"] == doctor_name
+        assert row["status"] == "pending"
+
+    def test_export_repasses_columnar_arrow_without_repasses(self, client: TestClient, auth_headers: dict,
+                                                              created_production):
+        """Test that productions without repasses are exported once with null repasse columns"""
+        import pyarrow as pa
+
+        response = client.get("/api/v1/repasses/export/columnar", params={"format": "arrow"}, headers=auth_headers)
+
+        assert response.status_code == 200
+        rows = pa.ipc.open_stream(response.content).read_all().to_pylist()
+        assert len(rows) == 1
+        assert rows[0]["production_id"] == str(created_production.id)
+        assert rows[0]["repasse_id"] is None and rows[0]["amount"] is None
+
+    def test_export_repasses_columnar_without_pyarrow(self, client: TestClient, auth_headers: dict, monkeypatch):
+        """Test that the columnar export answers 501 when pyarrow is not installed"""
+        from src.infrastructure.services import columnar_encoder
+
+        monkeypatch.setattr(columnar_encoder, "pa", None)
+
+        response = client.get("/api/v1/repasses/export/columnar", headers=auth_headers)
+
+        assert response.status_code == 501
@@ -0,0 +1,76 @@
+"""Unit tests for the authentication dependencies"""
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from prometheus_client import REGISTRY
+from uuid import uuid4
+
+from src.infrastructure.auth import dependencies
+from src.infrastructure.auth.dependencies import get_current_user
+from src.infrastructure.services.jwt_service import JWTService
+
+
+def counter(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    dependencies.verified_tokens.clear()
+    yield
+    dependencies.verified_tokens.clear()
+
+
+class TestVerifiedTokenCache:
+    """Test cases for the verified-token cache in get_current_user"""
+
+    def test_second_request_hits_cache(self, monkeypatch):
+        """The same token is only verified by python-jose once"""
+        user_id = str(uuid4())
+        token = JWTService().create_access_token(data={"sub": user_id})
+        calls = []
+        verify = dependencies.token_service.verify_token
+        monkeypatch.setattr(
+            dependencies.token_service, "verify_token",
+            lambda t: calls.append(t) or verify(t)
+        )
+        hits = counter("auth_token_cache_hits_total")
+        misses = counter("auth_token_cache_misses_total")
+
+        first = get_current_user(bearer(token))
+        second = get_current_user(bearer(token))
+
+        assert first["sub"] == second["sub"] == user_id
+        assert len(calls) == 1
+        assert counter("auth_token_cache_hits_total") == hits + 1
+        assert counter("auth_token_cache_misses_total") == misses + 1
+
+    def test_expired_token_is_not_cached(self):
+        """Tokens past their exp are rejected and never stored"""
+        token = JWTService().create_access_token(data={"sub": str(uuid4())}, expires_delta=-1)
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(bearer(token))
+
+        assert exc_info.value.status_code == 401
+        assert len(dependencies.verified_tokens) == 0
+
+    def test_invalid_token_is_rejected(self):
+        """Invalid tokens raise 401 and are not cached"""
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(bearer("not-a-jwt"))
+
+        assert exc_info.value.status_code == 401
+        assert len(dependencies.verified_tokens) == 0
+
+    def test_cached_payload_is_not_shared(self):
+        """Callers get their own copy of the cached payload"""
+        token = JWTService().create_access_token(data={"sub": str(uuid4())})
+
+        get_current_user(bearer(token))["sub"] = "tampered"
+
+        assert get_current_user(bearer(token))["sub"] != "tampered"
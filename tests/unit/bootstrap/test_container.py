@@ -0,0 +1,91 @@
+"""Unit tests for the dependency container"""
+import pytest
+from unittest.mock import Mock
+
+from src.bootstrap.container import Container, RepositoryScope
+from src.domain.usecase.doctor.get_all_doctors import GetAllDoctorsUseCase
+from src.domain.usecase.oauth.signin import SignInUseCase
+
+
+class TestContainer:
+    """Test cases for Container"""
+
+    def test_resolve_builds_requested_usecase(self):
+        container = Container()
+        db = Mock()
+
+        usecase = container.resolve("get_all_doctors_usecase", db)
+
+        assert isinstance(usecase, GetAllDoctorsUseCase)
+        assert usecase.get_all_doctors_port.db is db
+
+    def test_services_are_shared_between_requests(self):
+        container = Container()
+
+        first = container.resolve("signin_usecase", Mock())
+        second = container.resolve("signin_usecase", Mock())
+
+        assert isinstance(first, SignInUseCase)
+        assert first is not second
+        assert first.encrypt_password_port is second.encrypt_password_port
+        assert first.token_service_port is second.token_service_port
+
+    def test_read_only_usecases_are_marked(self):
+        container = Container()
+
+        assert container.is_read_only("get_all_doctors_usecase")
+        assert container.is_read_only("get_doctor_by_id_usecase")
+        assert container.is_read_only("get_repasse_stats_series_use_case")
+        assert not container.is_read_only("create_doctor_usecase")
+        assert not container.is_read_only("signin_usecase")
+        assert not container.is_read_only("does_not_exist_usecase")
+
+    def test_stats_cache_fill_reads_the_primary(self):
+        """The cached stats compute is never routed to a (possibly lagging) replica"""
+        container = Container()
+
+        assert container.is_primary_read("get_repasse_stats_use_case")
+        assert not container.is_read_only("get_repasse_stats_use_case")
+        assert not container.is_primary_read("get_all_doctors_usecase")
+
+    def test_stats_without_cache_are_a_replica_read(self):
+        """With STATS_CACHE_BACKEND=none there is nothing to fill, so stats route like any other read"""
+        container = Container()
+        container.stats_cache = None
+
+        assert container.is_read_only("get_repasse_stats_use_case")
+        assert not container.is_primary_read("get_repasse_stats_use_case")
+
+    def test_password_usecases_are_isolated(self):
+        container = Container()
+
+        assert container.is_isolated("signin_usecase")
+        assert container.is_isolated("signup_usecase")
+        assert not container.is_isolated("get_all_doctors_usecase")
+
+    def test_unknown_usecase_raises(self):
+        container = Container()
+
+        with pytest.raises(ValueError):
+            container.resolve("does_not_exist_usecase", Mock())
+
+        with pytest.raises(ValueError):
+            container.resolve("resolve", Mock())
+
+    def test_usecase_names_lists_every_builder(self):
+        names = Container.usecase_names()
+
+        assert "signup_usecase" in names
+        assert "get_repasse_stats_use_case" in names
+        assert "resolve" not in names
+
+
+class TestRepositoryScope:
+    """Test cases for RepositoryScope"""
+
+    def test_repositories_are_created_lazily_once(self):
+        scope = RepositoryScope(Mock())
+
+        assert "doctor_repository" not in vars(scope)
+        assert scope.doctor_repository is scope.doctor_repository
+        assert "hospital_repository" not in vars(scope)
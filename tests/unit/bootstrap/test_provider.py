@@ -0,0 +1,252 @@
+"""Unit tests for the use case provider (sync and async database modes)"""
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from starlette.requests import Request
+
+from src.bootstrap import provider
+from src.bootstrap.provider import AwaitableUseCase, open_usecase, read_session_factory, usecase_factory
+from src.infrastructure.database.connection import Base, to_async_url
+from src.infrastructure.database.routing import ReadYourWritesPins
+from src.dto.doctorDTO import CreateDoctorDTO
+
+
+@pytest.fixture
+async def async_db_session():
+    """AsyncSession (aiosqlite) sharing the schema used by the sync tests"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def replica_session():
+    """Separate in-memory database standing in for a lagging read replica"""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def pins(monkeypatch):
+    """Fresh read-your-writes pins with a replica reported as configured"""
+    pins = ReadYourWritesPins(window_seconds=5)
+    monkeypatch.setattr(provider, "read_your_writes", pins)
+    monkeypatch.setattr(provider, "has_replica", lambda: True)
+    return pins
+
+
+def make_request(token: str = None) -> Request:
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def make_doctor_dto(crm: str = "654321", email: str = "async@example.com") -> CreateDoctorDTO:
+    return CreateDoctorDTO(
+        name="Dr. Async",
+        crm=crm,
+        specialty="Cardiologia",
+        phone="11999999999",
+        email=email
+    )
+
+
+class TestToAsyncUrl:
+    """Test cases for the async URL conversion"""
+
+    def test_postgres_url_uses_asyncpg(self):
+        url = to_async_url("postgresql://user:secret@db:5432/seiwa_db")
+        assert url == "postgresql+asyncpg://user:secret@db:5432/seiwa_db"
+
+    def test_sqlite_url_uses_aiosqlite(self):
+        assert to_async_url("sqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            to_async_url("mysql://user:secret@db/seiwa_db")
+
+
+class TestAwaitableUseCase:
+    """Test cases for AwaitableUseCase"""
+
+    async def test_sync_session_runs_usecase(self, db_session, created_user):
+        """Sync mode: the use case runs on the threadpool"""
+        create = AwaitableUseCase("create_doctor_usecase", db_session)
+        doctor = await create.execute(make_doctor_dto(), created_user.id)
+
+        list_all = AwaitableUseCase("get_all_doctors_usecase", db_session)
+        doctors, total = await list_all.execute(user_id=created_user.id)
+
+        assert total.value == 1
+        assert doctors[0].id == doctor.id
+
+    async def test_async_session_runs_usecase(self, async_db_session):
+        """Async mode: the use case runs through AsyncSession.run_sync"""
+        user_id = uuid4()
+        create = AwaitableUseCase("create_doctor_usecase", async_db_session)
+        doctor = await create.execute(make_doctor_dto(), user_id)
+
+        get_by_id = AwaitableUseCase("get_doctor_by_id_usecase", async_db_session)
+        found = await get_by_id.execute(doctor.id)
+
+        assert found.crm == "654321"
+        assert found.user_id == user_id
+
+    async def test_async_session_propagates_usecase_errors(self, async_db_session):
+        user_id = uuid4()
+        create = AwaitableUseCase("create_doctor_usecase", async_db_session)
+        await create.execute(make_doctor_dto(), user_id)
+
+        with pytest.raises(ValueError, match="CRM already exists"):
+            await create.execute(make_doctor_dto(email="other@example.com"), user_id)
+
+
+class TestReadReplicaRouting:
+    """Test cases for routing read-only use cases to the replica"""
+
+    async def test_read_usecase_goes_to_replica(self, db_session, replica_session, pins):
+        """Reads use the replica session when one is configured"""
+        get_read = usecase_factory("get_all_doctors_usecase")
+
+        usecase = get_read(make_request("token-a"), db=db_session, replica=replica_session)
+
+        assert usecase.db is replica_session
+
+    async def test_read_usecase_without_replica_uses_primary(self, db_session, pins):
+        """Without a replica, reads stay on the primary session"""
+        get_read = usecase_factory("get_all_doctors_usecase")
+
+        usecase = get_read(make_request("token-a"), db=db_session, replica=None)
+
+        assert usecase.db is db_session
+
+    async def test_write_pins_same_user_to_primary(self, db_session, replica_session, created_user, pins):
+        """After a write, the same user reads their own data from the primary"""
+        get_write = usecase_factory("create_doctor_usecase")
+        get_read = usecase_factory("get_all_doctors_usecase")
+
+        create = get_write(make_request("token-a"), db=db_session)
+        await create.execute(make_doctor_dto(), created_user.id)
+
+        own_read = get_read(make_request("token-a"), db=db_session, replica=replica_session)
+        other_read = get_read(make_request("token-b"), db=db_session, replica=replica_session)
+        doctors, total = await own_read.execute(user_id=created_user.id)
+
+        assert own_read.db is db_session
+        assert total.value == 1
+        assert other_read.db is replica_session
+
+    async def test_failed_write_does_not_pin(self, db_session, created_user, created_doctor, pins):
+        """A write that raises leaves the user reading from the replica"""
+        get_write = usecase_factory("create_doctor_usecase")
+        create = get_write(make_request("token-a"), db=db_session)
+
+        with pytest.raises(ValueError):
+            await create.execute(make_doctor_dto(crm=created_doctor.crm, email="dup@example.com"), created_user.id)
+
+        assert not pins.is_pinned(make_request("token-a"))
+
+
+    async def test_primary_read_neither_uses_replica_nor_pins(self, db_session, replica_session, pins):
+        """Primary-only reads (stats cache fill) use the primary session and do not pin the caller"""
+        get_stats = usecase_factory("get_repasse_stats_use_case")
+
+        usecase = get_stats(db=db_session)
+
+        assert usecase.db is db_session
+        assert usecase.on_success is None
+
+    async def test_stats_without_cache_go_to_replica_unless_pinned(self, db_session, replica_session, pins, monkeypatch):
+        """Without a stats cache, stats read from the replica, and a caller who just wrote reads the primary"""
+        monkeypatch.setattr(provider.container, "stats_cache", None)
+        get_stats = usecase_factory("get_repasse_stats_use_case")
+        pins.pin(make_request("token-a"))
+
+        assert get_stats(make_request("token-b"), db=db_session, replica=replica_session).db is replica_session
+        assert get_stats(make_request("token-a"), db=db_session, replica=replica_session).db is db_session
+
+
+    async def test_streamed_write_pins_caller(self, db_session, created_user, pins):
+        """A write run through open_usecase (NDJSON import) pins its author once it succeeds"""
+        async with open_usecase("create_doctor_usecase", lambda: db_session, make_request("token-a")) as create:
+            assert not pins.is_pinned(make_request("token-a"))
+            await create.execute(make_doctor_dto(), created_user.id)
+
+        assert pins.is_pinned(make_request("token-a"))
+
+    async def test_streamed_read_does_not_pin(self, db_session, created_user, pins):
+        """Reads run through open_usecase (exports) leave the caller on the replica"""
+        async with open_usecase("get_all_doctors_usecase", lambda: db_session, make_request("token-a")) as list_all:
+            await list_all.execute(user_id=created_user.id)
+
+        assert not pins.is_pinned(make_request("token-a"))
+
+    async def test_streamed_read_of_pinned_caller_uses_primary(self, pins):
+        """Exports and NDJSON lists open their session on the primary right after the caller wrote"""
+        primary, replica = object(), object()
+        pins.pin(make_request("token-a"))
+
+        assert read_session_factory(make_request("token-a"), primary=primary, replica=replica) is primary
+        assert read_session_factory(make_request("token-b"), primary=primary, replica=replica) is replica
+
+
+class TestReadYourWritesPins:
+    """Test cases for the read-your-writes pin window"""
+
+    def test_pin_expires_after_window(self):
+        """Pins only last for the configured window"""
+        now = [100.0]
+        pins = ReadYourWritesPins(window_seconds=5, clock=lambda: now[0])
+        request = make_request("token-a")
+
+        pins.pin(request)
+        assert pins.is_pinned(request)
+
+        now[0] += 5
+        assert not pins.is_pinned(request)
+
+    def test_pin_drops_only_expired_pins(self):
+        """Each pin removes the expired pins (oldest first) and keeps the live ones"""
+        now = [100.0]
+        pins = ReadYourWritesPins(window_seconds=5, clock=lambda: now[0])
+        pins.pin(make_request("token-a"))
+        now[0] += 2
+        pins.pin(make_request("token-b"))
+        now[0] += 1
+        pins.pin(make_request("token-a"))
+
+        now[0] += 4.5
+        pins.pin(make_request("token-c"))
+
+        assert len(pins._pins) == 2
+        assert not pins.is_pinned(make_request("token-b"))
+        assert pins.is_pinned(make_request("token-a"))
+        assert pins.is_pinned(make_request("token-c"))
+
+    def test_anonymous_requests_are_never_pinned(self):
+        """Requests without Authorization are not tracked"""
+        pins = ReadYourWritesPins(window_seconds=5)
+
+        pins.pin(make_request())
+
+        assert not pins.is_pinned(make_request())
@@ -0,0 +1,201 @@
+"""Unit tests for the stats result cache backends"""
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from src.dto.repasseDTO import RepasseStatsDTO
+from src.infrastructure.cache.stats_cache import LocalStatsCache, RedisStatsCache, build_stats_cache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_stats(doctor_id, pending_count=1):
+    return RepasseStatsDTO(
+        doctor_id=doctor_id, period_start=None, period_end=None,
+        total_pending_count=pending_count, total_pending_value=Decimal("10.50"),
+        total_consolidated_count=0, total_consolidated_value=Decimal(0)
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_server():
+    """In-process Redis server (fakeredis with Lua), so the backend's script really runs"""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_client(redis_server):
+    return fakeredis.FakeRedis(server=redis_server)
+
+
+@pytest.fixture(params=["local", "redis"])
+def cache(request, clock, redis_client):
+    if request.param == "local":
+        return LocalStatsCache(ttl=30, stale_ttl=60, maxsize=100, clock=clock)
+    return RedisStatsCache(redis_client, ttl=30, stale_ttl=60, clock=clock)
+
+
+class TestStatsCache:
+    """Test cases shared by the local and the Redis-compatible backends"""
+
+    def test_miss_then_hit(self, cache):
+        """Test that a stored result is returned fresh for the same key"""
+        user_id, doctor_id = uuid4(), uuid4()
+        assert cache.get(user_id, doctor_id, None, None) is None
+
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id))
+        cached = cache.get(user_id, doctor_id, None, None)
+
+        assert cached.stale is False
+        assert cached.stats == make_stats(doctor_id)
+
+    def test_keys_include_tenant_and_period(self, cache):
+        """Test that another user or another period is a different entry"""
+        user_id, doctor_id = uuid4(), uuid4()
+        start, end = datetime(2026, 1, 1), datetime(2026, 2, 1)
+        cache.set(user_id, doctor_id, start, end, make_stats(doctor_id))
+
+        assert cache.get(user_id, doctor_id, start, end) is not None
+        assert cache.get(uuid4(), doctor_id, start, end) is None
+        assert cache.get(user_id, doctor_id, None, None) is None
+        assert cache.get(user_id, doctor_id, start, None) is None
+
+    def test_invalidate_drops_only_that_doctor(self, cache):
+        """Test that invalidation removes every period of the doctor and nothing else"""
+        user_id, doctor_id, other_id = uuid4(), uuid4(), uuid4()
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id))
+        cache.set(user_id, doctor_id, datetime(2026, 1, 1), None, make_stats(doctor_id))
+        cache.set(user_id, other_id, None, None, make_stats(other_id))
+
+        cache.invalidate_doctors([doctor_id])
+
+        assert cache.get(user_id, doctor_id, None, None) is None
+        assert cache.get(user_id, doctor_id, datetime(2026, 1, 1), None) is None
+        assert cache.get(user_id, other_id, None, None) is not None
+
+    def test_set_skipped_after_invalidation_during_compute(self, cache):
+        """Test that a result computed before an invalidation is not written back over it"""
+        user_id, doctor_id = uuid4(), uuid4()
+        generation = cache.generation(doctor_id)
+
+        cache.invalidate_doctors([doctor_id])
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id), generation)
+
+        assert cache.get(user_id, doctor_id, None, None) is None
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id), cache.generation(doctor_id))
+        assert cache.get(user_id, doctor_id, None, None) is not None
+
+    def test_entry_age_counts_from_compute_start(self, cache, clock):
+        """Test that a result stored with a generation is aged from when its compute began"""
+        user_id, doctor_id = uuid4(), uuid4()
+        generation = cache.generation(doctor_id)
+
+        clock.now += 90
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id), generation)
+
+        assert cache.get(user_id, doctor_id, None, None) is None
+
+    def test_stale_window(self, cache, clock):
+        """Test that an entry is fresh until the TTL, stale during the window and gone after it"""
+        user_id, doctor_id = uuid4(), uuid4()
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id))
+
+        clock.now += 30
+        assert cache.get(user_id, doctor_id, None, None).stale is True
+
+        clock.now += 60
+        assert cache.get(user_id, doctor_id, None, None) is None
+
+    def test_without_stale_window_entries_expire_at_ttl(self, clock):
+        """Test that stale-while-revalidate is off when stale_ttl is 0"""
+        cache = LocalStatsCache(ttl=30, clock=clock)
+        user_id, doctor_id = uuid4(), uuid4()
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id))
+
+        clock.now += 30
+
+        assert cache.get(user_id, doctor_id, None, None) is None
+
+
+class TestRedisStatsCache:
+    """Test cases specific to the network backend"""
+
+    def test_one_hash_per_doctor_with_expiry(self, redis_client, clock):
+        """Test that entries live in a per-doctor hash that expires with the entry lifetime"""
+        cache = RedisStatsCache(redis_client, ttl=30, stale_ttl=15, prefix="test:", clock=clock)
+        user_id, doctor_id = uuid4(), uuid4()
+
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id))
+        cache.set(uuid4(), doctor_id, None, None, make_stats(doctor_id), cache.generation(doctor_id))
+
+        assert redis_client.keys("test:*") == [f"test:{doctor_id}".encode()]
+        assert redis_client.hlen(f"test:{doctor_id}") == 2
+        assert redis_client.ttl(f"test:{doctor_id}") == 45
+
+    def test_generation_checked_write_runs_the_script(self, redis_client):
+        """Test that the Lua write compares the generation on the server and only then writes"""
+        cache = RedisStatsCache(redis_client, ttl=30)
+        user_id, doctor_id = uuid4(), uuid4()
+        generation = cache.generation(doctor_id)
+
+        # Another worker invalidates between the generation read and the write
+        redis_client.incr(f"stats:gen:{doctor_id}")
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id), generation)
+        assert redis_client.exists(f"stats:{doctor_id}") == 0
+
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id), cache.generation(doctor_id))
+        assert redis_client.hlen(f"stats:{doctor_id}") == 1
+        assert redis_client.ttl(f"stats:{doctor_id}") == 30
+
+    async def test_async_client_inside_run_sync(self, redis_server, redis_client, clock):
+        """Test that calls made from the run_sync greenlet (DB_MODE=async) await the async client"""
+        # The sync client must not be touched: None fails loudly if it is
+        async_client = fakeredis.aioredis.FakeRedis(server=redis_server)
+        cache = RedisStatsCache(None, ttl=30, clock=clock, async_client=async_client)
+        user_id, doctor_id = uuid4(), uuid4()
+
+        generation = await greenlet_spawn(cache.generation, doctor_id)
+        await greenlet_spawn(cache.set, user_id, doctor_id, None, None, make_stats(doctor_id), generation)
+        cached = await greenlet_spawn(cache.get, user_id, doctor_id, None, None)
+        await greenlet_spawn(cache.invalidate_doctors, [doctor_id])
+
+        assert cached.stats == make_stats(doctor_id)
+        assert redis_client.exists(f"stats:{doctor_id}") == 0
+        assert redis_client.get(f"stats:gen:{doctor_id}") == b"1"
+
+    def test_backend_errors_are_misses(self, redis_server, redis_client):
+        """Test that an unreachable server degrades to computing the stats"""
+        cache = RedisStatsCache(redis_client, ttl=30)
+        user_id, doctor_id = uuid4(), uuid4()
+        redis_server.connected = False
+
+        cache.set(user_id, doctor_id, None, None, make_stats(doctor_id), cache.generation(doctor_id))
+        cache.invalidate_doctors([doctor_id])
+
+        assert cache.get(user_id, doctor_id, None, None) is None
+
+
+class TestBuildStatsCache:
+    """Test cases for the backend selection"""
+
+    def test_backends(self):
+        assert build_stats_cache("none") is None
+        assert isinstance(build_stats_cache("local"), LocalStatsCache)
+        with pytest.raises(ValueError):
+            build_stats_cache("memcached")
@@ -0,0 +1,77 @@
+"""Unit tests for the TTL + LRU cache"""
+import pytest
+
+from src.infrastructure.cache.ttl_lru import TTLLRUCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLLRUCache:
+    """Test cases for TTLLRUCache"""
+
+    def test_get_returns_stored_value(self):
+        """Stored values are returned until they expire"""
+        cache = TTLLRUCache(maxsize=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+    def test_entries_expire(self):
+        """Entries disappear once their TTL has elapsed"""
+        clock = FakeClock()
+        cache = TTLLRUCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("default_ttl", 1)
+        cache.set("short_ttl", 2, ttl=1)
+
+        clock.now += 1
+        assert cache.get("short_ttl") is None
+        assert cache.get("default_ttl") == 1
+
+        clock.now += 9
+        assert cache.get("default_ttl") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """The least recently read entry is dropped when full"""
+        cache = TTLLRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_non_positive_ttl_is_not_stored(self):
+        """Already-expired values are not cached"""
+        cache = TTLLRUCache(maxsize=2)
+
+        cache.set("a", 1, ttl=0)
+
+        assert cache.get("a") is None
+
+    def test_delete_and_clear(self):
+        """Entries can be invalidated individually or all at once"""
+        cache = TTLLRUCache(maxsize=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_maxsize_raises(self):
+        """maxsize must be positive"""
+        with pytest.raises(ValueError):
+            TTLLRUCache(maxsize=0)
@@ -0,0 +1,60 @@
+"""Unit tests for the fast JSON response path"""
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.controller.fast_json import fast_json
+from src.domain.enums.repasse_status import RepasseStatus
+from src.dto.pagination import PaginatedResponse
+from src.dto.repasseDTO import RepasseResponseDTO
+
+
+def make_page():
+    items = [
+        RepasseResponseDTO(
+            id=uuid4(), production_id=uuid4(), amount=Decimal("1234.50"), status=RepasseStatus.PENDING,
+            created_at=datetime(2026, 1, 1, 12, 30, 15, 123456), updated_at=None
+        )
+        for _ in range(3)
+    ]
+    return PaginatedResponse.create(items=items, total=3, page=1, page_size=10, next_cursor="abc")
+
+
+class TestFastJson:
+    """Test cases for fast_json"""
+
+    def test_same_body_as_response_model_path(self):
+        """Test that the fast path encodes a page exactly like FastAPI's response_model path"""
+        page = make_page()
+        app = FastAPI()
+
+        @app.get("/standard", response_model=PaginatedResponse[RepasseResponseDTO])
+        async def standard():
+            return page
+
+        @app.get("/fast", response_model=PaginatedResponse[RepasseResponseDTO])
+        async def fast():
+            return fast_json(page)
+
+        client = TestClient(app)
+        standard_response, fast_response = client.get("/standard"), client.get("/fast")
+
+        assert fast_response.headers["content-type"] == "application/json"
+        assert fast_response.json() == standard_response.json()
+
+    def test_keeps_headers_set_by_dependencies(self):
+        """Test that headers put on the injected Response (e.g. ETag) are kept"""
+        app = FastAPI()
+
+        @app.get("/fast")
+        async def fast(response: Response):
+            response.headers["ETag"] = 'W/"abc"'
+            return fast_json(make_page(), response)
+
+        response = TestClient(app).get("/fast")
+
+        assert response.headers["etag"] == 'W/"abc"'
+        assert len(response.json()["items"]) == 3
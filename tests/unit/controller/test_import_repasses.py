@@ -0,0 +1,32 @@
+"""Unit tests for the NDJSON line splitter used by the repasse import"""
+from src.controller.repasse.import_repasses import iter_ndjson_lines
+
+
+async def collect(chunks, max_line_bytes=16):
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    return [line async for line in iter_ndjson_lines(body(), max_line_bytes)]
+
+
+class TestIterNdjsonLines:
+    """Test cases for iter_ndjson_lines"""
+
+    async def test_lines_split_across_chunks(self):
+        """Test that lines are rebuilt across chunk boundaries and blank lines skipped"""
+        lines = await collect([b'{"a"', b': 1}\n\n{"b": 2}\r', b"\n", b'{"c": 3}'])
+
+        assert lines == [(1, b'{"a": 1}'), (3, b'{"b": 2}\r'), (4, b'{"c": 3}')]
+
+    async def test_oversized_line_is_dropped_without_buffering(self):
+        """Test that a line over the limit is reported and the next line still parses"""
+        lines = await collect([b"x" * 10, b"x" * 10, b"x" * 10, b"\n", b'{"ok": 1}\n'])
+
+        assert lines == [(1, None), (2, b'{"ok": 1}')]
+
+    async def test_oversized_line_within_one_chunk_is_dropped(self):
+        """Test that a complete line over the limit is reported even when it arrives in a single chunk"""
+        lines = await collect([b'{"a": 1}\n' + b"x" * 20 + b'\n{"b": 2}\n'])
+
+        assert lines == [(1, b'{"a": 1}'), (2, None), (3, b'{"b": 2}')]
@@ -0,0 +1,168 @@
+"""Query plan tests: repository queries must be served by an index, not a table scan"""
+import random
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from src.domain.enums.repasse_status import RepasseStatus
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+from src.infrastructure.database.models.doctor_hospital_model import DoctorHospitalModel
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.hospital_model import HospitalModel
+from src.infrastructure.database.models.production_model import ProductionModel, ProductionType
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.domain.enums.collection import Collection
+from src.infrastructure.repositories.collection_version_repository import CollectionVersionRepository
+from src.infrastructure.repositories.doctor_hospital_repository import DoctorHospitalRepository
+from src.infrastructure.repositories.doctor_repository import DoctorRepository
+from src.infrastructure.repositories.hospital_repository import HospitalRepository
+from src.infrastructure.repositories.production_repository import ProductionRepository
+from src.infrastructure.repositories.repasse_repository import RepasseRepository
+
+USERS = 4
+DOCTORS = 200
+HOSPITALS = 50
+PRODUCTIONS = 4000
+REPASSES = 8000
+
+
+@pytest.fixture
+def seeded(db_session):
+    """Several tenants with enough rows that a table scan is clearly the wrong plan"""
+    rng = random.Random(42)
+    started = datetime(2024, 1, 1)
+    users = [{"id": uuid.uuid4(), "name": f"User {i}", "email": f"user{i}@seiwa.com", "password": "x"} for i in range(USERS)]
+    doctors = [
+        {"id": uuid.uuid4(), "name": f"Doctor {i}", "crm": f"CRM{i:05d}", "specialty": "Clinic",
+         "email": f"doctor{i}@seiwa.com", "user_id": users[i % USERS]["id"], "created_at": started + timedelta(minutes=i)}
+        for i in range(DOCTORS)
+    ]
+    hospitals = [
+        {"id": uuid.uuid4(), "name": f"Hospital {i}", "address": "Street", "user_id": users[i % USERS]["id"],
+         "created_at": started + timedelta(minutes=i)}
+        for i in range(HOSPITALS)
+    ]
+    links = {(doctor["id"], rng.choice(hospitals)["id"]) for doctor in doctors for _ in range(3)}
+    productions = []
+    for i in range(PRODUCTIONS):
+        doctor = rng.choice(doctors)
+        productions.append({
+            "id": uuid.uuid4(), "doctor_id": doctor["id"], "hospital_id": rng.choice(hospitals)["id"],
+            "user_id": doctor["user_id"], "type": rng.choice(list(ProductionType)), "date": date(2024, 1, 1),
+            "created_at": started + timedelta(minutes=i)
+        })
+    repasses = []
+    for i in range(REPASSES):
+        production = rng.choice(productions)
+        repasses.append({
+            "id": uuid.uuid4(), "production_id": production["id"], "user_id": production["user_id"],
+            "amount": Decimal("100.00"), "status": rng.choice(list(RepasseStatus)),
+            "created_at": started + timedelta(hours=i), "updated_at": started + timedelta(hours=i)
+        })
+
+    db_session.execute(insert(UserModel), users)
+    db_session.execute(insert(DoctorModel), doctors)
+    db_session.execute(insert(HospitalModel), hospitals)
+    db_session.execute(insert(DoctorHospitalModel), [
+        {"doctor_id": doctor_id, "hospital_id": hospital_id, "created_at": started} for doctor_id, hospital_id in links
+    ])
+    db_session.execute(insert(ProductionModel), productions)
+    db_session.execute(insert(RepasseModel), repasses)
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+
+    return {"user": users[0]["id"], "doctor": doctors[0], "hospital": hospitals[0]["id"], "production": productions[0]}
+
+
+@pytest.fixture
+def captured_selects(db_session):
+    """SELECTs sent to the database while the test body runs"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def table_scans(db_session, statement, parameters):
+    """Passos do plano que leem a tabela inteira (SCAN sem índice)"""
+    plan = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in plan if row[-1].startswith("SCAN ") and " INDEX " not in row[-1]]
+
+
+class TestRepositoryQueryPlans:
+    """Every repository read used by the API must use an index on a large seeded database"""
+
+    def test_no_sequential_scans(self, db_session, seeded, captured_selects):
+        """Test that EXPLAIN shows index searches for every repository query"""
+        user_id, doctor, hospital_id = seeded["user"], seeded["doctor"], seeded["hospital"]
+        production = seeded["production"]
+        start, end = datetime(2024, 3, 1), datetime(2024, 6, 1)
+
+        doctors = DoctorRepository(db_session)
+        doctors.get_by_id(doctor["id"])
+        doctors.get_by_crm(doctor["crm"])
+        doctors.get_by_email(doctor["email"])
+        doctors.get_all(0, 20, user_id)
+        doctors.get_all(0, 20, user_id, after=(doctor["created_at"], doctor["id"]))
+        doctors.count_all(user_id)
+
+        hospitals = HospitalRepository(db_session)
+        hospitals.get_by_id(hospital_id)
+        hospitals.get_all(0, 20, user_id)
+        hospitals.count_all(user_id)
+
+        links = DoctorHospitalRepository(db_session)
+        links.get_hospitals_by_doctor(doctor["id"])
+        links.get_doctors_by_hospital(hospital_id, 0, 20)
+        links.get_doctors_by_hospital(hospital_id, 0, 20, after=(start, doctor["id"]), start_date=start, end_date=end)
+        links.count_doctors_by_hospital(hospital_id, start, end)
+
+        productions = ProductionRepository(db_session)
+        productions.get_by_id(production["id"])
+        productions.get_all(0, 20, user_id)
+        productions.count_all(user_id)
+        productions.get_by_doctor(doctor["id"])
+        productions.get_by_hospital(hospital_id, 0, 20)
+        productions.get_by_hospital(hospital_id, 0, 20, after=(start, production["id"]), start_date=start.date())
+        productions.count_by_hospital(hospital_id, start.date(), end.date())
+        list(productions.export(user_id, doctor["id"], start.date(), end.date()))
+        list(productions.export_with_repasses(user_id, start.date(), end.date()))
+        productions.get_statement(doctor["id"], start.date(), end.date())
+
+        repasses = RepasseRepository(db_session)
+        repasses.get_all(0, 20, user_id)
+        repasses.count_all(user_id)
+        repasses.get_by_production(production["id"], 0, 20)
+        repasses.get_by_production(production["id"], 0, 20, after=(start, production["id"]), end_date=end)
+        repasses.count_by_production(production["id"], start, end)
+        repasses.get_by_hospital(hospital_id, 0, 20)
+        repasses.get_by_hospital(hospital_id, 0, 20, after=(start, production["id"]), start_date=start)
+        repasses.count_by_hospital(hospital_id, start, end)
+        repasses.get_by_doctor_and_date_range(doctor["id"], start, end)
+        repasses.get_stats_by_doctor(doctor["id"], start, end)
+        repasses.get_stats_series(doctor["id"], SeriesGranularity.MONTH, start, end, list(SeriesDimension))
+        repasses.get_doctor_balance(doctor["id"])
+        doctor_ids = links.get_doctor_ids_by_hospital(hospital_id)
+        repasses.get_stats_by_doctors(doctor_ids, start, end)
+        repasses.get_doctor_balances(doctor_ids)
+        list(repasses.export(user_id, doctor["id"], start, end))
+
+        CollectionVersionRepository(db_session).get_version(user_id, Collection.DOCTORS)
+
+        assert len(captured_selects) >= 20
+        scans = {
+            statement: found
+            for statement, parameters in captured_selects
+            if (found := table_scans(db_session, statement, parameters))
+        }
+        assert scans == {}
@@ -1,22 +1,37 @@
 """Unit tests for repositories"""
 import pytest
-from uuid import uuid4
+from uuid import UUID, uuid4
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
+from prometheus_client import REGISTRY
+from sqlalchemy import event, text
+from sqlalchemy.dialects import postgresql
+
 from src.infrastructure.repositories.doctor_repository import DoctorRepository
 from src.infrastructure.repositories.hospital_repository import HospitalRepository
 from src.infrastructure.repositories.production_repository import ProductionRepository
 from src.infrastructure.repositories.repasse_repository import RepasseRepository
+from src.infrastructure.repositories.doctor_balance_repository import DoctorBalanceRepository
+from src.infrastructure.repositories.collection_version_repository import CollectionVersionRepository
 from src.dto.doctorDTO import CreateDoctorDTO, UpdateDoctorDTO
 from src.dto.hospitalDTO import CreateHospitalDTO, UpdateHospitalDTO
-from src.dto.productionDTO import CreateProductionDTO, UpdateProductionDTO
-from src.dto.repasseDTO import CreateRepasseDTO, UpdateRepasseDTO
+from src.dto.productionDTO import CreateProductionDTO, ProductionResponseDTO, UpdateProductionDTO
+from src.dto.repasseDTO import CreateRepasseDTO, UpdateRepasseDTO, UpsertRepasseDTO
 from src.domain.entities.Doctor import Doctor
 from src.domain.entities.Hospital import Hospital
 from src.domain.entities.Production import Production
+from src.domain.entities.ReadModels import DoctorRow, HospitalRow, ProductionRow
 from src.domain.entities.Repasse import Repasse
 from src.domain.enums.repasse_status import RepasseStatus
+from src.domain.enums.collection import Collection
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+from src.dto.pagination import decode_cursor, encode_cursor
+from src.infrastructure.database.models.doctor_model import DoctorModel
+from src.infrastructure.database.models.doctor_balance_model import DoctorBalanceModel
+from src.infrastructure.database.models.production_model import ProductionModel
+from src.infrastructure.database.models.repasse_model import RepasseModel
+from src.infrastructure.database.models.user_model import UserModel
 
 
 class TestDoctorRepository:
@@ -76,12 +91,48 @@ class TestDoctorRepository:
         """Test getting all doctors"""
         repo = DoctorRepository(db_session)
 
-        doctors, total = repo.get_all()
+        doctors = repo.get_all()
 
         assert len(doctors) > 0
-        assert total > 0
         assert any(d.id == created_doctor.id for d in doctors)
 
+    def test_get_all_doctors_keyset(self, db_session, created_user):
+        """Test that keyset pages follow (created_at, id) with no gaps or repeats"""
+        same_instant = datetime(2026, 1, 1, 12, 0, 0)
+        for i in range(5):
+            db_session.add(DoctorModel(
+                name=f"Dr. {i}", crm=f"KS{i}", specialty="Cardiologia",
+                email=f"ks{i}@test.com", user_id=created_user.id, created_at=same_instant
+            ))
+        db_session.commit()
+        repo = DoctorRepository(db_session)
+
+        everything = repo.get_all(limit=10, user_id=created_user.id)
+        first_page = repo.get_all(limit=2, user_id=created_user.id)
+        after = (first_page[-1].created_at, first_page[-1].id)
+        second_page = repo.get_all(limit=2, user_id=created_user.id, after=after)
+
+        assert len(everything) == 5
+        assert [d.id for d in everything] == sorted(d.id for d in everything)
+        assert [d.id for d in first_page + second_page] == [d.id for d in everything[:4]]
+
+    def test_count_all_uses_cache_until_write(self, db_session, created_doctor, created_user):
+        """Test that totals are cached and invalidated by writes"""
+        repo = DoctorRepository(db_session)
+
+        first = repo.count_all(user_id=created_user.id)
+        second = repo.count_all(user_id=created_user.id)
+        repo.save(Doctor(
+            id=uuid4(), name="Dr. Count", crm="COUNT1", specialty="Cardiologia",
+            email="count@test.com", user_id=created_user.id,
+            created_at=datetime.now(timezone.utc).isoformat()
+        ))
+        third = repo.count_all(user_id=created_user.id)
+
+        assert (first.value, first.exact) == (1, True)
+        assert (second.value, second.exact) == (1, False)
+        assert (third.value, third.exact) == (2, True)
+
     def test_update_doctor(self, db_session, created_doctor):
         """Test updating a doctor"""
         repo = DoctorRepository(db_session)
@@ -130,9 +181,8 @@ class TestHospitalRepository:
     def test_get_all_hospitals(self, db_session, created_hospital):
         """Test listing hospitals"""
         repo = HospitalRepository(db_session)
-        hospitals, total = repo.get_all()
+        hospitals = repo.get_all()
         assert len(hospitals) > 0
-        assert total > 0
         assert any(h.id == created_hospital.id for h in hospitals)
 
     def test_update_hospital(self, db_session, created_hospital):
@@ -219,3 +269,477 @@ class TestRepasseRepository:
         assert len(results) == 2
         assert any(r.status == RepasseStatus.CONSOLIDATED for r in results)
         assert any(r.status == RepasseStatus.PENDING for r in results)
+
+    def test_get_stats_by_doctor(self, db_session, created_production, created_user):
+        """Test per-status counts and sums aggregated in SQL"""
+        repo = RepasseRepository(db_session)
+        for amount, status in (("500.00", RepasseStatus.CONSOLIDATED),
+                               ("300.10", RepasseStatus.PENDING),
+                               ("199.90", RepasseStatus.PENDING)):
+            repo.create(CreateRepasseDTO(
+                production_id=created_production.id, amount=Decimal(amount), status=status
+            ), created_user.id)
+
+        stats = repo.get_stats_by_doctor(created_production.doctor_id, None, None)
+        future = repo.get_stats_by_doctor(created_production.doctor_id, datetime(2999, 1, 1), None)
+
+        assert stats[RepasseStatus.PENDING] == (2, Decimal("500.00"))
+        assert stats[RepasseStatus.CONSOLIDATED] == (1, Decimal("500.00"))
+        assert future == {}
+
+
+    def test_upsert_many_is_idempotent(self, db_session, created_production, created_user):
+        """Test that re-delivered events return the existing row without duplicates"""
+        repo = RepasseRepository(db_session)
+
+        def event(external_id, amount="100.00"):
+            return UpsertRepasseDTO(
+                production_id=created_production.id, amount=Decimal(amount),
+                source_system="hospital-abc", external_id=external_id
+            )
+
+        first = repo.upsert_many([event("PAY-1"), event("PAY-2")], created_user.id)
+        again = repo.upsert_many([event("PAY-2", "999.00"), event("PAY-3"), event("PAY-3")], created_user.id)
+
+        assert [created for _, created in first] == [True, True]
+        assert again[0] == (first[1][0], False)
+        assert again[1][1] is True and again[2] == (again[1][0], False)
+        assert db_session.query(RepasseModel).count() == 3
+        assert repo.get_by_id(first[1][0]).amount == Decimal("100.00")
+        balance = repo.get_doctor_balance(created_production.doctor_id)
+        assert balance[RepasseStatus.PENDING] == (3, Decimal("300.00"))
+        assert DoctorBalanceRepository(db_session).find_drift() == []
+
+    def test_upsert_many_is_scoped_per_user(self, db_session, created_production, created_user):
+        """Test that the same event from another user is a new repasse, not the first user's"""
+        repo = RepasseRepository(db_session)
+        other_user = UserModel(name="Other User", email="other@example.com", password="x")
+        db_session.add(other_user)
+        db_session.commit()
+        event = UpsertRepasseDTO(
+            production_id=created_production.id, amount=Decimal("100.00"), source_system="hospital-abc", external_id="PAY-1"
+        )
+
+        [(mine, _)] = repo.upsert_many([event], created_user.id)
+        [(theirs, created)] = repo.upsert_many([event], other_user.id)
+
+        assert created is True
+        assert theirs != mine
+        assert repo.get_by_id(theirs).user_id == other_user.id
+
+    def test_get_stats_series(self, db_session, created_production, created_user):
+        """Test per-bucket, per-status aggregates in one grouped query"""
+        repo = RepasseRepository(db_session)
+        for created_at, amount, status in ((datetime(2024, 1, 5, 9), "100.00", RepasseStatus.PENDING),
+                                           (datetime(2024, 1, 20, 18), "50.00", RepasseStatus.PENDING),
+                                           (datetime(2024, 1, 20, 19), "70.00", RepasseStatus.CONSOLIDATED),
+                                           (datetime(2024, 3, 2, 8), "30.00", RepasseStatus.PENDING)):
+            repasse = repo.create(CreateRepasseDTO(
+                production_id=created_production.id, amount=Decimal(amount), status=status
+            ), created_user.id)
+            db_session.get(RepasseModel, repasse.id).created_at = created_at
+        db_session.commit()
+        doctor_id = created_production.doctor_id
+
+        monthly = repo.get_stats_series(doctor_id, SeriesGranularity.MONTH, None, None)
+        daily = repo.get_stats_series(
+            doctor_id, SeriesGranularity.DAY, datetime(2024, 1, 10), None, [SeriesDimension.HOSPITAL]
+        )
+
+        assert [(p.bucket_start, p.status, p.count, p.amount) for p in monthly] == [
+            (datetime(2024, 1, 1), RepasseStatus.CONSOLIDATED, 1, Decimal("70.00")),
+            (datetime(2024, 1, 1), RepasseStatus.PENDING, 2, Decimal("150.00")),
+            (datetime(2024, 3, 1), RepasseStatus.PENDING, 1, Decimal("30.00")),
+        ]
+        assert all(p.hospital_id is None and p.production_type is None for p in monthly)
+        assert [p.bucket_start for p in daily] == [datetime(2024, 1, 20)] * 2 + [datetime(2024, 3, 2)]
+        assert {p.hospital_id for p in daily} == {created_production.hospital_id}
+
+
+class TestDoctorBalanceRepository:
+    """Test cases for the per-doctor balance maintained alongside repasse writes"""
+
+    def test_balance_follows_repasse_writes(self, db_session, created_production, created_user):
+        """Test create, amount change, status transition and delete keep the balance exact"""
+        repo = RepasseRepository(db_session)
+        balances = DoctorBalanceRepository(db_session)
+        doctor_id = created_production.doctor_id
+
+        first = repo.create(CreateRepasseDTO(
+            production_id=created_production.id, amount=Decimal("300.00")
+        ), created_user.id)
+        second = repo.create(CreateRepasseDTO(
+            production_id=created_production.id, amount=Decimal("200.00")
+        ), created_user.id)
+        assert repo.get_doctor_balance(doctor_id)[RepasseStatus.PENDING] == (2, Decimal("500.00"))
+
+        repo.update(first.id, UpdateRepasseDTO(amount=Decimal("350.00"), status=RepasseStatus.CONSOLIDATED))
+        balance = repo.get_doctor_balance(doctor_id)
+        assert balance[RepasseStatus.PENDING] == (1, Decimal("200.00"))
+        assert balance[RepasseStatus.CONSOLIDATED] == (1, Decimal("350.00"))
+
+        repo.delete(second.id)
+        balance = repo.get_doctor_balance(doctor_id)
+        assert balance[RepasseStatus.PENDING] == (0, Decimal("0.00"))
+        assert balance[RepasseStatus.CONSOLIDATED] == (1, Decimal("350.00"))
+        assert balances.find_drift() == []
+
+    def test_update_and_delete_lock_the_repasse_row(self, db_session, created_production, created_user):
+        """Test that the old status/amount behind the balance delta are read with FOR UPDATE"""
+        # Arrange: SQLite drops the clause, so compile what the ORM runs for PostgreSQL
+        repo = RepasseRepository(db_session)
+        first = repo.create(CreateRepasseDTO(production_id=created_production.id, amount=Decimal("100.00")), created_user.id)
+        second = repo.create(CreateRepasseDTO(production_id=created_production.id, amount=Decimal("50.00")), created_user.id)
+        locked = []
+
+        def capture(state):
+            if state.is_select:
+                sql = str(state.statement.compile(dialect=postgresql.dialect()))
+                if "FROM repasses" in sql and sql.rstrip().endswith("FOR UPDATE"):
+                    locked.append(sql)
+
+        event.listen(db_session, "do_orm_execute", capture)
+        try:
+            # Act
+            repo.update(first.id, UpdateRepasseDTO(status=RepasseStatus.CONSOLIDATED))
+            repo.delete(second.id)
+        finally:
+            event.remove(db_session, "do_orm_execute", capture)
+
+        # Assert
+        assert len(locked) == 2
+        balance = repo.get_doctor_balance(created_production.doctor_id)
+        assert balance[RepasseStatus.CONSOLIDATED] == (1, Decimal("100.00"))
+        assert balance[RepasseStatus.PENDING] == (0, Decimal("0.00"))
+
+    def test_balance_matches_period_aggregate(self, db_session, created_production, created_user):
+        """Test that the maintained balance equals the all-time GROUP BY"""
+        repo = RepasseRepository(db_session)
+        for amount, status in (("500.00", RepasseStatus.CONSOLIDATED),
+                               ("300.10", RepasseStatus.PENDING),
+                               ("199.90", RepasseStatus.PENDING)):
+            repo.create(CreateRepasseDTO(
+                production_id=created_production.id, amount=Decimal(amount), status=status
+            ), created_user.id)
+
+        doctor_id = created_production.doctor_id
+        assert repo.get_doctor_balance(doctor_id) == repo.get_stats_by_doctor(doctor_id, None, None)
+
+    def test_production_delete_subtracts_its_repasses(self, db_session, created_production, created_user):
+        """Test that deleting a production removes its repasses from the balance"""
+        repo = RepasseRepository(db_session)
+        repo.create(CreateRepasseDTO(
+            production_id=created_production.id, amount=Decimal("100.00")
+        ), created_user.id)
+
+        ProductionRepository(db_session).delete(created_production.id)
+
+        balance = repo.get_doctor_balance(created_production.doctor_id)
+        assert balance[RepasseStatus.PENDING] == (0, Decimal("0.00"))
+
+    def test_repair_fixes_drift(self, db_session, created_production, created_user):
+        """Test that repair recomputes balances that drifted from the repasses"""
+        repo = RepasseRepository(db_session)
+        balances = DoctorBalanceRepository(db_session)
+        doctor_id = created_production.doctor_id
+        repo.create(CreateRepasseDTO(
+            production_id=created_production.id, amount=Decimal("100.00")
+        ), created_user.id)
+        db_session.get(DoctorBalanceModel, doctor_id).pending_value = Decimal("999.00")
+        db_session.commit()
+
+        repaired = balances.repair()
+
+        assert repaired == 1
+        assert balances.find_drift() == []
+        assert repo.get_doctor_balance(doctor_id)[RepasseStatus.PENDING] == (1, Decimal("100.00"))
+
+    def test_repair_writes_the_given_drift_without_recomputing(self, db_session, created_production, created_user,
+                                                               counted_selects):
+        """Test that repair(drift) writes exactly the drift already computed, with no second GROUP BY"""
+        repo = RepasseRepository(db_session)
+        balances = DoctorBalanceRepository(db_session)
+        doctor_id = created_production.doctor_id
+        repo.create(CreateRepasseDTO(
+            production_id=created_production.id, amount=Decimal("100.00")
+        ), created_user.id)
+        db_session.get(DoctorBalanceModel, doctor_id).pending_value = Decimal("999.00")
+        db_session.commit()
+
+        balances.lock_repasses()
+        drift = balances.find_drift()
+        counted_selects.clear()
+        repaired = balances.repair(drift)
+
+        assert [doctor for doctor, _, _ in drift] == [doctor_id]
+        assert repaired == 1
+        assert not any("GROUP BY" in statement for statement in counted_selects)
+        assert repo.get_doctor_balance(doctor_id)[RepasseStatus.PENDING] == (1, Decimal("100.00"))
+
+
+class TestCollectionVersionRepository:
+    """Test cases for the per-user collection version counters"""
+
+    def test_writes_bump_versions(self, db_session, created_doctor, created_production, created_user):
+        """Test that repository writes bump their collection, and cascading deletes the affected ones"""
+        versions = CollectionVersionRepository(db_session)
+        doctors_before = versions.get_version(created_user.id, Collection.DOCTORS)
+        productions_before = versions.get_version(created_user.id, Collection.PRODUCTIONS)
+        hospitals_before = versions.get_version(created_user.id, Collection.HOSPITALS)
+
+        DoctorRepository(db_session).update(created_doctor.id, name="Renamed")
+        assert versions.get_version(created_user.id, Collection.DOCTORS) == doctors_before + 1
+        assert versions.get_version(created_user.id, Collection.PRODUCTIONS) == productions_before
+
+        DoctorRepository(db_session).delete(created_doctor.id)
+        assert versions.get_version(created_user.id, Collection.DOCTORS) == doctors_before + 2
+        assert versions.get_version(created_user.id, Collection.PRODUCTIONS) == productions_before + 1
+        assert versions.get_version(created_user.id, Collection.HOSPITALS) == hospitals_before
+
+    def test_version_bump_runs_after_the_main_writes(self, db_session, created_production, created_user):
+        """Test that the version rows are upserted last, once per batch, so their lock is held only for the commit"""
+        # Arrange
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        doctor_id, hospital_id = created_production.doctor_id, created_production.hospital_id
+        batch = [
+            Production(
+                id=uuid4(), user_id=created_user.id, doctor_id=doctor_id, hospital_id=hospital_id, type="shift",
+                date=date(2024, 1, day), created_at=datetime.now(timezone.utc).isoformat()
+            )
+            for day in (1, 2, 3)
+        ]
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            # Act
+            ProductionRepository(db_session).save_many(batch)
+            DoctorRepository(db_session).delete(doctor_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        # Assert
+        writes = [statement for statement in statements if not statement.lstrip().upper().startswith("SELECT")]
+        version_writes = [index for index, statement in enumerate(writes) if "collection_versions" in statement]
+        assert len(version_writes) == 3
+        assert "INTO productions" in writes[version_writes[0] - 1]
+        assert "FROM doctors" in writes[version_writes[1] - 1]
+        assert version_writes[1:] == [len(writes) - 2, len(writes) - 1]
+
+    def test_unwritten_collection_is_version_zero(self, db_session):
+        """Test that a collection without writes reads as version 0"""
+        assert CollectionVersionRepository(db_session).get_version(uuid4(), Collection.HOSPITALS) == 0
+
+    def test_item_version_is_the_owners(self, db_session, created_hospital, created_user):
+        """Test that an item resolves to its owner and the owner's collection version, or None if missing"""
+        versions = CollectionVersionRepository(db_session)
+        assert versions.get_item_version(Collection.HOSPITALS, created_hospital.id) == (created_user.id, 0)
+
+        HospitalRepository(db_session).update(created_hospital.id, name="Renamed")
+
+        assert versions.get_item_version(Collection.HOSPITALS, created_hospital.id) == (created_user.id, 1)
+        assert versions.get_item_version(Collection.HOSPITALS, uuid4()) is None
+
+
+@pytest.fixture
+def counted_selects(db_session):
+    """Number of SELECTs sent to the database while the test body runs"""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(engine, "before_cursor_execute", count)
+
+
+class TestEntityCache:
+    """Test cases for the by-ID entity cache in front of the repositories"""
+
+    def test_repeated_lookup_skips_the_database(self, db_session, created_doctor, counted_selects):
+        """Test that a second get_by_id is served from the cache and counted as a hit"""
+        # Arrange
+        repo = DoctorRepository(db_session)
+        hits_before = REGISTRY.get_sample_value("entity_cache_hits_total", {"entity": "doctors"}) or 0
+
+        # Act
+        first = repo.get_by_id(created_doctor.id, cached=True)
+        second = repo.get_by_id(created_doctor.id, cached=True)
+
+        # Assert
+        assert first == second
+        assert len(counted_selects) == 1
+        assert REGISTRY.get_sample_value("entity_cache_hits_total", {"entity": "doctors"}) == hits_before + 1
+
+    def test_cached_entity_is_a_copy(self, db_session, created_hospital):
+        """Test that changing a returned entity does not change the cached one"""
+        repo = HospitalRepository(db_session)
+        repo.get_by_id(created_hospital.id, cached=True).name = "Changed by caller"
+
+        assert repo.get_by_id(created_hospital.id, cached=True).name == "Hospital Test"
+
+    def test_update_writes_through(self, db_session, created_production, counted_selects):
+        """Test that update replaces the cached entity with the committed state"""
+        # Arrange
+        repo = ProductionRepository(db_session)
+        repo.get_by_id(created_production.id, cached=True)
+
+        # Act
+        repo.update(created_production.id, description="Updated")
+        counted_selects.clear()
+        result = repo.get_by_id(created_production.id, cached=True)
+
+        # Assert
+        assert result.description == "Updated"
+        assert counted_selects == []
+
+    def test_delete_invalidates_entity_and_cascaded_productions(self, db_session, created_production, counted_selects):
+        """Test that deleting a doctor drops it and the cached productions from the cache"""
+        # Arrange
+        doctors = DoctorRepository(db_session)
+        productions = ProductionRepository(db_session)
+        doctor_id, production_id = created_production.doctor_id, created_production.id
+        doctors.get_by_id(doctor_id, cached=True)
+        productions.get_by_id(production_id, cached=True)
+
+        # Act
+        doctors.delete(doctor_id)
+        counted_selects.clear()
+
+        # Assert
+        assert doctors.get_by_id(doctor_id, cached=True) is None
+        productions.get_by_id(production_id, cached=True)
+        assert len(counted_selects) == 2
+
+    def test_cascade_keeps_other_doctors_productions_cached(self, db_session, created_production, created_user, counted_selects):
+        """Test that deleting a doctor only drops that doctor's productions from the cache"""
+        # Arrange
+        other = DoctorModel(
+            name="Dr. Other", crm="OTHER1", specialty="Cardiologia", email="other@test.com", user_id=created_user.id
+        )
+        db_session.add(other)
+        db_session.commit()
+        productions = ProductionRepository(db_session)
+        production_id = created_production.id
+        productions.get_by_id(production_id, cached=True)
+
+        # Act
+        DoctorRepository(db_session).delete(other.id)
+        counted_selects.clear()
+
+        # Assert
+        assert productions.get_by_id(production_id, cached=True) is not None
+        assert counted_selects == []
+
+    def test_lookup_without_cached_reads_the_database(self, db_session, created_doctor):
+        """Test that the default lookup (used before writes) sees a row deleted behind the cache"""
+        # Arrange: another worker deletes the doctor; this process still holds the cached copy
+        repo = DoctorRepository(db_session)
+        repo.get_by_id(created_doctor.id, cached=True)
+        db_session.query(DoctorModel).filter(DoctorModel.id == created_doctor.id).delete()
+        db_session.commit()
+
+        # Act / Assert
+        assert repo.get_by_id(created_doctor.id, cached=True) is not None
+        assert repo.get_by_id(created_doctor.id) is None
+
+    def test_save_production_for_doctor_deleted_behind_the_cache(self, db_session, created_doctor, created_hospital, created_user):
+        """Test that a foreign key violation on save is reported as a missing doctor and evicts the stale copy"""
+        # Arrange: SQLite only checks foreign keys when asked to
+        db_session.execute(text("PRAGMA foreign_keys=ON"))
+        doctors = DoctorRepository(db_session)
+        doctors.get_by_id(created_doctor.id, cached=True)
+        db_session.query(DoctorModel).filter(DoctorModel.id == created_doctor.id).delete()
+        db_session.commit()
+        production = Production(
+            id=uuid4(), user_id=created_user.id, doctor_id=created_doctor.id, hospital_id=created_hospital.id,
+            type="plantao", date=date(2024, 1, 15), description=None, created_at=datetime.now().isoformat()
+        )
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Doctor not found."):
+            ProductionRepository(db_session).save(production)
+        assert doctors.get_by_id(created_doctor.id, cached=True) is None
+
+    def test_create_repasse_for_production_deleted_behind_the_cache(self, db_session, created_production, created_user):
+        """Test that creating a repasse for a production deleted by another worker fails and evicts the stale copy"""
+        # Arrange
+        productions = ProductionRepository(db_session)
+        production_id = created_production.id
+        productions.get_by_id(production_id, cached=True)
+        db_session.query(ProductionModel).filter(ProductionModel.id == production_id).delete()
+        db_session.commit()
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="Production not found"):
+            RepasseRepository(db_session).create(
+                CreateRepasseDTO(production_id=production_id, amount=Decimal("100.00")), created_user.id
+            )
+        assert db_session.query(RepasseModel).count() == 0
+        assert productions.get_by_id(production_id, cached=True) is None
+
+
+class TestReadModels:
+    """Test cases for the slotted read models returned by list reads"""
+
+    def test_list_reads_keep_native_types(self, db_session, created_production, created_user):
+        """Test that list reads return slotted rows with UUID/datetime values, not strings"""
+        productions = ProductionRepository(db_session).get_all(user_id=created_user.id)
+        doctors = DoctorRepository(db_session).get_all(user_id=created_user.id)
+        hospitals = HospitalRepository(db_session).get_all(user_id=created_user.id)
+
+        for row, row_type in ((productions[0], ProductionRow), (doctors[0], DoctorRow), (hospitals[0], HospitalRow)):
+            assert type(row) is row_type
+            assert not hasattr(row, "__dict__")
+            assert isinstance(row.id, UUID)
+            assert isinstance(row.created_at, datetime)
+        assert productions[0].type == "shift"
+        assert productions[0].date == created_production.date
+
+    def test_repasse_rows_are_slotted(self, db_session, created_production, created_user):
+        """Test that repasse list reads map rows into the slotted Repasse"""
+        repo = RepasseRepository(db_session)
+        created = repo.create(CreateRepasseDTO(production_id=created_production.id, amount=Decimal("10.00")), user_id=created_user.id)
+
+        repasses = repo.get_all(user_id=created_user.id)
+
+        assert not hasattr(repasses[0], "__dict__")
+        assert (repasses[0].id, repasses[0].amount, repasses[0].status) == (created.id, created.amount, created.status)
+
+    def test_from_row_serializes_like_validated_dto(self, db_session, created_production, created_user):
+        """Test that a DTO built without validation emits the same JSON as a validated one"""
+        productions = ProductionRepository(db_session).get_all(user_id=created_user.id)
+        row = productions[0]
+
+        fast = ProductionResponseDTO.from_row(row)
+        validated = ProductionResponseDTO(
+            id=str(row.id), doctor_id=str(row.doctor_id), hospital_id=str(row.hospital_id), type=row.type,
+            date=row.date.isoformat(), description=row.description, created_at=row.created_at.isoformat(),
+            updated_at=None
+        )
+
+        assert fast.model_dump_json() == validated.model_dump_json()
+
+
+class TestPaginationCursor:
+    """Test cases for the opaque pagination cursor"""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes back to its sort key"""
+        item_id = uuid4()
+        created_at = datetime(2026, 1, 1, 12, 30, 15, 123456)
+
+        cursor = encode_cursor(created_at.isoformat(), item_id)
+
+        assert decode_cursor(cursor) == (created_at, item_id)
+
+    def test_invalid_cursor_raises(self):
+        """Test that tampered cursors are rejected"""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
@@ -1,5 +1,8 @@
 """Unit tests for services"""
+import asyncio
+import threading
 import pytest
+from sqlalchemy.util import greenlet_spawn
 from src.infrastructure.services.password_service import PasswordService
 from src.infrastructure.services.jwt_service import JWTService
 from uuid import uuid4
@@ -48,6 +51,38 @@ class TestPasswordService:
         assert password_service.verify_password(password, hash1)
         assert password_service.verify_password(password, hash2)
 
+    def test_hash_runs_on_dedicated_pool(self, password_service: PasswordService):
+        """Test that bcrypt never runs on the calling thread"""
+        threads = []
+        original = password_service.pwd_context.hash
+        password_service.pwd_context.hash = lambda secret: threads.append(
+            threading.current_thread().name
+        ) or original(secret)
+
+        password_service.encrypt_password("SecurePassword123")
+
+        assert threads[0].startswith("bcrypt")
+        assert threads[0] != threading.current_thread().name
+
+    async def test_hash_yields_event_loop_in_async_mode(self, password_service: PasswordService):
+        """Test that the event loop keeps running while a hash is computed inside run_sync"""
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker_task = asyncio.create_task(ticker())
+        hashed = await greenlet_spawn(password_service.encrypt_password, "SecurePassword123")
+        done.set()
+        await ticker_task
+
+        assert ticks > 1
+        assert await greenlet_spawn(password_service.verify_password, "SecurePassword123", hashed)
+
 
 class TestJWTService:
     """Test cases for JWTService"""
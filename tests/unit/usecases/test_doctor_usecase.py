@@ -5,6 +5,7 @@ from unittest.mock import Mock
 
 from src.domain.usecase.doctor.create_doctor import CreateDoctorUseCase
 from src.domain.usecase.doctor.get_doctor_by_id import GetDoctorByIdUseCase
+from src.domain.usecase.doctor.get_doctor_statement import GetDoctorStatementUseCase
 from src.domain.usecase.doctor.update_doctor import UpdateDoctorUseCase
 from src.domain.usecase.doctor.delete_doctor import DeleteDoctorUseCase
 from src.dto.doctorDTO import CreateDoctorDTO, UpdateDoctorDTO
@@ -145,6 +146,66 @@ class TestGetDoctorByIdUseCase:
         assert "Doctor not found" in str(exc_info.value)
 
 
+class TestGetDoctorStatementUseCase:
+    """Test cases for GetDoctorStatementUseCase"""
+
+    def test_statement_totals(self, sample_doctor_data):
+        """Test that pending and consolidated totals are summed from the embedded repasses"""
+        from datetime import date, datetime
+        from decimal import Decimal
+        from src.domain.entities.DoctorStatement import StatementProduction
+        from src.domain.entities.ReadModels import ProductionRow
+        from src.domain.entities.Repasse import Repasse
+        from src.domain.enums.repasse_status import RepasseStatus
+
+        # Arrange
+        doctor_id, user_id, production_id = uuid4(), uuid4(), uuid4()
+        doctor_repo = Mock()
+        doctor_repo.get_by_id.return_value = Doctor(
+            id=doctor_id, **sample_doctor_data, user_id=user_id, created_at="2024-01-01T00:00:00"
+        )
+
+        def repasse(amount, status):
+            return Repasse(id=uuid4(), user_id=user_id, production_id=production_id, amount=Decimal(amount),
+                           created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1), status=status)
+
+        statement_repo = Mock()
+        statement_repo.get_statement.return_value = [StatementProduction(
+            production=ProductionRow(id=production_id, user_id=user_id, doctor_id=doctor_id, hospital_id=uuid4(),
+                                     type="shift", date=date(2024, 1, 15), description=None,
+                                     created_at=datetime(2024, 1, 15), updated_at=None),
+            hospital_name="Hospital",
+            repasses=[
+                repasse("100.00", RepasseStatus.PENDING),
+                repasse("20.50", RepasseStatus.PENDING),
+                repasse("300.00", RepasseStatus.CONSOLIDATED),
+            ]
+        )]
+        usecase = GetDoctorStatementUseCase(get_doctor_by_id_port=doctor_repo, get_doctor_statement_port=statement_repo)
+
+        # Act
+        result = usecase.execute(doctor_id, date(2024, 1, 1), date(2024, 1, 31))
+
+        # Assert
+        assert result.total_pending_count == 2
+        assert result.total_pending_value == Decimal("120.50")
+        assert result.total_consolidated_count == 1
+        assert result.total_consolidated_value == Decimal("300.00")
+        statement_repo.get_statement.assert_called_once_with(doctor_id, date(2024, 1, 1), date(2024, 1, 31))
+
+    def test_statement_doctor_not_found(self):
+        """Test that the statement of an unknown doctor is not loaded"""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo.get_by_id.return_value = None
+        usecase = GetDoctorStatementUseCase(get_doctor_by_id_port=mock_repo, get_doctor_statement_port=mock_repo)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Doctor not found"):
+            usecase.execute(uuid4())
+        mock_repo.get_statement.assert_not_called()
+
+
 class TestUpdateDoctorUseCase:
     """Test cases for UpdateDoctorUseCase"""
 
@@ -2,18 +2,29 @@
 import pytest
 from uuid import uuid4
 from unittest.mock import Mock
-from datetime import date
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from fastapi import HTTPException
 
 from src.domain.usecase.production.create_production import CreateProductionUseCase
+from src.domain.usecase.production.bulk_create_productions import BulkCreateProductionsUseCase
+from src.domain.usecase.production.get_productions_by_hospital import GetProductionsByHospitalUseCase
 from src.domain.usecase.repasse.create_repasse import CreateRepasseUseCase
+from src.domain.usecase.repasse.get_repasse_stats import GetRepasseStatsUseCase
+from src.domain.usecase.repasse.get_cached_repasse_stats import GetCachedRepasseStatsUseCase
+from src.infrastructure.cache.stats_cache import LocalStatsCache
+from src.domain.usecase.repasse.get_repasse_stats_batch import GetRepasseStatsBatchUseCase
+from src.domain.usecase.repasse.get_repasse_stats_series import GetRepasseStatsSeriesUseCase
+from src.domain.enums.stats_series import SeriesDimension, SeriesGranularity
+from src.domain.entities.RepasseSeriesPoint import RepasseSeriesPoint
+from src.domain.enums.repasse_status import RepasseStatus
 from src.dto.productionDTO import CreateProductionDTO
 from src.dto.repasseDTO import CreateRepasseDTO
 from src.domain.entities.Production import Production
 from src.domain.entities.Repasse import Repasse
 from src.domain.entities.Doctor import Doctor
 from src.domain.entities.Hospital import Hospital
+from src.domain.entities.TotalCount import TotalCount
 
 
 class TestCreateProductionUseCase:
@@ -80,6 +91,8 @@ class TestCreateProductionUseCase:
         assert result is not None
         assert result.doctor_id == doctor_id
         assert result.hospital_id == hospital_id
+        mock_doctor_repo.get_by_id.assert_called_once_with(doctor_id, cached=True)
+        mock_hospital_repo.get_by_id.assert_called_once_with(hospital_id, cached=True)
         mock_production_repo.save.assert_called_once()
 
     def test_create_production_doctor_not_found(self):
@@ -157,6 +170,87 @@ class TestCreateProductionUseCase:
         assert "Hospital not found" in str(exc_info.value)
 
 
+class TestBulkCreateProductionsUseCase:
+    """Test cases for BulkCreateProductionsUseCase"""
+
+    def test_valid_items_saved_and_invalid_reported(self):
+        """Test one IN lookup per reference, one save, and per-item errors"""
+        # Arrange
+        doctor_id, hospital_id, user_id = uuid4(), uuid4(), uuid4()
+        mock_production_repo = Mock()
+        mock_production_repo.save_many.side_effect = lambda productions: len(productions)
+        mock_doctor_repo = Mock()
+        mock_doctor_repo.get_existing_ids.return_value = {doctor_id}
+        mock_hospital_repo = Mock()
+        mock_hospital_repo.get_existing_ids.return_value = {hospital_id}
+        usecase = BulkCreateProductionsUseCase(
+            save_productions_port=mock_production_repo,
+            get_existing_doctor_ids_port=mock_doctor_repo,
+            get_existing_hospital_ids_port=mock_hospital_repo
+        )
+        valid = {"doctor_id": str(doctor_id), "hospital_id": str(hospital_id), "type": "shift", "date": "2024-01-15"}
+        items = [
+            valid,
+            {**valid, "doctor_id": str(uuid4())},
+            {**valid, "type": "surgery"},
+            {**valid, "hospital_id": "not-a-uuid"},
+            {**valid, "type": "consultation"},
+        ]
+
+        # Act
+        result = usecase.execute(items, user_id)
+
+        # Assert
+        mock_doctor_repo.get_existing_ids.assert_called_once()
+        mock_hospital_repo.get_existing_ids.assert_called_once()
+        saved = mock_production_repo.save_many.call_args.args[0]
+        assert [production.type for production in saved] == ["shift", "consultation"]
+        # Same UTC clock as the model defaults, whatever the host timezone
+        assert datetime.fromisoformat(saved[0].created_at).utcoffset() == timedelta(0)
+        assert result.created == 2
+        assert result.failed == 3
+        assert [error.index for error in result.errors] == [1, 2, 3]
+        assert result.errors[0].detail == "Doctor not found."
+        assert result.errors[1].detail.startswith("type:")
+        assert result.ids[0] == saved[0].id
+        assert result.ids[1:4] == [None, None, None]
+
+
+class TestGetProductionsByHospitalUseCase:
+    """Test cases for GetProductionsByHospitalUseCase"""
+
+    def test_page_with_total(self):
+        """Test that the page and the total use the same hospital and period"""
+        # Arrange
+        hospital_id = uuid4()
+        start, end = date(2024, 1, 1), date(2024, 6, 30)
+        after = (datetime(2024, 2, 1), uuid4())
+        mock_repository = Mock()
+        mock_repository.get_by_hospital.return_value = []
+        mock_repository.count_by_hospital.return_value = TotalCount(value=42)
+        usecase = GetProductionsByHospitalUseCase(repository=mock_repository)
+
+        # Act
+        productions, total = usecase.execute(hospital_id, 0, 11, after=after, start_date=start, end_date=end)
+
+        # Assert
+        mock_repository.get_by_hospital.assert_called_once_with(hospital_id, 0, 11, after, start, end)
+        mock_repository.count_by_hospital.assert_called_once_with(hospital_id, start, end)
+        assert productions == []
+        assert total.value == 42
+
+    def test_page_without_total(self):
+        """Test that include_total=False skips the count query"""
+        mock_repository = Mock()
+        mock_repository.get_by_hospital.return_value = []
+        usecase = GetProductionsByHospitalUseCase(repository=mock_repository)
+
+        _, total = usecase.execute(uuid4(), 0, 11, include_total=False)
+
+        mock_repository.count_by_hospital.assert_not_called()
+        assert total is None
+
+
 class TestCreateRepasseUseCase:
     """Test cases for CreateRepasseUseCase"""
 
@@ -207,6 +301,7 @@ class TestCreateRepasseUseCase:
         assert result is not None
         assert result.production_id == production_id
         assert result.amount == Decimal("1500.00")
+        mock_production_repo.get_by_id.assert_called_once_with(production_id, cached=True)
         mock_repasse_repo.create.assert_called_once()
 
     def test_create_repasse_production_not_found(self):
@@ -236,3 +331,221 @@ class TestCreateRepasseUseCase:
 
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Production not found"
+
+
+class TestGetRepasseStatsUseCase:
+    """Test cases for GetRepasseStatsUseCase"""
+
+    def test_stats_from_aggregated_rows(self):
+        """Test that period stats are built from the per-status aggregate"""
+        # Arrange
+        doctor_id = uuid4()
+        start, end = date(2024, 1, 1), date(2024, 1, 31)
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_stats_by_doctor.return_value = {
+            RepasseStatus.PENDING: (2, Decimal("300.00")),
+            RepasseStatus.CONSOLIDATED: (1, Decimal("500.00")),
+        }
+        usecase = GetRepasseStatsUseCase(repasse_repository=mock_repasse_repo)
+
+        # Act
+        result = usecase.execute(doctor_id, start, end)
+
+        # Assert
+        mock_repasse_repo.get_stats_by_doctor.assert_called_once_with(doctor_id, start, end)
+        mock_repasse_repo.get_doctor_balance.assert_not_called()
+        mock_repasse_repo.get_by_doctor_and_date_range.assert_not_called()
+        assert result.total_pending_count == 2
+        assert result.total_pending_value == Decimal("300.00")
+        assert result.total_consolidated_count == 1
+        assert result.total_consolidated_value == Decimal("500.00")
+
+    def test_all_time_stats_from_maintained_balance(self):
+        """Test that stats without a period come from the maintained balance"""
+        # Arrange
+        doctor_id = uuid4()
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_doctor_balance.return_value = {
+            RepasseStatus.CONSOLIDATED: (3, Decimal("900.00")),
+        }
+        usecase = GetRepasseStatsUseCase(repasse_repository=mock_repasse_repo)
+
+        # Act
+        result = usecase.execute(doctor_id)
+
+        # Assert
+        mock_repasse_repo.get_doctor_balance.assert_called_once_with(doctor_id)
+        mock_repasse_repo.get_stats_by_doctor.assert_not_called()
+        assert result.total_pending_count == 0
+        assert result.total_consolidated_count == 3
+        assert result.total_consolidated_value == Decimal("900.00")
+
+
+class TestGetCachedRepasseStatsUseCase:
+    """Test cases for GetCachedRepasseStatsUseCase"""
+
+    def test_second_call_served_from_cache(self):
+        """Test that the stats are computed once per (user, doctor, period)"""
+        # Arrange
+        user_id, doctor_id = uuid4(), uuid4()
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_doctor_balance.return_value = {RepasseStatus.PENDING: (1, Decimal("10.00"))}
+        usecase = GetCachedRepasseStatsUseCase(
+            get_repasse_stats=GetRepasseStatsUseCase(repasse_repository=mock_repasse_repo),
+            stats_cache=LocalStatsCache(ttl=30)
+        )
+
+        # Act
+        first, first_stale = usecase.execute(user_id, doctor_id)
+        second, second_stale = usecase.execute(user_id, doctor_id)
+
+        # Assert
+        mock_repasse_repo.get_doctor_balance.assert_called_once_with(doctor_id)
+        assert first == second
+        assert (first_stale, second_stale) == (False, False)
+
+    def test_refresh_recomputes(self):
+        """Test that refresh=True skips the cached value and stores the new one"""
+        # Arrange
+        user_id, doctor_id = uuid4(), uuid4()
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_doctor_balance.side_effect = [
+            {RepasseStatus.PENDING: (1, Decimal("10.00"))},
+            {RepasseStatus.PENDING: (2, Decimal("20.00"))},
+        ]
+        usecase = GetCachedRepasseStatsUseCase(
+            get_repasse_stats=GetRepasseStatsUseCase(repasse_repository=mock_repasse_repo),
+            stats_cache=LocalStatsCache(ttl=30)
+        )
+        usecase.execute(user_id, doctor_id)
+
+        # Act
+        refreshed, _ = usecase.execute(user_id, doctor_id, refresh=True)
+        cached, _ = usecase.execute(user_id, doctor_id)
+
+        # Assert
+        assert refreshed.total_pending_count == cached.total_pending_count == 2
+
+    def test_invalidation_during_compute_is_not_overwritten(self):
+        """Test that stats computed before a concurrent write's invalidation are not cached"""
+        # Arrange: the write lands while the stats are being read from the database
+        user_id, doctor_id = uuid4(), uuid4()
+        cache = LocalStatsCache(ttl=30)
+        mock_repasse_repo = Mock()
+
+        def balance_then_concurrent_write(_doctor_id):
+            cache.invalidate_doctors([doctor_id])
+            return {RepasseStatus.PENDING: (1, Decimal("10.00"))}
+
+        mock_repasse_repo.get_doctor_balance.side_effect = balance_then_concurrent_write
+        usecase = GetCachedRepasseStatsUseCase(
+            get_repasse_stats=GetRepasseStatsUseCase(repasse_repository=mock_repasse_repo),
+            stats_cache=cache
+        )
+
+        # Act
+        usecase.execute(user_id, doctor_id)
+
+        # Assert
+        assert cache.get(user_id, doctor_id, None, None) is None
+
+    def test_without_cache_always_computes(self):
+        """Test that a disabled cache computes on every call"""
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_doctor_balance.return_value = {}
+        usecase = GetCachedRepasseStatsUseCase(get_repasse_stats=GetRepasseStatsUseCase(repasse_repository=mock_repasse_repo))
+
+        usecase.execute(uuid4(), uuid4())
+        usecase.execute(uuid4(), uuid4())
+
+        assert mock_repasse_repo.get_doctor_balance.call_count == 2
+
+
+class TestGetRepasseStatsBatchUseCase:
+    """Test cases for GetRepasseStatsBatchUseCase"""
+
+    def test_batch_stats_for_hospital_doctors(self):
+        """Test that a hospital resolves to its doctors and missing doctors get zeros"""
+        # Arrange
+        with_repasses, without_repasses, hospital_id = uuid4(), uuid4(), uuid4()
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_stats_by_doctors.return_value = {
+            with_repasses: {RepasseStatus.PENDING: (2, Decimal("300.00"))},
+        }
+        mock_links_repo = Mock()
+        mock_links_repo.get_doctor_ids_by_hospital.return_value = [with_repasses, without_repasses]
+        usecase = GetRepasseStatsBatchUseCase(
+            repasse_repository=mock_repasse_repo, doctor_hospital_repository=mock_links_repo
+        )
+
+        # Act
+        result = usecase.execute(hospital_id=hospital_id, start_date=start, end_date=end)
+
+        # Assert
+        mock_repasse_repo.get_stats_by_doctors.assert_called_once_with([with_repasses, without_repasses], start, end)
+        mock_repasse_repo.get_doctor_balances.assert_not_called()
+        assert result.doctors[with_repasses].total_pending_value == Decimal("300.00")
+        assert result.doctors[without_repasses].total_pending_count == 0
+
+    def test_all_time_batch_stats_from_maintained_balances(self):
+        """Test that batch stats without a period come from the maintained balances"""
+        # Arrange
+        doctor_id = uuid4()
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_doctor_balances.return_value = {
+            doctor_id: {RepasseStatus.CONSOLIDATED: (1, Decimal("50.00"))},
+        }
+        usecase = GetRepasseStatsBatchUseCase(repasse_repository=mock_repasse_repo, doctor_hospital_repository=Mock())
+
+        # Act
+        result = usecase.execute(doctor_ids=[doctor_id, doctor_id])
+
+        # Assert
+        mock_repasse_repo.get_doctor_balances.assert_called_once_with([doctor_id])
+        assert list(result.doctors) == [doctor_id]
+        assert result.doctors[doctor_id].total_consolidated_count == 1
+
+    def test_stats_without_repasses(self):
+        """Test that missing statuses default to zero"""
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_doctor_balance.return_value = {}
+        usecase = GetRepasseStatsUseCase(repasse_repository=mock_repasse_repo)
+
+        result = usecase.execute(uuid4())
+
+        assert result.total_pending_count == 0
+        assert result.total_pending_value == Decimal(0)
+        assert result.total_consolidated_count == 0
+        assert result.total_consolidated_value == Decimal(0)
+
+
+class TestGetRepasseStatsSeriesUseCase:
+    """Test cases for GetRepasseStatsSeriesUseCase"""
+
+    def test_points_pivoted_per_bucket(self):
+        """Test that per-status points become one bucket with pending and consolidated totals"""
+        # Arrange
+        doctor_id, hospital_id = uuid4(), uuid4()
+        january, february = datetime(2024, 1, 1), datetime(2024, 2, 1)
+        mock_repasse_repo = Mock()
+        mock_repasse_repo.get_stats_series.return_value = [
+            RepasseSeriesPoint(bucket_start=january, hospital_id=hospital_id, status=RepasseStatus.CONSOLIDATED, count=1, amount=Decimal("70.00")),
+            RepasseSeriesPoint(bucket_start=january, hospital_id=hospital_id, status=RepasseStatus.PENDING, count=2, amount=Decimal("150.00")),
+            RepasseSeriesPoint(bucket_start=february, hospital_id=hospital_id, status=RepasseStatus.PENDING, count=1, amount=Decimal("30.00")),
+        ]
+        usecase = GetRepasseStatsSeriesUseCase(repasse_repository=mock_repasse_repo)
+
+        # Act
+        result = usecase.execute(doctor_id, SeriesGranularity.MONTH, group_by=[SeriesDimension.HOSPITAL, SeriesDimension.HOSPITAL])
+
+        # Assert
+        mock_repasse_repo.get_stats_series.assert_called_once_with(
+            doctor_id, SeriesGranularity.MONTH, None, None, [SeriesDimension.HOSPITAL]
+        )
+        assert [bucket.bucket_start for bucket in result.buckets] == [january, february]
+        assert result.buckets[0].total_pending_count == 2
+        assert result.buckets[0].total_pending_value == Decimal("150.00")
+        assert result.buckets[0].total_consolidated_count == 1
+        assert result.buckets[1].total_consolidated_value == Decimal(0)
+        assert result.buckets[1].hospital_id == hospital_id